@@ -0,0 +1,214 @@
+# src/microburst_detection/api/admission.py
+"""Admission control for sensor ingest: rate limits, concurrency and load shedding."""
+
+import math
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Dict, Iterator
+
+from ..core.algorithms import ReflectivityAnalyzer, WindShearDetector
+from ..core.models import SensorData
+
+
+class Decision(str, Enum):
+    """Outcome of an admission check."""
+    ADMIT = "admitted"
+    RATE_LIMITED = "rate_limited"
+    SHED = "shed"
+    SATURATED = "saturated"
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def try_acquire(self, now: float) -> bool:
+        """Take one token if available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the next token is available."""
+        return max(0.0, (1.0 - self.tokens) / self.rate) if self.rate > 0 else math.inf
+
+
+def near_hazard(sensor_type: str, data: SensorData, margin: float = 0.75) -> bool:
+    """
+    Whether a reading is close enough to a detection threshold to never be shed.
+
+    The checks mirror the detector's own triggers, relaxed by ``margin`` so
+    readings on the way up to a threshold are protected too. Anemometer
+    pressure is not a trigger on its own: the detector only weighs a
+    pressure drop once the wind is past its threshold, and pressure jumps
+    are judged against each station's own baseline, which a single reading
+    cannot show.
+
+    Args:
+        sensor_type: ``lidar``, ``radar`` or ``anemometer``
+        data: Validated reading
+        margin: Fraction of each threshold treated as near-hazard
+
+    Returns:
+        True for high-value readings
+    """
+    if sensor_type == "lidar":
+        # Downdraft strong enough to produce threshold shear over the profile
+        return abs(data.vertical_velocity) >= WindShearDetector.WIND_SHEAR_THRESHOLD * margin
+    if sensor_type == "radar":
+        return (
+            data.reflectivity >= ReflectivityAnalyzer.MODERATE_REFLECTIVITY * margin
+            or abs(data.radial_velocity) * 0.7 >= WindShearDetector.WIND_SHEAR_THRESHOLD * margin
+        )
+    if sensor_type == "anemometer":
+        return data.wind_speed >= 20.0 * margin
+    return True
+
+
+class AdmissionController:
+    """
+    Decides whether an ingest request is processed.
+
+    Every reading is charged to its sensor's token bucket. When in-flight
+    ingest requests exceed ``shed_fraction`` of the concurrency limit, or the
+    event loop is lagging, routine readings are shed, and no routine reading
+    is admitted past the limit itself. Readings near hazard thresholds are
+    never shed: they may also use ``priority_reserve`` slots above the limit,
+    and only once those are taken too are they refused (``SATURATED``).
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_in_flight: int = 256,
+        priority_reserve: int = 32,
+        shed_fraction: float = 0.8,
+        max_loop_lag: float = 0.25,
+        max_sensors: int = 10000,
+        loop_lag: Callable[[], float] = lambda: 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize controller.
+
+        Args:
+            rate: Sustained readings per second allowed per sensor
+            burst: Bucket capacity per sensor
+            max_in_flight: Global ingest concurrency limit for routine readings
+            priority_reserve: Extra slots only near-hazard readings may use
+            shed_fraction: Fraction of the limit at which shedding starts
+            max_loop_lag: Event-loop lag (seconds) that also counts as overload
+            max_sensors: Buckets kept before the least recently used is evicted
+            loop_lag: Callable returning the latest event-loop lag sample
+            clock: Monotonic clock
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.priority_limit = max_in_flight + priority_reserve
+        self.shed_threshold = max(1, int(max_in_flight * shed_fraction))
+        self.max_loop_lag = max_loop_lag
+        self.max_sensors = max_sensors
+        self.loop_lag = loop_lag
+        self.clock = clock
+        self.in_flight = 0
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Count a request as in flight for the duration of the block."""
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def overloaded(self) -> bool:
+        """Whether routine readings should currently be shed."""
+        return self.in_flight > self.shed_threshold or self.loop_lag() > self.max_loop_lag
+
+    def admit(self, sensor_type: str, data: SensorData) -> Decision:
+        """
+        Decide on one validated reading.
+
+        Args:
+            sensor_type: Sensor category
+            data: Validated reading
+
+        Returns:
+            Admission decision
+        """
+        counters = self.counters.get(sensor_type)
+        if counters is None:
+            counters = self.counters[sensor_type] = {
+                "admitted": 0, "priority": 0, "rate_limited": 0, "shed": 0, "saturated": 0
+            }
+
+        priority = near_hazard(sensor_type, data)
+        if priority:
+            if self.in_flight > self.priority_limit:
+                counters["saturated"] += 1
+                return Decision.SATURATED
+        elif self.in_flight > self.max_in_flight or self.overloaded():
+            counters["shed"] += 1
+            return Decision.SHED
+
+        if not self._bucket(sensor_type, data).try_acquire(self.clock()):
+            counters["rate_limited"] += 1
+            return Decision.RATE_LIMITED
+
+        counters["admitted"] += 1
+        if priority:
+            counters["priority"] += 1
+        return Decision.ADMIT
+
+    def retry_after(self, sensor_type: str, data: SensorData) -> int:
+        """Whole seconds a rate-limited sensor should wait before retrying."""
+        bucket = self._buckets.get(self.sensor_key(sensor_type, data))
+        return max(1, math.ceil(bucket.retry_after())) if bucket else 1
+
+    def snapshot(self) -> dict:
+        """Current state and counters for the API."""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "priority_limit": self.priority_limit,
+            "shed_threshold": self.shed_threshold,
+            "overloaded": self.overloaded(),
+            "rate_per_sensor": self.rate,
+            "burst_per_sensor": self.burst,
+            "tracked_sensors": len(self._buckets),
+            "counters": {sensor: dict(values) for sensor, values in self.counters.items()},
+        }
+
+    @staticmethod
+    def sensor_key(sensor_type: str, data: SensorData) -> str:
+        """Rate-limit key: the sensor ID, or the sensor position when no ID is sent."""
+        if data.sensor_id:
+            return f"{sensor_type}:{data.sensor_id}"
+        return f"{sensor_type}@{data.latitude:.4f},{data.longitude:.4f}"
+
+    def _bucket(self, sensor_type: str, data: SensorData) -> TokenBucket:
+        key = self.sensor_key(sensor_type, data)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst, self.clock())
+            if len(self._buckets) > self.max_sensors:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
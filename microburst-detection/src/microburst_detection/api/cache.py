@@ -0,0 +1,204 @@
+# src/microburst_detection/api/cache.py
+"""Serialized response cache tied to the detection store version."""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from time import monotonic
+from typing import Hashable, Optional, Tuple
+
+from ..storage.detection_store import DetectionStore
+
+
+class CachedResponse:
+    """Serialized body plus the window facts needed to revalidate it."""
+
+    __slots__ = ("body", "etag", "version", "oldest")
+
+    def __init__(self, body: bytes, version: int, oldest: Optional[float]) -> None:
+        self.body = body
+        self.etag = '"' + blake2b(body, digest_size=12).hexdigest() + '"'
+        self.version = version
+        self.oldest = oldest
+
+
+class ResponseCache:
+    """
+    LRU cache of serialized query responses.
+
+    An entry stays valid while no detection stored after it falls inside the
+    queried window and none of the detections it contains has slid out of
+    the window. Detections outside the window bump the store version without
+    evicting anything.
+    """
+
+    def __init__(self, store: DetectionStore, max_entries: int = 256) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            store: Detection store whose version drives invalidation
+            max_entries: Maximum number of cached responses
+        """
+        self.store = store
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: Hashable,
+        since: Optional[float],
+        until: Optional[float] = None
+    ) -> Optional[CachedResponse]:
+        """
+        Look up a still-valid response for a query window.
+
+        Args:
+            key: Query identity (endpoint and parameters)
+            since: Current window start (epoch seconds)
+            until: Window end, or None for open-ended windows
+
+        Returns:
+            Cached response, or None when missing or stale
+        """
+        entry = self._entries.get(key)
+        if entry is None or not self._is_valid(entry, since, until):
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        body: bytes,
+        version: int,
+        oldest: Optional[float]
+    ) -> CachedResponse:
+        """
+        Store a serialized response.
+
+        Args:
+            key: Query identity
+            body: Serialized response body
+            version: Store version read *before* the response was computed
+            oldest: Earliest detection timestamp included in the response
+
+        Returns:
+            The cached entry
+        """
+        entry = CachedResponse(body, version, oldest)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_valid(
+        self,
+        entry: CachedResponse,
+        since: Optional[float],
+        until: Optional[float]
+    ) -> bool:
+        """Check an entry against the current window and store contents."""
+        if since is not None and entry.oldest is not None and entry.oldest < since:
+            return False
+
+        version = self.store.version
+        if version != entry.version:
+            if self.store.changed_since(entry.version, since, until):
+                return False
+            entry.version = version
+        return True
+
+
+class SnapshotCache:
+    """
+    Short-lived cache of payloads that mix store contents with live state.
+
+    An entry is served while the store version is unchanged and it is at
+    most ``ttl`` seconds old, which bounds how stale the live parts get.
+    """
+
+    def __init__(self, store: DetectionStore, ttl: float = 1.0, max_entries: int = 256) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            store: Detection store whose version drives invalidation
+            ttl: Maximum entry age in seconds
+            max_entries: Maximum number of cached payloads
+        """
+        self.store = store
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, CachedResponse]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the cached payload for ``key`` if it is still fresh."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        created, entry = item
+        if entry.version != self.store.version or monotonic() - created > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, body: bytes, version: int) -> CachedResponse:
+        """
+        Store a payload.
+
+        Args:
+            key: Query identity
+            body: Serialized payload
+            version: Store version read *before* the payload was computed
+
+        Returns:
+            The cached entry
+        """
+        entry = CachedResponse(body, version, None)
+        self._entries[key] = (monotonic(), entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an ``If-None-Match`` header against an entity tag.
+
+    Args:
+        if_none_match: Raw header value
+        etag: Current entity tag
+
+    Returns:
+        True when the client already holds this representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -0,0 +1,119 @@
+# src/microburst_detection/api/metrics.py
+"""Application metrics exposed on ``/metrics`` for Prometheus."""
+
+import asyncio
+
+from ..utils.metrics import MetricsRegistry
+
+SENSOR_TYPES = ("lidar", "radar", "anemometer")
+STAGES = ("validation", "detection", "fusion", "serialization", "broadcast")
+
+registry = MetricsRegistry()
+
+INGEST_REQUESTS = registry.counter(
+    "microburst_ingest_requests_total",
+    "Sensor readings received per sensor type and outcome",
+    ("sensor_type", "outcome")
+)
+DETECTIONS = registry.counter(
+    "microburst_detections_total",
+    "Microburst detections per sensor type and severity",
+    ("sensor_type", "severity")
+)
+STAGE_LATENCY = registry.histogram(
+    "microburst_stage_latency_seconds",
+    "Time spent in each ingest pipeline stage",
+    ("stage", "sensor_type")
+)
+HISTORY_SIZE = registry.gauge(
+    "microburst_detection_history_size",
+    "Detections held in the detection store",
+    multiprocess_mode="max"
+)
+PERSIST_PENDING = registry.gauge(
+    "microburst_persistence_pending",
+    "Detections queued for the background database writer"
+)
+PERSIST_WRITTEN = registry.gauge(
+    "microburst_persistence_written",
+    "Detections written to the database since startup"
+)
+PERSIST_DROPPED = registry.gauge(
+    "microburst_persistence_dropped",
+    "Detections dropped because the persistence queue was full"
+)
+ARCHIVED_READINGS = registry.gauge(
+    "microburst_raw_archive_readings",
+    "Readings appended to the raw sensor archive since startup"
+)
+WARMUP_DURATION = registry.gauge(
+    "microburst_warmup_duration_seconds",
+    "Time spent warming up each detection path at startup",
+    ("path",),
+    multiprocess_mode="max"
+)
+WS_CLIENTS = registry.gauge(
+    "microburst_websocket_clients",
+    "Connected WebSocket clients"
+)
+WS_QUEUE_DEPTH = registry.gauge(
+    "microburst_websocket_queue_depth",
+    "Messages waiting in WebSocket client send queues",
+    ("aggregate",),
+    multiprocess_mode="all"
+)
+WS_DROPPED = registry.counter(
+    "microburst_websocket_dropped_messages_total",
+    "Messages dropped because a client send queue was full"
+)
+RESPONSE_CACHE = registry.counter(
+    "microburst_response_cache_requests_total",
+    "Query responses served from cache (hit) or recomputed (miss)",
+    ("endpoint", "result")
+)
+LATENCY_ALARMS = registry.counter(
+    "microburst_latency_budget_breaches_total",
+    "Sensor/site latency budget breaches raised by the alarm"
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "microburst_event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wakeup and when it ran",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+# Pre-resolved children keep label lookups off the per-reading path
+OUTCOMES = {
+    sensor: {
+        outcome: INGEST_REQUESTS.labels(sensor, outcome)
+        for outcome in ("accepted", "invalid", "error", "rate_limited", "shed", "saturated")
+    }
+    for sensor in SENSOR_TYPES
+}
+STAGE_TIMERS = {
+    sensor: {stage: STAGE_LATENCY.labels(stage, sensor) for stage in STAGES}
+    for sensor in SENSOR_TYPES
+}
+
+
+_latest_loop_lag = 0.0
+
+
+def current_loop_lag() -> float:
+    """Most recent event-loop lag sample in seconds."""
+    return _latest_loop_lag
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """
+    Sample event-loop lag by measuring how late a fixed sleep wakes up.
+
+    Args:
+        interval: Seconds between samples
+    """
+    global _latest_loop_lag
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        _latest_loop_lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG.observe(_latest_loop_lag)
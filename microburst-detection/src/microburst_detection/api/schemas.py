@@ -10,7 +10,7 @@ from ..core.models import (
     LidarData,
     DopplerRadarData,
     AnemometerData,
-    MicroburstDetection,
+    MicroburstDetection,  # noqa: F401  (re-exported)
     SeverityLevel,
     DetectionMethod
 )
@@ -46,6 +46,7 @@ class DetectionResponseSchema(BaseModel):
     radius: float
     duration_seconds: int
     alert_level: str
+    site: Optional[str] = None
     additional_data: Optional[dict] = None
 
 
@@ -64,3 +65,53 @@ class StatisticsSchema(BaseModel):
     avg_confidence: float
     avg_wind_shear: float
     period_days: int
+
+
+class DashboardSyncSchema(BaseModel):
+    """Dashboard delta-sync response schema."""
+    cursor: str = Field(..., description="Pass back as ?cursor= on the next sync")
+    full: bool = Field(..., description="True when detections replaces the client's detections")
+    window_start: datetime = Field(
+        ..., description="Detections older than this have left the window"
+    )
+    detections: list[DetectionResponseSchema]
+    stats: Optional[StatisticsSchema] = Field(
+        None, description="Null when unchanged since the cursor"
+    )
+    health: HealthCheckSchema
+
+
+class SeriesSchema(BaseModel):
+    """Time-bucketed detection series (columnar; one entry per bucket)."""
+    resolution: int = Field(..., description="Bucket size in seconds")
+    since: float = Field(..., description="Range start (epoch seconds)")
+    until: float = Field(..., description="Range end (epoch seconds)")
+    starts: list[int] = Field(..., description="Bucket start times (epoch seconds)")
+    count: list[int]
+    severity: dict[str, list[int]] = Field(..., description="Counts per severity level")
+    max_wind_shear: list[Optional[float]]
+    mean_wind_shear: list[Optional[float]]
+    mean_confidence: list[Optional[float]]
+
+
+class LatencySummarySchema(BaseModel):
+    """Latency percentiles for one sensor type, site and stage (seconds)."""
+    sensor_type: str
+    site: str
+    stage: str = Field(..., description="ingest, detection, fusion or delivery")
+    count: int
+    mean: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+    max: float
+    window_count: int = Field(..., description="Samples in the rolling window")
+    window_p99: Optional[float] = None
+
+
+class LatencyReportSchema(BaseModel):
+    """End-to-end latency report."""
+    budget_seconds: float
+    window_seconds: float
+    summaries: list[LatencySummarySchema]
+    breaches: list[LatencySummarySchema]
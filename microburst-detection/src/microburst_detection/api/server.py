@@ -1,25 +1,51 @@
 # src/microburst_detection/api/server.py
 """FastAPI server for microburst detection system."""
 
-import logging
-from contextlib import asynccontextmanager
-from typing import Optional, Union
+import asyncio
+import json
+import os
+import tempfile
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter, time
+from typing import AsyncIterator, Awaitable, Callable, Optional, Sequence, Union
 
+import numpy as np
 import structlog
-from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 from ..core.detector import MicroburstDetector
+from ..core.models import DetectionMethod, SensorData
+from ..core.records import DetectionRecord
+from ..storage.detection_store import Cursor, StoredDetection, create_store
+from ..storage.archive import RawArchiveWriter
+from ..storage.persistence import DetectionWriter, sqlite_path_from_url
+from ..storage.series import SeriesIndex, lttb
 from ..utils.config import Settings
+from ..utils.latency import LatencyTracker
+from ..utils.metrics import MultiProcessCollector
+from ..utils.timeutils import from_epoch, to_epoch
+from . import metrics
+from .admission import AdmissionController, Decision
+from .cache import CachedResponse, ResponseCache, SnapshotCache, etag_matches
 from .schemas import (
     LidarDataSchema,
     RadarDataSchema,
     AnemometerDataSchema,
+    DashboardSyncSchema,
     DetectionResponseSchema,
-    HealthCheckSchema
+    HealthCheckSchema,
+    LatencyReportSchema,
+    SeriesSchema,
+    StatisticsSchema
 )
+from .warmup import warm_up
 
 # Configure structured logging
 structlog.configure(
@@ -42,42 +68,429 @@ structlog.configure(
 logger = structlog.get_logger()
 settings = Settings()
 
+SENSOR_TYPE_BY_METHOD = {
+    DetectionMethod.LIDAR: "lidar",
+    DetectionMethod.DOPPLER_RADAR: "radar",
+    DetectionMethod.ANEMOMETER: "anemometer",
+}
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """
+    Manages WebSocket connections for real-time updates.
+    
+    Each client gets a bounded send queue drained by its own writer task, so
+    a slow client never delays ingest or the other clients. Messages are
+    serialized once per broadcast rather than once per client.
+    """
     
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        queue_size: int = 1000,
+        on_delivered: Optional[Callable[[tuple], None]] = None
+    ) -> None:
         self.active_connections: list[WebSocket] = []
+        self.queue_size = queue_size
+        self.on_delivered = on_delivered
+        self._queues: dict[WebSocket, asyncio.Queue] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
     
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept and register a new WebSocket connection."""
+    async def connect(self, websocket: WebSocket, hold: bool = False) -> None:
+        """
+        Accept and register a new WebSocket connection.
+        
+        Args:
+            websocket: Client connection
+            hold: Queue broadcasts for the client without sending them until
+                ``release``
+        """
         await websocket.accept()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[websocket] = queue
+        if not hold:
+            self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         self.active_connections.append(websocket)
         logger.info("websocket_connected", clients=len(self.active_connections))
     
+    def release(
+        self,
+        websocket: WebSocket,
+        first: Sequence[Union[dict, str]],
+        after_seq: int
+    ) -> None:
+        """
+        Start sending to a held client, ``first`` ahead of what was held.
+        
+        Held detections with a sequence number up to ``after_seq`` are
+        dropped, as ``first`` already carries them.
+        
+        Args:
+            websocket: Client connected with ``hold=True``
+            first: Messages to send before the held broadcasts
+            after_seq: Last detection sequence number in ``first``
+        """
+        held = self._queues.get(websocket)
+        if held is None or websocket in self._writers:
+            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[websocket] = queue
+        for message in first:
+            self.send(websocket, message)
+        while not held.empty():
+            text, trace = held.get_nowait()
+            if json.loads(text).get("seq", after_seq + 1) <= after_seq:
+                continue
+            try:
+                queue.put_nowait((text, trace))
+            except asyncio.QueueFull:
+                metrics.WS_DROPPED.inc()
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+    
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info("websocket_disconnected", clients=len(self.active_connections))
     
-    async def broadcast(self, message: dict) -> None:
-        """Send message to all connected clients."""
-        for connection in self.active_connections:
+    async def broadcast(self, message: Union[dict, str], trace: Optional[tuple] = None) -> None:
+        """
+        Queue a message for all connected clients.
+        
+        Args:
+            message: Dict or pre-serialized JSON text
+            trace: Opaque value handed to ``on_delivered`` after each send
+        """
+        if not self._queues:
+            return
+        text = message if isinstance(message, str) else json.dumps(message)
+        for queue in self._queues.values():
+            try:
+                queue.put_nowait((text, trace))
+            except asyncio.QueueFull:
+                metrics.WS_DROPPED.inc()
+    
+    def send(self, websocket: WebSocket, message: Union[dict, str]) -> bool:
+        """
+        Queue a message for one client, behind anything already queued for it.
+        
+        Returns:
+            False if the client is gone or its queue is full
+        """
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        text = message if isinstance(message, str) else json.dumps(message)
+        try:
+            queue.put_nowait((text, None))
+        except asyncio.QueueFull:
+            metrics.WS_DROPPED.inc()
+            return False
+        return True
+    
+    def queue_depths(self) -> list[int]:
+        """Pending message count per connected client."""
+        return [queue.qsize() for queue in self._queues.values()]
+    
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Drain one client's queue onto its socket."""
+        while True:
+            text, trace = await queue.get()
             try:
-                await connection.send_json(message)
+                await websocket.send_text(text)
             except Exception as e:
                 logger.error("broadcast_error", error=str(e))
+                await self.disconnect(websocket)
+                return
+            if trace is not None and self.on_delivered is not None:
+                self.on_delivered(trace)
+
+
+admission = AdmissionController(
+    rate=settings.sensor_rate_limit,
+    burst=settings.sensor_burst,
+    max_in_flight=settings.ingest_concurrency,
+    priority_reserve=settings.ingest_priority_reserve,
+    shed_fraction=settings.shed_fraction,
+    max_loop_lag=settings.shed_loop_lag,
+    loop_lag=metrics.current_loop_lag
+)
+latency_tracker = LatencyTracker(
+    window_seconds=settings.latency_window_seconds, max_sites=settings.latency_max_sites
+)
+
+
+def _record_delivery(trace: tuple) -> None:
+    """Record sensor-to-client latency once a detection has been sent."""
+    sensor_type, site, sensor_epoch = trace
+    latency_tracker.record(sensor_type, site, "delivery", time() - sensor_epoch)
+
+
+manager = ConnectionManager(
+    queue_size=settings.websocket_queue_size, on_delivered=_record_delivery
+)
+detector = MicroburstDetector(
+    store=create_store(settings.state_backend, Path(settings.state_path)),
+    stateful=settings.stateful_detection
+)
+# A shared SQLite state backend is already durable; otherwise mirror the
+# in-memory history to database_url in the background.
+writer: Optional[DetectionWriter] = None
+if settings.persist_detections and not detector.store.shared:
+    writer = DetectionWriter(
+        sqlite_path_from_url(settings.database_url),
+        batch_size=settings.persist_batch_size,
+        flush_interval=settings.persist_flush_interval,
+        max_pending=settings.persist_max_pending
+    )
+    detector.store.on_add = writer.submit
+archive: Optional[RawArchiveWriter] = None
+if settings.raw_archive_enabled:
+    archive = RawArchiveWriter(
+        Path(settings.raw_archive_path),
+        max_segment_bytes=settings.raw_archive_segment_mb * 1024 * 1024,
+        max_segment_seconds=settings.raw_archive_segment_seconds
+    )
+# With several workers, /metrics combines every worker's registry
+collector: Optional[MultiProcessCollector] = None
+if settings.metrics_dir:
+    collector = MultiProcessCollector(
+        metrics.registry,
+        Path(settings.metrics_dir),
+        stale_after=max(30.0, 3 * settings.metrics_publish_interval)
+    )
+readiness = {"ready": False}
+response_cache = ResponseCache(detector.store, max_entries=settings.response_cache_size)
+sync_cache = SnapshotCache(
+    detector.store, ttl=settings.dashboard_sync_ttl, max_entries=settings.response_cache_size
+)
+series_index = SeriesIndex(detector.store)
+# Longest range /series and /series/trace can answer in full: the state
+# backend is pruned past the history retention, and after a restart the
+# memory backend only gets persist_load_hours of it back
+retained_hours = settings.history_retention_hours
+if writer is not None and settings.persist_load_hours:
+    retained_hours = min(retained_hours, settings.persist_load_hours)
+cache_counters = {
+    endpoint: {
+        result: metrics.RESPONSE_CACHE.labels(endpoint, result) for result in ("hit", "miss")
+    }
+    for endpoint in ("detections", "stats")
+}
+
+
+async def relay_remote_detections(interval: float) -> None:
+    """
+    Broadcast detections stored by other worker processes.
+    
+    Each worker broadcasts its own detections immediately; detections made
+    by sibling workers reach this worker's WebSocket clients through the
+    shared store.
+    
+    Args:
+        interval: Seconds between store polls
+    """
+    pid = os.getpid()
+    last_seq = detector.store.version
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            changes = await detector.read(detector.store.changes_since, last_seq)
+        except Exception as e:
+            logger.error("relay_error", error=str(e))
+            continue
+        for change in changes:
+            last_seq = change.seq
+            if change.origin != pid:
+                detection = change.detection
+                await manager.broadcast(
+                    {"type": "detection", "seq": change.seq, "data": detection.to_dict()},
+                    trace=(
+                        SENSOR_TYPE_BY_METHOD.get(detection.detection_method, "fusion"),
+                        detection.site,
+                        to_epoch(detection.timestamp)
+                    )
+                )
+
+
+async def flush_raw_archive(interval: float, retention_hours: float) -> None:
+    """
+    Periodically push buffered archive records to disk so readers see them.
+    
+    Flushes run in a worker thread so the write calls never stall the
+    event loop. With a retention set, sealed segments past it are deleted
+    once a minute, also in a worker thread since it lists and reads every
+    sidecar.
+    
+    Args:
+        interval: Seconds between flushes
+        retention_hours: Segment retention (0 keeps every segment)
+    """
+    pruned_at = 0.0
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(archive.flush)
+        if retention_hours and time() - pruned_at >= 60.0:
+            pruned_at = time()
+            await asyncio.to_thread(archive.prune, retention_hours * 3600)
+
+
+async def warm_up_and_mark_ready() -> None:
+    """
+    Warm every detection path, then report ready on ``/ready``.
+    
+    Started once the server accepts connections, so probes get 503 until
+    warm-up finishes. Warm-up runs on its own event loop in a worker thread
+    with a throwaway detector: what it warms is process-wide (imports,
+    first-call dispatch, validators), and this loop keeps serving requests
+    and sampling its lag meanwhile. A failed warm-up is logged and the
+    server reports ready anyway, cold.
+    """
+    if settings.warmup_enabled:
+        try:
+            durations = await asyncio.to_thread(asyncio.run, warm_up(settings.warmup_iterations))
+        except Exception as e:
+            logger.error("warmup_failed", error=str(e))
+        else:
+            for path, seconds in durations.items():
+                metrics.WARMUP_DURATION.labels(path).set(seconds)
+            logger.info("warmup_complete", **{k: round(v, 4) for k, v in durations.items()})
+    readiness["ready"] = True
+
+
+async def publish_metrics(interval: float) -> None:
+    """
+    Periodically share this worker's metrics with the other workers.
+    
+    The snapshot is taken on the event loop, where the registry is updated,
+    and written to the metrics directory in a worker thread.
+    
+    Args:
+        interval: Seconds between snapshots
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await _refresh_gauges()
+        await asyncio.to_thread(collector.write, metrics.registry.snapshot())
 
 
-manager = ConnectionManager()
-detector = MicroburstDetector()
+async def prune_history(retention_hours: float, interval: float = 60.0) -> None:
+    """
+    Periodically delete detections past the history retention.
+    
+    Keeps the in-memory history and its time index, or the shared state
+    database, bounded on a long-running server. A shared store is pruned in
+    a worker thread. Cached responses are dropped after a prune, as they may
+    still hold the deleted detections.
+    
+    Args:
+        retention_hours: Hours of detections kept
+        interval: Seconds between prunes
+    """
+    while True:
+        await asyncio.sleep(interval)
+        before = time() - retention_hours * 3600
+        try:
+            if detector.store.shared:
+                pruned = await asyncio.to_thread(detector.store.prune, before)
+            else:
+                pruned = detector.store.prune(before)
+        except Exception as e:
+            logger.error("history_prune_error", error=str(e))
+            continue
+        if pruned:
+            response_cache.clear()
+            logger.info("history_pruned", detections=pruned)
+
+
+async def watch_latency_budget(budget_seconds: float, interval: float) -> None:
+    """
+    Raise an alarm while the rolling p99 latency is over budget.
+    
+    Breaches are logged and pushed to WebSocket clients as
+    ``latency_alarm`` messages.
+    
+    Args:
+        budget_seconds: End-to-end latency budget
+        interval: Seconds between checks
+    """
+    while True:
+        await asyncio.sleep(interval)
+        breaches = latency_tracker.breaches(budget_seconds)
+        if not breaches:
+            continue
+        metrics.LATENCY_ALARMS.inc(len(breaches))
+        for breach in breaches:
+            logger.warning(
+                "latency_budget_exceeded",
+                sensor_type=breach["sensor_type"],
+                site=breach["site"],
+                stage=breach["stage"],
+                p99=breach["window_p99"],
+                budget=budget_seconds
+            )
+        await manager.broadcast({
+            "type": "latency_alarm",
+            "data": {"budget_seconds": budget_seconds, "breaches": breaches}
+        })
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan context manager."""
-    logger.info("app_startup", version="1.0.0", environment=settings.environment)
+    logger.info(
+        "app_startup",
+        version="1.0.0",
+        environment=settings.environment,
+        state_backend=settings.state_backend,
+        pid=os.getpid()
+    )
+    background = [
+        asyncio.create_task(metrics.monitor_event_loop_lag(settings.loop_lag_interval)),
+        asyncio.create_task(prune_history(settings.history_retention_hours)),
+    ]
+    if writer is not None:
+        since = time() - settings.persist_load_hours * 3600
+        loaded = await asyncio.to_thread(writer.load_recent, detector.store, since)
+        logger.info("history_loaded", detections=loaded, database=str(writer.path))
+        background.append(asyncio.create_task(writer.run()))
+    if archive is not None:
+        background.append(
+            asyncio.create_task(flush_raw_archive(
+                settings.raw_archive_flush_interval, settings.raw_archive_retention_hours
+            ))
+        )
+    if settings.latency_alarm_enabled:
+        background.append(asyncio.create_task(watch_latency_budget(
+            settings.latency_budget_seconds, settings.latency_alarm_interval
+        )))
+    if detector.store.shared:
+        background.append(
+            asyncio.create_task(relay_remote_detections(settings.broadcast_poll_interval))
+        )
+    if collector is not None:
+        background.append(
+            asyncio.create_task(publish_metrics(settings.metrics_publish_interval))
+        )
+    background.append(asyncio.create_task(warm_up_and_mark_ready()))
     yield
+    readiness["ready"] = False
+    for task in background:
+        task.cancel()
+    for task in background:
+        with suppress(asyncio.CancelledError):
+            await task
+    if writer is not None:
+        writer.close()
+    if archive is not None:
+        archive.close()
+    if collector is not None:
+        # Final counts, so they stay in the service totals after this worker exits
+        collector.write(metrics.registry.snapshot())
+    detector.store.close()
     logger.info("app_shutdown")
 
 
@@ -101,6 +514,20 @@ app.add_middleware(
 )
 
 
+@app.get("/ready")
+async def readiness_check() -> JSONResponse:
+    """
+    Readiness probe.
+    
+    Returns:
+        200 once warm-up has finished and history is loaded, 503 before
+        that and while shutting down
+    """
+    if not readiness["ready"]:
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return JSONResponse(content={"status": "ready"})
+
+
 @app.get("/health", response_model=HealthCheckSchema)
 async def health_check() -> HealthCheckSchema:
     """
@@ -116,129 +543,391 @@ async def health_check() -> HealthCheckSchema:
     )
 
 
-@app.post("/detect/lidar", response_model=Union[DetectionResponseSchema, None])
-async def analyze_lidar_data(data: LidarDataSchema) -> Optional[DetectionResponseSchema]:
+def _request_body(schema: type[BaseModel]) -> dict:
+    """OpenAPI request body for endpoints that validate the payload themselves."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema.model_json_schema()}}
+        }
+    }
+
+
+async def _ingest(
+    request: Request,
+    sensor_type: str,
+    schema: type[SensorData],
+    process: Callable[[SensorData], Awaitable[Optional[DetectionRecord]]],
+    log_event: str
+) -> Response:
     """
-    Process LIDAR sensor data and detect microbursts.
+    Run one sensor reading through validation, detection, fusion and broadcast.
+    
+    The request counts against the ingest concurrency limit from the moment
+    it arrives. After validation the admission controller may rate-limit
+    (429) any reading and shed (503) routine ones. Near-hazard readings are
+    never shed; they are refused (503) only when the concurrency limit and
+    its priority reserve are both exhausted. Each stage is timed into
+    ``microburst_stage_latency_seconds``. The detection is serialized once and
+    the same bytes are used for the HTTP response and the WebSocket broadcast.
+    Every other detection the reading stored (e.g. anemometer station surges)
+    is broadcast too; the detector returns a detection whenever it stored any.
     
     Args:
-        data: LIDAR measurement data
+        request: Incoming request carrying the JSON reading
+        sensor_type: Metrics label for the sensor
+        schema: Pydantic model used to validate the body
+        process: Detector coroutine for this sensor type
+        log_event: Structured log event name for detections
         
     Returns:
-        Detection result or None if no microburst detected
+        JSON response with the detection or ``null``
     """
-    try:
-        result = await detector.process_lidar(data)
+    received_at = time()
+    received = perf_counter()
+    outcomes = metrics.OUTCOMES[sensor_type]
+    timers = metrics.STAGE_TIMERS[sensor_type]
+    with admission.slot():
+        body = await request.body()
+        
+        started = perf_counter()
+        try:
+            data = schema.model_validate_json(body)
+        except ValidationError as e:
+            outcomes["invalid"].inc()
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+        validated = perf_counter()
+        timers["validation"].observe(validated - started)
+        
+        decision = admission.admit(sensor_type, data)
+        if decision is Decision.RATE_LIMITED:
+            outcomes["rate_limited"].inc()
+            raise HTTPException(
+                status_code=429,
+                detail="Sensor rate limit exceeded",
+                headers={"Retry-After": str(admission.retry_after(sensor_type, data))}
+            )
+        if decision is Decision.SHED:
+            outcomes["shed"].inc()
+            raise HTTPException(
+                status_code=503,
+                detail="Server overloaded; routine reading shed",
+                headers={"Retry-After": "1"}
+            )
+        if decision is Decision.SATURATED:
+            outcomes["saturated"].inc()
+            raise HTTPException(
+                status_code=503,
+                detail="Server saturated; near-hazard reading not processed, retry",
+                headers={"Retry-After": "1"}
+            )
+        
+        if archive is not None:
+            archive.append(sensor_type, data)
+        
+        try:
+            with detector.capture() as stored:
+                result = await process(data)
+            detected = perf_counter()
+            timers["detection"].observe(detected - validated)
         
-        if result:
+            detector.fuse(data)
+            fused = perf_counter()
+            timers["fusion"].observe(fused - detected)
+        except Exception as e:
+            outcomes["error"].inc()
+            logger.error(f"{sensor_type}_processing_error", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+        
+        outcomes["accepted"].inc()
+        if result is None:
+            return Response(content=b"null", media_type="application/json")
+        
+        sensor_epoch = to_epoch(data.timestamp)
+        site = data.site
+        # Wall-clock stage times derived from one time() call plus perf_counter offsets
+        latency_tracker.record(sensor_type, site, "ingest", received_at - sensor_epoch)
+        latency_tracker.record(
+            sensor_type, site, "detection", received_at + (detected - received) - sensor_epoch
+        )
+        latency_tracker.record(
+            sensor_type, site, "fusion", received_at + (fused - received) - sensor_epoch
+        )
+        
+        for _, detection in stored:
+            metrics.DETECTIONS.labels(sensor_type, detection.severity.value).inc()
             logger.info(
-                "microburst_detected",
-                event_id=result.event_id,
-                severity=result.severity.value,
-                confidence=result.confidence
+                log_event,
+                event_id=detection.event_id,
+                severity=detection.severity.value,
+                confidence=detection.confidence
             )
-            await manager.broadcast({"type": "detection", "data": result.model_dump()})
-            # Convert MicroburstDetection to DetectionResponseSchema
-            return DetectionResponseSchema(**result.model_dump())
         
-        return None
+        payload = result.to_json()
+        serialized = perf_counter()
+        timers["serialization"].observe(serialized - fused)
+        
+        # Every detection stored for this reading (station surges and network
+        # outflows as well as the returned one), in store order
+        for seq, detection in stored:
+            if detection is result:
+                message, trace = payload, (sensor_type, site, sensor_epoch)
+            else:
+                message = detection.to_json()
+                trace = (sensor_type, detection.site, to_epoch(detection.timestamp))
+            await manager.broadcast(
+                f'{{"type": "detection", "seq": {seq}, "data": ' + message + '}', trace=trace
+            )
+        timers["broadcast"].observe(perf_counter() - serialized)
+        
+        return Response(content=payload, media_type="application/json")
+
+
+@app.post(
+    "/detect/lidar",
+    response_model=Union[DetectionResponseSchema, None],
+    openapi_extra=_request_body(LidarDataSchema)
+)
+async def analyze_lidar_data(request: Request) -> Response:
+    """
+    Process LIDAR sensor data and detect microbursts.
     
-    except Exception as e:
-        logger.error("lidar_processing_error", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    Args:
+        request: Request with a LIDAR measurement body
+        
+    Returns:
+        Detection result or None if no microburst detected
+    """
+    return await _ingest(
+        request, "lidar", LidarDataSchema, detector.process_lidar, "microburst_detected"
+    )
 
 
-@app.post("/detect/radar", response_model=Union[DetectionResponseSchema, None])
-async def analyze_radar_data(data: RadarDataSchema) -> Optional[DetectionResponseSchema]:
+@app.post(
+    "/detect/radar",
+    response_model=Union[DetectionResponseSchema, None],
+    openapi_extra=_request_body(RadarDataSchema)
+)
+async def analyze_radar_data(request: Request) -> Response:
     """
     Process Doppler radar data and detect microbursts.
     
     Args:
-        data: Doppler radar measurement data
+        request: Request with a Doppler radar measurement body
         
     Returns:
         Detection result or None if no microburst detected
     """
-    try:
-        result = await detector.process_radar(data)
-        
-        if result:
-            logger.info(
-                "microburst_detected_radar",
-                event_id=result.event_id,
-                severity=result.severity.value
-            )
-            await manager.broadcast({"type": "detection", "data": result.model_dump()})
-            # Convert MicroburstDetection to DetectionResponseSchema
-            return DetectionResponseSchema(**result.model_dump())
-        
-        return None
-    
-    except Exception as e:
-        logger.error("radar_processing_error", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _ingest(
+        request, "radar", RadarDataSchema, detector.process_radar, "microburst_detected_radar"
+    )
 
 
-@app.post("/detect/anemometer", response_model=Optional[DetectionResponseSchema])
-async def analyze_anemometer_data(data: AnemometerDataSchema) -> Optional[DetectionResponseSchema]:
+@app.post(
+    "/detect/anemometer",
+    response_model=Optional[DetectionResponseSchema],
+    openapi_extra=_request_body(AnemometerDataSchema)
+)
+async def analyze_anemometer_data(request: Request) -> Response:
     """
     Process anemometer data and detect microbursts.
     
     Args:
-        data: Anemometer measurement data
+        request: Request with an anemometer measurement body
         
     Returns:
         Detection result or None if no microburst detected
     """
+    return await _ingest(
+        request,
+        "anemometer",
+        AnemometerDataSchema,
+        detector.process_anemometer,
+        "microburst_detected_anemometer"
+    )
+
+
+def _cached_response(request: Request, entry: CachedResponse) -> Response:
+    """Serve a cached body, or ``304 Not Modified`` when the client's ETag matches."""
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    return urlsafe_b64encode(f"{cursor[0]!r}:{cursor[1]}".encode()).decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a token produced by ``encode_cursor``."""
     try:
-        result = await detector.process_anemometer(data)
-        
-        if result:
-            logger.info(
-                "microburst_detected_anemometer",
-                event_id=result.event_id,
-                severity=result.severity.value
-            )
-            await manager.broadcast({"type": "detection", "data": result.model_dump()})
-            # Convert MicroburstDetection to DetectionResponseSchema
-            return DetectionResponseSchema(**result.model_dump())
-        
-        return None
+        ts, seq = urlsafe_b64decode(token.encode()).decode().split(":")
+        return float(ts), int(seq)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _stream_ndjson(
+    since: float,
+    until: Optional[float],
+    severity: Optional[str],
+    after: Optional[Cursor],
+    limit: Optional[int],
+    page_size: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    Serialize a window lazily as newline-delimited JSON.
     
-    except Exception as e:
-        logger.error("anemometer_processing_error", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    Rows are read one keyset page at a time through ``detector.read`` (off
+    the event loop for a shared store); one chunk is emitted per row so only
+    the current store page is in memory.
+    """
+    count = 0
+    while True:
+        rows = await detector.read(detector.store.page, since, until, severity, after, page_size)
+        for row in rows:
+            yield row.detection.to_json().encode() + b"\n"
+            count += 1
+            if limit is not None and count >= limit:
+                return
+        if len(rows) < page_size:
+            return
+        after = rows[-1].cursor
 
 
-@app.get("/detections", response_model=list[DetectionResponseSchema])
+@app.get(
+    "/detections",
+    response_model=list[DetectionResponseSchema],
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
 async def get_detections(
+    request: Request,
     severity: Optional[str] = Query(None),
-    hours: int = Query(24, ge=1, le=168)
-) -> list[DetectionResponseSchema]:
+    hours: int = Query(24, ge=1, le=168),
+    since: Optional[datetime] = Query(None, description="Window start (overrides hours)"),
+    until: Optional[datetime] = Query(None, description="Window end (exclusive)"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json or ndjson")
+) -> Response:
     """
     Retrieve historical microburst detections.
     
+    Plain ``hours``/``severity`` queries are cached and carry an ``ETag``;
+    the cached bytes are reused until a new detection lands inside the
+    requested window. Passing ``limit`` or ``cursor`` switches to keyset
+    pagination in (timestamp, sequence) order, with the next page token
+    in the ``X-Next-Cursor`` header. ``format=ndjson`` streams rows lazily
+    from the store, one page in memory at a time.
+    
     Args:
+        request: Incoming request (for ``If-None-Match``)
         severity: Filter by severity level (optional)
         hours: Number of hours to retrieve (1-168)
+        since: Explicit window start
+        until: Explicit window end
+        limit: Maximum rows per page
+        cursor: Opaque continuation token
+        format: Response format
         
     Returns:
         List of detections within the time window
     """
-    detections = await detector.get_recent_detections(hours=hours, severity=severity)
-    # Convert MicroburstDetection to DetectionResponseSchema
-    return [DetectionResponseSchema(**det.model_dump()) for det in detections]
+    window_start = to_epoch(since) if since is not None else time() - hours * 3600
+    window_end = to_epoch(until) if until is not None else None
+    after = decode_cursor(cursor) if cursor else None
+    
+    if format == "ndjson":
+        return StreamingResponse(
+            _stream_ndjson(window_start, window_end, severity, after, limit),
+            media_type="application/x-ndjson"
+        )
+    
+    if limit is not None or cursor is not None:
+        page_size = limit or 500
+        rows = await detector.read(
+            detector.store.page, window_start, window_end, severity, after, page_size
+        )
+        body = b"[" + b",".join(row.detection.to_json().encode() for row in rows) + b"]"
+        headers = {}
+        if len(rows) == page_size:
+            headers["X-Next-Cursor"] = encode_cursor(rows[-1].cursor)
+        return Response(content=body, media_type="application/json", headers=headers)
+    
+    entry = await _detections_entry(
+        hours, severity, window_start, window_end, explicit=since is not None
+    )
+    return _cached_response(request, entry)
+
+
+async def _detections_entry(
+    hours: int,
+    severity: Optional[str],
+    window_start: float,
+    window_end: Optional[float],
+    explicit: bool = False
+) -> CachedResponse:
+    """Cached serialized detection list for a window (shared by /detections and /dashboard/sync)."""
+    key = ("detections", window_start if explicit else hours, window_end,
+           severity.lower() if severity else None)
+    entry = response_cache.get(key, window_start, window_end)
+    
+    if entry is None:
+        cache_counters["detections"]["miss"].inc()
+        version = detector.store.version
+        if not explicit and window_end is None:
+            detections = await detector.get_recent_detections(hours=hours, severity=severity)
+        else:
+            detections = await detector.read(
+                detector.store.query, window_start, window_end, severity
+            )
+        body = b"[" + b",".join(d.to_json().encode() for d in detections) + b"]"
+        oldest = to_epoch(detections[0].timestamp) if detections else None
+        entry = response_cache.put(key, body, version, oldest)
+    else:
+        cache_counters["detections"]["hit"].inc()
+    return entry
 
 
 @app.websocket("/ws/stream")
-async def websocket_endpoint(websocket: WebSocket) -> None:
+async def websocket_endpoint(
+    websocket: WebSocket,
+    since_seq: Optional[int] = Query(None, ge=0, description="Resume after this detection seq")
+) -> None:
     """
     WebSocket endpoint for real-time data streaming.
     
     Clients can subscribe to receive real-time microburst detections,
     sensor data updates, and system alerts.
+    
+    Detection messages carry the store sequence number as ``seq``. The first
+    message is ``{"type": "hello", "seq": <latest>, ...}``. A client
+    reconnecting with ``since_seq`` is then sent the detections it missed
+    (at most ``websocket_replay_limit``; ``missed`` in ``hello`` counts any
+    older ones) before live messages. A ``hello`` seq lower than the
+    client's last one means the server's history was reset.
     """
-    await manager.connect(websocket)
+    if len(manager.active_connections) >= settings.max_connections:
+        logger.warning("websocket_rejected", clients=len(manager.active_connections))
+        await websocket.close(code=1013)  # Try again later
+        return
+    # Live broadcasts are held while the history is read (off the event
+    # loop for a shared store) and sent after the replay
+    await manager.connect(websocket, hold=True)
+    limit = min(settings.websocket_replay_limit, manager.queue_size - 1)
+    version, missed, changes = await detector.read(_replay_window, since_seq, limit)
+    hello = {"type": "hello", "seq": version, "replayed": len(changes), "missed": missed}
+    replay = [
+        f'{{"type": "detection", "seq": {change.seq}, "data": '
+        + change.detection.to_json() + '}'
+        for change in changes
+    ]
+    manager.release(websocket, [hello, *replay], changes[-1].seq if changes else version)
+    
     try:
         while True:
             data = await websocket.receive_text()
@@ -248,19 +937,319 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         await manager.disconnect(websocket)
 
 
-@app.get("/stats")
-async def get_statistics(days: int = Query(7, ge=1, le=90)):
+def _replay_window(
+    since_seq: Optional[int], limit: int
+) -> tuple[int, int, list[StoredDetection]]:
+    """Store version, missed count and the detections to replay after ``since_seq``."""
+    version = detector.store.version
+    start = min(since_seq, version) if since_seq is not None else version
+    floor = max(start, version - limit)
+    changes = detector.store.changes_since(floor) if floor < version else []
+    return version, floor - start, changes
+
+
+@app.get("/stats", response_model=StatisticsSchema)
+async def get_statistics(request: Request, days: int = Query(7, ge=1, le=90)) -> Response:
     """
     Get microburst detection statistics.
     
+    Cached and revalidated with ``ETag`` the same way as ``/detections``.
+    
     Args:
+        request: Incoming request (for ``If-None-Match``)
         days: Number of days to analyze
         
     Returns:
         Statistics including detection count, severity distribution, etc.
     """
-    stats = await detector.get_statistics(days=days)
-    return stats
+    return _cached_response(request, await _stats_entry(days))
+
+
+async def _stats_entry(days: int) -> CachedResponse:
+    """Cached serialized statistics (shared by /stats and /dashboard/sync)."""
+    since = time() - days * 86400
+    key = ("stats", days)
+    entry = response_cache.get(key, since)
+    
+    if entry is None:
+        cache_counters["stats"]["miss"].inc()
+        version = detector.store.version
+        stats = await detector.get_statistics(days=days)
+        oldest = await detector.read(detector.store.first_timestamp, since)
+        entry = response_cache.put(key, json.dumps(stats).encode(), version, oldest)
+    else:
+        cache_counters["stats"]["hit"].inc()
+    return entry
+
+
+def encode_sync_cursor(seq: int, stats_etag: str) -> str:
+    """Encode a dashboard's sync position: store seq and the stats it holds."""
+    stats_tag = stats_etag.strip('"')
+    return urlsafe_b64encode(f"{seq}:{stats_tag}".encode()).decode()
+
+
+def decode_sync_cursor(token: str) -> tuple[int, str]:
+    """Decode a token produced by ``encode_sync_cursor``."""
+    try:
+        seq, stats_tag = urlsafe_b64decode(token.encode()).decode().split(":")
+        return int(seq), f'"{stats_tag}"'
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/dashboard/sync", response_model=DashboardSyncSchema)
+async def dashboard_sync(
+    request: Request,
+    cursor: Optional[str] = Query(None, description="cursor from the previous sync"),
+    hours: int = Query(24, ge=1, le=168, description="Detection window"),
+    days: int = Query(7, ge=1, le=90, description="Statistics window")
+) -> Response:
+    """
+    Everything a dashboard polls for, as a delta since its last sync.
+    
+    Without a cursor (or when the cursor is too far behind, or from before
+    a history reset) ``detections`` is the full window and ``full`` is
+    true. Otherwise it holds only detections stored since the cursor that
+    fall in the window; the client drops its own detections older than
+    ``window_start``. ``stats`` is null while unchanged. Payloads are
+    shared between dashboards at the same cursor for up to
+    ``dashboard_sync_ttl`` seconds, so the cost of a poll follows the
+    number of new detections rather than the window size.
+    
+    Args:
+        request: Incoming request (for ``If-None-Match``)
+        cursor: ``cursor`` value from the previous response
+        hours: Detection window in hours
+        days: Statistics window in days
+        
+    Returns:
+        Detections, statistics and health with the next cursor
+    """
+    position = decode_sync_cursor(cursor) if cursor else None
+    key = ("sync", position, hours, days)
+    entry = sync_cache.get(key)
+    if entry is None:
+        version = detector.store.version
+        entry = sync_cache.put(key, await _sync_payload(position, version, hours, days), version)
+    return _cached_response(request, entry)
+
+
+async def _sync_payload(
+    position: Optional[tuple[int, str]],
+    version: int,
+    hours: int,
+    days: int
+) -> bytes:
+    """Build the ``/dashboard/sync`` body for a client at ``position``."""
+    now = time()
+    window_start = now - hours * 3600
+    stats = await _stats_entry(days)
+    
+    seq = position[0] if position is not None else None
+    full = seq is None or seq > version or version - seq > settings.dashboard_sync_max_delta
+    if full:
+        detections = (await _detections_entry(hours, None, window_start, None)).body
+    else:
+        changes = await detector.read(detector.store.changes_since, seq)
+        fresh = [
+            change.detection.to_json().encode() for change in changes
+            if to_epoch(change.detection.timestamp) >= window_start
+        ]
+        detections = b"[" + b",".join(fresh) + b"]"
+    
+    health = json.dumps({
+        "status": "operational" if readiness["ready"] else "starting",
+        "version": "1.0.0",
+        "active_connections": len(manager.active_connections),
+        "timestamp": datetime.utcnow().isoformat(),
+    })
+    stats_body = stats.body if full or position[1] != stats.etag else b"null"
+    head = json.dumps({
+        "cursor": encode_sync_cursor(version, stats.etag),
+        "full": full,
+        "window_start": from_epoch(window_start).isoformat(),
+    })
+    return (
+        head[:-1].encode() + b', "detections": ' + detections + b', "stats": ' + stats_body
+        + b', "health": ' + health.encode() + b"}"
+    )
+
+
+def _changes_after(seq: int) -> tuple[int, list[StoredDetection]]:
+    """Store version and the detections stored after ``seq``, read together."""
+    version = detector.store.version
+    return version, detector.store.changes_since(seq) if seq < version else []
+
+
+@app.get("/series", response_model=SeriesSchema)
+async def get_series(
+    hours: int = Query(24, ge=1, description="Range to cover, up to the retained history"),
+    points: int = Query(300, ge=10, le=2000, description="Most buckets returned"),
+    resolution: Optional[int] = Query(
+        None, description="Bucket seconds (chosen from hours and points by default)"
+    )
+) -> Response:
+    """
+    Detection activity in time buckets for charts.
+    
+    Buckets (counts per severity, max and mean wind shear, mean confidence)
+    are maintained incrementally at 1 min, 5 min, 1 h and 1 day resolution;
+    the finest one that covers the range in at most ``points`` buckets is
+    returned, so the payload size does not grow with the range. An explicit
+    ``resolution`` that would need more buckets, or is not retained for the
+    whole range, is rejected with 400, as is a range longer than the
+    detection history kept (``HISTORY_RETENTION_HOURS``, and
+    ``PERSIST_LOAD_HOURS`` with the memory backend), which the buckets
+    could only cover partially.
+    
+    Args:
+        hours: Range ending now
+        points: Maximum number of buckets
+        resolution: Explicit bucket size in seconds
+        
+    Returns:
+        Columnar series with bucket start times in epoch seconds
+    """
+    _check_retained(hours)
+    now = time()
+    since = now - hours * 3600
+    series_index.apply(*await detector.read(_changes_after, series_index.seq), now)
+    explicit = resolution is not None
+    if not explicit:
+        resolution = series_index.resolution_for(since, now, points)
+    try:
+        series = series_index.series(since, now, resolution, points if explicit else None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    series["since"] = since
+    series["until"] = now
+    return Response(content=json.dumps(series), media_type="application/json")
+
+
+def _check_retained(hours: int) -> None:
+    """Reject a range reaching past the detection history that is kept."""
+    if hours > retained_hours:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only the last {retained_hours} h of detections are retained"
+        )
+
+
+@app.get("/series/trace")
+async def get_series_trace(
+    request: Request,
+    field: str = Query(
+        "max_wind_shear", pattern="^(max_wind_shear|confidence|vertical_velocity)$",
+        description="Detection field to plot"
+    ),
+    hours: int = Query(24, ge=1, description="Range to cover, up to the retained history"),
+    points: int = Query(300, ge=10, le=2000, description="Most points returned")
+) -> Response:
+    """
+    Raw per-detection trace of one field, downsampled with LTTB.
+    
+    Largest-Triangle-Three-Buckets keeps the points that shape the curve
+    (spikes included), so ``points`` bounds the payload without flattening
+    peaks. Cached and revalidated with ``ETag`` like ``/detections``.
+    
+    Args:
+        request: Incoming request (for ``If-None-Match``)
+        field: Detection field
+        hours: Range ending now
+        points: Maximum number of points
+        
+    Returns:
+        ``timestamps`` (epoch seconds) and ``values``, plus ``total`` raw points
+    """
+    _check_retained(hours)
+    since = time() - hours * 3600
+    key = ("trace", field, hours, points)
+    entry = response_cache.get(key, since)
+    if entry is None:
+        version = detector.store.version
+        detections = await detector.read(detector.store.query, since)
+        timestamps = np.array([to_epoch(d.timestamp) for d in detections], dtype=float)
+        values = np.array([getattr(d, field) for d in detections], dtype=float)
+        kept = lttb(timestamps, values, points)
+        body = json.dumps({
+            "field": field,
+            "total": len(detections),
+            "timestamps": timestamps[kept].tolist(),
+            "values": values[kept].tolist(),
+        }).encode()
+        oldest = float(timestamps[0]) if len(timestamps) else None
+        entry = response_cache.put(key, body, version, oldest)
+    return _cached_response(request, entry)
+
+
+@app.get("/admission")
+async def get_admission() -> dict:
+    """
+    Admission control state.
+    
+    Returns:
+        In-flight ingest requests, limits, and per-sensor-type counters of
+        admitted, priority (near-hazard), rate-limited and shed readings
+    """
+    return {
+        **admission.snapshot(),
+        "websocket_clients": len(manager.active_connections),
+        "max_websocket_clients": settings.max_connections
+    }
+
+
+@app.get("/latency", response_model=LatencyReportSchema)
+async def get_latency() -> LatencyReportSchema:
+    """
+    End-to-end latency from sensor timestamp to each pipeline stage.
+    
+    Returns:
+        Percentile summaries per sensor type, site and stage, plus any
+        sensor/site pairs whose rolling p99 is over the configured budget
+    """
+    return LatencyReportSchema(
+        budget_seconds=settings.latency_budget_seconds,
+        window_seconds=settings.latency_window_seconds,
+        summaries=latency_tracker.summaries(),
+        breaches=latency_tracker.breaches(settings.latency_budget_seconds)
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint.
+    
+    Each worker process keeps its own registry. With a metrics directory
+    (set by ``run_server`` for several workers), the scraped worker combines
+    its current registry with the snapshots the other workers publish every
+    ``METRICS_PUBLISH_INTERVAL`` seconds, so any worker reports
+    service-wide values.
+    
+    Returns:
+        Metrics in Prometheus text exposition format
+    """
+    await _refresh_gauges()
+    if collector is None:
+        body = metrics.registry.render()
+    else:
+        body = await asyncio.to_thread(collector.render, metrics.registry.snapshot())
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+async def _refresh_gauges() -> None:
+    """Set the gauges sampled from live state rather than updated as it changes."""
+    depths = manager.queue_depths()
+    metrics.HISTORY_SIZE.set(await detector.read(detector.store.__len__))
+    if archive is not None:
+        metrics.ARCHIVED_READINGS.set(archive.appended)
+    if writer is not None:
+        metrics.PERSIST_PENDING.set(writer.pending)
+        metrics.PERSIST_WRITTEN.set(writer.written)
+        metrics.PERSIST_DROPPED.set(writer.dropped)
+    metrics.WS_CLIENTS.set(len(manager.active_connections))
+    metrics.WS_QUEUE_DEPTH.labels("total").set(sum(depths))
+    metrics.WS_QUEUE_DEPTH.labels("max").set(max(depths, default=0))
 
 
 @app.exception_handler(Exception)
@@ -276,21 +1265,59 @@ async def general_exception_handler(request, exc: Exception):
 def run_server(
     host: str = "0.0.0.0",
     port: int = 8000,
-    reload: bool = True
+    reload: bool = True,
+    workers: int = 1
 ) -> None:
     """
     Run the FastAPI server.
     
+    With more than one worker, every process imports this module on its own,
+    so detection history is switched to the shared SQLite backend, and
+    metrics to a shared snapshot directory, through the environment before
+    the workers are spawned. Station histories, station
+    networks and storm cell tracks cannot be shared that way: each worker
+    would only see the readings routed to it. Several workers therefore
+    require ``STATEFUL_DETECTION=false``.
+    
     Args:
         host: Server host
         port: Server port
         reload: Enable auto-reload on code changes
+        workers: Number of worker processes (ignored when reload is enabled)
+        
+    Raises:
+        ValueError: For more than one worker while stateful detection is on
     """
+    if workers > 1 and reload:
+        logger.warning("workers_ignored_with_reload", workers=workers)
+        workers = 1
+    
+    if workers > 1 and settings.stateful_detection:
+        raise ValueError(
+            "Station histories and storm cell tracks are kept per process; "
+            "set STATEFUL_DETECTION=false to run more than one worker"
+        )
+    
+    if workers > 1 and settings.state_backend.lower() == "memory":
+        logger.info("shared_state_enabled", backend="sqlite", path=settings.state_path)
+        os.environ["STATE_BACKEND"] = "sqlite"
+    
+    if workers > 1:
+        # Start from an empty metrics directory so totals begin at this launch
+        metrics_dir = Path(settings.metrics_dir or tempfile.mkdtemp(prefix="microburst-metrics-"))
+        for stale in metrics_dir.glob("*.json"):
+            stale.unlink()
+        logger.info("shared_metrics_enabled", path=str(metrics_dir))
+        os.environ["METRICS_DIR"] = str(metrics_dir)
+    
+    import uvicorn
+    
     uvicorn.run(
         "microburst_detection.api.server:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
         log_config=None  # Use structlog for logging
     )
 
@@ -0,0 +1,329 @@
+# src/microburst_detection/benchmarks/cases.py
+"""The benchmark suite: algorithms, fusion, detector, serialization and the HTTP/WebSocket path."""
+
+import json
+import os
+import sys
+import tempfile
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Any, Coroutine
+
+import numpy as np
+
+from ..core.algorithms import (
+    MicroburstSeverityClassifier,
+    ReflectivityAnalyzer,
+    TemporalCoherence,
+    VelocityCoadaptationDetector,
+    WindShearDetector,
+)
+from ..core.detector import MicroburstDetector
+from ..core.models import READING_MODELS, validate_reading, validate_readings
+from ..core.records import DetectionRecord
+from ..fusion.data_fusion import SensorFusion
+from ..fusion.kalman_filter import KalmanFilter
+from ..fusion.mosaic import MosaicGrid, RadarMosaic, SweepGeometry
+from ..storage.detection_store import MemoryDetectionStore
+from .runner import benchmark
+
+_BASE = {"latitude": 52.453, "longitude": -1.748, "site": "BENCH", "sensor_id": "bench-1"}
+
+# Readings strong enough to exercise each detector through to a detection
+_READINGS = {
+    "lidar": {**_BASE, "altitude": 1200.0, "vertical_velocity": -6000.0, "backscatter": 0.8},
+    "radar": {**_BASE, "altitude": 1500.0, "reflectivity": 60.0,
+              "radial_velocity": -15.0, "spectrum_width": 3.2},
+    "anemometer": {**_BASE, "altitude": 10.0, "wind_speed": 30.0, "wind_direction": 245.0,
+                   "temperature": 18.3, "pressure": 1000.0},
+}
+
+
+def _payload(sensor_type: str, **overrides) -> dict:
+    timestamp = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+    return {**_READINGS[sensor_type], "timestamp": timestamp, **overrides}
+
+
+def _reading(sensor_type: str):
+    return validate_reading(READING_MODELS[sensor_type], _payload(sensor_type))
+
+
+def _readings(sensor_type: str, n: int, seed: int = 0) -> list:
+    """``n`` validated readings with values spread around the detection thresholds."""
+    rng = np.random.default_rng(seed)
+    if sensor_type == "lidar":
+        varying = {"vertical_velocity": rng.uniform(-8000, 0, n)}
+    elif sensor_type == "radar":
+        varying = {"reflectivity": rng.uniform(20, 70, n)}
+    else:
+        varying = {"wind_speed": rng.uniform(0, 40, n), "pressure": rng.uniform(995, 1020, n)}
+    items = [
+        _payload(sensor_type, **{field: float(values[i]) for field, values in varying.items()})
+        for i in range(n)
+    ]
+    return validate_readings(READING_MODELS[sensor_type], items)
+
+
+def _drive(coroutine: Coroutine) -> Any:
+    """
+    Run a coroutine that never suspends to completion without an event loop.
+
+    The detector's ``process_*`` methods are async but do no I/O; stepping
+    them directly keeps event-loop overhead out of the measurement.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("Benchmarked coroutine suspended")
+
+
+def _detection() -> DetectionRecord:
+    detection = MicroburstDetector(store=MemoryDetectionStore()).detect_batch(
+        "anemometer", [_reading("anemometer")], store=False
+    )[0]
+    return detection
+
+
+# --- Algorithms --------------------------------------------------------------
+
+@benchmark("algorithms.wind_shear", sizes=(10, 100, 1000, 10000), unit="profile points")
+def wind_shear(size: int, stack: ExitStack):
+    altitudes = np.linspace(0, 3000, size)
+    velocities = np.sin(np.linspace(0, 4 * np.pi, size)) * 10
+    return lambda: WindShearDetector.calculate_wind_shear(altitudes, velocities)
+
+
+@benchmark("algorithms.wind_shear_stacked", sizes=(100, 1000, 10000), unit="3-point profiles")
+def wind_shear_stacked(size: int, stack: ExitStack):
+    rng = np.random.default_rng(1)
+    altitudes = np.linspace(700, 1700, 3) + rng.uniform(0, 500, (size, 1))
+    velocities = rng.uniform(-30, 5, (size, 3))
+    return lambda: WindShearDetector.calculate_wind_shear(altitudes, velocities)
+
+
+@benchmark("algorithms.hook_echo", sizes=(10, 50, 200), unit="grid side")
+def hook_echo(size: int, stack: ExitStack):
+    grid = np.random.default_rng(2).uniform(30, 60, (size, size))
+    axis = np.linspace(-0.1, 0.1, size)
+    return lambda: ReflectivityAnalyzer.detect_hook_echo(grid, axis, axis)
+
+
+@benchmark("algorithms.hook_echo_batch", sizes=(100, 1000, 10000), unit="10x10 grids")
+def hook_echo_batch(size: int, stack: ExitStack):
+    grids = np.random.default_rng(3).uniform(30, 60, (size, 10, 10))
+    return lambda: ReflectivityAnalyzer.detect_hook_echo_batch(grids)
+
+
+@benchmark("algorithms.storm_cells", sizes=(100, 500, 1000), unit="grid side")
+def storm_cells(size: int, stack: ExitStack):
+    from scipy.ndimage import gaussian_filter
+
+    # Smooth field with ~15% of the grid in storms
+    field = gaussian_filter(np.random.default_rng(8).normal(size=(size, size)), 8)
+    grid = 25.0 + 15.0 * field / field.std()
+    axis = np.linspace(-0.1, 0.1, size)
+    return lambda: ReflectivityAnalyzer.extract_cells(grid, axis, axis)
+
+
+@benchmark("algorithms.velocity_divergence", sizes=(16, 256, 4096), unit="range gates")
+def velocity_divergence(size: int, stack: ExitStack):
+    rng = np.random.default_rng(4)
+    velocities = rng.normal(0, 8, size)
+    ranges = np.linspace(500, 20000, size)
+    azimuths = np.linspace(0, 360, size)
+    divergence = VelocityCoadaptationDetector.calculate_velocity_divergence
+    return lambda: divergence(velocities, ranges, azimuths)
+
+
+@benchmark("algorithms.severity_classify")
+def severity_classify(size: int, stack: ExitStack):
+    return lambda: MicroburstSeverityClassifier.classify(8.5, -12.0, 55.0, 0.8)
+
+
+@benchmark("algorithms.temporal_persistence", sizes=(10, 100, 1000), unit="detections")
+def temporal_persistence(size: int, stack: ExitStack):
+    rng = np.random.default_rng(5)
+    times = np.cumsum(rng.uniform(10, 400, size))
+    detections = [(float(t), float(c)) for t, c in zip(times, rng.random(size))]
+    return lambda: TemporalCoherence.validate_temporal_persistence(detections)
+
+
+# --- Fusion ------------------------------------------------------------------
+
+@benchmark("fusion.sensor_fusion", sizes=(1, 2, 3), unit="sensors per update")
+def sensor_fusion(size: int, stack: ExitStack):
+    fusion = SensorFusion()
+    sensors = {name: _reading(name) for name in ("lidar", "radar", "anemometer")[:size]}
+    return lambda: fusion.fuse_measurements(**sensors)
+
+
+@benchmark("fusion.kalman_filter", sizes=(2, 4, 8), unit="state dimensions")
+def kalman_filter(size: int, stack: ExitStack):
+    kalman = KalmanFilter(state_dim=size, measurement_dim=size)
+    measurement = np.random.default_rng(6).normal(0, 1, size)
+
+    def step():
+        kalman.predict()
+        kalman.update(measurement)
+    return step
+
+
+@benchmark("fusion.radar_mosaic", sizes=(1, 4, 8), unit="radars on a 1000x1000 km grid")
+def radar_mosaic(size: int, stack: ExitStack):
+    rng = np.random.default_rng(7)
+    mosaic = RadarMosaic(MosaicGrid(_BASE["latitude"], _BASE["longitude"]))
+    azimuths = np.arange(0.25, 360.0, 0.5)
+    sweep = rng.uniform(0, 60, (len(azimuths), 920)).astype(np.float32)
+    geometries = [
+        SweepGeometry(
+            _BASE["latitude"] + rng.uniform(-3, 3), _BASE["longitude"] + rng.uniform(-4, 4),
+            100.0, 0.5, 920, 250.0, azimuth_resolution=0.5,
+        )
+        for _ in range(size)
+    ]
+    for i, geometry in enumerate(geometries):
+        mosaic.update(f"R{i}", geometry, azimuths, sweep, sweep)
+
+    def step():
+        mosaic.update("R0", geometries[0], azimuths, sweep, sweep)
+        mosaic.composite()
+    return step
+
+
+# --- Detector ----------------------------------------------------------------
+
+def _process(sensor_type: str, method: str):
+    def setup(size: int, stack: ExitStack):
+        detector = MicroburstDetector(store=MemoryDetectionStore())
+        process = getattr(detector, method)
+        reading = _reading(sensor_type)
+        return lambda: _drive(process(reading))
+    return setup
+
+
+for _sensor_type, _method in (
+    ("lidar", "process_lidar"), ("radar", "process_radar"), ("anemometer", "process_anemometer")
+):
+    benchmark(f"detector.{_sensor_type}", unit="reading")(_process(_sensor_type, _method))
+
+
+def _batch(sensor_type: str):
+    def setup(size: int, stack: ExitStack):
+        detector = MicroburstDetector(store=MemoryDetectionStore())
+        readings = _readings(sensor_type, size)
+        return lambda: detector.detect_batch(sensor_type, readings, store=False)
+    return setup
+
+
+for _sensor_type in ("lidar", "radar", "anemometer"):
+    benchmark(
+        f"detector.batch_{_sensor_type}", sizes=(100, 1000, 10000), unit="readings"
+    )(_batch(_sensor_type))
+
+
+# --- Serialization -----------------------------------------------------------
+
+@benchmark("serialization.validate_reading", unit="reading")
+def validate_one(size: int, stack: ExitStack):
+    body = json.dumps(_payload("lidar")).encode()
+    return lambda: validate_reading(READING_MODELS["lidar"], body)
+
+
+@benchmark("serialization.validate_readings", sizes=(100, 1000, 10000), unit="readings")
+def validate_many(size: int, stack: ExitStack):
+    body = json.dumps([_payload("lidar")] * size).encode()
+    return lambda: validate_readings(READING_MODELS["lidar"], body)
+
+
+@benchmark("serialization.record_to_json", unit="detection")
+def record_to_json(size: int, stack: ExitStack):
+    detection = _detection()
+
+    def encode():
+        detection._json = None  # bypass the per-record cache
+        return detection.to_json()
+    return encode
+
+
+@benchmark("serialization.record_from_json", unit="detection")
+def record_from_json(size: int, stack: ExitStack):
+    payload = _detection().to_json()
+    return lambda: DetectionRecord.from_json(payload)
+
+
+@benchmark("serialization.response_model", unit="detection")
+def response_model(size: int, stack: ExitStack):
+    detection = _detection()
+    return lambda: detection.to_model().model_dump_json()
+
+
+# --- HTTP and WebSocket ------------------------------------------------------
+
+_STATE_DIR = None
+
+
+def _client(stack: ExitStack):
+    """A started ``TestClient`` for the app, with its state kept in a temp directory."""
+    global _STATE_DIR
+    if "microburst_detection.api.server" not in sys.modules and _STATE_DIR is None:
+        # Benchmarks must not write to the configured database or archive
+        _STATE_DIR = tempfile.mkdtemp(prefix="microburst-bench-")
+        os.environ["DATABASE_URL"] = f"sqlite:///{_STATE_DIR}/microburst.db"
+        os.environ["RAW_ARCHIVE_PATH"] = f"{_STATE_DIR}/raw_archive"
+        # Every request posts the same sensor, which would soon be rate-limited
+        os.environ["SENSOR_RATE_LIMIT"] = "1000000"
+        os.environ["SENSOR_BURST"] = "1000000"
+    from fastapi.testclient import TestClient
+
+    from ..api.server import app
+    return stack.enter_context(TestClient(app))
+
+
+def _post(sensor_type: str):
+    def setup(size: int, stack: ExitStack):
+        client = _client(stack)
+        body = json.dumps(_payload(sensor_type)).encode()
+        headers = {"content-type": "application/json"}
+
+        def post():
+            response = client.post(f"/detect/{sensor_type}", content=body, headers=headers)
+            assert response.status_code == 200, response.text
+        return post
+    return setup
+
+
+for _sensor_type in ("lidar", "radar", "anemometer"):
+    benchmark(f"http.detect_{_sensor_type}", unit="request")(_post(_sensor_type))
+
+
+@benchmark("http.detections_page", sizes=(10, 100, 1000), unit="detections per page")
+def detections_page(size: int, stack: ExitStack):
+    client = _client(stack)
+    from ..api.server import detector
+
+    if len(detector.store.query()) < size:
+        for detection in MicroburstDetector(store=MemoryDetectionStore()).detect_batch(
+            "anemometer", _readings("anemometer", size * 4), store=False
+        ):
+            detector.store.add(detection)
+    return lambda: client.get("/detections", params={"limit": size})
+
+
+@benchmark("http.stats_cached", unit="request")
+def stats_cached(size: int, stack: ExitStack):
+    client = _client(stack)
+    return lambda: client.get("/stats")
+
+
+@benchmark("ws.roundtrip", unit="message")
+def ws_roundtrip(size: int, stack: ExitStack):
+    client = _client(stack)
+    websocket = stack.enter_context(client.websocket_connect("/ws/stream"))
+    websocket.receive_json()  # hello
+
+    def roundtrip():
+        websocket.send_text("ping")
+        websocket.receive_text()
+    return roundtrip
@@ -0,0 +1,266 @@
+# src/microburst_detection/benchmarks/runner.py
+"""Benchmark registry, timing loop, JSON results and baseline comparison."""
+
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RESULTS_VERSION = 1
+
+# Calls are repeated until one sample takes at least this long, so timer
+# resolution and loop overhead stay negligible for sub-microsecond operations
+TARGET_SAMPLE_SECONDS = 50e-6
+MAX_LOOPS = 1 << 20
+
+Setup = Callable[[int, ExitStack], Callable[[], Any]]
+
+
+class Case:
+    """One benchmark: a setup building the timed callable for each input size."""
+
+    def __init__(
+        self, name: str, group: str, sizes: Sequence[int], setup: Setup, unit: str
+    ) -> None:
+        self.name = name
+        self.group = group
+        self.sizes = tuple(sizes)
+        self.setup = setup
+        self.unit = unit
+
+
+#: Registered cases by name, in registration order
+CASES: Dict[str, Case] = {}
+
+
+def benchmark(
+    name: str, sizes: Sequence[int] = (1,), unit: str = "call"
+) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark case.
+
+    The decorated function receives an input size and an ``ExitStack`` for
+    resources that must outlive the measurement (clients, temp dirs), and
+    returns the zero-argument callable to time.
+
+    Args:
+        name: Dotted case name; the first component is its group
+        sizes: Input sizes swept by the runner
+        unit: What one call processes, for reading the size column
+    """
+    def register(setup: Setup) -> Setup:
+        CASES[name] = Case(name, name.split(".")[0], sizes, setup, unit)
+        return setup
+    return register
+
+
+def select(patterns: Optional[Sequence[str]] = None) -> List[Case]:
+    """
+    Cases whose name matches any pattern.
+
+    Patterns are shell-style globs; a pattern without wildcards matches as a
+    substring, so ``fusion`` selects every fusion case.
+    """
+    from . import cases  # noqa: F401  (registers the suite)
+
+    if not patterns:
+        return list(CASES.values())
+    globs = [p if any(c in p for c in "*?[") else f"*{p}*" for p in patterns]
+    return [case for case in CASES.values() if any(fnmatchcase(case.name, g) for g in globs)]
+
+
+def measure(
+    fn: Callable[[], Any],
+    min_time: float = 0.2,
+    min_samples: int = 5,
+    max_samples: int = 2000
+) -> dict:
+    """
+    Time ``fn`` and summarize per-call durations.
+
+    After one warm-up call the number of calls per sample is calibrated to
+    reach ``TARGET_SAMPLE_SECONDS``. Samples are then collected until both
+    ``min_time`` and ``min_samples`` are met, or ``max_samples`` is reached.
+
+    Args:
+        fn: Callable to time
+        min_time: Seconds of sampling per measurement
+        min_samples: Fewest samples taken
+        max_samples: Most samples taken
+
+    Returns:
+        Per-call seconds: ``p50``, ``p90``, ``p99``, ``mean``, ``min``, ``max``,
+        plus ``samples`` and ``loops`` (calls per sample)
+    """
+    clock = time.perf_counter
+    fn()
+
+    loops = 1
+    while True:
+        start = clock()
+        for _ in range(loops):
+            fn()
+        elapsed = clock() - start
+        if elapsed >= TARGET_SAMPLE_SECONDS or loops >= MAX_LOOPS:
+            break
+        loops = min(MAX_LOOPS, loops * max(2, int(TARGET_SAMPLE_SECONDS / max(elapsed, 1e-9))))
+
+    samples = []
+    started = clock()
+    while len(samples) < max_samples:
+        start = clock()
+        for _ in range(loops):
+            fn()
+        samples.append((clock() - start) / loops)
+        if len(samples) >= min_samples and clock() - started >= min_time:
+            break
+
+    values = np.array(samples)
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "mean": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "samples": len(samples),
+        "loops": loops,
+    }
+
+
+def result_key(result: dict) -> str:
+    """Identity of a result across runs: ``name[size]``."""
+    return f"{result['name']}[{result['size']}]"
+
+
+def run(
+    cases: Sequence[Case],
+    min_time: float = 0.2,
+    quick: bool = False,
+    on_result: Optional[Callable[[dict], None]] = None
+) -> List[dict]:
+    """
+    Run cases over their size sweeps.
+
+    Args:
+        cases: Cases to run
+        min_time: Seconds of sampling per (case, size)
+        quick: Only run each case's smallest size
+        on_result: Called with each result as it is produced
+
+    Returns:
+        One result per (case, size)
+    """
+    results = []
+    for case in cases:
+        sizes = case.sizes[:1] if quick else case.sizes
+        for size in sizes:
+            with ExitStack() as stack:
+                fn = case.setup(size, stack)
+                stats = measure(fn, min_time=min_time)
+            result = {
+                "name": case.name, "group": case.group, "size": size, "unit": case.unit, **stats
+            }
+            result["ops_per_sec"] = 1.0 / stats["p50"] if stats["p50"] > 0 else 0.0
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def environment() -> dict:
+    """Facts about the machine and stack, stored alongside results."""
+    from .. import __version__
+
+    return {
+        "package": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save(results: List[dict], path: Path) -> None:
+    """Write results as a JSON document."""
+    document = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(document, indent=2))
+
+
+def load(path: Path) -> dict:
+    """Read a JSON document written by ``save``."""
+    document = json.loads(Path(path).read_text())
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return document
+
+
+def compare(
+    results: List[dict],
+    baseline: List[dict],
+    threshold: float = 0.10,
+    metric: str = "p50"
+) -> List[dict]:
+    """
+    Compare results against a baseline run.
+
+    A result regresses when ``metric`` grew by more than ``threshold``
+    (a fraction: 0.10 means 10% slower) and improves when it shrank by
+    more than ``threshold``.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed relative slowdown
+        metric: Statistic compared (``p50``, ``p90``, ``p99``, ``mean`` or ``min``)
+
+    Returns:
+        One row per current result with ``key``, ``baseline``, ``current``,
+        ``change`` (relative, None for new cases) and ``status``
+        (``regressed``, ``improved``, ``ok`` or ``new``)
+    """
+    previous = {result_key(result): result for result in baseline}
+    rows = []
+    for result in results:
+        key = result_key(result)
+        current = result[metric]
+        before = previous.get(key)
+        if before is None or before[metric] <= 0:
+            rows.append({
+                "key": key, "baseline": None, "current": current, "change": None, "status": "new"
+            })
+            continue
+        change = current / before[metric] - 1.0
+        if change > threshold:
+            status = "regressed"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({
+            "key": key,
+            "baseline": before[metric],
+            "current": current,
+            "change": change,
+            "status": status,
+        })
+    return rows
@@ -0,0 +1,302 @@
+# src/microburst_detection/cli/batch.py
+"""Streaming batch analysis of large reading files for ``microburst-detect analyze``."""
+
+import glob
+import gzip
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SENSOR_TYPES = ("lidar", "radar", "anemometer")
+
+#: Field that identifies each sensor type when a file does not say
+_SIGNATURE_FIELDS = {
+    "vertical_velocity": "lidar",
+    "reflectivity": "radar",
+    "wind_speed": "anemometer",
+}
+
+_SUFFIXES = (".json", ".ndjson", ".jsonl", ".json.gz", ".ndjson.gz", ".jsonl.gz")
+
+# A chunk handed to a worker: NDJSON lines, or already-parsed objects from a JSON file
+Chunk = Union[List[bytes], List[dict]]
+
+
+def iter_input_files(patterns: Sequence[str]) -> Iterator[Path]:
+    """
+    Expand inputs into reading files.
+
+    Directories are searched recursively for ``.json``/``.ndjson``/``.jsonl``
+    files (optionally gzipped); other inputs are treated as glob patterns or
+    plain paths. Each file is yielded once.
+
+    Args:
+        patterns: Files, directories or glob patterns
+
+    Yields:
+        File paths in sorted order per input
+    """
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = sorted(
+                p for p in path.rglob("*") if p.is_file() and p.name.endswith(_SUFFIXES)
+            )
+        elif any(char in pattern for char in "*?["):
+            matches = glob.glob(pattern, recursive=True)
+            candidates = sorted(Path(p) for p in matches if Path(p).is_file())
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                yield candidate
+
+
+def _open(path: Path) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")
+
+
+def _is_ndjson(path: Path) -> bool:
+    name = path.name[:-3] if path.name.endswith(".gz") else path.name
+    return name.endswith((".ndjson", ".jsonl"))
+
+
+def sensor_type_for(path: Path, first: Optional[dict]) -> Optional[str]:
+    """
+    Infer a file's sensor type from its path, then from its first record.
+
+    Args:
+        path: Input file
+        first: First parsed record, if any
+
+    Returns:
+        ``lidar``, ``radar``, ``anemometer`` or None if undecidable
+    """
+    for part in reversed(path.parts):
+        lowered = part.lower()
+        for sensor_type in SENSOR_TYPES:
+            if sensor_type in lowered:
+                return sensor_type
+    if first:
+        for field, sensor_type in _SIGNATURE_FIELDS.items():
+            if field in first:
+                return sensor_type
+    return None
+
+
+def iter_chunks(path: Path, batch_size: int) -> Iterator[Chunk]:
+    """
+    Read a file as chunks of at most ``batch_size`` readings.
+
+    NDJSON files are streamed line by line and lines are passed on unparsed,
+    so the reading process only splits bytes. JSON files (a single object or
+    an array of objects) are parsed whole.
+
+    Args:
+        path: Input file
+        batch_size: Readings per chunk
+
+    Yields:
+        Lists of raw NDJSON lines or of parsed objects
+    """
+    with _open(path) as f:
+        if _is_ndjson(path):
+            lines: List[bytes] = []
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                lines.append(line)
+                if len(lines) >= batch_size:
+                    yield lines
+                    lines = []
+            if lines:
+                yield lines
+            return
+        document = json.load(f)
+    items = document if isinstance(document, list) else [document]
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def _peek(chunk: Chunk) -> Optional[dict]:
+    """First record of a chunk, parsed."""
+    if not chunk:
+        return None
+    first = chunk[0]
+    if isinstance(first, bytes):
+        try:
+            first = json.loads(first)
+        except ValueError:
+            return None
+    return first if isinstance(first, dict) else None
+
+
+# Per-process detector, created on first use in each worker
+_detector = None
+
+
+def detect_chunk(sensor_type: str, chunk: Chunk) -> Tuple[int, int, int, bytes]:
+    """
+    Validate a chunk and run vectorized detection over it.
+
+    The chunk is validated as one JSON array; if that fails, readings are
+    validated one by one so a bad line only drops itself.
+
+    Args:
+        sensor_type: ``lidar``, ``radar`` or ``anemometer``
+        chunk: Raw NDJSON lines or parsed objects
+
+    Returns:
+        Tuple of (readings, invalid, detections, detections as NDJSON bytes)
+    """
+    global _detector
+    from pydantic import ValidationError
+
+    from ..core.detector import MicroburstDetector
+    from ..core.models import READING_MODELS, validate_reading, validate_readings
+
+    if _detector is None:
+        _detector = MicroburstDetector()
+    model = READING_MODELS[sensor_type]
+
+    raw = isinstance(chunk[0], bytes) if chunk else False
+    try:
+        readings = validate_readings(model, b"[" + b",".join(chunk) + b"]" if raw else chunk)
+    except ValidationError:
+        readings = []
+        for item in chunk:
+            try:
+                readings.append(validate_reading(model, item))
+            except (ValidationError, ValueError):
+                pass
+
+    detections = _detector.detect_batch(sensor_type, readings, store=False)
+    output = b"".join(detection.to_json().encode() + b"\n" for detection in detections)
+    return len(chunk), len(chunk) - len(readings), len(detections), output
+
+
+class _InlineExecutor(Executor):
+    """Runs submissions immediately in the calling process (``workers=1``)."""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class BatchSummary:
+    """Counters reported at the end of a batch run."""
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.skipped: List[Path] = []
+        self.readings: Dict[str, int] = {sensor_type: 0 for sensor_type in SENSOR_TYPES}
+        self.invalid: Dict[str, int] = {sensor_type: 0 for sensor_type in SENSOR_TYPES}
+        self.detections: Dict[str, int] = {sensor_type: 0 for sensor_type in SENSOR_TYPES}
+        self.bytes_read = 0
+        self.elapsed = 0.0
+
+    @property
+    def total_readings(self) -> int:
+        return sum(self.readings.values())
+
+    @property
+    def total_detections(self) -> int:
+        return sum(self.detections.values())
+
+    @property
+    def readings_per_second(self) -> float:
+        return self.total_readings / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def run_batch(
+    inputs: Sequence[str],
+    output: Optional[Path] = None,
+    sensor_type: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: int = 10000,
+    on_progress: Optional[Callable[[BatchSummary], None]] = None
+) -> BatchSummary:
+    """
+    Analyze every reading in ``inputs`` and stream detections to ``output``.
+
+    The calling process reads files and cuts them into chunks; a process pool
+    validates and detects. At most ``2 * workers`` chunks are in flight and
+    results are written in input order as they complete, so memory stays
+    bounded whatever the input size.
+
+    Args:
+        inputs: Files, directories or glob patterns
+        output: NDJSON file receiving one detection per line
+        sensor_type: Sensor type of every input (inferred per file when None)
+        workers: Worker processes (CPU count when None; 1 runs inline)
+        batch_size: Readings per chunk
+        on_progress: Called with the running summary after each chunk
+
+    Returns:
+        Run summary
+    """
+    if sensor_type is not None and sensor_type not in SENSOR_TYPES:
+        raise ValueError(f"Unknown sensor type: {sensor_type}")
+    workers = workers or os.cpu_count() or 1
+    summary = BatchSummary()
+    started = time.perf_counter()
+    executor: Executor = ProcessPoolExecutor(workers) if workers > 1 else _InlineExecutor()
+    pending: deque = deque()
+    sink = open(output, "wb") if output else None
+
+    def collect(limit: int) -> None:
+        # Write finished chunks in order; block while more than ``limit`` are in flight
+        while pending and (len(pending) > limit or pending[0][1].done()):
+            kind, future = pending.popleft()
+            readings, invalid, detections, lines = future.result()
+            summary.readings[kind] += readings - invalid
+            summary.invalid[kind] += invalid
+            summary.detections[kind] += detections
+            if sink is not None and lines:
+                sink.write(lines)
+            if on_progress is not None:
+                on_progress(summary)
+
+    try:
+        for path in iter_input_files(inputs):
+            if output is not None and path.resolve() == Path(output).resolve():
+                continue
+            if not path.exists():
+                logger.warning(f"Input not found: {path}")
+                summary.skipped.append(path)
+                continue
+            kind = sensor_type
+            summary.files += 1
+            summary.bytes_read += path.stat().st_size
+            for chunk in iter_chunks(path, batch_size):
+                if kind is None:
+                    kind = sensor_type_for(path, _peek(chunk))
+                    if kind is None:
+                        logger.warning(f"Cannot tell the sensor type of {path}; skipping")
+                        summary.skipped.append(path)
+                        summary.files -= 1
+                        break
+                pending.append((kind, executor.submit(detect_chunk, kind, chunk)))
+                collect(2 * workers)
+        collect(0)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        if sink is not None:
+            sink.close()
+        summary.elapsed = time.perf_counter() - started
+
+    return summary
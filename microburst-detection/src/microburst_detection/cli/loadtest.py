@@ -0,0 +1,279 @@
+# src/microburst_detection/cli/loadtest.py
+"""Open-loop async load generator for ``microburst-detect loadtest``."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: Site tag on every synthetic reading; subscribers ignore other detections
+LOADTEST_SITE = "LOADTEST"
+
+SENSOR_TYPES = ("lidar", "radar", "anemometer")
+
+
+def synthetic_reading(sensor_type: str, rng: random.Random, hazard: bool, sensor_id: str) -> dict:
+    """
+    Build one reading stamped with the current wall-clock time.
+
+    Hazard readings are strong enough to produce a detection (and to be
+    exempt from load shedding); routine readings stay below every threshold.
+
+    Args:
+        sensor_type: ``lidar``, ``radar`` or ``anemometer``
+        rng: Random source
+        hazard: Whether the reading should trigger a detection
+        sensor_id: Sensor identifier (per-sensor rate limits key on it)
+
+    Returns:
+        JSON-ready reading
+    """
+    reading = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "latitude": 52.453 + rng.uniform(-0.05, 0.05),
+        "longitude": -1.748 + rng.uniform(-0.05, 0.05),
+        "site": LOADTEST_SITE,
+        "sensor_id": sensor_id,
+    }
+    if sensor_type == "lidar":
+        reading.update(
+            altitude=rng.uniform(800, 1600),
+            vertical_velocity=rng.uniform(-8000, -6000) if hazard else rng.uniform(-2, 2),
+            backscatter=rng.uniform(0.3, 0.9),
+        )
+    elif sensor_type == "radar":
+        reading.update(
+            altitude=rng.uniform(1000, 2000),
+            # A mix of cells either side of 40 dBZ is what produces a hook echo
+            reflectivity=rng.uniform(41, 46) if hazard else rng.uniform(5, 25),
+            radial_velocity=rng.uniform(-20, -10) if hazard else rng.uniform(-3, 3),
+            spectrum_width=rng.uniform(1, 4),
+        )
+    else:
+        reading.update(
+            altitude=10.0,
+            wind_speed=rng.uniform(25, 35) if hazard else rng.uniform(2, 10),
+            wind_direction=rng.uniform(0, 360),
+            temperature=rng.uniform(10, 25),
+            pressure=rng.uniform(1000, 1005) if hazard else rng.uniform(1013, 1020),
+        )
+    return reading
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    """``p50``/``p90``/``p99``/``max`` of ``values`` (None when empty)."""
+    if not values:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {"p50": float(p50), "p90": float(p90), "p99": float(p99), "max": float(max(values))}
+
+
+class LoadTestStats:
+    """Counters and latency samples collected during a run."""
+
+    def __init__(self) -> None:
+        self.scheduled = 0
+        self.skipped = 0
+        self.statuses: Dict[str, int] = {}
+        self.latencies: List[float] = []
+        self.service_times: List[float] = []
+        self.detections = 0
+        self.deliveries: List[float] = []
+        self.subscribers_connected = 0
+        self.subscribers_failed = 0
+
+    @property
+    def completed(self) -> int:
+        return len(self.latencies)
+
+    def count(self, status: str) -> None:
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+async def run_load_test(
+    api_url: str = "http://localhost:8000",
+    rate: float = 200.0,
+    duration: float = 30.0,
+    subscribers: int = 10,
+    concurrency: int = 64,
+    sensors: int = 100,
+    hazard_ratio: float = 0.05,
+    sensor_types: tuple = SENSOR_TYPES,
+    seed: Optional[int] = None,
+    on_tick: Optional[Callable[[LoadTestStats, float], None]] = None
+) -> dict:
+    """
+    Drive the API at a fixed request rate while WebSocket subscribers listen.
+
+    Requests follow an open-loop schedule: request ``i`` is due at
+    ``start + i / rate`` whether or not earlier ones have finished, and its
+    latency is measured from that due time, so a stalled server shows up as
+    latency instead of silently lowering the offered rate. When more than
+    ``4 * concurrency`` requests are outstanding, due requests are skipped
+    and counted.
+
+    Readings carry the client's wall-clock time as their timestamp; the
+    server echoes it in broadcast detections, so subscribers measure
+    reading-to-delivery latency directly (client and server share a clock
+    when run on the same host).
+
+    Args:
+        api_url: Server base URL
+        rate: Target requests per second
+        duration: Seconds of load
+        subscribers: WebSocket clients listening to ``/ws/stream``
+        concurrency: Pooled HTTP connections
+        sensors: Distinct sensor ids readings are spread across
+        hazard_ratio: Fraction of readings that should trigger a detection
+        sensor_types: Sensor types to cycle through
+        seed: Random seed for reproducible traffic
+        on_tick: Called about once a second with the stats and elapsed seconds
+
+    Returns:
+        Report dictionary (see ``report``)
+    """
+    import aiohttp
+
+    rng = random.Random(seed)
+    stats = LoadTestStats()
+    loop = asyncio.get_running_loop()
+    ws_url = api_url.replace("http", "ws", 1) + "/ws/stream"
+    endpoints = {kind: f"{api_url}/detect/{kind}" for kind in sensor_types}
+    sensor_ids = [f"loadtest-{i:05d}" for i in range(max(1, sensors))]
+    in_flight: set = set()
+
+    async def send(session, kind: str, body: bytes, due: float) -> None:
+        started = loop.time()
+        try:
+            async with session.post(
+                endpoints[kind], data=body, headers={"content-type": "application/json"}
+            ) as response:
+                payload = await response.read()
+                status = str(response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            stats.count(type(e).__name__)
+            return
+        finished = loop.time()
+        stats.count(status)
+        stats.latencies.append(finished - due)
+        stats.service_times.append(finished - started)
+        if status == "200" and payload.strip() != b"null":
+            stats.detections += 1
+
+    async def subscribe(session, ready: asyncio.Event) -> None:
+        try:
+            ws = await session.ws_connect(ws_url, heartbeat=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Includes handshakes refused because the server is at max_connections
+            stats.subscribers_failed += 1
+            return
+        async with ws:
+            stats.subscribers_connected += 1
+            ready.set()
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    break
+                received = time.time()
+                event = json.loads(message.data)
+                data = event.get("data") or {}
+                if event.get("type") != "detection" or data.get("site") != LOADTEST_SITE:
+                    continue
+                sent = datetime.fromisoformat(data["timestamp"])
+                if sent.tzinfo is None:
+                    sent = sent.replace(tzinfo=timezone.utc)
+                stats.deliveries.append(received - sent.timestamp())
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session, \
+            aiohttp.ClientSession() as ws_session:
+        ready = asyncio.Event()
+        listeners = [asyncio.create_task(subscribe(ws_session, ready)) for _ in range(subscribers)]
+        if subscribers:
+            try:
+                await asyncio.wait_for(ready.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pass
+            # Let the remaining subscribers finish their handshakes
+            await asyncio.sleep(0.2)
+
+        start = loop.time()
+        next_tick = start + 1.0
+        index = 0
+        while True:
+            due = start + index / rate
+            if due - start >= duration:
+                break
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            now = loop.time()
+            if on_tick is not None and now >= next_tick:
+                on_tick(stats, now - start)
+                next_tick += 1.0
+
+            index += 1
+            stats.scheduled += 1
+            if len(in_flight) >= 4 * concurrency:
+                stats.skipped += 1
+                continue
+            kind = sensor_types[index % len(sensor_types)]
+            reading = synthetic_reading(
+                kind, rng, rng.random() < hazard_ratio, sensor_ids[index % len(sensor_ids)]
+            )
+            task = asyncio.create_task(send(session, kind, json.dumps(reading).encode(), due))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.wait(list(in_flight))
+        elapsed = loop.time() - start
+        # Give the last broadcasts time to reach subscribers
+        if listeners:
+            await asyncio.sleep(0.5)
+        for listener in listeners:
+            listener.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+
+    return report(stats, elapsed, rate)
+
+
+def report(stats: LoadTestStats, elapsed: float, rate: float) -> dict:
+    """
+    Summarize a run.
+
+    Returns:
+        ``requests`` (scheduled, completed, skipped, status counts, target and
+        achieved rate), ``latency`` and ``service_time`` percentiles (seconds,
+        from due time and from actual send), and ``delivery`` (detections,
+        expected and received deliveries, latency percentiles, subscribers)
+    """
+    expected = stats.detections * stats.subscribers_connected
+    return {
+        "elapsed": elapsed,
+        "requests": {
+            "scheduled": stats.scheduled,
+            "completed": stats.completed,
+            "skipped": stats.skipped,
+            "statuses": dict(sorted(stats.statuses.items())),
+            "target_rate": rate,
+            "achieved_rate": stats.completed / elapsed if elapsed > 0 else 0.0,
+        },
+        "latency": percentiles(stats.latencies),
+        "service_time": percentiles(stats.service_times),
+        "delivery": {
+            "subscribers": stats.subscribers_connected,
+            "subscribers_failed": stats.subscribers_failed,
+            "detections": stats.detections,
+            "expected": expected,
+            "received": len(stats.deliveries),
+            "latency": percentiles(stats.deliveries),
+        },
+    }
@@ -3,17 +3,19 @@
 
 import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress
 from rich.panel import Panel
-from rich.syntax import Syntax
-import aiohttp
+
+from .stream import StreamConsumer, StreamState, ndjson_sink, render
+
+# aiohttp, rich.progress and rich.syntax (which pulls in pygments) are
+# imported by the commands that use them, keeping `--help` and `version` fast.
 
 app = typer.Typer(
     name="microburst-detect",
@@ -47,7 +49,11 @@ def server(
         )
     )
     
-    run_server(host=host, port=port, reload=reload)
+    try:
+        run_server(host=host, port=port, reload=reload, workers=workers)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]", style="bold")
+        raise typer.Exit(code=1)
 
 
 async def _analyze_async(
@@ -58,7 +64,14 @@ async def _analyze_async(
 ) -> None:
     """Async implementation of analyze command."""
     from microburst_detection.core.detector import MicroburstDetector
-    from microburst_detection.core.models import LidarData, DopplerRadarData
+    from microburst_detection.core.models import (
+        AnemometerData,
+        DopplerRadarData,
+        LidarData,
+        validate_reading
+    )
+    
+    from rich.progress import Progress
     
     detector = MicroburstDetector()
     results = []
@@ -72,11 +85,11 @@ async def _analyze_async(
                 console.print(f"[blue]Processing LIDAR: {lidar_file}[/blue]")
                 with open(lidar_file) as f:
                     lidar_data_dict = json.load(f)
-                # Convert dict to Pydantic model
-                lidar_data = LidarData(**lidar_data_dict)
+                # Validate once at the edge
+                lidar_data = validate_reading(LidarData, lidar_data_dict)
                 detection = await detector.process_lidar(lidar_data)
                 if detection:
-                    results.append(detection.model_dump())
+                    results.append(detection.to_dict())
                 progress.advance(task)
             
             # Process Radar data
@@ -84,11 +97,11 @@ async def _analyze_async(
                 console.print(f"[blue]Processing Radar: {radar_file}[/blue]")
                 with open(radar_file) as f:
                     radar_data_dict = json.load(f)
-                # Convert dict to Pydantic model
-                radar_data = DopplerRadarData(**radar_data_dict)
+                # Validate once at the edge
+                radar_data = validate_reading(DopplerRadarData, radar_data_dict)
                 detection = await detector.process_radar(radar_data)
                 if detection:
-                    results.append(detection.model_dump())
+                    results.append(detection.to_dict())
                 progress.advance(task)
             
             # Process Anemometer data
@@ -96,12 +109,11 @@ async def _analyze_async(
                 console.print(f"[blue]Processing Anemometer: {anemometer_file}[/blue]")
                 with open(anemometer_file) as f:
                     anemometer_data_dict = json.load(f)
-                # Convert dict to Pydantic model
-                from microburst_detection.core.models import AnemometerData
-                anemometer_data = AnemometerData(**anemometer_data_dict)
+                # Validate once at the edge
+                anemometer_data = validate_reading(AnemometerData, anemometer_data_dict)
                 detection = await detector.process_anemometer(anemometer_data)
                 if detection:
-                    results.append(detection.model_dump())
+                    results.append(detection.to_dict())
                 progress.advance(task)
         
         if not results:
@@ -131,8 +143,64 @@ async def _analyze_async(
         raise typer.Exit(code=1)
 
 
+def _analyze_batch(
+    inputs: List[str],
+    output: Optional[Path],
+    sensor: Optional[str],
+    workers: Optional[int],
+    batch_size: int
+) -> None:
+    """Batch mode of the analyze command."""
+    from microburst_detection.cli.batch import run_batch
+    
+    try:
+        with console.status("[cyan]Analyzing...") as status:
+            def progress(summary) -> None:
+                status.update(
+                    f"[cyan]Analyzing... {summary.total_readings:,} readings, "
+                    f"{summary.total_detections:,} detections"
+                )
+            summary = run_batch(
+                inputs, output, sensor_type=sensor, workers=workers,
+                batch_size=batch_size, on_progress=progress
+            )
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]", style="bold")
+        raise typer.Exit(code=1)
+    
+    table = Table(title="Batch Analysis")
+    table.add_column("Sensor", style="cyan")
+    table.add_column("Readings", style="magenta", justify="right")
+    table.add_column("Invalid", style="magenta", justify="right")
+    table.add_column("Detections", style="magenta", justify="right")
+    for kind, readings in summary.readings.items():
+        if readings or summary.invalid[kind]:
+            table.add_row(
+                kind, f"{readings:,}", f"{summary.invalid[kind]:,}", f"{summary.detections[kind]:,}"
+            )
+    table.add_row(
+        "total", f"{summary.total_readings:,}", f"{sum(summary.invalid.values()):,}",
+        f"{summary.total_detections:,}", style="bold"
+    )
+    console.print(table)
+    
+    megabytes = summary.bytes_read / 1e6
+    console.print(
+        f"{summary.files} files, {megabytes:.1f} MB in {summary.elapsed:.2f}s: "
+        f"{summary.readings_per_second:,.0f} readings/s, "
+        f"{megabytes / summary.elapsed if summary.elapsed else 0:.1f} MB/s"
+    )
+    for path in summary.skipped:
+        console.print(f"[yellow]Skipped {path}[/yellow]")
+    if output:
+        console.print(f"[green]✓ Detections written to {output}[/green]")
+
+
 @app.command()
 def analyze(
+    inputs: Optional[List[str]] = typer.Argument(
+        None, help="Files, directories or globs of JSON/NDJSON readings (batch mode)"
+    ),
     lidar_file: Optional[Path] = typer.Option(
         None, "--lidar", help="LIDAR data JSON file"
     ),
@@ -143,95 +211,299 @@ def analyze(
         None, "--anemometer", help="Anemometer data JSON file"
     ),
     output: Optional[Path] = typer.Option(
-        None, "--output", "-o", help="Output file (JSON)"
-    )
+        None, "--output", "-o", help="Output file (JSON; NDJSON in batch mode)"
+    ),
+    sensor: Optional[str] = typer.Option(
+        None, "--sensor", help="Sensor type of batch inputs (inferred per file by default)"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="Batch worker processes (default: CPU count)"
+    ),
+    batch_size: int = typer.Option(10000, "--batch-size", help="Readings per batch")
 ) -> None:
     """
     Analyze sensor data files for microbursts.
     
+    With positional inputs, runs in batch mode: NDJSON is streamed, batches are
+    detected in a process pool and detections are written to --output as NDJSON.
+    
     Example:
         microburst-detect analyze --lidar data.json --output results.json
+        microburst-detect analyze archive/ 'extra/*.ndjson.gz' -o detections.ndjson
     """
+    if inputs:
+        _analyze_batch(inputs, output, sensor, workers, batch_size)
+        return
     asyncio.run(_analyze_async(lidar_file, radar_file, anemometer_file, output))
 
 
 async def _stream_async(
+    state: StreamState,
     api_url: str,
-    duration: int
+    duration: float,
+    fps: float,
+    ndjson: Optional[str],
+    since_seq: Optional[int],
+    reconnect: bool
 ) -> None:
     """Async implementation of stream command."""
-    console.print(
-        Panel(
-            f"[bold cyan]Connecting to {api_url}[/bold cyan]\n"
-            f"Duration: {duration}s",
-            title="WebSocket Stream"
-        )
+    import sys
+
+    from rich.live import Live
+
+    if since_seq is not None:
+        state.last_seq = since_seq
+
+    sink = None
+    if ndjson is not None:
+        sink = sys.stdout if ndjson == "-" else open(ndjson, "a", buffering=1 << 16)
+    consumer = StreamConsumer(
+        api_url, state, on_detection=ndjson_sink(sink) if sink else None, reconnect=reconnect
     )
-    
-    ws_url = api_url.replace("http", "ws") + "/ws/stream"
-    start_time = datetime.now()
-    detection_count = 0
-    
+    task = asyncio.create_task(consumer.run())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration if duration > 0 else None
+
+    def expired() -> bool:
+        return task.done() or (deadline is not None and loop.time() >= deadline)
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(ws_url) as ws:
-                console.print("[green]✓ Connected[/green]\n")
-                
-                while (datetime.now() - start_time).total_seconds() < duration:
-                    try:
-                        msg = await asyncio.wait_for(ws.receive_json(), timeout=1.0)
-                        
-                        if msg.get("type") == "detection":
-                            detection_count += 1
-                            data = msg.get("data", {})
-                            
-                            severity = data.get("severity", "unknown")
-                            confidence = data.get("confidence", 0)
-                            wind_shear = data.get("max_wind_shear", 0)
-                            
-                            severity_color = {
-                                "severe": "red",
-                                "extreme": "dark_red",
-                                "moderate": "yellow",
-                                "low": "green"
-                            }.get(severity, "white")
-                            
-                            console.print(
-                                f"[{severity_color}]●[/{severity_color}] "
-                                f"[bold]{severity.upper()}[/bold] "
-                                f"Confidence: {confidence:.2%} "
-                                f"Wind Shear: {wind_shear:.1f} m/s"
-                            )
-                    
-                    except asyncio.TimeoutError:
-                        continue
-                    except Exception as e:
-                        console.print(f"[yellow]Warning: {e}[/yellow]")
+        if sink is not None:
+            # Headless: no rendering, only periodic flushes
+            while not expired():
+                await asyncio.wait({task}, timeout=1.0)
+                sink.flush()
+        else:
+            with Live(render(state, api_url), console=console, auto_refresh=False) as live:
+                while not expired():
+                    await asyncio.wait({task}, timeout=1.0 / fps)
+                    state.tick()
+                    live.update(render(state, api_url), refresh=True)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        if sink is not None:
+            sink.flush()
+            if sink is not sys.stdout:
+                sink.close()
+
+
+@app.command()
+def stream(
+    api_url: str = typer.Option("http://localhost:8000", "--api", help="API server URL"),
+    duration: float = typer.Option(
+        60, "--duration", help="Stream duration in seconds (0 = until interrupted)"
+    ),
+    fps: float = typer.Option(
+        4.0, "--fps", min=0.5, max=30.0, help="Live view refreshes per second"
+    ),
+    ndjson: Optional[str] = typer.Option(
+        None,
+        "--ndjson",
+        help=(
+            "Append detection messages to this NDJSON file ('-' for stdout) "
+            "instead of the live view"
+        ),
+    ),
+    since_seq: Optional[int] = typer.Option(
+        None, "--since-seq", min=0, help="Replay detections after this sequence number first"
+    ),
+    reconnect: bool = typer.Option(
+        True, "--reconnect/--no-reconnect", help="Reconnect and resume after connection loss"
+    )
+) -> None:
+    """
+    Stream real-time detections from WebSocket server.
+
+    The live view redraws at --fps with counts aggregated between frames, so
+    bursts of detections never back up behind the terminal. After a dropped
+    connection the stream reconnects and resumes from the last sequence
+    number it saw; with --ndjson every detection is written as it arrives.
+
+    Example:
+        microburst-detect stream --api http://localhost:8000 --duration 120
+        microburst-detect stream --duration 0 --ndjson detections.ndjson
+    """
+    state = StreamState()
+    try:
+        asyncio.run(_stream_async(state, api_url, duration, fps, ndjson, since_seq, reconnect))
+    except KeyboardInterrupt:
+        pass
+    summary = Console(stderr=True) if ndjson == "-" else console
+    summary.print(
+        f"[green]Session ended[/green] - Detections: {state.total}, "
+        f"last seq: {state.last_seq if state.last_seq is not None else '-'}, "
+        f"reconnects: {state.reconnects}, replayed: {state.replayed}, missed: {state.missed}"
+    )
+    if state.connections == 0 and state.last_error:
+        summary.print(f"[red]Connection error: {state.last_error}[/red]", style="bold")
+        raise typer.Exit(code=1)
+
+
+async def _latency_async(api_url: str) -> dict:
+    """Fetch the latency report from the API."""
+    import aiohttp
     
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{api_url}/latency") as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+@app.command()
+def latency(
+    api_url: str = typer.Option("http://localhost:8000", "--api", help="API server URL"),
+    fail_on_breach: bool = typer.Option(
+        False, "--fail-on-breach", help="Exit with code 1 when the p99 budget is exceeded"
+    )
+) -> None:
+    """
+    Show end-to-end detection latency (sensor timestamp to alert delivered).
+
+    Example:
+        microburst-detect latency --api http://localhost:8000 --fail-on-breach
+    """
+    try:
+        report = asyncio.run(_latency_async(api_url))
     except Exception as e:
         console.print(f"[red]Connection error: {e}[/red]", style="bold")
         raise typer.Exit(code=1)
-    
-    finally:
-        elapsed = (datetime.now() - start_time).total_seconds()
-        console.print(
-            f"\n[green]Session ended[/green] - "
-            f"Duration: {elapsed:.1f}s, Detections: {detection_count}"
+
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.1f}"
+
+    budget = report["budget_seconds"]
+    table = Table(title=f"End-to-End Latency (ms) - budget p99 ≤ {budget * 1000:.0f} ms")
+    for column in ("Sensor", "Site", "Stage", "Count", "p50", "p90", "p99", "Max", "Window p99"):
+        key = column in ("Sensor", "Site", "Stage")
+        table.add_column(column, style="cyan" if key else "magenta")
+
+    for row in report["summaries"]:
+        window_p99 = ms(row["window_p99"])
+        if row["window_p99"] is not None and row["window_p99"] > budget:
+            window_p99 = f"[bold red]{window_p99}[/bold red]"
+        table.add_row(
+            row["sensor_type"], row["site"], row["stage"], str(row["count"]),
+            ms(row["p50"]), ms(row["p90"]), ms(row["p99"]), ms(row["max"]), window_p99
         )
 
+    console.print(table)
+
+    breaches = report["breaches"]
+    if breaches:
+        for breach in breaches:
+            console.print(
+                f"[red]✗ {breach['sensor_type']}@{breach['site']} {breach['stage']} "
+                f"p99 {ms(breach['window_p99'])} ms exceeds budget[/red]"
+            )
+        if fail_on_breach:
+            raise typer.Exit(code=1)
+    else:
+        console.print("[green]✓ All sensors within latency budget[/green]")
+
 
 @app.command()
-def stream(
+def loadtest(
     api_url: str = typer.Option("http://localhost:8000", "--api", help="API server URL"),
-    duration: int = typer.Option(60, "--duration", help="Stream duration in seconds")
+    rate: float = typer.Option(200.0, "--rate", help="Target requests per second"),
+    duration: float = typer.Option(30.0, "--duration", help="Seconds of load"),
+    subscribers: int = typer.Option(10, "--subscribers", help="WebSocket subscribers"),
+    concurrency: int = typer.Option(64, "--concurrency", help="Pooled HTTP connections"),
+    sensors: int = typer.Option(100, "--sensors", help="Distinct sensor ids"),
+    hazard_ratio: float = typer.Option(
+        0.05, "--hazard-ratio", help="Fraction of readings that trigger detections"
+    ),
+    sensor_types: Optional[List[str]] = typer.Option(
+        None, "--sensor", help="Sensor type to send (repeatable; default: all)"
+    ),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed"),
+    json_output: Optional[Path] = typer.Option(None, "--json", help="Write the report as JSON")
 ) -> None:
     """
-    Stream real-time detections from WebSocket server.
+    Load-test the API and WebSocket stream with synthetic readings.
+    
+    Readings are posted at a fixed rate over pooled connections while
+    subscribers listen on /ws/stream. Reports ingest throughput, response
+    latency percentiles and reading-to-delivery latency seen by subscribers.
     
     Example:
-        microburst-detect stream --api http://localhost:8000 --duration 120
+        microburst-detect loadtest --rate 500 --duration 60 --subscribers 50
     """
-    asyncio.run(_stream_async(api_url, duration))
+    from microburst_detection.cli.loadtest import SENSOR_TYPES, run_load_test
+    
+    kinds = tuple(sensor_types) if sensor_types else SENSOR_TYPES
+    unknown = [kind for kind in kinds if kind not in SENSOR_TYPES]
+    if unknown or rate <= 0 or duration <= 0:
+        console.print(
+            f"[red]Invalid options: sensor types must be {', '.join(SENSOR_TYPES)}; "
+            f"rate and duration must be positive[/red]"
+        )
+        raise typer.Exit(code=1)
+    
+    console.print(
+        Panel(
+            f"[bold cyan]{api_url}[/bold cyan]\n"
+            f"Rate: {rate:g}/s for {duration:g}s, {subscribers} subscribers, "
+            f"{concurrency} connections",
+            title="Load Test"
+        )
+    )
+    
+    try:
+        with console.status("[cyan]Connecting...") as status:
+            def tick(stats, elapsed: float) -> None:
+                status.update(
+                    f"[cyan]{elapsed:.0f}s: {stats.completed:,}/{stats.scheduled:,} requests, "
+                    f"{stats.detections:,} detections, {len(stats.deliveries):,} deliveries"
+                )
+            result = asyncio.run(run_load_test(
+                api_url, rate=rate, duration=duration, subscribers=subscribers,
+                concurrency=concurrency, sensors=sensors, hazard_ratio=hazard_ratio,
+                sensor_types=kinds, seed=seed, on_tick=tick
+            ))
+    except OSError as e:
+        console.print(f"[red]Connection error: {e}[/red]", style="bold")
+        raise typer.Exit(code=1)
+    
+    requests = result["requests"]
+    delivery = result["delivery"]
+    
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.1f}ms"
+    
+    table = Table(title="Load Test Results")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta", justify="right")
+    table.add_row("Requests completed", f"{requests['completed']:,} / {requests['scheduled']:,}")
+    table.add_row("Skipped (client backlog)", f"{requests['skipped']:,}")
+    table.add_row(
+        "Statuses", ", ".join(f"{code}: {n:,}" for code, n in requests["statuses"].items()) or "-"
+    )
+    table.add_row(
+        "Throughput", f"{requests['achieved_rate']:,.1f}/s (target {requests['target_rate']:g}/s)"
+    )
+    subscribers = delivery["subscribers"]
+    failed = delivery["subscribers_failed"]
+    table.add_row("Subscribers", f"{subscribers} connected, {failed} failed")
+    table.add_row("Detections", f"{delivery['detections']:,}")
+    table.add_row("Deliveries", f"{delivery['received']:,} / {delivery['expected']:,} expected")
+    console.print(table)
+    
+    latency = Table(title="Latency")
+    latency.add_column("Measure", style="cyan")
+    for column in ("p50", "p90", "p99", "max"):
+        latency.add_column(column, style="magenta", justify="right")
+    for label, values in (
+        ("Response (from due time)", result["latency"]),
+        ("Response (from send)", result["service_time"]),
+        ("Reading → subscriber", delivery["latency"]),
+    ):
+        latency.add_row(label, *(ms(values[key]) for key in ("p50", "p90", "p99", "max")))
+    console.print(latency)
+    
+    if json_output is not None:
+        json_output.write_text(json.dumps(result, indent=2))
+        console.print(f"[green]✓ Report saved to {json_output}[/green]")
 
 
 @app.command()
@@ -250,6 +522,91 @@ def version() -> None:
     )
 
 
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    """ISO date/datetime option (naive = UTC) to epoch seconds."""
+    if value is None:
+        return None
+    from microburst_detection.utils.timeutils import to_epoch
+    return to_epoch(datetime.fromisoformat(value))
+
+
+@app.command()
+def export(
+    output: Path = typer.Option(..., "--output", "-o", help="Output directory"),
+    source: str = typer.Option(
+        "all", "--source", help="detections, lidar, radar, anemometer or all"
+    ),
+    database: Optional[Path] = typer.Option(
+        None, "--database", help="Detection database (default: from settings)"
+    ),
+    archive: Optional[Path] = typer.Option(
+        None, "--archive", help="Raw archive directory (default: RAW_ARCHIVE_PATH)"
+    ),
+    since: Optional[str] = typer.Option(None, "--since", help="Start date/time (ISO, UTC)"),
+    until: Optional[str] = typer.Option(None, "--until", help="End date/time (ISO, UTC)"),
+    chunk_size: int = typer.Option(50000, "--chunk-size", help="Rows per chunk")
+) -> None:
+    """
+    Export detections and raw readings to Parquet partitioned by day and site.
+    
+    Writes <output>/<source>/date=YYYY-MM-DD/site=XXXX/part-NNNN.parquet,
+    readable with pandas.read_parquet(<output>/<source>).
+    
+    Example:
+        microburst-detect export -o ./lake --since 2025-11-01 --until 2025-12-01
+    """
+    from microburst_detection.storage.archive import DTYPES, RawArchiveReader
+    from microburst_detection.storage.detection_store import SQLiteDetectionStore
+    from microburst_detection.storage.export import export_detections, export_readings
+    from microburst_detection.storage.persistence import sqlite_path_from_url
+    from microburst_detection.utils.config import Settings
+    
+    valid = ("detections", *DTYPES)
+    if source != "all" and source not in valid:
+        console.print(f"[red]Unknown source '{source}' (choose from {', '.join(valid)}, all)[/red]")
+        raise typer.Exit(code=1)
+    
+    settings = Settings()
+    start, end = _parse_time(since), _parse_time(until)
+    sources = valid if source == "all" else (source,)
+    
+    table = Table(title="Parquet Export")
+    table.add_column("Source", style="cyan")
+    table.add_column("Rows", style="magenta")
+    table.add_column("Files", style="magenta")
+    
+    try:
+        for name in sources:
+            if name == "detections":
+                if database is None:
+                    database = (
+                        Path(settings.state_path) if settings.state_backend == "sqlite"
+                        else sqlite_path_from_url(settings.database_url)
+                    )
+                if not database.exists():
+                    console.print(f"[yellow]No detection database at {database}[/yellow]")
+                    continue
+                store = SQLiteDetectionStore(database)
+                try:
+                    summary = export_detections(
+                        store, output / name, start, end, chunk_size=chunk_size
+                    )
+                finally:
+                    store.close()
+            else:
+                reader = RawArchiveReader(archive or Path(settings.raw_archive_path))
+                summary = export_readings(
+                    reader, name, output / name, start, end, chunk_size=chunk_size
+                )
+            table.add_row(name, str(summary["rows"]), str(len(summary["files"])))
+    except ImportError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    
+    console.print(table)
+    console.print(f"[green]✓ Exported to {output}[/green]")
+
+
 @app.command()
 def config(
     show: bool = typer.Option(False, "--show", help="Show current configuration"),
@@ -280,6 +637,7 @@ def config(
         config = json.load(f)
     
     if show:
+        from rich.syntax import Syntax
         console.print(Panel(Syntax(json.dumps(config, indent=2), "json"), title="Configuration"))
     
     if set_value:
@@ -294,41 +652,224 @@ def config(
             raise typer.Exit(code=1)
 
 
+def _duration(seconds: Optional[float]) -> str:
+    """Human-readable duration for benchmark tables."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
 @app.command()
-def benchmark() -> None:
+def benchmark(
+    select: Optional[List[str]] = typer.Option(
+        None, "--filter", "-k", help="Case name glob or substring (repeatable)"
+    ),
+    quick: bool = typer.Option(False, "--quick", help="Only the smallest size of each case"),
+    min_time: float = typer.Option(0.2, "--min-time", help="Seconds of sampling per case and size"),
+    json_output: Optional[Path] = typer.Option(None, "--json", help="Write results as JSON"),
+    baseline: Optional[Path] = typer.Option(
+        None, "--baseline", help="Compare against results saved with --json"
+    ),
+    threshold: float = typer.Option(
+        0.10, "--threshold", help="Allowed slowdown before a case counts as regressed (0.10 = 10%)"
+    ),
+    metric: str = typer.Option(
+        "p50", "--metric", help="Statistic compared: p50, p90, p99, mean or min"
+    ),
+    list_cases: bool = typer.Option(False, "--list", help="List cases and exit")
+) -> None:
+    """
+    Run the performance benchmark suite.
+    
+    Covers the algorithms, both fusion implementations, the detector per
+    sensor type, serialization and the HTTP/WebSocket path, sweeping input
+    sizes and reporting per-call percentiles. Exits with code 1 when any
+    case regressed against --baseline.
+    
+    Example:
+        microburst-detect benchmark --json baseline.json
+        microburst-detect benchmark -k detector -k fusion --baseline baseline.json --threshold 0.15
     """
-    Run performance benchmark of detection algorithms.
+    from microburst_detection.benchmarks import runner
+    
+    if metric not in ("p50", "p90", "p99", "mean", "min"):
+        console.print(f"[red]Unknown metric '{metric}'[/red]")
+        raise typer.Exit(code=1)
+    
+    cases = runner.select(select)
+    if list_cases:
+        table = Table(title="Benchmark Cases")
+        table.add_column("Case", style="cyan")
+        table.add_column("Sizes", style="magenta")
+        table.add_column("Size unit")
+        for case in cases:
+            table.add_row(case.name, ", ".join(map(str, case.sizes)), case.unit)
+        console.print(table)
+        return
+    if not cases:
+        console.print("[yellow]No benchmark cases match[/yellow]")
+        raise typer.Exit(code=1)
+    
+    previous = None
+    if baseline is not None:
+        try:
+            previous = runner.load(baseline)["results"]
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Cannot read baseline: {e}[/red]")
+            raise typer.Exit(code=1)
+    
+    console.print(f"[bold cyan]Running {len(cases)} benchmark cases...[/bold cyan]\n")
+    with console.status("[cyan]Benchmarking...") as status:
+        results = runner.run(
+            cases, min_time=min_time, quick=quick,
+            on_result=lambda result: status.update(f"[cyan]{runner.result_key(result)}")
+        )
+    
+    comparison = {}
+    if previous is not None:
+        comparison = {
+            row["key"]: row for row in runner.compare(results, previous, threshold, metric)
+        }
+    
+    table = Table(title="Benchmark Results (per call)")
+    table.add_column("Case", style="cyan", no_wrap=True, min_width=max(len(c.name) for c in cases))
+    for column in ("Size", "p50", "p99"):
+        table.add_column(column, style="magenta", justify="right", no_wrap=True)
+    if previous is not None:
+        table.add_column(f"Δ {metric}", justify="right", no_wrap=True)
+    styles = {"regressed": "red", "improved": "green", "ok": "white", "new": "yellow"}
+    for result in results:
+        row = [
+            result["name"], str(result["size"]), _duration(result["p50"]), _duration(result["p99"])
+        ]
+        if previous is not None:
+            compared = comparison[runner.result_key(result)]
+            label = "new" if compared["change"] is None else f"{compared['change']:+.1%}"
+            row.append(f"[{styles[compared['status']]}]{label}[/{styles[compared['status']]}]")
+        table.add_row(*row)
+    console.print(table)
+    
+    if json_output is not None:
+        runner.save(results, json_output)
+        console.print(f"[green]✓ Results saved to {json_output}[/green]")
+    
+    regressed = [row for row in comparison.values() if row["status"] == "regressed"]
+    if regressed:
+        console.print(
+            f"[red]{len(regressed)} case(s) regressed by more than {threshold:.0%}: "
+            f"{', '.join(row['key'] for row in regressed)}[/red]"
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def profile(
+    inputs: Optional[List[str]] = typer.Argument(
+        None,
+        help="Recorded readings to replay (files, directories or globs); synthetic when omitted",
+    ),
+    sensor: Optional[str] = typer.Option(
+        None, "--sensor", help="Sensor type of the recorded inputs (inferred when omitted)"
+    ),
+    readings: int = typer.Option(
+        6000,
+        "--readings",
+        "-n",
+        min=1,
+        help="Synthetic readings, or the most recorded ones replayed",
+    ),
+    hazard_ratio: float = typer.Option(
+        0.05,
+        "--hazard-ratio",
+        min=0.0,
+        max=1.0,
+        help="Fraction of synthetic readings that trigger a detection",
+    ),
+    seed: int = typer.Option(0, "--seed", help="Random seed for synthetic readings"),
+    output: Path = typer.Option(
+        Path("profile"), "--output", "-o", help="Directory for the reports"
+    ),
+    top: int = typer.Option(20, "--top", min=1, help="Functions and allocation sites listed"),
+    interval: float = typer.Option(
+        1.0, "--interval", min=0.1, help="Stack sampling interval in milliseconds"
+    ),
+    allocations: bool = typer.Option(True, "--alloc/--no-alloc", help="Run the tracemalloc pass"),
+    sampling: bool = typer.Option(True, "--sample/--no-sample", help="Run the stack sampling pass")
+) -> None:
     """
-    import time
-    import numpy as np
-    from microburst_detection.core.algorithms import WindShearDetector
+    Profile the detection and fusion pipeline.
     
-    console.print("[bold cyan]Running Performance Benchmark...[/bold cyan]\n")
+    Replays readings through validation, detection, fusion and serialization
+    (the server's ingest path without HTTP) under cProfile, a stack sampler
+    and tracemalloc, one pass each. Writes cpu.pstats, functions.txt,
+    stacks.collapsed (for flamegraph.pl or speedscope), allocations.txt and
+    summary.json, and prints the time spent per pipeline stage.
     
-    # Generate synthetic data
-    altitudes = np.linspace(0, 3000, 100)
-    vertical_velocities = np.sin(np.linspace(0, 4*np.pi, 100)) * 10
+    Example:
+        microburst-detect profile -n 20000 -o profile/
+        microburst-detect profile archive/radar/ --sensor radar -n 5000
+    """
+    from microburst_detection.cli import profiling
     
-    # Benchmark wind shear detection
-    iterations = 1000
-    start = time.time()
+    if sensor is not None and sensor not in profiling.SENSOR_TYPES:
+        console.print(f"[red]Unknown sensor type '{sensor}'[/red]")
+        raise typer.Exit(code=1)
+    try:
+        if inputs:
+            workload = list(profiling.recorded_workload(inputs, sensor_type=sensor, limit=readings))
+        else:
+            workload = profiling.synthetic_workload(readings, hazard_ratio=hazard_ratio, seed=seed)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]", style="bold")
+        raise typer.Exit(code=1)
+    if not workload:
+        console.print("[yellow]No readings to profile[/yellow]")
+        raise typer.Exit(code=1)
     
-    for _ in range(iterations):
-        WindShearDetector.calculate_wind_shear(altitudes, vertical_velocities)
+    with console.status(f"[cyan]Profiling {len(workload):,} readings..."):
+        summary = profiling.profile_workload(
+            workload, output, top=top, interval=interval / 1000.0,
+            allocations=allocations, sampling=sampling
+        )
     
-    elapsed = time.time() - start
-    avg_time = (elapsed / iterations) * 1000
+    counts = summary["counts"]
+    console.print(
+        f"{counts['readings']:,} readings ({counts['invalid']:,} invalid), "
+        f"{counts['detections']:,} detections; unprofiled "
+        f"{summary['baseline']['readings_per_second']:,.0f} readings/s"
+    )
     
-    results_table = Table(title="Benchmark Results")
-    results_table.add_column("Metric", style="cyan")
-    results_table.add_column("Value", style="magenta")
+    table = Table(title="Pipeline Stages (inclusive)")
+    table.add_column("Stage", style="cyan", no_wrap=True)
+    for column in ("Calls", "cProfile", "Share", "Sampled"):
+        table.add_column(column, style="magenta", justify="right", no_wrap=True)
+    for row in summary["stages"]:
+        sampled = row.get("sampled_share")
+        table.add_row(
+            row["stage"], f"{row['calls']:,}", _duration(row["cumulative"]), f"{row['share']:.1%}",
+            "-" if sampled is None else f"{sampled:.1%}"
+        )
+    console.print(table)
     
-    results_table.add_row("Total Iterations", str(iterations))
-    results_table.add_row("Total Time", f"{elapsed:.3f}s")
-    results_table.add_row("Average Time", f"{avg_time:.3f}ms")
-    results_table.add_row("Throughput", f"{1000/avg_time:.0f} ops/sec")
+    table = Table(title="Top Functions (self time)")
+    table.add_column("Function", style="cyan", overflow="fold")
+    for column in ("Calls", "Self", "Cumulative"):
+        table.add_column(column, style="magenta", justify="right", no_wrap=True)
+    for row in summary["functions"][:10]:
+        table.add_row(
+            row["function"],
+            f"{row['calls']:,}",
+            _duration(row["tottime"]),
+            _duration(row["cumtime"]),
+        )
+    console.print(table)
     
-    console.print(results_table)
+    if summary["allocations"] is not None:
+        console.print(f"Peak traced memory: {summary['allocations']['peak_bytes'] / 1024:.1f} KiB")
+    console.print(f"[green]✓ Reports written to {output}/[/green]")
 
 
 if __name__ == "__main__":
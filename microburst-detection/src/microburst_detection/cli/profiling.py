@@ -0,0 +1,428 @@
+# src/microburst_detection/cli/profiling.py
+"""Pipeline profiler for ``microburst-detect profile``: cProfile, tracemalloc and stack sampling."""
+
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import pstats
+import random
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from ..core.detector import MicroburstDetector
+from ..core.models import READING_MODELS, validate_reading
+from ..storage.detection_store import MemoryDetectionStore
+from .batch import _peek, iter_chunks, iter_input_files, sensor_type_for
+from .loadtest import SENSOR_TYPES, synthetic_reading
+
+logger = logging.getLogger(__name__)
+
+#: One reading to push through the pipeline: sensor type and raw JSON (bytes) or mapping
+WorkItem = Tuple[str, object]
+
+#: Pipeline stages reported on their own: (stage, module under the package, function name)
+STAGES = (
+    ("validate", "core.models", "validate_reading"),
+    ("process_lidar", "core.detector", "process_lidar"),
+    ("process_radar", "core.detector", "process_radar"),
+    ("process_anemometer", "core.detector", "process_anemometer"),
+    ("calculate_wind_shear", "core.algorithms", "calculate_wind_shear"),
+    ("detect_hook_echo", "core.algorithms", "detect_hook_echo"),
+    ("_classify_severity", "core.detector", "_classify_severity"),
+    ("store.add", "storage.detection_store", "add"),
+    ("fuse", "core.detector", "fuse"),
+    ("fuse_measurements", "fusion.data_fusion", "fuse_measurements"),
+    ("_predict", "fusion.data_fusion", "_predict"),
+    ("_update", "fusion.data_fusion", "_update"),
+    ("to_json", "core.records", "to_json"),
+)
+
+# Import-time and tracer frames that would otherwise top the allocation report
+_ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def synthetic_workload(readings: int, hazard_ratio: float = 0.05, seed: int = 0) -> List[WorkItem]:
+    """
+    Readings cycling through every sensor type, as JSON bytes.
+
+    Args:
+        readings: Number of readings
+        hazard_ratio: Fraction that should trigger a detection
+        seed: Random seed
+
+    Returns:
+        Work items
+    """
+    rng = random.Random(seed)
+    workload = []
+    for i in range(readings):
+        kind = SENSOR_TYPES[i % len(SENSOR_TYPES)]
+        reading = synthetic_reading(kind, rng, rng.random() < hazard_ratio, f"profile-{i % 50:03d}")
+        workload.append((kind, json.dumps(reading).encode()))
+    return workload
+
+
+def recorded_workload(
+    inputs: Sequence[str],
+    sensor_type: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Iterator[WorkItem]:
+    """
+    Readings from recorded files (anything ``analyze`` accepts in batch mode).
+
+    Args:
+        inputs: Files, directories or glob patterns
+        sensor_type: Sensor type for every file (inferred per file when None)
+        limit: Stop after this many readings
+
+    Yields:
+        Work items; files whose sensor type cannot be determined are skipped
+    """
+    count = 0
+    for path in iter_input_files(inputs):
+        kind = sensor_type
+        for chunk in iter_chunks(path, 10000):
+            if kind is None:
+                kind = sensor_type_for(path, _peek(chunk))
+                if kind is None:
+                    logger.warning(f"Skipping {path}: unknown sensor type")
+                    break
+            for item in chunk:
+                yield kind, item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+
+async def _pipeline(workload: Sequence[WorkItem], detector: MicroburstDetector) -> Dict[str, int]:
+    """The server's per-reading path without HTTP: validate, detect, fuse, serialize."""
+    process = {kind: getattr(detector, f"process_{kind}") for kind in SENSOR_TYPES}
+    invalid = detections = 0
+    for sensor_type, raw in workload:
+        try:
+            data = validate_reading(READING_MODELS[sensor_type], raw)
+        except ValidationError:
+            invalid += 1
+            continue
+        detection = await process[sensor_type](data)
+        detector.fuse(data)
+        if detection is not None:
+            detection.to_json()
+            detections += 1
+    return {"readings": len(workload), "invalid": invalid, "detections": detections}
+
+
+def run_pipeline(workload: Sequence[WorkItem]) -> Tuple[Dict[str, int], float]:
+    """
+    Run the workload once through a fresh detector.
+
+    Returns:
+        Counts (readings, invalid, detections) and elapsed seconds
+    """
+    detector = MicroburstDetector(store=MemoryDetectionStore())
+    started = time.perf_counter()
+    counts = asyncio.run(_pipeline(workload, detector))
+    return counts, time.perf_counter() - started
+
+
+class StackSampler:
+    """
+    Samples the Python stack at a fixed interval of CPU time.
+
+    Stacks are counted in the collapsed format flamegraph tools read
+    (``root;caller;callee count``). Frames are labelled ``module:qualname``.
+    With a ``root``, stacks start there and samples taken while it is not
+    on the stack (event loop setup and teardown) are dropped, so the graph
+    covers only the workload.
+
+    On POSIX the main thread is sampled from a ``SIGPROF`` interval timer,
+    which interrupts it between bytecodes wherever it is. Elsewhere (or off
+    the main thread) a background thread samples the calling thread; it can
+    only look while that thread has released the GIL, which over-weights
+    code that calls into releasing C functions (NumPy, SciPy, I/O).
+    """
+
+    def __init__(self, interval: float = 0.001, root: Optional[CodeType] = None) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds of CPU time between samples
+            root: Code object at which stacks start
+        """
+        self.interval = interval
+        self.root = root
+        self.counts: Counter = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_handler = None
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        self.use_signal = hasattr(signal, "setitimer") and on_main_thread
+
+    @property
+    def samples(self) -> int:
+        return sum(self.counts.values())
+
+    def _label(self, code: CodeType, module: str) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{module}:{code.co_qualname}"
+        return label
+
+    def _record(self, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(self._label(code, frame.f_globals.get("__name__", "?")))
+            if code is self.root:
+                break
+            frame = frame.f_back
+        else:
+            if self.root is not None:
+                return
+        if stack:
+            self.counts[";".join(reversed(stack))] += 1
+
+    def _on_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        self._record(frame)
+
+    def _run(self) -> None:
+        current_frames = sys._current_frames
+        while not self._stop.wait(self.interval):
+            self._record(current_frames().get(self._thread_id))
+
+    def start(self) -> None:
+        """Start sampling."""
+        if self.use_signal:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self.use_signal:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+
+    def collapsed(self) -> str:
+        """Counted stacks in collapsed format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+def _stage_matches(spec: Tuple[str, str, str]) -> Tuple[str, str]:
+    _, module, function = spec
+    return module.replace(".", "/") + ".py", function
+
+
+def stage_times(stats: pstats.Stats, total: float) -> List[dict]:
+    """
+    Inclusive time per pipeline stage from a cProfile run.
+
+    Returns:
+        ``stage``, ``calls``, ``cumulative`` seconds and ``share`` of ``total``
+        for each stage that ran
+    """
+    rows = []
+    for spec in STAGES:
+        suffix, function = _stage_matches(spec)
+        calls = cumulative = 0
+        for (filename, _, name), (_, ncalls, _, cumtime, _) in stats.stats.items():
+            if name == function and filename.replace("\\", "/").endswith(suffix):
+                calls += ncalls
+                cumulative += cumtime
+        if calls:
+            rows.append({
+                "stage": spec[0],
+                "calls": calls,
+                "cumulative": cumulative,
+                "share": cumulative / total if total > 0 else 0.0,
+            })
+    return rows
+
+
+def stage_samples(counts: Counter) -> Dict[str, float]:
+    """Fraction of stack samples in which each stage was on the stack."""
+    total = sum(counts.values())
+    if not total:
+        return {}
+    shares = {}
+    for stage, module, function in STAGES:
+        hits = 0
+        for stack, count in counts.items():
+            for frame in stack.split(";"):
+                frame_module, _, qualname = frame.partition(":")
+                if frame_module.endswith(module) and qualname.rsplit(".", 1)[-1] == function:
+                    hits += count
+                    break
+        if hits:
+            shares[stage] = hits / total
+    return shares
+
+
+def top_functions(stats: pstats.Stats, limit: int) -> List[dict]:
+    """Functions with the most self time."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": pstats.func_std_string(pstats.func_strip_path(key)),
+            "calls": ncalls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        }
+        for key, (_, ncalls, tottime, cumtime, _) in rows
+    ]
+
+
+def profile_workload(
+    workload: Sequence[WorkItem],
+    output: Path,
+    top: int = 25,
+    interval: float = 0.001,
+    allocations: bool = True,
+    sampling: bool = True
+) -> dict:
+    """
+    Profile the detection and fusion pipeline over a workload.
+
+    The workload runs once unprofiled (warming caches and giving the
+    baseline throughput), then once per profiler with a fresh detector each
+    time, so cProfile's tracing overhead does not distort the sampled
+    stacks or allocation figures.
+
+    Files written to ``output``:
+
+    - ``cpu.pstats``: cProfile data (``python -m pstats``, snakeviz)
+    - ``functions.txt``: functions by cumulative and by self time
+    - ``stacks.collapsed``: sampled stacks for flamegraph.pl or speedscope
+    - ``allocations.txt``: tracemalloc growth by line, and peak usage
+    - ``summary.json``: everything below
+
+    Args:
+        workload: Work items (materialized; it is replayed per pass)
+        output: Directory for the reports
+        top: Functions and allocation sites listed
+        interval: Stack sampling interval in seconds
+        allocations: Run the tracemalloc pass
+        sampling: Run the stack sampling pass
+
+    Returns:
+        ``counts``, ``baseline`` (seconds, readings per second), ``stages``,
+        ``functions``, ``samples`` and ``allocations`` (None when skipped)
+    """
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    counts, baseline = run_pipeline(workload)
+
+    profiler = cProfile.Profile()
+    detector = MicroburstDetector(store=MemoryDetectionStore())
+    started = time.perf_counter()
+    profiler.enable()
+    asyncio.run(_pipeline(workload, detector))
+    profiler.disable()
+    profiled = time.perf_counter() - started
+    profiler.dump_stats(output / "cpu.pstats")
+
+    stats = pstats.Stats(profiler)
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(top)
+    pstats.Stats(profiler, stream=report).sort_stats("tottime").print_stats(top)
+    (output / "functions.txt").write_text(report.getvalue())
+    total = max(stats.total_tt, 1e-12)
+    stages = stage_times(stats, total)
+
+    samples = None
+    if sampling:
+        detector = MicroburstDetector(store=MemoryDetectionStore())
+        sampler = StackSampler(interval=interval, root=_pipeline.__code__)
+        sampler.start()
+        try:
+            asyncio.run(_pipeline(workload, detector))
+        finally:
+            sampler.stop()
+        (output / "stacks.collapsed").write_text(sampler.collapsed())
+        shares = stage_samples(sampler.counts)
+        for row in stages:
+            row["sampled_share"] = shares.get(row["stage"])
+        samples = sampler.samples
+
+    allocation_report = None
+    if allocations:
+        allocation_report = _profile_allocations(workload, output / "allocations.txt", top)
+
+    summary = {
+        "counts": counts,
+        "baseline": {
+            "seconds": baseline,
+            "readings_per_second": counts["readings"] / baseline if baseline > 0 else 0.0,
+        },
+        "profiled_seconds": profiled,
+        "stages": stages,
+        "functions": top_functions(stats, top),
+        "samples": samples,
+        "allocations": allocation_report,
+    }
+    (output / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
+
+
+def _profile_allocations(workload: Sequence[WorkItem], path: Path, top: int) -> dict:
+    """Run the workload under tracemalloc and write the allocation report."""
+    detector = MicroburstDetector(store=MemoryDetectionStore())
+    tracemalloc.start(25)
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS)
+        tracemalloc.reset_peak()
+        asyncio.run(_pipeline(workload, detector))
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS)
+    finally:
+        tracemalloc.stop()
+
+    growth = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0][:top]
+    retained = after.compare_to(before, "traceback")[:3]
+    lines = [
+        f"Peak traced memory: {peak / 1024:.1f} KiB", "", f"Top {len(growth)} lines by growth:"
+    ]
+    lines += [f"  {stat}" for stat in growth]
+    lines += ["", "Largest growth by traceback:"]
+    for stat in retained:
+        lines.append(f"  {stat.size_diff / 1024:.1f} KiB in {stat.count_diff} blocks")
+        lines += [f"    {line}" for line in stat.traceback.format(most_recent_first=True)[:12]]
+    path.write_text("\n".join(lines) + "\n")
+
+    return {
+        "peak_bytes": peak,
+        "top": [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in growth
+        ],
+    }
@@ -0,0 +1,235 @@
+# src/microburst_detection/cli/stream.py
+"""WebSocket detection consumer for ``microburst-detect stream``: live view, NDJSON sink, resume."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import Counter, deque
+from typing import IO, Callable, Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_COLORS = {
+    "low": "green",
+    "moderate": "yellow",
+    "severe": "red",
+    "extreme": "dark_red",
+}
+
+
+class StreamState:
+    """
+    Running aggregate of the stream.
+
+    Events only update counters here; the live view renders this state at
+    its own frame rate, so the terminal never paces the consumer.
+    """
+
+    def __init__(self, recent: int = 10) -> None:
+        self.started = time.monotonic()
+        self.total = 0
+        self.by_severity: Counter = Counter()
+        self.by_site: Counter = Counter()
+        self.recent: Deque[dict] = deque(maxlen=recent)
+        self.max_wind_shear = 0.0
+        self.last_seq: Optional[int] = None
+        self.connected = False
+        self.connections = 0
+        self.reconnects = 0
+        self.replayed = 0
+        self.missed = 0
+        self.resets = 0
+        self.duplicates = 0
+        self.last_error: Optional[str] = None
+        self.alarm: Optional[dict] = None
+        self._rate_mark = (self.started, 0)
+        self.rate = 0.0
+
+    def hello(self, message: dict) -> None:
+        """Record a server ``hello``; a lower seq than ours means history was reset."""
+        seq = message.get("seq", 0)
+        if self.last_seq is None or seq < self.last_seq:
+            if self.last_seq is not None:
+                self.resets += 1
+            self.last_seq = seq
+        self.replayed += message.get("replayed", 0)
+        self.missed += message.get("missed", 0)
+
+    def accept(self, message: dict) -> bool:
+        """
+        Count a detection message.
+
+        Returns:
+            False for a duplicate (seq already seen, e.g. live and replayed)
+        """
+        seq = message.get("seq")
+        if seq is not None:
+            if self.last_seq is not None and seq <= self.last_seq:
+                self.duplicates += 1
+                return False
+            self.last_seq = seq
+        data = message.get("data") or {}
+        self.total += 1
+        self.by_severity[data.get("severity", "unknown")] += 1
+        self.by_site[data.get("site") or "-"] += 1
+        self.max_wind_shear = max(self.max_wind_shear, data.get("max_wind_shear") or 0.0)
+        self.recent.append(data)
+        return True
+
+    def tick(self) -> None:
+        """Update the events-per-second estimate (called once per frame)."""
+        now = time.monotonic()
+        then, count = self._rate_mark
+        if now - then >= 1.0:
+            self.rate = (self.total - count) / (now - then)
+            self._rate_mark = (now, self.total)
+
+
+class StreamConsumer:
+    """
+    Consumes ``/ws/stream`` with automatic reconnect and resume.
+
+    After a disconnect it reconnects with exponential backoff and passes the
+    last seen ``seq`` as ``since_seq``, so the server replays what was missed;
+    messages already seen are dropped by sequence number.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        state: StreamState,
+        on_detection: Optional[Callable[[dict, str], None]] = None,
+        reconnect: bool = True,
+        max_backoff: float = 10.0
+    ) -> None:
+        """
+        Initialize consumer.
+
+        Args:
+            api_url: Server base URL
+            state: Aggregate updated for every message
+            on_detection: Called with each new detection message and its raw text
+            reconnect: Reconnect after connection loss instead of returning
+            max_backoff: Longest wait between reconnect attempts (seconds)
+        """
+        self.ws_url = api_url.replace("http", "ws", 1) + "/ws/stream"
+        self.state = state
+        self.on_detection = on_detection
+        self.reconnect = reconnect
+        self.max_backoff = max_backoff
+
+    def url(self) -> str:
+        """Stream URL, resuming after the last seen sequence number."""
+        if self.state.last_seq is None:
+            return self.ws_url
+        return f"{self.ws_url}?since_seq={self.state.last_seq}"
+
+    def handle(self, text: str) -> None:
+        """Process one text frame."""
+        message = json.loads(text)
+        kind = message.get("type")
+        if kind == "detection":
+            if self.state.accept(message) and self.on_detection is not None:
+                self.on_detection(message, text)
+        elif kind == "hello":
+            self.state.hello(message)
+        elif kind == "latency_alarm":
+            self.state.alarm = message.get("data")
+
+    async def run(self) -> None:
+        """Consume until cancelled (or the first disconnect without ``reconnect``)."""
+        import aiohttp
+
+        backoff = 0.5
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(self.url(), heartbeat=15.0) as ws:
+                        self.state.connected = True
+                        self.state.connections += 1
+                        backoff = 0.5
+                        async for message in ws:
+                            if message.type == aiohttp.WSMsgType.TEXT:
+                                self.handle(message.data)
+                            elif message.type in (
+                                aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR
+                            ):
+                                break
+                        self.state.last_error = f"closed ({ws.close_code})"
+                except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+                    self.state.last_error = str(e) or type(e).__name__
+                self.state.connected = False
+                if not self.reconnect:
+                    return
+                self.state.reconnects += 1
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+                backoff = min(backoff * 2, self.max_backoff)
+
+
+def ndjson_sink(stream: IO[str]) -> Callable[[dict, str], None]:
+    """Detection callback appending each raw message to ``stream`` as one line."""
+    def write(message: dict, text: str) -> None:
+        stream.write(text)
+        stream.write("\n")
+    return write
+
+
+def render(state: StreamState, api_url: str):
+    """Build the live view for the current state."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    if state.connected:
+        status = "[green]connected[/green]"
+    else:
+        status = "[red]reconnecting[/red]" if state.connections else "[yellow]connecting[/yellow]"
+    header = (
+        f"{status}  {api_url}  up {time.monotonic() - state.started:.0f}s  "
+        f"seq {state.last_seq if state.last_seq is not None else '-'}\n"
+        f"[bold]{state.total:,}[/bold] detections  {state.rate:,.1f}/s  "
+        f"max shear {state.max_wind_shear:.1f} m/s  "
+        f"reconnects {state.reconnects}  replayed {state.replayed}  "
+        f"missed {state.missed}  duplicates {state.duplicates}"
+    )
+    if not state.connected and state.last_error:
+        header += f"\n[yellow]{state.last_error}[/yellow]"
+    if state.alarm:
+        header += f"\n[red]Latency alarm: {len(state.alarm.get('breaches', []))} breach(es)[/red]"
+
+    severities = Table(title="By severity", expand=True)
+    severities.add_column("Severity")
+    severities.add_column("Count", justify="right")
+    for severity in ("extreme", "severe", "moderate", "low"):
+        color = SEVERITY_COLORS[severity]
+        count = state.by_severity.get(severity, 0)
+        severities.add_row(f"[{color}]{severity}[/{color}]", f"{count:,}")
+
+    sites = Table(title="Top sites", expand=True)
+    sites.add_column("Site")
+    sites.add_column("Count", justify="right")
+    for site, count in state.by_site.most_common(5):
+        sites.add_row(site, f"{count:,}")
+
+    summary = Table.grid(expand=True)
+    summary.add_column(ratio=1)
+    summary.add_column(ratio=1)
+    summary.add_row(severities, sites)
+
+    recent = Table(title="Latest detections", expand=True)
+    for column in ("Time", "Site", "Severity", "Shear", "Confidence"):
+        recent.add_column(column, justify="right" if column in ("Shear", "Confidence") else "left")
+    for data in reversed(state.recent):
+        severity = data.get("severity", "unknown")
+        color = SEVERITY_COLORS.get(severity, "white")
+        recent.add_row(
+            str(data.get("timestamp", ""))[:19],
+            data.get("site") or "-",
+            f"[{color}]{severity.upper()}[/{color}]",
+            f"{data.get('max_wind_shear') or 0:.1f}",
+            f"{data.get('confidence') or 0:.0%}",
+        )
+
+    return Group(Panel(header, title="Detection Stream"), summary, recent)
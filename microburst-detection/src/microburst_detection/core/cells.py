@@ -0,0 +1,192 @@
+# src/microburst_detection/core/cells.py
+"""Storm cell tracking from scan to scan."""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+from .algorithms import ReflectivityAnalyzer
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000.0
+
+# Cells from ReflectivityAnalyzer.extract_cells plus their track
+TRACKED_CELL_DTYPE = np.dtype(ReflectivityAnalyzer.CELL_DTYPE.descr + [
+    ("track", np.int64),
+    ("scans", np.int32),        # scans the track has been seen in, this one included
+    ("duration", np.float32),   # seconds since the track was first seen
+    ("speed", np.float32),      # m/s, centroid motion since the previous scan
+    ("heading", np.float32),    # degrees the cell moves toward, 0 = north
+])
+
+
+class StormCellTracker:
+    """
+    Gives the storm cells of successive scans persistent track ids.
+
+    Each track's centroid is extrapolated with its last motion to the new
+    scan time, and current cells are matched to the predicted positions
+    closest pair first, within ``max_speed`` times the elapsed time plus
+    ``slack``. Unmatched cells start new tracks; tracks not matched for
+    ``expire_after`` seconds are dropped. Cells without coordinates (NaN
+    centroids) get a new track id every scan.
+    """
+
+    def __init__(
+        self, max_speed: float = 30.0, slack: float = 3000.0, expire_after: float = 600.0
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            max_speed: Fastest cell motion considered [m/s]
+            slack: Matching distance added for centroid jitter as cells change shape [m]
+            expire_after: Seconds a track survives without a matching cell
+        """
+        self.max_speed = max_speed
+        self.slack = slack
+        self.expire_after = expire_after
+
+        self._next_track = 1
+        self._ids = np.empty(0, dtype=np.int64)
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._u = np.empty(0)        # m/s east
+        self._v = np.empty(0)        # m/s north
+        self._seen = np.empty(0)     # epoch seconds of the last match
+        self._first = np.empty(0)
+        self._scans = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def tracks(self) -> List[int]:
+        """Ids of the live tracks."""
+        return self._ids.tolist()
+
+    def update(self, cells: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        Match a scan's cells to the live tracks.
+
+        Args:
+            cells: ``ReflectivityAnalyzer.CELL_DTYPE`` array of one scan
+            timestamp: Scan time (epoch seconds)
+
+        Returns:
+            The cells as a ``TRACKED_CELL_DTYPE`` array, in input order
+        """
+        live = timestamp - self._seen <= self.expire_after
+        if not live.all():
+            self._keep(live)
+
+        n = len(cells)
+        matched_track = np.full(n, -1)
+        located = np.flatnonzero(np.isfinite(cells["latitude"]) & np.isfinite(cells["longitude"]))
+        if len(located) and len(self._ids):
+            from scipy.spatial import cKDTree
+
+            elapsed = np.maximum(timestamp - self._seen, 0.0)
+            predicted_lat, predicted_lon = _offset(
+                self._lat, self._lon, self._u * elapsed, self._v * elapsed
+            )
+            limit = self.max_speed * elapsed + self.slack
+            # Candidate pairs from a tree on a plane projection (with margin
+            # for its distortion), then checked at their true distance
+            reference = float(np.mean(predicted_lat))
+            tree = cKDTree(
+                _project(cells["latitude"][located], cells["longitude"][located], reference)
+            )
+            predicted = _project(predicted_lat, predicted_lon, reference)
+            nearby = tree.query_ball_point(predicted, 1.25 * limit)
+            tracks = np.repeat(np.arange(len(nearby)), [len(found) for found in nearby])
+            candidates = located[np.concatenate(nearby).astype(np.int64)] if len(tracks) else tracks
+            distance = _distance(predicted_lat[tracks], predicted_lon[tracks],
+                                 cells["latitude"][candidates], cells["longitude"][candidates])
+            close = distance <= limit[tracks]
+            tracks, candidates, distance = tracks[close], candidates[close], distance[close]
+            # Closest pairs first; each track and each cell used once
+            order = np.argsort(distance, kind="stable")
+            taken = np.zeros(len(self._ids), dtype=bool)
+            for t, c in zip(tracks[order].tolist(), candidates[order].tolist()):
+                if not taken[t] and matched_track[c] < 0:
+                    taken[t] = True
+                    matched_track[c] = t
+
+        out = np.zeros(n, dtype=TRACKED_CELL_DTYPE)
+        for name in ReflectivityAnalyzer.CELL_DTYPE.names:
+            out[name] = cells[name]
+
+        matched = np.flatnonzero(matched_track >= 0)
+        if len(matched):
+            t = matched_track[matched]
+            elapsed = np.maximum(timestamp - self._seen[t], 1e-9)
+            east, north = _displacement(
+                self._lat[t], self._lon[t], cells["latitude"][matched], cells["longitude"][matched]
+            )
+            self._u[t] = east / elapsed
+            self._v[t] = north / elapsed
+            self._lat[t] = cells["latitude"][matched]
+            self._lon[t] = cells["longitude"][matched]
+            self._seen[t] = timestamp
+            self._scans[t] += 1
+            out["track"][matched] = self._ids[t]
+            out["scans"][matched] = self._scans[t]
+            out["duration"][matched] = timestamp - self._first[t]
+            out["speed"][matched] = np.hypot(self._u[t], self._v[t])
+            out["heading"][matched] = np.degrees(np.arctan2(self._u[t], self._v[t])) % 360.0
+
+        new = np.flatnonzero(matched_track < 0)
+        if len(new):
+            ids = np.arange(self._next_track, self._next_track + len(new))
+            self._next_track += len(new)
+            out["track"][new] = ids
+            out["scans"][new] = 1
+            # Cells without coordinates get an id but cannot be followed
+            keep = np.isin(new, located)
+            new, ids = new[keep], ids[keep]
+            self._ids = np.concatenate((self._ids, ids))
+            self._lat = np.concatenate((self._lat, cells["latitude"][new]))
+            self._lon = np.concatenate((self._lon, cells["longitude"][new]))
+            self._u = np.concatenate((self._u, np.zeros(len(new))))
+            self._v = np.concatenate((self._v, np.zeros(len(new))))
+            self._seen = np.concatenate((self._seen, np.full(len(new), float(timestamp))))
+            self._first = np.concatenate((self._first, np.full(len(new), float(timestamp))))
+            self._scans = np.concatenate((self._scans, np.ones(len(new), dtype=np.int32)))
+        return out
+
+    def _keep(self, mask: np.ndarray) -> None:
+        for name in ("_ids", "_lat", "_lon", "_u", "_v", "_seen", "_first", "_scans"):
+            setattr(self, name, getattr(self, name)[mask])
+
+
+def _distance(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Equirectangular distance [m], accurate at storm-motion scales."""
+    east, north = _displacement(lat1, lon1, lat2, lon2)
+    return np.hypot(east, north)
+
+
+def _displacement(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """East and north displacement [m] from the first position to the second."""
+    scale = np.radians(1.0) * EARTH_RADIUS_M
+    east = (lon2 - lon1) * scale * np.cos(np.radians((lat1 + lat2) / 2))
+    north = (lat2 - lat1) * scale
+    return east, north
+
+
+def _offset(
+    lat: np.ndarray, lon: np.ndarray, east: np.ndarray, north: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Position moved by an east/north displacement [m]."""
+    scale = np.radians(1.0) * EARTH_RADIUS_M
+    return lat + north / scale, lon + east / (scale * np.cos(np.radians(lat)))
+
+
+def _project(lat: np.ndarray, lon: np.ndarray, reference: float) -> np.ndarray:
+    """Points on a plane [m] (equirectangular about ``reference`` latitude)."""
+    scale = np.radians(1.0) * EARTH_RADIUS_M
+    return np.column_stack((lon * scale * np.cos(np.radians(reference)), lat * scale))
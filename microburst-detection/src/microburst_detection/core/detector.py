@@ -1,19 +1,41 @@
 # src/microburst_detection/core/detector.py
 """Main microburst detector orchestrator."""
 
+import asyncio
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Optional, List
+from math import pi
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, List, Sequence, Tuple, TypeVar, Union
+)
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    import numpy as np
+
 from ..core.models import (
     LidarData,
     DopplerRadarData,
     AnemometerData,
-    MicroburstDetection,
+    FusedSensorData,
+    SensorData,
     SeverityLevel,
     DetectionMethod
 )
+from ..core.records import (
+    AnemometerReading,
+    DetectionRecord,
+    LidarReading,
+    RadarReading,
+    Reading,
+    sensor_type_of
+)
+from ..core.cells import StormCellTracker
+from ..core.network import NetworkAlarm, StationNetwork
+from ..core.stations import StationBuffers, StationEvent
 from ..core.algorithms import (
     WindShearDetector,
     ReflectivityAnalyzer,
@@ -22,9 +44,19 @@ from ..core.algorithms import (
     TemporalCoherence
 )
 from ..fusion.data_fusion import SensorFusion
+from ..sensors.radar_volume import REFLECTIVITY, VELOCITY, Tilt
+from ..storage.detection_store import DetectionStore, MemoryDetectionStore
+from ..utils.timeutils import from_epoch, to_epoch
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# (sequence number, detection) pairs stored inside the current task's capture() block
+_captured: ContextVar[Optional[List[Tuple[int, DetectionRecord]]]] = ContextVar(
+    "captured_detections", default=None
+)
+
 
 class MicroburstDetector:
     """
@@ -34,21 +66,117 @@ class MicroburstDetector:
     to provide robust microburst identification.
     """
     
-    def __init__(self) -> None:
-        """Initialize detector with algorithm instances."""
+    def __init__(
+        self,
+        store: Optional[DetectionStore] = None,
+        stateful: bool = True
+    ) -> None:
+        """
+        Initialize detector with algorithm instances.
+        
+        Args:
+            store: Detection history backend (process-local memory by default)
+            stateful: Keep station histories, station networks and storm cell
+                tracks between calls. They live in this process only, so
+                detectors in several server workers must run without them:
+                anemometer readings are then judged one at a time and every
+                hooked cell is reported each scan.
+        """
         self.wind_shear_detector = WindShearDetector()
         self.reflectivity_analyzer = ReflectivityAnalyzer()
         self.velocity_detector = VelocityCoadaptationDetector()
         self.severity_classifier = MicroburstSeverityClassifier()
         self.temporal_validator = TemporalCoherence()
         self.fusion = SensorFusion()
+        # Anemometer networks and rolling station histories by site,
+        # each evaluated for all its stations once per time step
+        self.networks: Dict[str, StationNetwork] = {}
+        self.station_buffers: Dict[str, StationBuffers] = {}
+        # Storm cell tracks by site, and the tracks already reported for a hook echo
+        self.cell_trackers: Dict[str, StormCellTracker] = {}
+        self._hook_tracks: Dict[str, set] = {}
+        self.stateful = stateful
         
-        # Detection history for temporal validation
-        self.detection_history: List[MicroburstDetection] = []
+        # Detection history for temporal validation and API queries
+        self.store = store if store is not None else MemoryDetectionStore()
+        self.latest_fusion: Optional[FusedSensorData] = None
+        # Store sequence number of the most recent detection made here
+        self.last_seq = 0
         
         logger.info("MicroburstDetector initialized")
     
-    async def process_lidar(self, data: LidarData) -> Optional[MicroburstDetection]:
+    @property
+    def detection_history(self) -> List[DetectionRecord]:
+        """All stored detections in time order."""
+        return self.store.query()
+    
+    async def _save(self, detection: DetectionRecord) -> int:
+        """
+        Store a detection and remember its sequence number.
+        
+        Shared stores write to a database, so the insert runs in the default
+        executor instead of blocking the event loop; process-local stores
+        are written inline.
+        
+        Returns:
+            Store sequence number of the detection
+        """
+        if self.store.shared:
+            seq = await asyncio.get_running_loop().run_in_executor(None, self.store.add, detection)
+        else:
+            seq = self.store.add(detection)
+        self._remember(seq, detection)
+        return seq
+    
+    def _remember(self, seq: int, detection: DetectionRecord) -> None:
+        """Note a stored detection as the latest, and for an active ``capture``."""
+        self.last_seq = seq
+        captured = _captured.get()
+        if captured is not None:
+            captured.append((seq, detection))
+    
+    async def read(self, method: Callable[..., T], *args: Any) -> T:
+        """
+        Call a store read without blocking the event loop.
+        
+        Like ``_save``: shared stores query a database, so the call runs in
+        the default executor; process-local stores are read inline.
+        
+        Args:
+            method: Store method, or any callable that reads the store
+            *args: Arguments for ``method``
+            
+        Returns:
+            The result of ``method``
+        """
+        if self.store.shared:
+            return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+        return method(*args)
+    
+    @contextmanager
+    def capture(self) -> Iterator[List[Tuple[int, DetectionRecord]]]:
+        """
+        Collect the detections stored by the current task inside the block.
+        
+        A single reading can store several detections (an anemometer reading
+        may close a time step with station surges and network outflows) while
+        returning only one. Collection is per task, so concurrent requests
+        only see their own detections.
+        
+        Yields:
+            List filled with (sequence number, detection) pairs in store order
+        """
+        stored: List[Tuple[int, DetectionRecord]] = []
+        token = _captured.set(stored)
+        try:
+            yield stored
+        finally:
+            _captured.reset(token)
+    
+    async def process_lidar(
+        self,
+        data: Union[LidarData, LidarReading]
+    ) -> Optional[DetectionRecord]:
         """
         Process LIDAR data and detect microbursts.
         
@@ -86,7 +214,7 @@ class MicroburstDetector:
             confidence = min(data.backscatter * 1.5, 1.0)
             
             # Create detection event
-            detection = MicroburstDetection(
+            detection = DetectionRecord(
                 event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
                 timestamp=data.timestamp,
                 latitude=data.latitude,
@@ -99,10 +227,11 @@ class MicroburstDetector:
                 confidence=confidence,
                 radius=1000.0,  # Typical microburst radius
                 duration_seconds=180,  # Typical duration
-                alert_level=self._generate_alert_level(max_wind_shear)
+                alert_level=self._generate_alert_level(max_wind_shear),
+                site=data.site
             )
             
-            self.detection_history.append(detection)
+            await self._save(detection)
             logger.info(f"LIDAR detection: {detection.event_id}, severity={detection.severity}")
             
             return detection
@@ -111,7 +240,10 @@ class MicroburstDetector:
             logger.error(f"Error processing LIDAR data: {e}")
             raise
     
-    async def process_radar(self, data: DopplerRadarData) -> Optional[MicroburstDetection]:
+    async def process_radar(
+        self,
+        data: Union[DopplerRadarData, RadarReading]
+    ) -> Optional[DetectionRecord]:
         """
         Process Doppler radar data and detect microbursts.
         
@@ -147,7 +279,7 @@ class MicroburstDetector:
             estimated_wind_shear = abs(data.radial_velocity) * 0.7
             
             # Create detection
-            detection = MicroburstDetection(
+            detection = DetectionRecord(
                 event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
                 timestamp=data.timestamp,
                 latitude=data.latitude,
@@ -161,13 +293,14 @@ class MicroburstDetector:
                 radius=1500.0,
                 duration_seconds=240,
                 alert_level=self._generate_alert_level(estimated_wind_shear),
+                site=data.site,
                 additional_data={
                     'max_reflectivity': hook_result['max_reflectivity'],
                     'spectrum_width': data.spectrum_width
                 }
             )
             
-            self.detection_history.append(detection)
+            await self._save(detection)
             logger.info(f"Radar detection: {detection.event_id}, severity={detection.severity}")
             
             return detection
@@ -176,12 +309,222 @@ class MicroburstDetector:
             logger.error(f"Error processing radar data: {e}")
             raise
     
-    async def process_anemometer(self, data: AnemometerData) -> Optional[MicroburstDetection]:
+    async def process_radar_tilt(
+        self,
+        tilt: Tilt,
+        segment_length: float = 2000.0,
+        divergence_threshold: float = 10.0
+    ) -> Optional[DetectionRecord]:
+        """
+        Detect a microburst outflow in one tilt of a radar volume.
+        
+        Tilts are independent, so callers can run this on the lowest tilts
+        (where outflows are seen) as soon as they are committed, before the
+        rest of the volume arrives. Only this tilt's reflectivity and velocity
+        mappings are read.
+        
+        The outflow signature is a radial velocity rising by at least
+        ``divergence_threshold`` along a radial within ``segment_length``
+        (approaching then receding flow); a hook echo on the storm cell over
+        the outflow raises confidence.
+        
+        Args:
+            tilt: Committed tilt
+            segment_length: Distance over which velocity differences are taken [m]
+            divergence_threshold: Minimum velocity difference [m/s]
+            
+        Returns:
+            Detection at the strongest divergence, or None
+        """
+        import numpy as np
+        
+        volume = tilt.volume
+        velocity = tilt.moment(VELOCITY)
+        lag = max(int(round(segment_length / volume.gate_spacing)), 1)
+        if lag >= tilt.shape[1]:
+            return None
+        
+        difference = velocity[:, lag:] - velocity[:, :-lag]
+        difference = np.where(np.isnan(difference), -np.inf, difference)
+        radial, gate = np.unravel_index(int(np.argmax(difference)), difference.shape)
+        delta_v = float(difference[radial, gate])
+        if delta_v < divergence_threshold:
+            return None
+        
+        reflectivity = np.nan_to_num(tilt.moment(REFLECTIVITY), nan=-30.0)
+        cells, labels = self.reflectivity_analyzer.extract_cells(reflectivity, return_labels=True)
+        # Storm cells over the divergent segment; other storms in the tilt don't count
+        over = np.unique(labels[radial, gate:gate + lag + 1])
+        over = cells[over[over > 0] - 1]
+        cell = over[np.argmax(over["hook_score"])] if len(over) else None
+        hook_confidence = float(cell["hook_score"]) if cell is not None else 0.0
+        max_reflectivity = float(
+            cell["max_reflectivity"] if cell is not None else reflectivity.max()
+        )
+        latitude, longitude, altitude = tilt.locate(radial, gate + lag / 2)
+        
+        detection = DetectionRecord(
+            event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
+            timestamp=from_epoch(tilt.timestamp),
+            latitude=latitude,
+            longitude=longitude,
+            altitude=altitude,
+            severity=self._classify_severity(delta_v, -delta_v / 2),
+            detection_method=DetectionMethod.DOPPLER_RADAR,
+            max_wind_shear=delta_v,
+            # Each side of a symmetric outflow carries about half the difference
+            vertical_velocity=-delta_v / 2,
+            confidence=min(0.5 + delta_v / 50.0 + 0.2 * (hook_confidence > 0.5), 0.95),
+            radius=lag * volume.gate_spacing / 2,
+            duration_seconds=240,
+            alert_level=self._generate_alert_level(delta_v),
+            site=volume.site,
+            additional_data={
+                'tilt': tilt.index,
+                'elevation': tilt.elevation,
+                'azimuth': float(tilt.azimuths[radial]),
+                'range': float(volume.first_gate + volume.gate_spacing * (gate + lag / 2)),
+                'max_reflectivity': max_reflectivity,
+                'hook_confidence': hook_confidence,
+                'cell_area': int(cell["area"]) if cell is not None else 0
+            }
+        )
+        
+        await self._save(detection)
+        logger.info(
+            f"Radar volume detection: {detection.event_id}, tilt={tilt.index}, "
+            f"severity={detection.severity}"
+        )
+        return detection
+    
+    async def process_reflectivity_grid(
+        self,
+        reflectivity: "np.ndarray",
+        lat_grid: "np.ndarray",
+        lon_grid: "np.ndarray",
+        timestamp: float,
+        site: Optional[str] = None,
+        velocity: Optional["np.ndarray"] = None,
+        cell_size: float = 1000.0,
+        altitude: float = 0.0,
+        min_area: int = 4
+    ) -> List[DetectionRecord]:
+        """
+        Detect hook echoes storm cell by storm cell in a reflectivity grid.
+        
+        Meant for composites such as ``RadarMosaic`` output. Cells are
+        tracked across calls for the same site and a tracked cell is
+        reported once, when its hook echo first appears, so every storm in
+        the grid gets its own detection and a persisting storm does not
+        repeat it every scan. With a velocity grid, the spread of velocities
+        within the cell gives the shear estimate.
+        
+        Args:
+            reflectivity: Reflectivity grid [dBZ]
+            lat_grid: Latitude per row (1-D) or per grid cell (2-D)
+            lon_grid: Longitude per column (1-D) or per grid cell (2-D)
+            timestamp: Scan time (epoch seconds)
+            site: Airport or site identifier
+            velocity: Radial velocity grid [m/s], NaN for no data (optional)
+            cell_size: Grid cell side [m]
+            altitude: Height the grid represents [m]
+            min_area: Smallest storm cell considered, in grid cells
+            
+        Returns:
+            Stored detections, weakest first
+        """
+        import numpy as np
+        
+        key = site or ""
+        tracker = self.cell_trackers.get(key) if self.stateful else StormCellTracker()
+        if tracker is None:
+            tracker = self.cell_trackers[key] = StormCellTracker()
+        cells, labels = self.reflectivity_analyzer.extract_cells(
+            reflectivity, lat_grid, lon_grid, min_area, return_labels=True
+        )
+        tracked = tracker.update(cells, timestamp)
+        reported = self._hook_tracks.setdefault(key, set()) if self.stateful else set()
+        reported.intersection_update(tracker.tracks)
+        hooked = tracked[(tracked["hook_score"] > 0.5) & ~np.isin(tracked["track"], list(reported))]
+        reported.update(hooked["track"].tolist())
+        
+        spread = np.zeros(len(hooked))
+        if velocity is not None and len(hooked):
+            # Velocity range per hooked cell, over its own grid cells only
+            members = np.flatnonzero(np.isin(labels, hooked["label"]))
+            position = np.searchsorted(hooked["label"], labels.ravel()[members])
+            values = np.asarray(velocity, dtype=float).ravel()[members]
+            high = np.full(len(hooked), -np.inf)
+            low = np.full(len(hooked), np.inf)
+            np.maximum.at(high, position, np.where(np.isnan(values), -np.inf, values))
+            np.minimum.at(low, position, np.where(np.isnan(values), np.inf, values))
+            spread = np.where(np.isfinite(high) & np.isfinite(low), high - low, 0.0)
+        
+        detections = [
+            self._cell_detection(cell, float(shear), timestamp, site, cell_size, altitude)
+            for cell, shear in zip(hooked, spread)
+        ]
+        detections.sort(key=attrgetter("max_wind_shear"))
+        for detection in detections:
+            await self._save(detection)
+            logger.info(
+                f"Storm cell detection: {detection.event_id}, severity={detection.severity}"
+            )
+        return detections
+    
+    def _cell_detection(
+        self,
+        cell: "np.void",
+        shear: float,
+        timestamp: float,
+        site: Optional[str],
+        cell_size: float,
+        altitude: float
+    ) -> DetectionRecord:
+        """Detection record for a hook echo on one tracked storm cell."""
+        return DetectionRecord(
+            event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
+            timestamp=from_epoch(timestamp),
+            latitude=float(cell["latitude"]),
+            longitude=float(cell["longitude"]),
+            altitude=altitude,
+            severity=self._classify_severity(shear, -shear / 2),
+            detection_method=DetectionMethod.DOPPLER_RADAR,
+            max_wind_shear=shear,
+            vertical_velocity=-shear / 2,
+            confidence=min(0.5 + 0.2 * float(cell["hook_score"]) + shear / 50.0, 0.95),
+            radius=float((cell["area"] / pi) ** 0.5 * cell_size),
+            duration_seconds=240,
+            alert_level=self._generate_alert_level(shear),
+            site=site,
+            additional_data={
+                'storm_cell': True,
+                'track': int(cell["track"]),
+                'scans': int(cell["scans"]),
+                'area': int(cell["area"]),
+                'max_reflectivity': float(cell["max_reflectivity"]),
+                'mean_reflectivity': float(cell["mean_reflectivity"]),
+                'hook_confidence': float(cell["hook_score"]),
+                'cell_speed': float(cell["speed"]),
+                'cell_heading': float(cell["heading"])
+            }
+        )
+    
+    async def process_anemometer(
+        self,
+        data: Union[AnemometerData, AnemometerReading]
+    ) -> Optional[DetectionRecord]:
         """
         Process anemometer data and detect microbursts.
         
         Anemometers provide surface wind data which can indicate microburst
-        outflows at ground level.
+        outflows at ground level. Each reading is judged on its own, and is
+        also added to its site's station histories, which detect wind surges
+        against each station's rolling baseline (see ``StationBuffers``), and
+        to the site's station network, which detects divergent outflow across
+        neighboring stations (see ``StationNetwork``). Surge and network
+        detections are stored as they start; when the single-reading rule
+        does not fire, the strongest of them is returned.
         
         Args:
             data: Anemometer measurement data
@@ -190,7 +533,10 @@ class MicroburstDetector:
             Detection result or None if no microburst detected
         """
         try:
-            import numpy as np
+            reference_pressure = self._reference_pressure(data)
+            
+            station_detections = await self._observe_stations(data) if self.stateful else []
+            fallback = station_detections[-1] if station_detections else None
             
             # Anemometer detects microbursts through sudden wind speed changes
             # and pressure drops. High wind speeds (>20 m/s) with rapid changes
@@ -199,15 +545,15 @@ class MicroburstDetector:
             # Check for significant wind speed (potential microburst indicator)
             wind_speed_threshold = 20.0  # m/s
             if data.wind_speed < wind_speed_threshold:
-                return None
+                return fallback
             
             # Estimate wind shear from wind speed (surface level indicator)
             # Higher wind speeds at surface can indicate strong downdraft
             estimated_wind_shear = (data.wind_speed - 10.0) * 0.4  # Rough conversion
             
-            # Check pressure drop (another microburst indicator)
-            # Normal pressure ~1013 hPa, significant drops indicate downdraft
-            pressure_drop = 1013.0 - data.pressure if data.pressure < 1013.0 else 0
+            # Check pressure drop (another microburst indicator) against the
+            # station's rolling mean, or ~1013 hPa before it has history
+            pressure_drop = max(reference_pressure - data.pressure, 0.0)
             
             # Combine indicators for confidence
             confidence = min(
@@ -217,10 +563,10 @@ class MicroburstDetector:
             
             # Only create detection if indicators are strong enough
             if estimated_wind_shear < 3.0 and pressure_drop < 5.0:
-                return None
+                return fallback
             
             # Create detection
-            detection = MicroburstDetection(
+            detection = DetectionRecord(
                 event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
                 timestamp=data.timestamp,
                 latitude=data.latitude,
@@ -234,6 +580,7 @@ class MicroburstDetector:
                 radius=2000.0,  # Surface measurements have wider radius uncertainty
                 duration_seconds=300,
                 alert_level=self._generate_alert_level(estimated_wind_shear),
+                site=data.site,
                 additional_data={
                     'wind_speed': data.wind_speed,
                     'wind_direction': data.wind_direction,
@@ -242,8 +589,10 @@ class MicroburstDetector:
                 }
             )
             
-            self.detection_history.append(detection)
-            logger.info(f"Anemometer detection: {detection.event_id}, severity={detection.severity}")
+            await self._save(detection)
+            logger.info(
+                f"Anemometer detection: {detection.event_id}, severity={detection.severity}"
+            )
             
             return detection
         
@@ -251,11 +600,322 @@ class MicroburstDetector:
             logger.error(f"Error processing anemometer data: {e}")
             raise
     
+    @staticmethod
+    def _station_id(data: Union[AnemometerData, AnemometerReading]) -> str:
+        """Station identity within a site: sensor_id, or position without one."""
+        return data.sensor_id or f"{data.latitude:.5f},{data.longitude:.5f}"
+    
+    def _reference_pressure(self, data: Union[AnemometerData, AnemometerReading]) -> float:
+        """Station's rolling mean pressure, or standard pressure before it has history."""
+        buffers = self.station_buffers.get(data.site or "")
+        if buffers is None:
+            return 1013.0
+        baseline = buffers.baseline_pressure(self._station_id(data))
+        return baseline if baseline is not None else 1013.0
+    
+    async def _observe_stations(
+        self, data: Union[AnemometerData, AnemometerReading]
+    ) -> List[DetectionRecord]:
+        """
+        Feed a reading into its site's station histories and station network.
+        
+        The first reading of a new time step closes the previous one: both
+        are evaluated on every station's data so far before the reading is
+        applied.
+        
+        Returns:
+            Stored surge and network detections, weakest first
+        """
+        site = data.site or ""
+        buffers = self.station_buffers.get(site)
+        if buffers is None:
+            buffers = self.station_buffers[site] = StationBuffers()
+        network = self.networks.get(site)
+        if network is None:
+            network = self.networks[site] = StationNetwork()
+        
+        now = to_epoch(data.timestamp)
+        detections = []
+        if buffers.due(now):
+            detections += [
+                self._surge_detection(event, data) for event in buffers.evaluate(now) if event.surge
+            ]
+        if network.due(now):
+            detections += [self._network_detection(alarm, data) for alarm in network.evaluate(now)]
+        
+        station = self._station_id(data)
+        buffers.update(
+            station, data.latitude, data.longitude,
+            data.wind_speed, data.wind_direction, data.pressure, now,
+        )
+        network.update(
+            station, data.latitude, data.longitude, data.wind_speed, data.wind_direction, now
+        )
+        
+        detections.sort(key=attrgetter("max_wind_shear"))
+        for detection in detections:
+            await self._save(detection)
+            logger.info(
+                f"Anemometer station detection: {detection.event_id}, "
+                f"severity={detection.severity}"
+            )
+        return detections
+    
+    def _surge_detection(
+        self,
+        event: StationEvent,
+        data: Union[AnemometerData, AnemometerReading]
+    ) -> DetectionRecord:
+        """Detection record for a wind surge at one station."""
+        return DetectionRecord(
+            event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
+            timestamp=data.timestamp,
+            latitude=event.latitude,
+            longitude=event.longitude,
+            altitude=data.altitude,
+            severity=self._classify_severity(event.speed_change, -event.speed),
+            detection_method=DetectionMethod.ANEMOMETER,
+            max_wind_shear=event.speed_change,
+            vertical_velocity=-event.speed * 0.6,  # Same surface-wind estimate as single readings
+            # A gust front turns the wind and lifts pressure too
+            confidence=min(0.45 + 0.2 * event.direction_shift + 0.2 * event.pressure_jump, 0.85),
+            radius=2000.0,
+            duration_seconds=300,
+            alert_level=self._generate_alert_level(event.speed_change),
+            site=data.site,
+            additional_data={
+                'surge': True,
+                'station': event.station,
+                'wind_speed': event.speed,
+                'baseline_wind_speed': event.baseline_speed,
+                'direction_change': event.direction_change,
+                'pressure_change': event.pressure_change
+            }
+        )
+    
+    def _network_detection(
+        self,
+        alarm: NetworkAlarm,
+        data: Union[AnemometerData, AnemometerReading]
+    ) -> DetectionRecord:
+        """Detection record for a station network alarm."""
+        # Mass continuity: surface divergence implies a downdraft of about
+        # divergence x depth just above the outflow layer (~300 m)
+        vertical_velocity = -alarm.divergence * 300.0
+        return DetectionRecord(
+            event_id=f"evt_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:6]}",
+            timestamp=data.timestamp,
+            latitude=alarm.latitude,
+            longitude=alarm.longitude,
+            altitude=data.altitude,
+            severity=self._classify_severity(alarm.wind_shear, vertical_velocity),
+            detection_method=DetectionMethod.ANEMOMETER,
+            max_wind_shear=alarm.wind_shear,
+            vertical_velocity=vertical_velocity,
+            # Agreement across stations is stronger evidence than one station
+            confidence=min(0.5 + 0.05 * alarm.stations, 0.95),
+            radius=max(alarm.radius, 500.0),
+            duration_seconds=300,
+            alert_level=self._generate_alert_level(alarm.wind_shear),
+            site=data.site,
+            additional_data={
+                'network': True,
+                'divergence': alarm.divergence,
+                'stations': alarm.stations,
+                'triangles': alarm.triangles
+            }
+        )
+    
+    def detect_batch(
+        self,
+        sensor_type: str,
+        readings: Sequence[Union[SensorData, Reading]],
+        store: bool = False
+    ) -> List[DetectionRecord]:
+        """
+        Run one sensor type's detection rule over many readings at once.
+
+        Applies the same thresholds as ``process_lidar``, ``process_radar``
+        and ``process_anemometer``, evaluated on NumPy columns instead of one
+        reading at a time; records are only built for readings that trigger.
+        
+        Only the single-reading rules are applied. Anemometer pressure drops
+        are measured against each station's current rolling baseline, as in
+        ``process_anemometer``, but batches are not added to the station
+        histories or networks, so they raise no surge or network detections
+        and leave live station state untouched.
+
+        Args:
+            sensor_type: ``lidar``, ``radar`` or ``anemometer``
+            readings: Readings of that sensor type
+            store: Also add detections to the detection store. The adds run
+                synchronously in the calling thread, so leave this off on an
+                event loop with a shared store
+
+        Returns:
+            Detections in input order
+        """
+        import numpy as np
+
+        n = len(readings)
+        if n == 0:
+            return []
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(map(attrgetter(name), readings), dtype=float, count=n)
+
+        altitude = column("altitude")
+        stamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        detections = []
+
+        if sensor_type == "lidar":
+            vertical_velocity = column("vertical_velocity")
+            altitudes = np.stack([altitude - 500, altitude, altitude + 500], axis=1)
+            velocities = np.stack(
+                [vertical_velocity * 0.3, vertical_velocity, vertical_velocity * 0.5], axis=1
+            )
+            wind_shear, _ = self.wind_shear_detector.calculate_wind_shear(altitudes, velocities)
+            max_wind_shear = wind_shear.max(axis=1)
+            confidence = np.minimum(column("backscatter") * 1.5, 1.0)
+
+            sheared = max_wind_shear >= WindShearDetector.WIND_SHEAR_THRESHOLD
+            for i in np.flatnonzero(sheared).tolist():
+                data = readings[i]
+                shear = float(max_wind_shear[i])
+                detections.append(DetectionRecord(
+                    event_id=f"evt_{stamp}_{uuid4().hex[:6]}",
+                    timestamp=data.timestamp,
+                    latitude=data.latitude,
+                    longitude=data.longitude,
+                    altitude=data.altitude,
+                    severity=self._classify_severity(shear, data.vertical_velocity),
+                    detection_method=DetectionMethod.LIDAR,
+                    max_wind_shear=shear,
+                    vertical_velocity=data.vertical_velocity,
+                    confidence=float(confidence[i]),
+                    radius=1000.0,
+                    duration_seconds=180,
+                    alert_level=self._generate_alert_level(shear),
+                    site=data.site
+                ))
+
+        elif sensor_type == "radar":
+            reflectivity = column("reflectivity")
+            grids = np.random.uniform(
+                (reflectivity - 10)[:, None, None],
+                (reflectivity + 5)[:, None, None],
+                (n, 10, 10)
+            )
+            hook_result = self.reflectivity_analyzer.detect_hook_echo_batch(grids)
+
+            for i in np.flatnonzero(hook_result['hook_detected']).tolist():
+                data = readings[i]
+                estimated_wind_shear = abs(data.radial_velocity) * 0.7
+                detections.append(DetectionRecord(
+                    event_id=f"evt_{stamp}_{uuid4().hex[:6]}",
+                    timestamp=data.timestamp,
+                    latitude=data.latitude,
+                    longitude=data.longitude,
+                    altitude=data.altitude,
+                    severity=self._classify_severity(estimated_wind_shear, data.radial_velocity),
+                    detection_method=DetectionMethod.DOPPLER_RADAR,
+                    max_wind_shear=estimated_wind_shear,
+                    vertical_velocity=data.radial_velocity,
+                    confidence=float(hook_result['hook_confidence'][i]),
+                    radius=1500.0,
+                    duration_seconds=240,
+                    alert_level=self._generate_alert_level(estimated_wind_shear),
+                    site=data.site,
+                    additional_data={
+                        'max_reflectivity': float(hook_result['max_reflectivity'][i]),
+                        'spectrum_width': data.spectrum_width
+                    }
+                ))
+
+        elif sensor_type == "anemometer":
+            wind_speed = column("wind_speed")
+            estimated_wind_shear = (wind_speed - 10.0) * 0.4
+            # One baseline lookup per station, not per reading
+            stations = [(data.site, self._station_id(data)) for data in readings]
+            references: Dict[tuple, float] = {}
+            for key, data in zip(stations, readings):
+                if key not in references:
+                    references[key] = self._reference_pressure(data)
+            reference = np.array([references[key] for key in stations])
+            pressure_drop = np.maximum(reference - column("pressure"), 0.0)
+            confidence = np.minimum(0.3 + wind_speed / 50.0 + pressure_drop / 20.0, 0.85)
+            triggered = (wind_speed >= 20.0) & (
+                (estimated_wind_shear >= 3.0) | (pressure_drop >= 5.0)
+            )
+
+            for i in np.flatnonzero(triggered).tolist():
+                data = readings[i]
+                shear = float(estimated_wind_shear[i])
+                detections.append(DetectionRecord(
+                    event_id=f"evt_{stamp}_{uuid4().hex[:6]}",
+                    timestamp=data.timestamp,
+                    latitude=data.latitude,
+                    longitude=data.longitude,
+                    altitude=data.altitude,
+                    severity=self._classify_severity(shear, -data.wind_speed),
+                    detection_method=DetectionMethod.ANEMOMETER,
+                    max_wind_shear=shear,
+                    vertical_velocity=-data.wind_speed * 0.6,
+                    confidence=float(confidence[i]),
+                    radius=2000.0,
+                    duration_seconds=300,
+                    alert_level=self._generate_alert_level(shear),
+                    site=data.site,
+                    additional_data={
+                        'wind_speed': data.wind_speed,
+                        'wind_direction': data.wind_direction,
+                        'pressure_drop': float(pressure_drop[i]),
+                        'temperature': data.temperature
+                    }
+                ))
+
+        else:
+            raise ValueError(f"Unknown sensor type: {sensor_type}")
+
+        if store:
+            for detection in detections:
+                self._remember(self.store.add(detection), detection)
+
+        logger.debug(f"Batch of {n} {sensor_type} readings: {len(detections)} detections")
+        return detections
+
+    def fuse(
+        self,
+        data: Union[
+            LidarData, DopplerRadarData, AnemometerData,
+            LidarReading, RadarReading, AnemometerReading,
+        ]
+    ) -> FusedSensorData:
+        """
+        Feed a single reading into the multi-sensor Kalman fusion.
+        
+        Args:
+            data: Measurement from any supported sensor
+            
+        Returns:
+            Updated fused state estimate
+        """
+        sensor_type = sensor_type_of(data)
+        if sensor_type == "lidar":
+            fused = self.fusion.fuse_measurements(lidar=data)
+        elif sensor_type == "radar":
+            fused = self.fusion.fuse_measurements(radar=data)
+        else:
+            fused = self.fusion.fuse_measurements(anemometer=data)
+        
+        self.latest_fusion = fused
+        return fused
+    
     async def get_recent_detections(
         self,
         hours: int = 24,
         severity: Optional[str] = None
-    ) -> List[MicroburstDetection]:
+    ) -> List[DetectionRecord]:
         """
         Retrieve recent detections with optional filtering.
         
@@ -267,19 +927,7 @@ class MicroburstDetector:
             List of matching detections
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        filtered = [
-            d for d in self.detection_history
-            if d.timestamp >= cutoff_time
-        ]
-        
-        if severity:
-            filtered = [
-                d for d in filtered
-                if d.severity.value == severity.lower()
-            ]
-        
-        return filtered
+        return await self.read(self.store.query, to_epoch(cutoff_time), None, severity)
     
     async def get_statistics(self, days: int = 7) -> dict:
         """
@@ -292,25 +940,7 @@ class MicroburstDetector:
             Statistics dictionary
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
-        recent = [d for d in self.detection_history if d.timestamp >= cutoff]
-        
-        severity_counts = {
-            'low': 0,
-            'moderate': 0,
-            'severe': 0,
-            'extreme': 0
-        }
-        
-        for detection in recent:
-            severity_counts[detection.severity.value] += 1
-        
-        return {
-            'total_detections': len(recent),
-            'severity_distribution': severity_counts,
-            'avg_confidence': sum(d.confidence for d in recent) / len(recent) if recent else 0,
-            'avg_wind_shear': sum(d.max_wind_shear for d in recent) / len(recent) if recent else 0,
-            'period_days': days
-        }
+        return await self.read(self.store.statistics, to_epoch(cutoff), days)
     
     def _classify_severity(self, wind_shear: float, vertical_velocity: float) -> SeverityLevel:
         """Classify detection severity based on parameters."""
@@ -1,12 +1,18 @@
 # src/microburst_detection/core/models.py
 """Data models for microburst detection system using Pydantic v2."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, TypeAdapter, ValidationInfo
+
+
+# Longest identifiers accepted, in UTF-8 bytes; fixed-width storage
+# records (see ``storage.archive``) are sized from these
+SITE_MAX_BYTES = 16
+SENSOR_ID_MAX_BYTES = 32
 
 
 class SeverityLevel(str, Enum):
@@ -43,14 +49,35 @@ class SensorData(BaseModel):
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
     altitude: float = Field(..., ge=0, description="Altitude in meters")
+    site: Optional[str] = Field(default=None, description="Airport or site identifier")
+    sensor_id: Optional[str] = Field(default=None, description="Unique sensor identifier")
     
     @field_validator('timestamp')
     @classmethod
-    def validate_timestamp(cls, v: datetime) -> datetime:
-        """Ensure timestamp is not in the future."""
-        if v > datetime.utcnow():
+    def validate_timestamp(cls, v: datetime, info: ValidationInfo) -> datetime:
+        """
+        Ensure timestamp is not in the future.
+        
+        A ``now`` (naive UTC) entry in the validation context is used as the
+        reference time, so batches read the clock once.
+        """
+        now = info.context.get("now") if info.context else None
+        if now is None:
+            now = datetime.utcnow()
+        if v.tzinfo is not None:
+            now = now.replace(tzinfo=timezone.utc)
+        if v > now:
             raise ValueError('Timestamp cannot be in the future')
         return v
+    
+    @field_validator('site', 'sensor_id')
+    @classmethod
+    def validate_identifier_length(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        """Limit identifiers to the bytes stored for them."""
+        limit = SITE_MAX_BYTES if info.field_name == 'site' else SENSOR_ID_MAX_BYTES
+        if v is not None and len(v.encode()) > limit:
+            raise ValueError(f'{info.field_name} must be at most {limit} bytes (UTF-8)')
+        return v
 
 
 class LidarData(SensorData):
@@ -153,6 +180,7 @@ class MicroburstDetection(BaseModel):
     radius: float = Field(..., ge=0, description="Microburst radius in meters")
     duration_seconds: int = Field(..., ge=0)
     alert_level: str = Field(..., description="Alert classification for pilots")
+    site: Optional[str] = Field(default=None, description="Airport or site identifier")
     additional_data: Optional[dict] = Field(default=None)
 
 
@@ -174,3 +202,55 @@ class FusedSensorData(BaseModel):
     anemometer_available: bool = False
     
     fusion_quality: float = Field(ge=0, le=1, description="Overall data quality metric")
+
+
+ReadingModel = TypeVar("ReadingModel", bound=SensorData)
+
+#: Reading model per sensor type
+READING_MODELS = {"lidar": LidarData, "radar": DopplerRadarData, "anemometer": AnemometerData}
+
+
+@lru_cache(maxsize=None)
+def _batch_adapter(model: Type[SensorData]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def validate_reading(model: Type[ReadingModel], item: Any) -> ReadingModel:
+    """
+    Validate one untrusted reading at the system edge.
+    
+    Args:
+        model: Reading model class
+        item: Raw mapping, or JSON text/bytes
+        
+    Returns:
+        Validated reading
+    """
+    context = {"now": datetime.utcnow()}
+    if isinstance(item, (str, bytes)):
+        return model.model_validate_json(item, context=context)
+    return model.model_validate(item, context=context)
+
+
+def validate_readings(model: Type[ReadingModel], items: Iterable[Any]) -> List[ReadingModel]:
+    """
+    Validate a batch of untrusted readings in a single call.
+    
+    The list adapter is built once per model and the clock is read once per
+    batch rather than once per reading.
+    
+    Args:
+        model: Reading model class
+        items: Raw mappings, or a JSON array as text/bytes
+        
+    Returns:
+        Validated readings in input order
+        
+    Raises:
+        ValidationError: If any reading is invalid (locations are prefixed with its index)
+    """
+    adapter = _batch_adapter(model)
+    context = {"now": datetime.utcnow()}
+    if isinstance(items, (str, bytes)):
+        return adapter.validate_json(items, context=context)
+    return adapter.validate_python(list(items), context=context)
@@ -0,0 +1,328 @@
+# src/microburst_detection/core/network.py
+"""Surface anemometer network (LLWAS-style) divergence detection."""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000.0
+
+
+class NetworkAlarm(NamedTuple):
+    """A cluster of adjacent divergent triangles that started alarming at one time step."""
+    latitude: float
+    longitude: float
+    radius: float               # m, center to farthest member station
+    divergence: float           # 1/s, strongest triangle
+    wind_shear: float           # m/s, largest divergent wind difference between member stations
+    stations: int
+    triangles: int
+
+
+class StationNetwork:
+    """
+    Wind-field divergence over a network of surface anemometers.
+
+    Station positions are triangulated once (Delaunay) and every per-triangle
+    gradient operator is precomputed, so a time step is a couple of array
+    operations over all triangles at once. The triangulation is rebuilt only
+    when a station joins or leaves the network.
+
+    For each triangle the wind field is taken as linear between its three
+    stations; its divergence is the constant ``du/dx + dv/dy`` of that
+    interpolant. Adjacent divergent triangles form one cluster. Its shear is
+    the largest change in the wind component along the line between two of
+    its stations, the headwind loss an aircraft crossing the outflow would
+    see; the cluster alarms when that reaches the shear threshold. (Edges of
+    a dense network each see only part of the outflow's wind change.)
+
+    Station winds are exponentially averaged over ``smoothing`` seconds, as
+    gusts at 1 Hz would otherwise produce divergent triangles everywhere; a
+    station takes part once it has been reporting for that long.
+    """
+
+    DIVERGENCE_THRESHOLD: float = 1e-3  # 1/s
+    SHEAR_THRESHOLD: float = 5.0        # m/s (~10 kt, LLWAS windshear alert)
+
+    def __init__(
+        self,
+        step: float = 1.0,
+        smoothing: float = 5.0,
+        stale_after: float = 10.0,
+        expire_after: float = 300.0,
+        max_edge: float = 6000.0,
+        divergence_threshold: float = DIVERGENCE_THRESHOLD,
+        shear_threshold: float = SHEAR_THRESHOLD
+    ) -> None:
+        """
+        Initialize network.
+
+        Args:
+            step: Seconds between evaluations
+            smoothing: Time constant of the per-station wind average (seconds)
+            stale_after: Triangles with a station silent this long are skipped
+            expire_after: Stations silent this long leave the network
+            max_edge: Triangles with a longer edge (m) are not evaluated
+            divergence_threshold: Minimum divergence of a cluster triangle [1/s]
+            shear_threshold: Minimum wind change across an alarming cluster [m/s]
+        """
+        self.step = step
+        self.smoothing = smoothing
+        self.stale_after = stale_after
+        self.expire_after = expire_after
+        self.max_edge = max_edge
+        self.divergence_threshold = divergence_threshold
+        self.shear_threshold = shear_threshold
+
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        capacity = 16
+        self._lat = np.zeros(capacity)
+        self._lon = np.zeros(capacity)
+        self._u = np.zeros(capacity)
+        self._v = np.zeros(capacity)
+        self._updated = np.full(capacity, -np.inf)
+        self._joined = np.full(capacity, np.inf)
+
+        self._dirty = True
+        self.rebuilds = 0
+        self.last_evaluated: Optional[float] = None
+        self._origin = (0.0, 0.0)
+        self._xy = np.zeros((0, 2))
+        self._triangles = np.zeros((0, 3), dtype=int)
+        self._neighbors = np.zeros((0, 3), dtype=int)
+        self._grad_x = np.zeros((0, 3))
+        self._grad_y = np.zeros((0, 3))
+        self._alarming = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def update(
+        self,
+        station: str,
+        latitude: float,
+        longitude: float,
+        wind_speed: float,
+        wind_direction: float,
+        timestamp: float
+    ) -> None:
+        """
+        Record a station's latest wind.
+
+        Args:
+            station: Station identifier
+            latitude: Station latitude
+            longitude: Station longitude
+            wind_speed: Wind speed [m/s]
+            wind_direction: Direction the wind blows from [degrees]
+            timestamp: Observation time (epoch seconds)
+        """
+        direction = np.radians(wind_direction)
+        u = -wind_speed * np.sin(direction)
+        v = -wind_speed * np.cos(direction)
+        i = self._index.get(station)
+        if i is None:
+            i = self._add(station)
+            self._joined[i] = timestamp
+            self._u[i], self._v[i] = u, v
+        else:
+            if latitude != self._lat[i] or longitude != self._lon[i]:
+                self._dirty = True
+            elapsed = max(timestamp - self._updated[i], 0.0)
+            weight = 1.0 - np.exp(-elapsed / self.smoothing) if self.smoothing > 0 else 1.0
+            self._u[i] += weight * (u - self._u[i])
+            self._v[i] += weight * (v - self._v[i])
+        self._lat[i] = latitude
+        self._lon[i] = longitude
+        self._updated[i] = timestamp
+
+    def remove(self, station: str) -> None:
+        """Take a station out of the network."""
+        i = self._index.pop(station, None)
+        if i is None:
+            return
+        last = len(self._ids) - 1
+        if i != last:
+            moved = self._ids[last]
+            self._ids[i] = moved
+            self._index[moved] = i
+            for column in (self._lat, self._lon, self._u, self._v, self._updated, self._joined):
+                column[i] = column[last]
+        self._ids.pop()
+        self._dirty = True
+
+    def due(self, now: float) -> bool:
+        """Whether a time step has passed since the last evaluation."""
+        return self.last_evaluated is None or now - self.last_evaluated >= self.step
+
+    def evaluate(self, now: float) -> List[NetworkAlarm]:
+        """
+        Evaluate every triangle for one time step.
+
+        Args:
+            now: Time step (epoch seconds)
+
+        Returns:
+            Alarms for clusters of divergent triangles that were not alarming
+            at the previous step (onsets only, so a persisting outflow alarms once)
+        """
+        self.last_evaluated = now
+        expired = [station for station, i in self._index.items()
+                   if now - self._updated[i] > self.expire_after]
+        for station in expired:
+            self.remove(station)
+        if self._dirty:
+            self._rebuild()
+        if not len(self._triangles):
+            return []
+
+        n = len(self._ids)
+        u, v = self._u[:n], self._v[:n]
+        divergence = (
+            np.einsum("tk,tk->t", self._grad_x, u[self._triangles])
+            + np.einsum("tk,tk->t", self._grad_y, v[self._triangles])
+        )
+        fresh = (
+            ((now - self._updated[:n]) <= self.stale_after)
+            & ((now - self._joined[:n]) >= self.smoothing)
+        )
+        divergent = fresh[self._triangles].all(axis=1) & (divergence >= self.divergence_threshold)
+        previous = self._alarming
+        self._alarming = np.zeros_like(divergent)
+        if not divergent.any():
+            return []
+        members, labels = self._clusters(divergent)
+        # The wind-vector spread over a cluster's stations bounds its shear;
+        # only clusters that could reach the threshold get the exact check
+        corner_labels = np.repeat(labels, 3)
+        order = np.argsort(corner_labels, kind="stable")
+        corner_labels = corner_labels[order]
+        corners = self._triangles[members].ravel()[order]
+        starts = np.flatnonzero(np.r_[True, corner_labels[1:] != corner_labels[:-1]])
+        spread = np.hypot(
+            np.maximum.reduceat(u[corners], starts) - np.minimum.reduceat(u[corners], starts),
+            np.maximum.reduceat(v[corners], starts) - np.minimum.reduceat(v[corners], starts),
+        )
+        alarms = []
+        for label in corner_labels[starts[spread >= self.shear_threshold]]:
+            cluster = members[labels == label]
+            alarm = self._alarm(cluster, divergence, u, v)
+            if alarm.wind_shear < self.shear_threshold:
+                continue
+            self._alarming[cluster] = True
+            if not previous[cluster].any():
+                alarms.append(alarm)
+        return alarms
+
+    def _add(self, station: str) -> int:
+        i = len(self._ids)
+        if i == len(self._lat):
+            capacity = 2 * i
+            self._lat = np.resize(self._lat, capacity)
+            self._lon = np.resize(self._lon, capacity)
+            self._u = np.resize(self._u, capacity)
+            self._v = np.resize(self._v, capacity)
+            self._updated = np.resize(self._updated, capacity)
+            self._joined = np.resize(self._joined, capacity)
+        self._ids.append(station)
+        self._index[station] = i
+        self._dirty = True
+        return i
+
+    def _rebuild(self) -> None:
+        """Triangulate station positions and precompute the per-step operators."""
+        from scipy.spatial import Delaunay
+        from scipy.spatial import QhullError
+
+        self._dirty = False
+        self.rebuilds += 1
+        n = len(self._ids)
+        lat, lon = self._lat[:n], self._lon[:n]
+        # Local equirectangular projection (m); exact enough over an airport
+        self._origin = (float(lat.mean()), float(lon.mean())) if n else (0.0, 0.0)
+        scale = np.radians(1.0) * EARTH_RADIUS_M
+        self._xy = np.column_stack((
+            (lon - self._origin[1]) * scale * np.cos(np.radians(self._origin[0])),
+            (lat - self._origin[0]) * scale,
+        ))
+        self._alarming = np.zeros(0, dtype=bool)
+        try:
+            triangulation = Delaunay(self._xy) if n >= 3 else None
+        except QhullError:
+            # Collinear or coincident stations
+            triangulation = None
+        if triangulation is None:
+            self._triangles = np.zeros((0, 3), dtype=int)
+            return
+
+        triangles = triangulation.simplices
+        corners = self._xy[triangles]                                   # (t, 3, 2)
+        following = np.roll(corners, -1, axis=1)
+        keep = (np.linalg.norm(following - corners, axis=2) <= self.max_edge).all(axis=1)
+        renumber = np.full(len(triangles) + 1, -1)
+        renumber[np.flatnonzero(keep)] = np.arange(keep.sum())
+        self._triangles = triangles[keep]
+        self._neighbors = renumber[triangulation.neighbors[keep]]       # -1 stays -1
+        corners = corners[keep]
+
+        # Gradient of the linear interpolant: grad f = sum_k f_k * (b_k, c_k)
+        x, y = corners[..., 0], corners[..., 1]
+        x1, x2 = np.roll(x, -1, axis=1), np.roll(x, -2, axis=1)
+        y1, y2 = np.roll(y, -1, axis=1), np.roll(y, -2, axis=1)
+        twice_area = (
+            (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0])
+            - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+        )
+        self._grad_x = (y1 - y2) / twice_area[:, None]
+        self._grad_y = (x2 - x1) / twice_area[:, None]
+
+        self._alarming = np.zeros(len(self._triangles), dtype=bool)
+        logger.debug(f"Triangulated {n} stations: {len(self._triangles)} triangles")
+
+    def _clusters(self, alarming: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Flagged triangles and a cluster label for each (shared edges link triangles)."""
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        members = np.flatnonzero(alarming)
+        neighbors = self._neighbors[members]
+        linked = (neighbors >= 0) & alarming[neighbors]
+        rows = np.repeat(members, 3)[linked.ravel()]
+        graph = coo_matrix(
+            (np.ones(len(rows)), (rows, neighbors[linked])),
+            shape=(len(alarming), len(alarming))
+        )
+        _, labels = connected_components(graph, directed=False)
+        return members, labels[members]
+
+    def _alarm(
+        self, members: np.ndarray, divergence: np.ndarray, u: np.ndarray, v: np.ndarray
+    ) -> NetworkAlarm:
+        stations = np.unique(self._triangles[members])
+        # Along-line wind change for every pair of member stations
+        offsets = self._xy[stations][None, :, :] - self._xy[stations][:, None, :]
+        changes = np.stack((u[stations], v[stations]), axis=1)
+        changes = changes[None, :, :] - changes[:, None, :]
+        distance = np.linalg.norm(offsets, axis=2)
+        np.fill_diagonal(distance, np.inf)
+        shear = float(((changes * offsets).sum(axis=2) / distance).max())
+        weights = divergence[members]
+        centroids = self._xy[self._triangles[members]].mean(axis=1)
+        center = np.average(centroids, axis=0, weights=weights)
+        radius = float(np.linalg.norm(self._xy[stations] - center, axis=1).max())
+        scale = np.radians(1.0) * EARTH_RADIUS_M
+        latitude = self._origin[0] + center[1] / scale
+        longitude = self._origin[1] + center[0] / (scale * np.cos(np.radians(self._origin[0])))
+        return NetworkAlarm(
+            latitude=float(latitude),
+            longitude=float(longitude),
+            radius=radius,
+            divergence=float(weights.max()),
+            wind_shear=shear,
+            stations=len(stations),
+            triangles=len(members),
+        )
@@ -0,0 +1,314 @@
+# src/microburst_detection/core/records.py
+"""Lightweight internal record types used behind the Pydantic API boundary."""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+from .models import (
+    AnemometerData,
+    DetectionMethod,
+    DopplerRadarData,
+    LidarData,
+    MicroburstDetection,
+    SensorData,
+    SeverityLevel,
+)
+
+
+class Reading:
+    """
+    Trusted sensor reading.
+
+    Readings from internal producers (simulators, replayed archives, batch
+    files validated once up front) use these instead of the Pydantic models.
+    The detector and fusion only read attributes, so either type is accepted.
+    """
+
+    __slots__ = ("timestamp", "latitude", "longitude", "altitude", "site", "sensor_id")
+
+    sensor_type = ""
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        site: Optional[str] = None,
+        sensor_id: Optional[str] = None
+    ) -> None:
+        self.timestamp = timestamp
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+        self.site = site
+        self.sensor_id = sensor_id
+
+    @classmethod
+    def fields(cls) -> tuple:
+        """All field names, base fields first."""
+        names: tuple = ()
+        for klass in reversed(cls.__mro__):
+            names += klass.__dict__.get("__slots__", ())
+        return names
+
+    @classmethod
+    def from_model(cls, model: SensorData) -> "Reading":
+        """Copy a validated Pydantic reading without re-validating it."""
+        return cls(**{name: getattr(model, name) for name in cls.fields()})
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields())
+        return f"{type(self).__name__}({values})"
+
+
+class LidarReading(Reading):
+    """Trusted LIDAR reading."""
+
+    __slots__ = ("vertical_velocity", "backscatter", "range_resolution")
+
+    sensor_type = "lidar"
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        vertical_velocity: float,
+        backscatter: float,
+        range_resolution: float = 30.0,
+        site: Optional[str] = None,
+        sensor_id: Optional[str] = None
+    ) -> None:
+        super().__init__(timestamp, latitude, longitude, altitude, site, sensor_id)
+        self.vertical_velocity = vertical_velocity
+        self.backscatter = backscatter
+        self.range_resolution = range_resolution
+
+
+class RadarReading(Reading):
+    """Trusted Doppler radar reading."""
+
+    __slots__ = ("reflectivity", "radial_velocity", "spectrum_width")
+
+    sensor_type = "radar"
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        reflectivity: float,
+        radial_velocity: float,
+        spectrum_width: float,
+        site: Optional[str] = None,
+        sensor_id: Optional[str] = None
+    ) -> None:
+        super().__init__(timestamp, latitude, longitude, altitude, site, sensor_id)
+        self.reflectivity = reflectivity
+        self.radial_velocity = radial_velocity
+        self.spectrum_width = spectrum_width
+
+
+class AnemometerReading(Reading):
+    """Trusted surface anemometer reading."""
+
+    __slots__ = ("wind_speed", "wind_direction", "temperature", "pressure")
+
+    sensor_type = "anemometer"
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        wind_speed: float,
+        wind_direction: float,
+        temperature: float,
+        pressure: float,
+        site: Optional[str] = None,
+        sensor_id: Optional[str] = None
+    ) -> None:
+        super().__init__(timestamp, latitude, longitude, altitude, site, sensor_id)
+        self.wind_speed = wind_speed
+        self.wind_direction = wind_direction
+        self.temperature = temperature
+        self.pressure = pressure
+
+
+def sensor_type_of(data: Union[Reading, SensorData]) -> str:
+    """
+    Sensor category of a reading of either representation.
+
+    Args:
+        data: Pydantic model or internal record
+
+    Returns:
+        ``lidar``, ``radar`` or ``anemometer``
+    """
+    if isinstance(data, Reading):
+        return data.sensor_type
+    if isinstance(data, LidarData):
+        return "lidar"
+    if isinstance(data, DopplerRadarData):
+        return "radar"
+    if isinstance(data, AnemometerData):
+        return "anemometer"
+    raise TypeError(f"Unsupported reading type: {type(data).__name__}")
+
+
+def _json_default(value: Any) -> Any:
+    """Encode numpy scalars that algorithms leave in ``additional_data``."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class DetectionRecord:
+    """
+    Detection result as produced by the detector and kept in history.
+
+    The detector only builds these from values it computed itself, so no
+    validation runs on construction. ``to_dict``/``to_json`` produce the same
+    shape as ``MicroburstDetection`` for the API. Records are treated as
+    immutable, so the JSON encoding is computed once and reused by the
+    broadcast, the store and every query that returns the record.
+    """
+
+    FIELDS = (
+        "event_id",
+        "timestamp",
+        "latitude",
+        "longitude",
+        "altitude",
+        "severity",
+        "detection_method",
+        "max_wind_shear",
+        "vertical_velocity",
+        "confidence",
+        "radius",
+        "duration_seconds",
+        "alert_level",
+        "site",
+        "additional_data",
+    )
+
+    __slots__ = FIELDS + ("_json",)
+
+    def __init__(
+        self,
+        event_id: str,
+        timestamp: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        severity: SeverityLevel,
+        detection_method: DetectionMethod,
+        max_wind_shear: float,
+        vertical_velocity: float,
+        confidence: float,
+        radius: float,
+        duration_seconds: int,
+        alert_level: str,
+        site: Optional[str] = None,
+        additional_data: Optional[dict] = None
+    ) -> None:
+        self.event_id = event_id
+        self.timestamp = timestamp
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+        self.severity = severity
+        self.detection_method = detection_method
+        self.max_wind_shear = max_wind_shear
+        self.vertical_velocity = vertical_velocity
+        self.confidence = confidence
+        self.radius = radius
+        self.duration_seconds = duration_seconds
+        self.alert_level = alert_level
+        self.site = site
+        self.additional_data = additional_data
+        self._json: Optional[str] = None
+
+    @classmethod
+    def coerce(cls, detection: Union["DetectionRecord", MicroburstDetection]) -> "DetectionRecord":
+        """Return ``detection`` as a record, converting Pydantic models."""
+        if isinstance(detection, cls):
+            return detection
+        return cls(**{name: getattr(detection, name) for name in cls.FIELDS})
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "DetectionRecord":
+        """Rebuild a record from ``to_dict`` output (e.g. stored JSON)."""
+        timestamp = values["timestamp"]
+        return cls(
+            event_id=values["event_id"],
+            timestamp=(
+                datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp
+            ),
+            latitude=values["latitude"],
+            longitude=values["longitude"],
+            altitude=values["altitude"],
+            severity=SeverityLevel(values["severity"]),
+            detection_method=DetectionMethod(values["detection_method"]),
+            max_wind_shear=values["max_wind_shear"],
+            vertical_velocity=values["vertical_velocity"],
+            confidence=values["confidence"],
+            radius=values["radius"],
+            duration_seconds=values["duration_seconds"],
+            alert_level=values["alert_level"],
+            site=values.get("site"),
+            additional_data=values.get("additional_data"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: Union[str, bytes]) -> "DetectionRecord":
+        """Rebuild a record from ``to_json`` output."""
+        record = cls.from_dict(json.loads(payload))
+        record._json = payload.decode() if isinstance(payload, bytes) else payload
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible dictionary in ``MicroburstDetection`` field order."""
+        return {
+            "event_id": self.event_id,
+            "timestamp": self.timestamp.isoformat(),
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "altitude": self.altitude,
+            "severity": self.severity.value,
+            "detection_method": self.detection_method.value,
+            "max_wind_shear": self.max_wind_shear,
+            "vertical_velocity": self.vertical_velocity,
+            "confidence": self.confidence,
+            "radius": self.radius,
+            "duration_seconds": self.duration_seconds,
+            "alert_level": self.alert_level,
+            "site": self.site,
+            "additional_data": self.additional_data,
+        }
+
+    def to_json(self) -> str:
+        """Compact JSON encoding of ``to_dict`` (cached after the first call)."""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict(), separators=(",", ":"), default=_json_default)
+        return self._json
+
+    def to_model(self) -> MicroburstDetection:
+        """Validated Pydantic model, for callers that need one."""
+        return MicroburstDetection.model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DetectionRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        return (
+            f"DetectionRecord(event_id={self.event_id!r}, timestamp={self.timestamp!r}, "
+            f"severity={self.severity.value!r}, method={self.detection_method.value!r})"
+        )
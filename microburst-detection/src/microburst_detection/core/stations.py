@@ -0,0 +1,329 @@
+# src/microburst_detection/core/stations.py
+"""Rolling per-station anemometer history with surge and pressure-jump detection."""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class StationEvent(NamedTuple):
+    """Signals that started at a station at one tick, against its rolling baseline."""
+    station: str
+    latitude: float
+    longitude: float
+    surge: bool
+    direction_shift: bool
+    pressure_jump: bool
+    speed: float                # m/s, recent mean
+    baseline_speed: float       # m/s
+    speed_change: float         # m/s
+    direction_change: float     # degrees
+    pressure_change: float      # hPa, positive for a rise
+
+
+class StationBuffers:
+    """
+    Ring buffers of the last ``window`` seconds of every station's wind and pressure.
+
+    Samples are placed on a regular grid of ``period``-second slots: several
+    samples in one slot are averaged and short gaps between a station's
+    samples are filled by linear interpolation, so irregular reporting
+    costs one slice assignment per sample. Each quantity is one 2-D array
+    (stations x slots) used as a ring, with empty slots held at zero and
+    flagged in a shared mask, so every station is compared against its own
+    baseline in a few plain array sums per tick.
+
+    The latest ``recent`` seconds are compared with the rest of the window:
+    a surge is a rise in mean speed of at least ``surge_threshold`` (and
+    ``surge_sigmas`` baseline standard deviations), a direction shift a
+    turn of the mean wind vector of at least ``shift_threshold`` degrees,
+    and a pressure jump a change of at least ``jump_threshold`` hPa.
+    Stations silent for a whole window have no samples left and are
+    dropped at the next evaluation.
+    """
+
+    SURGE_THRESHOLD: float = 7.5      # m/s (~15 kt)
+    SHIFT_THRESHOLD: float = 45.0     # degrees
+    JUMP_THRESHOLD: float = 1.0       # hPa
+
+    def __init__(
+        self,
+        window: float = 600.0,
+        period: float = 1.0,
+        recent: float = 30.0,
+        max_gap: float = 30.0,
+        min_speed: float = 3.0,
+        surge_threshold: float = SURGE_THRESHOLD,
+        surge_sigmas: float = 3.0,
+        shift_threshold: float = SHIFT_THRESHOLD,
+        jump_threshold: float = JUMP_THRESHOLD
+    ) -> None:
+        """
+        Initialize buffers.
+
+        Args:
+            window: Seconds of history kept per station
+            period: Slot length (seconds); also the evaluation interval
+            recent: Seconds compared against the rest of the window
+            max_gap: Longest gap between samples that is interpolated (seconds)
+            min_speed: Below this mean speed (m/s) direction shifts are ignored
+            surge_threshold: Minimum rise in mean speed [m/s]
+            surge_sigmas: Minimum rise in baseline standard deviations
+            shift_threshold: Minimum turn of the mean wind [degrees]
+            jump_threshold: Minimum change in mean pressure [hPa]
+        """
+        self.period = period
+        self.slots = max(int(round(window / period)), 2)
+        self.recent_slots = min(max(int(round(recent / period)), 1), self.slots - 1)
+        self.max_gap = max(int(round(max_gap / period)), 1)
+        self.min_speed = min_speed
+        self.surge_threshold = surge_threshold
+        self.surge_sigmas = surge_sigmas
+        self.shift_threshold = shift_threshold
+        self.jump_threshold = jump_threshold
+
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        capacity = 16
+        self._speed = np.zeros((capacity, self.slots), dtype=np.float32)
+        self._u = np.zeros((capacity, self.slots), dtype=np.float32)
+        self._v = np.zeros((capacity, self.slots), dtype=np.float32)
+        self._pressure = np.zeros((capacity, self.slots), dtype=np.float32)
+        self._filled = np.zeros((capacity, self.slots), dtype=bool)
+        self._lat = np.zeros(capacity)
+        self._lon = np.zeros(capacity)
+        self._last_slot = np.full(capacity, np.iinfo(np.int64).min // 2, dtype=np.int64)
+        self._slot_samples = np.zeros(capacity, dtype=np.int64)
+        self._flags = np.zeros((capacity, 3), dtype=bool)
+        self.head: Optional[int] = None
+        self.last_evaluated: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def _columns(self) -> tuple:
+        return (self._speed, self._u, self._v, self._pressure)
+
+    def update(
+        self,
+        station: str,
+        latitude: float,
+        longitude: float,
+        wind_speed: float,
+        wind_direction: float,
+        pressure: float,
+        timestamp: float
+    ) -> None:
+        """
+        Add a sample.
+
+        Args:
+            station: Station identifier
+            latitude: Station latitude
+            longitude: Station longitude
+            wind_speed: Wind speed [m/s]
+            wind_direction: Direction the wind blows from [degrees]
+            pressure: Station pressure [hPa]
+            timestamp: Observation time (epoch seconds)
+        """
+        slot = int(timestamp // self.period)
+        self._advance(slot)
+        if slot <= self.head - self.slots:
+            return  # Older than the window
+
+        i = self._index.get(station)
+        if i is None:
+            i = self._add(station)
+        self._lat[i] = latitude
+        self._lon[i] = longitude
+
+        direction = np.radians(wind_direction)
+        values = (
+            wind_speed, -wind_speed * np.sin(direction), -wind_speed * np.cos(direction), pressure
+        )
+        column = slot % self.slots
+        last = int(self._last_slot[i])
+        if slot == last:
+            # Another sample in the same slot: running mean
+            self._slot_samples[i] += 1
+            weight = 1.0 / self._slot_samples[i]
+            for array, value in zip(self._columns, values):
+                array[i, column] += weight * (value - array[i, column])
+            return
+
+        gap = slot - last
+        if 1 < gap <= self.max_gap and last > self.head - self.slots:
+            # Linear fill between the previous slot and this one
+            fraction = np.arange(1, gap) / gap
+            between = (last + np.arange(1, gap)) % self.slots
+            previous = last % self.slots
+            for array, value in zip(self._columns, values):
+                start = array[i, previous]
+                array[i, between] = start + (value - start) * fraction
+            self._filled[i, between] = True
+        for array, value in zip(self._columns, values):
+            array[i, column] = value
+        self._filled[i, column] = True
+        if slot > last:
+            self._last_slot[i] = slot
+            self._slot_samples[i] = 1
+
+    def baseline_pressure(self, station: str) -> Optional[float]:
+        """Mean pressure over the station's window, or None without history."""
+        i = self._index.get(station)
+        if i is None:
+            return None
+        valid = self._filled[i]
+        count = valid.sum()
+        if count < self.recent_slots:
+            return None
+        return float(self._pressure[i].sum(dtype=np.float64) / count)
+
+    def due(self, timestamp: float) -> bool:
+        """Whether a new slot has started since the last evaluation."""
+        return self.last_evaluated is None or int(timestamp // self.period) > self.last_evaluated
+
+    def evaluate(self, timestamp: float) -> List[StationEvent]:
+        """
+        Compare every station's recent samples with its baseline.
+
+        Args:
+            timestamp: Evaluation time (epoch seconds); the slot containing it
+                is still filling, so windows end at the slot before
+
+        Returns:
+            Events for stations where a surge, direction shift or pressure
+            jump started since the previous evaluation
+        """
+        slot = int(timestamp // self.period)
+        self._advance(slot)
+        self.last_evaluated = slot
+        self._expire(slot)
+        n = len(self._ids)
+        if not n:
+            return []
+
+        recent = (slot - 1 - np.arange(self.recent_slots)) % self.slots
+        current = slot % self.slots  # still filling
+        valid = self._filled[:n]
+        recent_count = valid[:, recent].sum(axis=1)
+        baseline_count = valid.sum(axis=1) - valid[:, current] - recent_count
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            (speed, speed_base, speed_sq), (u, u_base), (v, v_base), (pressure, pressure_base) = (
+                self._means(
+                    array[:n], recent, current, recent_count, baseline_count,
+                    squares=array is self._speed,
+                )
+                for array in self._columns
+            )
+            baseline_std = np.sqrt(np.maximum(speed_sq - speed_base ** 2, 0.0))
+            enough = (
+                (recent_count * 2 >= self.recent_slots)
+                & (baseline_count * 2 >= self.slots - self.recent_slots - 1)
+            )
+            speed_change = speed - speed_base
+            surge_floor = np.maximum(self.surge_threshold, self.surge_sigmas * baseline_std)
+            surge = enough & (speed_change >= surge_floor)
+            turn = np.degrees(np.abs(np.arctan2(u_base * v - v_base * u, u_base * u + v_base * v)))
+            steady = (
+                (np.hypot(u, v) >= self.min_speed) & (np.hypot(u_base, v_base) >= self.min_speed)
+            )
+            shift = enough & steady & (turn >= self.shift_threshold)
+            pressure_change = pressure - pressure_base
+            jump = enough & (np.abs(pressure_change) >= self.jump_threshold)
+
+        flags = np.column_stack((surge, shift, jump))
+        started = (flags & ~self._flags[:n]).any(axis=1)
+        self._flags[:n] = flags
+        return [
+            StationEvent(
+                station=self._ids[i],
+                latitude=float(self._lat[i]),
+                longitude=float(self._lon[i]),
+                surge=bool(surge[i]),
+                direction_shift=bool(shift[i]),
+                pressure_jump=bool(jump[i]),
+                speed=float(speed[i]),
+                baseline_speed=float(speed_base[i]),
+                speed_change=float(speed_change[i]),
+                direction_change=float(turn[i]) if steady[i] else 0.0,
+                pressure_change=float(pressure_change[i]),
+            )
+            for i in np.flatnonzero(started).tolist()
+        ]
+
+    @staticmethod
+    def _means(
+        values: np.ndarray,
+        recent: np.ndarray,
+        current: int,
+        recent_count: np.ndarray,
+        baseline_count: np.ndarray,
+        squares: bool = False
+    ) -> tuple:
+        """Recent and baseline means per station (plus the baseline mean square)."""
+        recent_total = values[:, recent].sum(axis=1, dtype=np.float64)
+        baseline_total = values.sum(axis=1, dtype=np.float64) - values[:, current] - recent_total
+        means = (recent_total / recent_count, baseline_total / baseline_count)
+        if not squares:
+            return means
+        squared = values * values
+        baseline_sq = (
+            squared.sum(axis=1, dtype=np.float64)
+            - squared[:, current]
+            - squared[:, recent].sum(axis=1)
+        )
+        return means + (baseline_sq / baseline_count,)
+
+    def _advance(self, slot: int) -> None:
+        """Move the ring head forward, clearing the slots it passes over."""
+        if self.head is None:
+            self.head = slot
+            return
+        if slot <= self.head:
+            return
+        cleared = (self.head + 1 + np.arange(min(slot - self.head, self.slots))) % self.slots
+        for array in self._columns:
+            array[:, cleared] = 0.0
+        self._filled[:, cleared] = False
+        self.head = slot
+
+    def _expire(self, slot: int) -> None:
+        """Drop stations whose last sample has left the window, compacting the rows."""
+        n = len(self._ids)
+        keep = self._last_slot[:n] > slot - self.slots
+        if keep.all():
+            return
+        kept = int(keep.sum())
+        for name in ("_speed", "_u", "_v", "_pressure", "_filled", "_lat", "_lon",
+                     "_last_slot", "_slot_samples", "_flags"):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+            array[kept:n] = 0
+        self._ids = [station for station, live in zip(self._ids, keep.tolist()) if live]
+        self._index = {station: i for i, station in enumerate(self._ids)}
+
+    def _add(self, station: str) -> int:
+        i = len(self._ids)
+        if i == len(self._lat):
+            capacity = 2 * i
+            for name in ("_speed", "_u", "_v", "_pressure", "_filled"):
+                grown = np.zeros((capacity, self.slots), dtype=getattr(self, name).dtype)
+                grown[:i] = getattr(self, name)
+                setattr(self, name, grown)
+            self._lat = np.resize(self._lat, capacity)
+            self._lon = np.resize(self._lon, capacity)
+            self._last_slot = np.resize(self._last_slot, capacity)
+            self._slot_samples = np.resize(self._slot_samples, capacity)
+            self._flags = np.resize(self._flags, (capacity, 3))
+        self._ids.append(station)
+        self._index[station] = i
+        self._last_slot[i] = np.iinfo(np.int64).min // 2
+        self._slot_samples[i] = 0
+        self._flags[i] = False
+        return i
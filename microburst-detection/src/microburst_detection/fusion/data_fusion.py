@@ -2,7 +2,7 @@
 """Multi-sensor data fusion using Kalman filtering."""
 
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Optional
 from datetime import datetime
 
 from ..core.models import LidarData, DopplerRadarData, AnemometerData, FusedSensorData
@@ -88,7 +88,8 @@ class SensorFusion:
         # Calculate fusion quality based on covariance trace
         fusion_quality = 1.0 / (1.0 + np.trace(self.covariance))
         
-        return FusedSensorData(
+        # Values computed here are trusted; skip Pydantic validation
+        return FusedSensorData.model_construct(
             timestamp=datetime.utcnow(),
             location=(lat, lon),
             altitude=alt,
@@ -0,0 +1,400 @@
+# src/microburst_detection/fusion/mosaic.py
+"""Multi-radar reflectivity and velocity mosaics on a common latitude/longitude grid."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..sensors.radar_volume import EARTH_RADIUS_M, REFLECTIVITY, VELOCITY, Tilt
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or weighting changes so stale disk caches are ignored
+_TABLE_VERSION = 1
+_EFFECTIVE_RADIUS_M = EARTH_RADIUS_M * 4.0 / 3.0
+
+
+class MosaicGrid(NamedTuple):
+    """Regular latitude/longitude grid centered on a point, sized in meters at its center."""
+    latitude: float
+    longitude: float
+    width: float = 1_000_000.0     # m
+    height: float = 1_000_000.0    # m
+    cell: float = 1000.0           # m
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return int(round(self.height / self.cell)), int(round(self.width / self.cell))
+
+    def axes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Latitudes of the rows and longitudes of the columns (cell centers)."""
+        rows, cols = self.shape
+        scale = np.radians(1.0) * EARTH_RADIUS_M
+        y = (np.arange(rows) + 0.5) * self.cell - self.height / 2
+        x = (np.arange(cols) + 0.5) * self.cell - self.width / 2
+        return (
+            self.latitude + y / scale,
+            self.longitude + x / (scale * np.cos(np.radians(self.latitude))),
+        )
+
+
+class SweepGeometry(NamedTuple):
+    """Everything about a radar sweep that decides which gate lands in which grid cell."""
+    latitude: float
+    longitude: float
+    altitude: float
+    elevation: float               # degrees
+    gates: int
+    gate_spacing: float            # m
+    first_gate: float = 0.0        # m
+    azimuth_resolution: float = 1.0  # degrees per nominal radial
+
+    @classmethod
+    def of(cls, tilt: Tilt, azimuth_resolution: float = 1.0) -> "SweepGeometry":
+        volume = tilt.volume
+        return cls(
+            volume.latitude, volume.longitude, volume.altitude, tilt.elevation,
+            volume.gates, volume.gate_spacing, volume.first_gate, azimuth_resolution
+        )
+
+    @property
+    def radials(self) -> int:
+        return int(round(360.0 / self.azimuth_resolution))
+
+    def key(self, grid: MosaicGrid) -> str:
+        """Cache key; elevation and position are rounded so scan-to-scan jitter reuses the table."""
+        fields = [
+            _TABLE_VERSION,
+            list(grid),
+            round(self.latitude, 5), round(self.longitude, 5), round(self.elevation, 1),
+            self.gates, self.gate_spacing, self.first_gate, self.azimuth_resolution,
+        ]
+        return hashlib.sha1(json.dumps(fields).encode()).hexdigest()[:16]
+
+
+class RemapTable(NamedTuple):
+    """Grid cells covered by one radar geometry and the gate feeding each of them."""
+    cells: np.ndarray      # int32, flat grid cell index
+    gates: np.ndarray      # int32, flat index into the (radials x gates) regularized sweep
+    weights: np.ndarray    # float32, compositing weight
+
+
+def build_table(
+    grid: MosaicGrid, geometry: SweepGeometry, range_scale: float = 50_000.0
+) -> RemapTable:
+    """
+    Map every grid cell within a radar's reach to its nearest gate.
+
+    Ground range and bearing from the radar are computed on the sphere and
+    turned into slant range along the beam under the 4/3 earth model. Each
+    cell gets the weight ``exp(-(range / range_scale)^2)``, so where radars
+    overlap the nearest (lowest, finest) beam dominates.
+
+    Args:
+        grid: Mosaic grid
+        geometry: Radar sweep geometry
+        range_scale: Ground range [m] at which the weight falls to 1/e
+
+    Returns:
+        Remap table
+    """
+    lat_axis, lon_axis = grid.axes()
+    rows_total, cols = grid.shape
+    elevation = np.radians(geometry.elevation)
+    reach = geometry.first_gate + geometry.gate_spacing * (geometry.gates - 0.5)
+
+    # Only look at the bounding box of the radar's coverage
+    scale = np.radians(1.0) * EARTH_RADIUS_M
+    lat_reach = reach / scale
+    rows = np.flatnonzero(np.abs(lat_axis - geometry.latitude) <= lat_reach + grid.cell / scale)
+    if not len(rows):
+        return _empty_table()
+    poleward = min(np.abs(lat_axis[rows]).max(), 89.0)
+    lon_reach = lat_reach / np.cos(np.radians(poleward))
+    columns = np.flatnonzero(np.abs(lon_axis - geometry.longitude) <= lon_reach + grid.cell / scale)
+    if not len(columns):
+        return _empty_table()
+
+    phi1 = np.radians(geometry.latitude)
+    phi2 = np.radians(lat_axis[rows])[:, None]
+    delta = np.radians(lon_axis[columns] - geometry.longitude)[None, :]
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta / 2) ** 2
+    angle = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))   # at the earth's center
+    ground = angle * EARTH_RADIUS_M
+    bearing = np.degrees(np.arctan2(
+        np.sin(delta) * np.cos(phi2),
+        np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(delta)
+    )) % 360.0
+
+    # Slant range to the beam above the cell (law of sines in the
+    # center-radar-target triangle with the effective earth radius)
+    effective = ground / _EFFECTIVE_RADIUS_M
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slant = _EFFECTIVE_RADIUS_M * np.sin(effective) / np.cos(effective + elevation)
+    gate = np.rint((slant - geometry.first_gate) / geometry.gate_spacing)
+    inside = (gate >= 0) & (gate < geometry.gates) & (effective + elevation < np.pi / 2)
+
+    radial = (bearing[inside] // geometry.azimuth_resolution).astype(np.int64) % geometry.radials
+    row, column = np.nonzero(inside)
+    return RemapTable(
+        cells=(rows[row] * cols + columns[column]).astype(np.int32),
+        gates=(radial * geometry.gates + gate[inside].astype(np.int64)).astype(np.int32),
+        weights=np.exp(-(ground[inside] / range_scale) ** 2).astype(np.float32),
+    )
+
+
+def _empty_table() -> RemapTable:
+    return RemapTable(np.empty(0, np.int32), np.empty(0, np.int32), np.empty(0, np.float32))
+
+
+class _Site(NamedTuple):
+    key: str
+    geometry: SweepGeometry
+    offset: int
+    size: int
+
+
+class RadarMosaic:
+    """
+    Composite reflectivity and velocity from several radars on one grid.
+
+    The expensive part, mapping grid cells to gates, depends only on a
+    radar's geometry, so it is done once per geometry and cached in memory
+    and (with ``cache_dir``) as ``.npz`` files that survive restarts. Each
+    sweep is first put on nominal azimuths (one row gather, no
+    trigonometry) into its radar's slot of a flat buffer; compositing then
+    gathers every table entry from the buffers and reduces per cell with
+    ``reduceat`` over entries presorted by cell:
+
+    - reflectivity is the weighted mean of the radars with data at the cell
+    - velocity comes from the highest-weight radar with data, since radial
+      velocities seen from different sites cannot be averaged
+    """
+
+    def __init__(
+        self, grid: MosaicGrid, cache_dir: Optional[Path] = None, range_scale: float = 50_000.0
+    ) -> None:
+        """
+        Initialize mosaic.
+
+        Args:
+            grid: Mosaic grid
+            cache_dir: Directory for remap tables (memory only when None)
+            range_scale: Weighting range scale passed to ``build_table`` [m]
+        """
+        self.grid = grid
+        self.shape = grid.shape
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.range_scale = range_scale
+        self.tables_built = 0
+        self.tables_loaded = 0
+        self.timestamps: Dict[str, Optional[float]] = {}
+
+        self._tables: Dict[str, RemapTable] = {}
+        self._sites: Dict[str, _Site] = {}
+        self._reflectivity = np.empty(0, dtype=np.float32)
+        self._velocity = np.empty(0, dtype=np.float32)
+        self._cells = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0, dtype=np.int64)
+        self._entries = _empty_table()
+
+    def __len__(self) -> int:
+        return len(self._sites)
+
+    def axes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid latitudes and longitudes, as taken by ``ReflectivityAnalyzer``."""
+        return self.grid.axes()
+
+    def table(self, geometry: SweepGeometry) -> RemapTable:
+        """Remap table for a geometry: from memory, else from disk, else built (and saved)."""
+        key = geometry.key(self.grid)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+        path = self.cache_dir / f"remap-{key}.npz" if self.cache_dir is not None else None
+        if path is not None and path.exists():
+            try:
+                with np.load(path) as data:
+                    table = RemapTable(data["cells"], data["gates"], data["weights"])
+                self.tables_loaded += 1
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable remap table {path}: {e}")
+        if table is None:
+            table = build_table(self.grid, geometry, self.range_scale)
+            self.tables_built += 1
+            if path is not None:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                temporary = path.with_suffix(".tmp.npz")
+                np.savez(temporary, **table._asdict())
+                os.replace(temporary, path)
+        self._tables[key] = table
+        return table
+
+    def update(
+        self,
+        site: str,
+        geometry: SweepGeometry,
+        azimuths: np.ndarray,
+        reflectivity: np.ndarray,
+        velocity: Optional[np.ndarray] = None,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Replace a radar's contribution with a new sweep.
+
+        Args:
+            site: Radar identifier
+            geometry: Sweep geometry
+            azimuths: Azimuth of each radial [degrees]
+            reflectivity: Reflectivity (radials x gates) [dBZ], NaN for no data
+            velocity: Radial velocity (radials x gates) [m/s], NaN for no data
+            timestamp: Sweep time (epoch seconds)
+        """
+        reflectivity = np.asarray(reflectivity)
+        if reflectivity.shape != (len(azimuths), geometry.gates):
+            raise ValueError(
+                f"Sweep shape {reflectivity.shape} does not match "
+                f"{len(azimuths)} radials x {geometry.gates} gates"
+            )
+        current = self._sites.get(site)
+        if current is None or current.key != geometry.key(self.grid):
+            self._register(site, geometry)
+            current = self._sites[site]
+
+        radial = _nominal_radials(
+            np.asarray(azimuths, dtype=np.float64), geometry.azimuth_resolution, geometry.radials
+        )
+        missing = radial < 0
+        for buffer, values in ((self._reflectivity, reflectivity), (self._velocity, velocity)):
+            slot = buffer[current.offset:current.offset + current.size]
+            slot = slot.reshape(geometry.radials, geometry.gates)
+            if values is None:
+                slot[:] = np.nan
+                continue
+            slot[:] = np.asarray(values)[radial]
+            slot[missing] = np.nan
+        self.timestamps[site] = timestamp
+
+    def update_tilt(self, site: str, tilt: Tilt, azimuth_resolution: float = 1.0) -> None:
+        """Replace a radar's contribution with a committed tilt of a ``RadarVolume``."""
+        moments = tilt.volume.moments
+        self.update(
+            site,
+            SweepGeometry.of(tilt, azimuth_resolution),
+            tilt.azimuths,
+            tilt.moment(REFLECTIVITY),
+            tilt.moment(VELOCITY) if VELOCITY in moments else None,
+            tilt.timestamp,
+        )
+
+    def remove(self, site: str) -> None:
+        """Drop a radar from the mosaic."""
+        if site in self._sites:
+            sites = {name: s for name, s in self._sites.items() if name != site}
+            self.timestamps.pop(site, None)
+            self._layout(sites)
+
+    def composite(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Composite the latest sweep of every radar.
+
+        Returns:
+            (reflectivity, velocity) grids of ``grid.shape``, NaN where no
+            radar has data
+        """
+        size = self.shape[0] * self.shape[1]
+        reflectivity = np.full(size, np.nan, dtype=np.float32)
+        velocity = np.full(size, np.nan, dtype=np.float32)
+        if not len(self._cells):
+            return reflectivity.reshape(self.shape), velocity.reshape(self.shape)
+
+        entries = self._entries
+        values = self._reflectivity[entries.gates]
+        valid = ~np.isnan(values)
+        weights = np.where(valid, entries.weights, 0.0)
+        total = np.add.reduceat(weights * np.where(valid, values, 0.0), self._starts)
+        norm = np.add.reduceat(weights, self._starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            reflectivity[self._cells] = total / norm
+
+        # Entries are sorted by descending weight within a cell: take the first with data
+        values = self._velocity[entries.gates]
+        position = np.where(np.isnan(values), len(values), np.arange(len(values)))
+        first = np.minimum.reduceat(position, self._starts)
+        found = first < len(values)
+        velocity[self._cells[found]] = values[first[found]]
+        return reflectivity.reshape(self.shape), velocity.reshape(self.shape)
+
+    def _register(self, site: str, geometry: SweepGeometry) -> None:
+        sites = dict(self._sites)
+        size = geometry.radials * geometry.gates
+        sites[site] = _Site(geometry.key(self.grid), geometry, -1, size)
+        self._layout(sites)
+
+    def _layout(self, sites: Dict[str, _Site]) -> None:
+        """Reallocate the sweep buffers and merge the tables when the set of geometries changes."""
+        total = sum(s.size for s in sites.values())
+        reflectivity = np.full(total, np.nan, dtype=np.float32)
+        velocity = np.full(total, np.nan, dtype=np.float32)
+        laid_out: Dict[str, _Site] = {}
+        cells, gates, weights = [], [], []
+        offset = 0
+        for name, s in sites.items():
+            old = self._sites.get(name)
+            if old is not None and old.key == s.key and old.offset >= 0:
+                # Unchanged radar: keep its latest sweep
+                previous = slice(old.offset, old.offset + old.size)
+                reflectivity[offset:offset + s.size] = self._reflectivity[previous]
+                velocity[offset:offset + s.size] = self._velocity[previous]
+            laid_out[name] = s._replace(offset=offset)
+            table = self.table(s.geometry)
+            cells.append(table.cells)
+            gates.append(table.gates.astype(np.int64) + offset)
+            weights.append(table.weights)
+            offset += s.size
+
+        self._sites = laid_out
+        self._reflectivity = reflectivity
+        self._velocity = velocity
+        if not cells:
+            self._cells = np.empty(0, dtype=np.int64)
+            self._starts = np.empty(0, dtype=np.int64)
+            self._entries = _empty_table()
+            return
+        cells = np.concatenate(cells)
+        weights = np.concatenate(weights)
+        # By cell, then by descending weight (weights are in (0, 1]); one
+        # integer radix sort is several times faster than lexsort here
+        rank = ((1.0 - weights.astype(np.float64)) * (1 << 31)).astype(np.int64)
+        order = np.argsort((cells.astype(np.int64) << 32) | rank, kind="stable")
+        cells = cells[order]
+        self._entries = RemapTable(cells, np.concatenate(gates)[order], weights[order])
+        self._starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        self._cells = cells[self._starts].astype(np.int64)
+
+
+def _nominal_radials(azimuths: np.ndarray, resolution: float, count: int) -> np.ndarray:
+    """
+    Index of the measured radial nearest each nominal radial center.
+
+    Nominal radials further than one resolution from any measured radial
+    (sector scans, dropped radials) get -1.
+    """
+    centers = (np.arange(count) + 0.5) * resolution
+    if not len(azimuths):
+        return np.full(count, -1, dtype=np.int64)
+    order = np.argsort(azimuths % 360.0)
+    ordered = azimuths[order] % 360.0
+    # Pad with the neighbors across north so the search wraps
+    padded = np.concatenate((ordered[-1:] - 360.0, ordered, ordered[:1] + 360.0))
+    above = np.searchsorted(padded, centers)
+    below = above - 1
+    nearer = np.where(centers - padded[below] <= padded[above] - centers, below, above)
+    distance = np.abs(centers - padded[nearer])
+    radial = order[(nearer - 1) % len(ordered)]
+    return np.where(distance <= resolution, radial, -1)
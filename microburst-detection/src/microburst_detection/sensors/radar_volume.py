@@ -0,0 +1,338 @@
+# src/microburst_detection/sensors/radar_volume.py
+"""Radar volume scans stored as memory-mapped tilts, readable while they are written."""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+METADATA = "volume.json"
+REFLECTIVITY = "reflectivity"
+VELOCITY = "velocity"
+
+EARTH_RADIUS_M = 6371000.0
+# 4/3 earth radius model for beam height under standard refraction
+_EFFECTIVE_RADIUS_M = EARTH_RADIUS_M * 4.0 / 3.0
+
+
+class Tilt:
+    """
+    One committed sweep of a volume.
+
+    Moment arrays (azimuths x gates, float32, NaN for no data) are opened as
+    read-only ``np.memmap`` views on first access, so only the pages of the
+    moments actually read become resident.
+    """
+
+    def __init__(self, volume: "RadarVolume", index: int, info: dict) -> None:
+        self.volume = volume
+        self.index = index
+        self.elevation: float = info["elevation"]
+        self.timestamp: float = info["timestamp"]
+        self.shape: Tuple[int, int] = (info["azimuths"], volume.gates)
+        self._maps: Dict[str, np.memmap] = {}
+
+    def __repr__(self) -> str:
+        return f"Tilt({self.index}, elevation={self.elevation}, shape={self.shape})"
+
+    @property
+    def azimuths(self) -> np.ndarray:
+        """Azimuth of each radial [degrees]."""
+        return self._map("azimuth", (self.shape[0],))
+
+    @property
+    def ranges(self) -> np.ndarray:
+        """Slant range to each gate center [m]."""
+        return self.volume.first_gate + self.volume.gate_spacing * np.arange(self.volume.gates)
+
+    def moment(self, name: str) -> np.ndarray:
+        """Read-only memory-mapped moment array (azimuths x gates)."""
+        if name not in self.volume.moments:
+            raise KeyError(f"Unknown moment: {name}")
+        return self._map(name, self.shape)
+
+    def locate(self, radial: int, gate: float) -> Tuple[float, float, float]:
+        """
+        Position of a gate.
+
+        Args:
+            radial: Radial index
+            gate: Gate index (fractional for points between gates)
+
+        Returns:
+            (latitude, longitude, altitude above sea level in m)
+        """
+        volume = self.volume
+        slant = volume.first_gate + volume.gate_spacing * gate
+        elevation = np.radians(self.elevation)
+        ground = slant * np.cos(elevation)
+        azimuth = np.radians(float(self.azimuths[radial]))
+        scale = np.radians(1.0) * EARTH_RADIUS_M
+        latitude = volume.latitude + ground * np.cos(azimuth) / scale
+        longitude = volume.longitude + ground * np.sin(azimuth) / (
+            scale * np.cos(np.radians(volume.latitude))
+        )
+        height = slant * np.sin(elevation) + slant ** 2 / (2 * _EFFECTIVE_RADIUS_M)
+        return float(latitude), float(longitude), float(volume.altitude + height)
+
+    def _map(self, name: str, shape: tuple) -> np.memmap:
+        array = self._maps.get(name)
+        if array is None:
+            path = self.volume.path / _tilt_file(self.index, name)
+            array = self._maps[name] = np.memmap(path, dtype=np.float32, mode="r", shape=shape)
+        return array
+
+
+class TiltWriter:
+    """
+    Fills one tilt's files radial by radial as data arrives.
+
+    The files are preallocated (NaN) and written through writable mappings;
+    the tilt becomes visible to readers only on ``commit``.
+    """
+
+    def __init__(self, volume: "RadarVolume", index: int, elevation: float,
+                 azimuths: np.ndarray, timestamp: float) -> None:
+        self.volume = volume
+        self.index = index
+        self.elevation = elevation
+        self.timestamp = timestamp
+        shape = (len(azimuths), volume.gates)
+        self._maps = {"azimuth": self._create("azimuth", (len(azimuths),))}
+        self._maps["azimuth"][:] = azimuths
+        for name in volume.moments:
+            self._maps[name] = self._create(name, shape)
+            self._maps[name][:] = np.nan
+
+    def write(self, start: int, **moments: np.ndarray) -> None:
+        """
+        Write consecutive radials.
+
+        Args:
+            start: Index of the first radial
+            moments: Moment name to (radials x gates) values
+        """
+        for name, values in moments.items():
+            if name not in self.volume.moments:
+                raise KeyError(f"Unknown moment: {name}")
+            values = np.asarray(values, dtype=np.float32)
+            self._maps[name][start:start + len(values)] = values
+
+    def commit(self) -> Tilt:
+        """Flush the tilt and publish it in the volume metadata."""
+        for array in self._maps.values():
+            array.flush()
+        azimuths = len(self._maps["azimuth"])
+        self._maps.clear()
+        return self.volume._publish(self.index, {
+            "elevation": self.elevation,
+            "timestamp": self.timestamp,
+            "azimuths": azimuths,
+        })
+
+    def _create(self, name: str, shape: tuple) -> np.memmap:
+        path = self.volume.path / _tilt_file(self.index, name)
+        return np.memmap(path, dtype=np.float32, mode="w+", shape=shape)
+
+
+class RadarVolume:
+    """
+    A radar volume scan: tilts x azimuths x gates x moments.
+
+    Each tilt's moments live in their own raw float32 file next to a JSON
+    metadata file listing the committed tilts, so a volume of hundreds of MB
+    is never read as a whole: tilts and moments are mapped on demand and
+    only touched pages stay resident. Writers append tilts as the radar
+    scans them and readers pick them up with ``refresh`` (or ``follow``),
+    so detection can run on the lowest tilts before the volume is complete.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open an existing volume.
+
+        Args:
+            path: Volume directory written by ``RadarVolume.create``
+        """
+        self.path = Path(path)
+        self._version = None
+        self._tilts: List[Tilt] = []
+        self.refresh()
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        latitude: float,
+        longitude: float,
+        altitude: float,
+        gates: int,
+        gate_spacing: float,
+        first_gate: float = 0.0,
+        moments: Sequence[str] = (REFLECTIVITY, VELOCITY),
+        site: Optional[str] = None,
+        timestamp: Optional[float] = None
+    ) -> "RadarVolume":
+        """
+        Start a new, empty volume.
+
+        Args:
+            path: Directory to create
+            latitude: Radar latitude
+            longitude: Radar longitude
+            altitude: Antenna altitude [m]
+            gates: Gates per radial
+            gate_spacing: Distance between gates [m]
+            first_gate: Range to the first gate center [m]
+            moments: Moment names stored for every tilt
+            site: Airport or site identifier
+            timestamp: Volume start time (epoch seconds)
+
+        Returns:
+            The volume, open for appending
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        metadata = {
+            "site": site,
+            "latitude": latitude,
+            "longitude": longitude,
+            "altitude": altitude,
+            "gates": gates,
+            "gate_spacing": gate_spacing,
+            "first_gate": first_gate,
+            "moments": list(moments),
+            "timestamp": time.time() if timestamp is None else timestamp,
+            "complete": False,
+            "tilts": [],
+        }
+        _write_metadata(path, metadata)
+        return cls(path)
+
+    def __len__(self) -> int:
+        return len(self._tilts)
+
+    def __iter__(self) -> Iterator[Tilt]:
+        return iter(list(self._tilts))
+
+    def tilt(self, index: int) -> Tilt:
+        """Committed tilt by scan order."""
+        return self._tilts[index]
+
+    @property
+    def complete(self) -> bool:
+        return self._metadata["complete"]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the committed moment data."""
+        return sum(4 * tilt.shape[0] * tilt.shape[1] * len(self.moments) for tilt in self._tilts)
+
+    def refresh(self) -> int:
+        """
+        Pick up tilts committed since the last call (cheap when nothing changed).
+
+        Returns:
+            Number of committed tilts
+        """
+        stat = os.stat(self.path / METADATA)
+        # Every update replaces the file, so the inode changes even when the
+        # filesystem's mtime is too coarse to tell two updates apart
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if version == self._version:
+            return len(self._tilts)
+        self._version = version
+        self._metadata = json.loads((self.path / METADATA).read_text())
+        for name in (
+            "site", "latitude", "longitude", "altitude", "gates", "gate_spacing", "first_gate",
+            "moments",
+        ):
+            setattr(self, name, self._metadata[name])
+        for index in range(len(self._tilts), len(self._metadata["tilts"])):
+            self._tilts.append(Tilt(self, index, self._metadata["tilts"][index]))
+        return len(self._tilts)
+
+    def follow(self, poll: float = 0.1, timeout: Optional[float] = None) -> Iterator[Tilt]:
+        """
+        Yield tilts as they are committed until the volume is complete.
+
+        Args:
+            poll: Seconds between metadata checks while waiting
+            timeout: Stop after this many seconds without a new tilt
+        """
+        yielded = 0
+        waited = 0.0
+        while True:
+            self.refresh()
+            if yielded < len(self._tilts):
+                for tilt in self._tilts[yielded:]:
+                    yield tilt
+                yielded = len(self._tilts)
+                waited = 0.0
+                continue
+            if self.complete or (timeout is not None and waited >= timeout):
+                return
+            time.sleep(poll)
+            waited += poll
+
+    def begin_tilt(
+        self, elevation: float, azimuths: np.ndarray, timestamp: Optional[float] = None
+    ) -> TiltWriter:
+        """
+        Start writing the next tilt.
+
+        Args:
+            elevation: Antenna elevation [degrees]
+            azimuths: Azimuth of each radial [degrees]
+            timestamp: Sweep time (epoch seconds)
+        """
+        self.refresh()
+        return TiltWriter(
+            self, len(self._metadata["tilts"]), elevation, np.asarray(azimuths, dtype=np.float32),
+            time.time() if timestamp is None else timestamp
+        )
+
+    def append_tilt(
+        self,
+        elevation: float,
+        azimuths: np.ndarray,
+        moments: Dict[str, np.ndarray],
+        timestamp: Optional[float] = None
+    ) -> Tilt:
+        """Write and commit a whole tilt at once."""
+        writer = self.begin_tilt(elevation, azimuths, timestamp)
+        writer.write(0, **moments)
+        return writer.commit()
+
+    def finish(self) -> None:
+        """Mark the volume complete."""
+        self.refresh()
+        self._metadata["complete"] = True
+        _write_metadata(self.path, self._metadata)
+        self.refresh()
+
+    def _publish(self, index: int, info: dict) -> Tilt:
+        self.refresh()
+        if index != len(self._metadata["tilts"]):
+            raise RuntimeError(f"Tilt {index} committed out of order")
+        self._metadata["tilts"].append(info)
+        _write_metadata(self.path, self._metadata)
+        self.refresh()
+        return self._tilts[index]
+
+
+def _tilt_file(index: int, name: str) -> str:
+    return f"tilt{index:02d}_{name}.f32"
+
+
+def _write_metadata(path: Path, metadata: dict) -> None:
+    """Replace the metadata atomically so readers never see a partial file."""
+    temporary = path / (METADATA + ".tmp")
+    temporary.write_text(json.dumps(metadata))
+    os.replace(temporary, path / METADATA)
@@ -0,0 +1,400 @@
+# src/microburst_detection/storage/archive.py
+"""Append-only segmented archive of raw sensor readings with memory-mapped readback."""
+
+import json
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from ..core.models import SENSOR_ID_MAX_BYTES, SITE_MAX_BYTES, SensorData
+from ..core.records import AnemometerReading, LidarReading, RadarReading, Reading
+from ..utils.timeutils import from_epoch, to_epoch
+
+logger = logging.getLogger(__name__)
+
+
+_COMMON_FIELDS = [
+    ("ts", "<f8"),
+    ("latitude", "<f8"),
+    ("longitude", "<f8"),
+    ("altitude", "<f4"),
+    ("site", f"S{SITE_MAX_BYTES}"),
+    ("sensor_id", f"S{SENSOR_ID_MAX_BYTES}"),
+]
+
+#: Packed little-endian record layout per sensor type
+DTYPES: Dict[str, np.dtype] = {
+    "lidar": np.dtype(_COMMON_FIELDS + [
+        ("vertical_velocity", "<f4"),
+        ("backscatter", "<f4"),
+        ("range_resolution", "<f4"),
+    ]),
+    "radar": np.dtype(_COMMON_FIELDS + [
+        ("reflectivity", "<f4"),
+        ("radial_velocity", "<f4"),
+        ("spectrum_width", "<f4"),
+    ]),
+    "anemometer": np.dtype(_COMMON_FIELDS + [
+        ("wind_speed", "<f4"),
+        ("wind_direction", "<f4"),
+        ("temperature", "<f4"),
+        ("pressure", "<f4"),
+    ]),
+}
+
+_READING_TYPES = {"lidar": LidarReading, "radar": RadarReading, "anemometer": AnemometerReading}
+
+_STRUCT_CODES = {"<f8": "d", "<f4": "f"}
+
+
+def _struct_code(field: np.dtype) -> str:
+    """``struct`` format code for one record field."""
+    if field.kind == "S":
+        return f"{field.itemsize}s"
+    return _STRUCT_CODES[field.str]
+
+
+def _struct_for(dtype: np.dtype) -> struct.Struct:
+    """``struct`` packer producing exactly one ``dtype`` record."""
+    packer = struct.Struct("<" + "".join(_struct_code(dtype[name]) for name in dtype.names))
+    assert packer.size == dtype.itemsize
+    return packer
+
+
+class _Segment:
+    """One open segment file being appended to."""
+
+    def __init__(self, path: Path, started: float) -> None:
+        self.path = path
+        self.started = started
+        self.file = open(path, "ab", buffering=1 << 16)
+        self.size = 0
+        self.count = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        self.ordered = True
+
+
+class RawArchiveWriter:
+    """
+    Append-only binary log of ingested readings.
+
+    Each sensor type gets its own directory of segment files holding
+    fixed-width packed records (see ``DTYPES``). Appends pack one record with
+    ``struct`` into a buffered file; segments rotate by size or age, and on
+    rotation a JSON sidecar records the segment's time range, count and
+    layout so readers can skip it without opening it.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            root: Archive directory
+            max_segment_bytes: Rotate a segment once it reaches this size
+            max_segment_seconds: Rotate a segment once it is this old
+            clock: Wall clock used for segment naming and rotation
+        """
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_seconds = max_segment_seconds
+        self.clock = clock
+        self._packers = {sensor: _struct_for(dtype) for sensor, dtype in DTYPES.items()}
+        self._segments: Dict[str, _Segment] = {}
+        self._sequence = 0
+        self.appended = 0
+
+    def append(self, sensor_type: str, data: Union[SensorData, Reading]) -> None:
+        """
+        Archive one reading.
+
+        Args:
+            sensor_type: ``lidar``, ``radar`` or ``anemometer``
+            data: Validated reading
+
+        Raises:
+            ValueError: If the site or sensor ID exceeds its field width
+        """
+        ts = to_epoch(data.timestamp)
+        site = (data.site or "").encode()
+        sensor_id = (data.sensor_id or "").encode()
+        if len(site) > SITE_MAX_BYTES or len(sensor_id) > SENSOR_ID_MAX_BYTES:
+            # Validated readings never get here; struct would silently truncate
+            raise ValueError(f"Identifiers too long to archive: {data.site!r}, {data.sensor_id!r}")
+        if sensor_type == "lidar":
+            record = self._packers["lidar"].pack(
+                ts, data.latitude, data.longitude, data.altitude, site, sensor_id,
+                data.vertical_velocity, data.backscatter, data.range_resolution
+            )
+        elif sensor_type == "radar":
+            record = self._packers["radar"].pack(
+                ts, data.latitude, data.longitude, data.altitude, site, sensor_id,
+                data.reflectivity, data.radial_velocity, data.spectrum_width
+            )
+        else:
+            record = self._packers["anemometer"].pack(
+                ts, data.latitude, data.longitude, data.altitude, site, sensor_id,
+                data.wind_speed, data.wind_direction, data.temperature, data.pressure
+            )
+
+        segment = self._segment(sensor_type)
+        segment.file.write(record)
+        segment.size += len(record)
+        segment.count += 1
+        if segment.first_ts is None:
+            segment.first_ts = ts
+        elif ts < segment.last_ts:
+            segment.ordered = False
+        segment.last_ts = ts if segment.last_ts is None else max(segment.last_ts, ts)
+        self.appended += 1
+
+    def flush(self) -> None:
+        """
+        Push buffered records to the OS so readers can see them.
+
+        Safe to call from a worker thread while appends go on; a segment
+        sealed meanwhile was flushed by its close and is skipped.
+        """
+        for segment in list(self._segments.values()):
+            try:
+                segment.file.flush()
+            except ValueError:
+                pass
+
+    def rotate(self, sensor_type: Optional[str] = None) -> None:
+        """Seal the open segment(s) and write their index sidecars."""
+        for sensor in [sensor_type] if sensor_type else list(self._segments):
+            segment = self._segments.pop(sensor, None)
+            if segment is not None:
+                self._seal(sensor, segment)
+
+    def close(self) -> None:
+        """Seal every open segment."""
+        self.rotate()
+
+    def prune(self, retention_seconds: float) -> int:
+        """
+        Delete sealed segments whose newest record is older than the retention.
+
+        Only sealed segments are considered, so segments still being written
+        by this or another worker process are never removed.
+
+        Args:
+            retention_seconds: Age of the newest record beyond which a segment goes
+
+        Returns:
+            Number of segments deleted
+        """
+        cutoff = self.clock() - retention_seconds
+        removed = 0
+        for sidecar in self.root.glob("*/*.json"):
+            try:
+                end = json.loads(sidecar.read_text())["end"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if end < cutoff:
+                sidecar.with_suffix(".seg").unlink(missing_ok=True)
+                sidecar.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(
+                f"Pruned {removed} raw archive segments older than {retention_seconds:.0f}s"
+            )
+        return removed
+
+    def _segment(self, sensor_type: str) -> _Segment:
+        segment = self._segments.get(sensor_type)
+        now = self.clock()
+        if segment is not None and (
+            segment.size >= self.max_segment_bytes
+            or now - segment.started >= self.max_segment_seconds
+        ):
+            self._seal(sensor_type, self._segments.pop(sensor_type))
+            segment = None
+        if segment is None:
+            directory = self.root / sensor_type
+            directory.mkdir(parents=True, exist_ok=True)
+            self._sequence += 1
+            # Time-sortable and unique per worker process
+            name = f"{int(now * 1000):015d}-{os.getpid()}-{self._sequence:06d}.seg"
+            segment = self._segments[sensor_type] = _Segment(directory / name, now)
+        return segment
+
+    def _seal(self, sensor_type: str, segment: _Segment) -> None:
+        segment.file.close()
+        if segment.count == 0:
+            segment.path.unlink(missing_ok=True)
+            return
+        index = {
+            "sensor_type": sensor_type,
+            "dtype": DTYPES[sensor_type].descr,
+            "record_size": DTYPES[sensor_type].itemsize,
+            "count": segment.count,
+            "start": segment.first_ts,
+            "end": segment.last_ts,
+            "ordered": segment.ordered,
+        }
+        segment.path.with_suffix(".json").write_text(json.dumps(index))
+
+
+class SegmentInfo:
+    """Index facts about one segment, from its sidecar or derived from the file."""
+
+    __slots__ = ("path", "count", "start", "end", "ordered", "sealed")
+
+    def __init__(self, path: Path, count: int, start: Optional[float], end: Optional[float],
+                 ordered: bool, sealed: bool) -> None:
+        self.path = path
+        self.count = count
+        self.start = start
+        self.end = end
+        self.ordered = ordered
+        self.sealed = sealed
+
+
+class RawArchiveReader:
+    """
+    Read archived readings as NumPy structured arrays backed by ``np.memmap``.
+
+    Time-range scans over ordered segments return slices of the mapping, so
+    no record is copied until the caller touches it.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize reader.
+
+        Args:
+            root: Archive directory written by ``RawArchiveWriter``
+        """
+        self.root = Path(root)
+
+    def segments(self, sensor_type: str) -> List[SegmentInfo]:
+        """
+        List a sensor type's segments in creation order.
+
+        Sealed segments are described by their sidecar; the open (or crashed)
+        segment is mapped to read its range, ignoring a trailing partial record.
+        """
+        dtype = DTYPES[sensor_type]
+        infos = []
+        for path in sorted((self.root / sensor_type).glob("*.seg")):
+            sidecar = path.with_suffix(".json")
+            if sidecar.exists():
+                index = json.loads(sidecar.read_text())
+                infos.append(SegmentInfo(
+                    path, index["count"], index["start"], index["end"], index["ordered"], True
+                ))
+                continue
+            records = self._map(path, dtype)
+            if len(records) == 0:
+                continue
+            ts = records["ts"]
+            infos.append(SegmentInfo(
+                path, len(records), float(ts.min()), float(ts.max()),
+                bool(np.all(ts[1:] >= ts[:-1])), False
+            ))
+        return infos
+
+    def scan(
+        self,
+        sensor_type: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield records with ``since <= ts < until``, one array per segment.
+
+        Args:
+            sensor_type: ``lidar``, ``radar`` or ``anemometer``
+            since: Inclusive start (epoch seconds)
+            until: Exclusive end (epoch seconds)
+
+        Yields:
+            Structured arrays with ``DTYPES[sensor_type]``; memmap views for
+            ordered segments, filtered copies otherwise
+        """
+        dtype = DTYPES[sensor_type]
+        for info in self.segments(sensor_type):
+            if since is not None and info.end < since:
+                continue
+            if until is not None and info.start >= until:
+                continue
+            records = self._map(info.path, dtype)[:info.count]
+            ts = records["ts"]
+            if info.ordered:
+                start = 0 if since is None else int(np.searchsorted(ts, since, side="left"))
+                stop = (
+                    len(records) if until is None else int(np.searchsorted(ts, until, side="left"))
+                )
+                if stop > start:
+                    yield records[start:stop]
+            else:
+                mask = np.ones(len(records), dtype=bool)
+                if since is not None:
+                    mask &= ts >= since
+                if until is not None:
+                    mask &= ts < until
+                if mask.any():
+                    yield records[mask]
+
+    def read(
+        self,
+        sensor_type: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> np.ndarray:
+        """Concatenate ``scan`` results into one (copied) array."""
+        parts = list(self.scan(sensor_type, since, until))
+        if not parts:
+            return np.empty(0, dtype=DTYPES[sensor_type])
+        return np.concatenate(parts)
+
+    def readings(
+        self,
+        sensor_type: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> Iterator[Reading]:
+        """
+        Rebuild reading records for replaying a time range through the detector.
+
+        Args:
+            sensor_type: ``lidar``, ``radar`` or ``anemometer``
+            since: Inclusive start (epoch seconds)
+            until: Exclusive end (epoch seconds)
+
+        Yields:
+            ``LidarReading``, ``RadarReading`` or ``AnemometerReading``
+        """
+        reading_type = _READING_TYPES[sensor_type]
+        value_fields = DTYPES[sensor_type].names[len(_COMMON_FIELDS):]
+        for records in self.scan(sensor_type, since, until):
+            for row in records.tolist():
+                ts, latitude, longitude, altitude, site, sensor_id, *values = row
+                yield reading_type(
+                    from_epoch(ts), latitude, longitude, altitude,
+                    **dict(zip(value_fields, values)),
+                    site=site.decode(errors="replace") or None,
+                    sensor_id=sensor_id.decode(errors="replace") or None
+                )
+
+    @staticmethod
+    def _map(path: Path, dtype: np.dtype) -> np.ndarray:
+        """Memory-map whole records of a segment (empty array for empty files)."""
+        count = path.stat().st_size // dtype.itemsize
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
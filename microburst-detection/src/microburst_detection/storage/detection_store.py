@@ -0,0 +1,603 @@
+# src/microburst_detection/storage/detection_store.py
+"""Detection history backends shared by the detector and the API."""
+
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..core.models import MicroburstDetection
+from ..core.records import DetectionRecord
+from ..utils.timeutils import to_epoch
+
+logger = logging.getLogger(__name__)
+
+
+# Keyset position in (timestamp, sequence) order
+Cursor = Tuple[float, int]
+
+
+class StoredDetection(NamedTuple):
+    """Detection together with its store sequence number and origin process."""
+    seq: int
+    origin: int
+    detection: DetectionRecord
+
+
+def summarize(detections: Iterable[DetectionRecord], days: int) -> dict:
+    """
+    Build the statistics payload for a set of detections.
+
+    Args:
+        detections: Detections inside the statistics window
+        days: Window length reported back to the caller
+
+    Returns:
+        Statistics dictionary
+    """
+    severity_counts = {
+        'low': 0,
+        'moderate': 0,
+        'severe': 0,
+        'extreme': 0
+    }
+    total = 0
+    confidence_sum = 0.0
+    wind_shear_sum = 0.0
+
+    for detection in detections:
+        severity_counts[detection.severity.value] += 1
+        confidence_sum += detection.confidence
+        wind_shear_sum += detection.max_wind_shear
+        total += 1
+
+    return {
+        'total_detections': total,
+        'severity_distribution': severity_counts,
+        'avg_confidence': confidence_sum / total if total else 0,
+        'avg_wind_shear': wind_shear_sum / total if total else 0,
+        'period_days': days
+    }
+
+
+class DetectionRow(NamedTuple):
+    """Detection with its keyset position for cursor pagination."""
+    ts: float
+    seq: int
+    detection: DetectionRecord
+
+    @property
+    def cursor(self) -> Cursor:
+        return (self.ts, self.seq)
+
+
+class DetectionStore(ABC):
+    """
+    Interface for detection history storage.
+
+    Every stored detection receives a monotonically increasing sequence
+    number, so ``version`` changes whenever the history changes and
+    ``changes_since`` lets consumers catch up incrementally.
+    """
+
+    #: True when several processes see the same history
+    shared: bool = False
+
+    @abstractmethod
+    def add(self, detection: Union[DetectionRecord, MicroburstDetection]) -> int:
+        """Store a detection (Pydantic models are converted) and return its sequence number."""
+
+    @abstractmethod
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None
+    ) -> List[DetectionRecord]:
+        """Return detections with ``since <= timestamp < until`` in time order."""
+
+    @abstractmethod
+    def page(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None,
+        after: Optional[Cursor] = None,
+        limit: int = 500
+    ) -> List[DetectionRow]:
+        """
+        Return up to ``limit`` detections ordered by (timestamp, sequence).
+
+        Args:
+            since: Inclusive window start (epoch seconds)
+            until: Exclusive window end (epoch seconds)
+            severity: Severity filter
+            after: Keyset cursor; only rows strictly after it are returned
+            limit: Maximum number of rows
+
+        Returns:
+            Rows in keyset order
+        """
+
+    def iter_range(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None,
+        after: Optional[Cursor] = None,
+        page_size: int = 500
+    ) -> Iterator[DetectionRow]:
+        """
+        Lazily yield a window in keyset order, one page in memory at a time.
+
+        Each page is a separate keyset query, so no lock or database cursor
+        is held while the consumer processes rows.
+        """
+        while True:
+            rows = self.page(since, until, severity, after, page_size)
+            yield from rows
+            if len(rows) < page_size:
+                return
+            after = rows[-1].cursor
+
+    def statistics(self, since: float, days: int) -> dict:
+        """Return the statistics payload for detections newer than ``since``."""
+        return summarize(self.query(since=since), days)
+
+    @abstractmethod
+    def changes_since(self, seq: int) -> List[StoredDetection]:
+        """Return detections stored after sequence number ``seq``."""
+
+    @abstractmethod
+    def changed_since(
+        self,
+        seq: int,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> bool:
+        """Whether any detection stored after ``seq`` falls inside ``[since, until)``."""
+
+    @abstractmethod
+    def first_timestamp(self, since: Optional[float] = None) -> Optional[float]:
+        """Earliest detection timestamp at or after ``since``."""
+
+    @abstractmethod
+    def prune(self, before: float) -> int:
+        """
+        Delete detections timestamped before ``before`` (epoch seconds).
+
+        Sequence numbers are never reused, so ``version`` is unchanged.
+
+        Returns:
+            Number of detections deleted
+        """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Sequence number of the most recent detection (0 when nothing was ever stored)."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored detections."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryDetectionStore(DetectionStore):
+    """
+    Process-local history kept in time order for bisect range queries.
+
+    The arrival-order log behind ``changes_since`` holds sequence numbers
+    ``_offset + 1`` onwards; ``prune`` drops its old prefix.
+    """
+
+    def __init__(self, on_add: Optional[Callable[[DetectionRecord], None]] = None) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            on_add: Called with every newly added detection (e.g. to queue it
+                for persistence); must not block
+        """
+        self.on_add = on_add
+        self._log: List[DetectionRecord] = []
+        self._log_times: List[float] = []
+        self._times: List[float] = []
+        self._time_seqs: List[int] = []
+        self._by_time: List[DetectionRecord] = []
+        self._offset = 0
+        self._origin = os.getpid()
+
+    def add(self, detection: Union[DetectionRecord, MicroburstDetection]) -> int:
+        detection = DetectionRecord.coerce(detection)
+        ts = to_epoch(detection.timestamp)
+        # Readings arrive almost in order, so this is usually an append
+        index = bisect_right(self._times, ts)
+        self._log.append(detection)
+        self._log_times.append(ts)
+        seq = self.version
+        self._times.insert(index, ts)
+        self._time_seqs.insert(index, seq)
+        self._by_time.insert(index, detection)
+        if self.on_add is not None:
+            self.on_add(detection)
+        return seq
+
+    def load(self, detections: Iterable[DetectionRecord]) -> int:
+        """
+        Bulk-load previously persisted detections without notifying ``on_add``.
+
+        Args:
+            detections: Detections in any order
+
+        Returns:
+            Number of detections loaded
+        """
+        loaded = sorted(
+            ((to_epoch(d.timestamp), DetectionRecord.coerce(d)) for d in detections),
+            key=lambda item: item[0]
+        )
+        for ts, detection in loaded:
+            self._log.append(detection)
+            self._log_times.append(ts)
+        if loaded:
+            # Rebuild the time index in one pass instead of bisect-inserting
+            order = sorted(range(len(self._log)), key=self._log_times.__getitem__)
+            self._times = [self._log_times[i] for i in order]
+            self._time_seqs = [self._offset + i + 1 for i in order]
+            self._by_time = [self._log[i] for i in order]
+        return len(loaded)
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None
+    ) -> List[DetectionRecord]:
+        start = 0 if since is None else bisect_left(self._times, since)
+        stop = len(self._times) if until is None else bisect_left(self._times, until)
+        selected = self._by_time[start:stop]
+
+        if severity:
+            severity = severity.lower()
+            selected = [d for d in selected if d.severity.value == severity]
+
+        return selected
+
+    def page(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None,
+        after: Optional[Cursor] = None,
+        limit: int = 500
+    ) -> List[DetectionRow]:
+        start = 0 if since is None else bisect_left(self._times, since)
+        if after is not None:
+            after_ts, after_seq = after
+            position = bisect_left(self._times, after_ts)
+            # Equal timestamps are kept in arrival (sequence) order
+            while (
+                position < len(self._times)
+                and self._times[position] == after_ts
+                and self._time_seqs[position] <= after_seq
+            ):
+                position += 1
+            start = max(start, position)
+        stop = len(self._times) if until is None else bisect_left(self._times, until)
+        severity = severity.lower() if severity else None
+
+        rows: List[DetectionRow] = []
+        for index in range(start, stop):
+            detection = self._by_time[index]
+            if severity and detection.severity.value != severity:
+                continue
+            rows.append(DetectionRow(self._times[index], self._time_seqs[index], detection))
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def changes_since(self, seq: int) -> List[StoredDetection]:
+        start = max(seq - self._offset, 0)
+        return [
+            StoredDetection(self._offset + index + 1, self._origin, detection)
+            for index, detection in enumerate(self._log[start:], start=start)
+        ]
+
+    def changed_since(
+        self,
+        seq: int,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> bool:
+        for ts in self._log_times[max(seq - self._offset, 0):]:
+            if (since is None or ts >= since) and (until is None or ts < until):
+                return True
+        return False
+
+    def first_timestamp(self, since: Optional[float] = None) -> Optional[float]:
+        index = 0 if since is None else bisect_left(self._times, since)
+        return self._times[index] if index < len(self._times) else None
+
+    def prune(self, before: float) -> int:
+        count = bisect_left(self._times, before)
+        del self._times[:count], self._time_seqs[:count], self._by_time[:count]
+        # The log is in arrival order: drop its old prefix. A late reading
+        # behind a newer one stays in the log until everything before it goes.
+        stale = 0
+        while stale < len(self._log_times) and self._log_times[stale] < before:
+            stale += 1
+        del self._log[:stale], self._log_times[:stale]
+        self._offset += stale
+        return count
+
+    @property
+    def version(self) -> int:
+        return self._offset + len(self._log)
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+
+class SQLiteDetectionStore(DetectionStore):
+    """
+    History shared between worker processes through a SQLite database in WAL mode.
+
+    WAL lets every worker read while one writes, and ``synchronous=NORMAL``
+    keeps commits off the fsync path. Writes go through one connection
+    under a lock; every thread reads through its own connection, so a read
+    never waits behind an insert running in another thread.
+    """
+
+    shared = True
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS detections (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id TEXT NOT NULL,
+            ts REAL NOT NULL,
+            severity TEXT NOT NULL,
+            confidence REAL NOT NULL,
+            max_wind_shear REAL NOT NULL,
+            origin INTEGER NOT NULL,
+            payload TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_detections_ts ON detections (ts);
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open (or create) the shared state database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._origin = os.getpid()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        logger.info(f"SQLite detection store opened at {self.path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            str(self.path), timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+
+    def _reader(self) -> sqlite3.Connection:
+        """The calling thread's read connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    _INSERT = (
+        "INSERT INTO detections "
+        "(event_id, ts, severity, confidence, max_wind_shear, origin, payload) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    def add(self, detection: Union[DetectionRecord, MicroburstDetection]) -> int:
+        row = self._row(DetectionRecord.coerce(detection))
+        with self._lock:
+            return self._conn.execute(self._INSERT, row).lastrowid
+
+    def add_many(self, detections: Iterable[DetectionRecord]) -> int:
+        """
+        Store several detections in a single transaction.
+
+        Args:
+            detections: Detections to insert
+
+        Returns:
+            Number of rows written
+        """
+        rows = [self._row(DetectionRecord.coerce(d)) for d in detections]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(self._INSERT, rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def _row(self, detection: DetectionRecord) -> tuple:
+        """Column values for one detection."""
+        return (
+            detection.event_id,
+            to_epoch(detection.timestamp),
+            detection.severity.value,
+            detection.confidence,
+            detection.max_wind_shear,
+            self._origin,
+            detection.to_json(),
+        )
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None
+    ) -> List[DetectionRecord]:
+        clauses, params = self._window(since, until, severity)
+        sql = "SELECT payload FROM detections"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts, seq"
+
+        rows = self._reader().execute(sql, params).fetchall()
+        return [DetectionRecord.from_json(row[0]) for row in rows]
+
+    def page(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        severity: Optional[str] = None,
+        after: Optional[Cursor] = None,
+        limit: int = 500
+    ) -> List[DetectionRow]:
+        clauses, params = self._window(since, until, severity)
+        if after is not None:
+            clauses.append("(ts > ? OR (ts = ? AND seq > ?))")
+            params.extend([after[0], after[0], after[1]])
+        sql = "SELECT ts, seq, payload FROM detections"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts, seq LIMIT ?"
+
+        rows = self._reader().execute(sql, [*params, limit]).fetchall()
+        return [
+            DetectionRow(row[0], row[1], DetectionRecord.from_json(row[2]))
+            for row in rows
+        ]
+
+    def statistics(self, since: float, days: int) -> dict:
+        rows = self._reader().execute(
+            "SELECT severity, COUNT(*), SUM(confidence), SUM(max_wind_shear) "
+            "FROM detections WHERE ts >= ? GROUP BY severity",
+            (since,)
+        ).fetchall()
+
+        stats = summarize((), days)
+        total = 0
+        confidence_sum = 0.0
+        wind_shear_sum = 0.0
+        for severity, count, confidence, wind_shear in rows:
+            stats['severity_distribution'][severity] = count
+            total += count
+            confidence_sum += confidence
+            wind_shear_sum += wind_shear
+
+        stats['total_detections'] = total
+        stats['avg_confidence'] = confidence_sum / total if total else 0
+        stats['avg_wind_shear'] = wind_shear_sum / total if total else 0
+        return stats
+
+    def changes_since(self, seq: int) -> List[StoredDetection]:
+        rows = self._reader().execute(
+            "SELECT seq, origin, payload FROM detections WHERE seq > ? ORDER BY seq",
+            (seq,)
+        ).fetchall()
+        return [
+            StoredDetection(row[0], row[1], DetectionRecord.from_json(row[2]))
+            for row in rows
+        ]
+
+    def changed_since(
+        self,
+        seq: int,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> bool:
+        clauses, params = self._window(since, until, None)
+        sql = "SELECT 1 FROM detections WHERE " + " AND ".join(["seq > ?", *clauses]) + " LIMIT 1"
+        return self._reader().execute(sql, [seq, *params]).fetchone() is not None
+
+    def first_timestamp(self, since: Optional[float] = None) -> Optional[float]:
+        row = self._reader().execute(
+            "SELECT MIN(ts) FROM detections WHERE ts >= ?",
+            (since if since is not None else float("-inf"),)
+        ).fetchone()
+        return row[0]
+
+    def prune(self, before: float) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM detections WHERE ts < ?", (before,)).rowcount
+
+    @property
+    def version(self) -> int:
+        # AUTOINCREMENT's counter, which survives deleting the newest rows
+        row = self._reader().execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'detections'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def __len__(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM detections").fetchone()[0]
+
+    def close(self) -> None:
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _window(
+        since: Optional[float],
+        until: Optional[float],
+        severity: Optional[str]
+    ) -> tuple[list[str], list]:
+        """Build WHERE clauses for a time/severity window."""
+        clauses: list[str] = []
+        params: list = []
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        if severity:
+            clauses.append("severity = ?")
+            params.append(severity.lower())
+        return clauses, params
+
+
+def create_store(backend: str = "memory", path: Optional[Path] = None) -> DetectionStore:
+    """
+    Create the detection store for the configured backend.
+
+    Args:
+        backend: ``memory`` for a process-local store, ``sqlite`` for shared state
+        path: Database file for the ``sqlite`` backend
+
+    Returns:
+        Detection store instance
+    """
+    backend = backend.lower()
+    if backend == "memory":
+        return MemoryDetectionStore()
+    if backend == "sqlite":
+        if path is None:
+            raise ValueError("The sqlite state backend requires a database path")
+        return SQLiteDetectionStore(path)
+    raise ValueError(f"Unknown state backend: {backend}")
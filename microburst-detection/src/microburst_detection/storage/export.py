@@ -0,0 +1,291 @@
+# src/microburst_detection/storage/export.py
+"""Columnar Parquet export of detection history and raw sensor archives."""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from .archive import DTYPES, RawArchiveReader
+from .detection_store import DetectionRow, DetectionStore
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+UNKNOWN_SITE = "unknown"
+
+
+def _require_pyarrow():
+    """Import pyarrow, which is only installed with the ``export`` extra."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow: pip install 'amarr-stormomon[export]'"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _day(ts: float) -> str:
+    """UTC calendar day (``YYYY-MM-DD``) of an epoch timestamp."""
+    return _day_name(int(ts // SECONDS_PER_DAY))
+
+
+@lru_cache(maxsize=4096)
+def _day_name(day_number: int) -> str:
+    return np.datetime_as_string(np.datetime64(day_number, "D"))
+
+
+class PartitionedParquetWriter:
+    """
+    Writes row groups into Hive-style ``date=YYYY-MM-DD/site=XXXX`` directories.
+
+    Files do not repeat the partition columns; dataset readers such as
+    ``pyarrow.dataset`` and ``pandas.read_parquet`` restore them from the path.
+    Sites come from client readings, so they are percent-encoded into the
+    directory name (as Hive partitioning expects) and can never escape the
+    dataset directory.
+
+    One Parquet file stays open per partition and receives a row group per
+    ``write`` call. Inputs are scanned in time order, so ``close_before``
+    closes every day that has been passed. This keeps the number of open
+    files and buffered row groups bounded.
+    """
+
+    def __init__(self, root: Path, schema, compression: str = "zstd") -> None:
+        """
+        Initialize writer.
+
+        Args:
+            root: Dataset directory
+            schema: ``pyarrow.Schema`` of every file
+            compression: Parquet compression codec
+        """
+        _, self._pq = _require_pyarrow()
+        self.root = Path(root)
+        self.schema = schema
+        self.compression = compression
+        self._open: Dict[Tuple[str, str], object] = {}
+        self.files: List[Path] = []
+        self.rows = 0
+
+    def write(self, day: str, site: str, table) -> None:
+        """Append ``table`` as a row group to the ``(day, site)`` partition."""
+        key = (day, site)
+        writer = self._open.get(key)
+        if writer is None:
+            directory = self.root / f"date={day}" / f"site={quote(site, safe='')}"
+            directory.mkdir(parents=True, exist_ok=True)
+            part = 0
+            while (directory / f"part-{part:04d}.parquet").exists():
+                part += 1
+            path = directory / f"part-{part:04d}.parquet"
+            writer = self._open[key] = self._pq.ParquetWriter(
+                path, self.schema, compression=self.compression
+            )
+            self.files.append(path)
+        writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close_before(self, day: str) -> None:
+        """Close partitions for days earlier than ``day``."""
+        for key in [key for key in self._open if key[0] < day]:
+            self._open.pop(key).close()
+
+    def close(self) -> None:
+        """Close every open partition."""
+        for writer in self._open.values():
+            writer.close()
+        self._open.clear()
+
+
+def detection_schema():
+    """Arrow schema for exported detections."""
+    pa, _ = _require_pyarrow()
+    return pa.schema([
+        ("event_id", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("latitude", pa.float64()),
+        ("longitude", pa.float64()),
+        ("altitude", pa.float64()),
+        ("severity", pa.string()),
+        ("detection_method", pa.string()),
+        ("max_wind_shear", pa.float64()),
+        ("vertical_velocity", pa.float64()),
+        ("confidence", pa.float64()),
+        ("radius", pa.float64()),
+        ("duration_seconds", pa.int32()),
+        ("alert_level", pa.string()),
+        ("additional_data", pa.string()),
+    ])
+
+
+def _timestamps(epochs: np.ndarray, schema):
+    """Epoch seconds to the schema's microsecond UTC timestamp column."""
+    pa, _ = _require_pyarrow()
+    return pa.array(np.round(epochs * 1e6).astype(np.int64), schema.field("timestamp").type)
+
+
+def _detection_table(rows: Sequence[DetectionRow], schema):
+    pa, _ = _require_pyarrow()
+    detections = [row.detection for row in rows]
+    return pa.table({
+        "event_id": [d.event_id for d in detections],
+        "timestamp": _timestamps(np.array([row.ts for row in rows]), schema),
+        "latitude": [d.latitude for d in detections],
+        "longitude": [d.longitude for d in detections],
+        "altitude": [d.altitude for d in detections],
+        "severity": [d.severity.value for d in detections],
+        "detection_method": [d.detection_method.value for d in detections],
+        "max_wind_shear": [d.max_wind_shear for d in detections],
+        "vertical_velocity": [d.vertical_velocity for d in detections],
+        "confidence": [d.confidence for d in detections],
+        "radius": [d.radius for d in detections],
+        "duration_seconds": [d.duration_seconds for d in detections],
+        "alert_level": [d.alert_level for d in detections],
+        "additional_data": [
+            json.dumps(d.additional_data) if d.additional_data is not None else None
+            for d in detections
+        ],
+    }, schema=schema)
+
+
+def export_detections(
+    store: DetectionStore,
+    root: Path,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    chunk_size: int = 50000,
+    compression: str = "zstd"
+) -> dict:
+    """
+    Export detection history to a dataset partitioned by day and site.
+
+    The store is read with keyset pages of ``chunk_size`` rows, so memory
+    use is bounded by one chunk regardless of the history length.
+
+    Args:
+        store: Detection store to read
+        root: Output dataset directory
+        since: Inclusive start (epoch seconds)
+        until: Exclusive end (epoch seconds)
+        chunk_size: Rows per read page and per written row group (at most)
+        compression: Parquet compression codec
+
+    Returns:
+        Summary with ``rows`` and ``files``
+    """
+    schema = detection_schema()
+    writer = PartitionedParquetWriter(root, schema, compression)
+    try:
+        after = None
+        while True:
+            rows = store.page(since=since, until=until, after=after, limit=chunk_size)
+            if not rows:
+                break
+            groups: Dict[Tuple[str, str], List[DetectionRow]] = {}
+            for row in rows:
+                key = (_day(row.ts), row.detection.site or UNKNOWN_SITE)
+                groups.setdefault(key, []).append(row)
+            writer.close_before(_day(rows[0].ts))
+            for (day, site), group in groups.items():
+                writer.write(day, site, _detection_table(group, schema))
+            if len(rows) < chunk_size:
+                break
+            after = rows[-1].cursor
+    finally:
+        writer.close()
+    logger.info(f"Exported {writer.rows} detections to {root}")
+    return {"rows": writer.rows, "files": writer.files}
+
+
+def _reading_columns(sensor_type_or_dtype) -> Tuple[str, ...]:
+    """Archive fields exported as columns (timestamp and site are handled separately)."""
+    dtype = sensor_type_or_dtype
+    if isinstance(dtype, str):
+        dtype = DTYPES[dtype]
+    return tuple(name for name in dtype.names if name not in ("ts", "site"))
+
+
+def reading_schema(sensor_type: str):
+    """Arrow schema for exported raw readings of one sensor type."""
+    pa, _ = _require_pyarrow()
+    fields = [("timestamp", pa.timestamp("us", tz="UTC"))]
+    for name in _reading_columns(sensor_type):
+        kind = DTYPES[sensor_type][name]
+        if kind.kind == "S":
+            fields.append((name, pa.string()))
+        elif kind.itemsize == 8:
+            fields.append((name, pa.float64()))
+        else:
+            fields.append((name, pa.float32()))
+    return pa.schema(fields)
+
+
+def _reading_table(records: np.ndarray, schema):
+    pa, _ = _require_pyarrow()
+    columns = {"timestamp": _timestamps(records["ts"], schema)}
+    for name in _reading_columns(records.dtype):
+        values = records[name]
+        if values.dtype.kind == "S":
+            decoded = np.char.decode(values, "utf-8")
+            columns[name] = pa.array(np.where(decoded == "", None, decoded), pa.string())
+        else:
+            columns[name] = pa.array(np.ascontiguousarray(values))
+    return pa.table(columns, schema=schema)
+
+
+def export_readings(
+    reader: RawArchiveReader,
+    sensor_type: str,
+    root: Path,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    chunk_size: int = 250000,
+    compression: str = "zstd"
+) -> dict:
+    """
+    Export one sensor type's raw archive to a dataset partitioned by day and site.
+
+    Segments are memory-mapped and converted ``chunk_size`` records at a
+    time, so only one chunk is materialized at once.
+
+    Args:
+        reader: Raw archive reader
+        sensor_type: ``lidar``, ``radar`` or ``anemometer``
+        root: Output dataset directory
+        since: Inclusive start (epoch seconds)
+        until: Exclusive end (epoch seconds)
+        chunk_size: Records converted per step
+        compression: Parquet compression codec
+
+    Returns:
+        Summary with ``rows`` and ``files``
+    """
+    schema = reading_schema(sensor_type)
+    writer = PartitionedParquetWriter(root, schema, compression)
+    try:
+        for segment in reader.scan(sensor_type, since, until):
+            for start in range(0, len(segment), chunk_size):
+                chunk = np.asarray(segment[start:start + chunk_size])
+                days = (chunk["ts"] // SECONDS_PER_DAY).astype(np.int64)
+                sites = chunk["site"]
+                order = np.lexsort((sites, days))
+                chunk, days, sites = chunk[order], days[order], sites[order]
+                writer.close_before(_day(days[0] * SECONDS_PER_DAY))
+                # Boundaries where (day, site) changes in the sorted chunk
+                change = np.flatnonzero((days[1:] != days[:-1]) | (sites[1:] != sites[:-1])) + 1
+                bounds = [0, *change.tolist(), len(chunk)]
+                for lo, hi in zip(bounds[:-1], bounds[1:]):
+                    site = sites[lo].decode() or UNKNOWN_SITE
+                    table = _reading_table(chunk[lo:hi], schema)
+                    writer.write(_day(days[lo] * SECONDS_PER_DAY), site, table)
+    finally:
+        writer.close()
+    logger.info(f"Exported {writer.rows} {sensor_type} readings to {root}")
+    return {"rows": writer.rows, "files": writer.files}
@@ -0,0 +1,152 @@
+# src/microburst_detection/storage/persistence.py
+"""Durable detection history: batched background writes to the configured database."""
+
+import asyncio
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional
+
+from ..core.records import DetectionRecord
+from .detection_store import MemoryDetectionStore, SQLiteDetectionStore
+
+logger = logging.getLogger(__name__)
+
+
+def sqlite_path_from_url(url: str) -> Path:
+    """
+    Resolve a ``sqlite:///`` database URL to a file path.
+
+    ``sqlite:///./microburst.db`` is relative to the working directory and
+    ``sqlite:////var/lib/microburst.db`` is absolute.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Database file path
+
+    Raises:
+        ValueError: For non-SQLite or in-memory URLs
+    """
+    prefix = "sqlite:///"
+    if not url.startswith(prefix):
+        raise ValueError(f"Unsupported database_url (only sqlite:/// is supported): {url}")
+    path = url[len(prefix):]
+    if not path or path == ":memory:":
+        raise ValueError("database_url must point to a file for persistence")
+    return Path(path)
+
+
+class DetectionWriter:
+    """
+    Write-behind persistence for an in-memory detection store.
+
+    ``submit`` only appends to a deque, so the detection path never waits on
+    disk. A background task drains the deque every ``flush_interval`` seconds
+    and writes up to ``batch_size`` detections per transaction from a worker
+    thread, into a WAL-mode SQLite database indexed by timestamp.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_pending: int = 100000
+    ) -> None:
+        """
+        Initialize writer; the database is opened by ``open``.
+
+        Args:
+            path: SQLite database file
+            batch_size: Maximum detections per transaction
+            flush_interval: Seconds between background flushes
+            max_pending: Queued detections kept before the oldest are dropped
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: Deque[DetectionRecord] = deque(maxlen=max_pending)
+        self._database: Optional[SQLiteDetectionStore] = None
+        self.written = 0
+        self.dropped = 0
+
+    def open(self) -> None:
+        """Open (or create) the database."""
+        if self._database is None:
+            self._database = SQLiteDetectionStore(self.path)
+
+    def submit(self, detection: DetectionRecord) -> None:
+        """Queue a detection for persistence without blocking."""
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(detection)
+
+    @property
+    def pending(self) -> int:
+        """Detections queued but not yet written."""
+        return len(self._pending)
+
+    def load_recent(self, store: MemoryDetectionStore, since: Optional[float]) -> int:
+        """
+        Load persisted detections newer than ``since`` into a memory store.
+
+        Args:
+            store: Store to populate (``on_add`` is not triggered)
+            since: Epoch seconds, or None for the whole history
+
+        Returns:
+            Number of detections loaded
+        """
+        self.open()
+        return store.load(self._database.query(since=since))
+
+    async def run(self) -> None:
+        """Flush pending detections until cancelled, then write what is left."""
+        self.open()
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        finally:
+            # Runs on cancellation at shutdown; the thread is shielded from it
+            self._write_pending()
+
+    async def flush(self) -> int:
+        """
+        Write every pending detection, one transaction per batch.
+
+        Returns:
+            Number of detections written
+        """
+        written = 0
+        while self._pending:
+            batch = self._take_batch()
+            try:
+                written += await asyncio.to_thread(self._database.add_many, batch)
+            except Exception as e:
+                # Keep the batch for the next attempt
+                self._pending.extendleft(reversed(batch))
+                logger.error(f"Detection persistence failed ({len(batch)} pending): {e}")
+                break
+        self.written += written
+        return written
+
+    def close(self) -> None:
+        """Write anything still pending and close the database."""
+        if self._database is not None:
+            self._write_pending()
+            self._database.close()
+            self._database = None
+
+    def _take_batch(self) -> List[DetectionRecord]:
+        count = min(self.batch_size, len(self._pending))
+        return [self._pending.popleft() for _ in range(count)]
+
+    def _write_pending(self) -> None:
+        """Synchronous drain used at shutdown."""
+        if self._database is None:
+            return
+        while self._pending:
+            self.written += self._database.add_many(self._take_batch())
@@ -0,0 +1,263 @@
+# src/microburst_detection/storage/series.py
+"""Time-bucketed detection series kept incrementally at several resolutions."""
+
+import logging
+from math import floor
+from time import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.records import DetectionRecord
+from ..utils.timeutils import to_epoch
+from .detection_store import DetectionStore, StoredDetection
+
+logger = logging.getLogger(__name__)
+
+SEVERITIES = ("low", "moderate", "severe", "extreme")
+
+#: (bucket seconds, retention seconds) from finest to coarsest
+DEFAULT_RESOLUTIONS: Tuple[Tuple[int, int], ...] = (
+    (60, 2 * 86400),
+    (300, 14 * 86400),
+    (3600, 90 * 86400),
+    (86400, 5 * 365 * 86400),
+)
+
+# Bucket layout: count, one count per severity, shear sum, shear max, confidence sum
+_COUNT, _SHEAR_SUM, _SHEAR_MAX, _CONFIDENCE_SUM = 0, 5, 6, 7
+_SEVERITY_INDEX = {severity: 1 + i for i, severity in enumerate(SEVERITIES)}
+
+
+class SeriesIndex:
+    """
+    Per-resolution detection aggregates that follow a detection store.
+
+    ``catch_up`` folds in only detections stored since the last call (by
+    store sequence number), so keeping the series current costs O(new
+    detections x resolutions) no matter how much history is covered, and
+    detections from other workers sharing the store are included too.
+    Buckets older than their resolution's retention are dropped.
+    """
+
+    def __init__(
+        self,
+        store: DetectionStore,
+        resolutions: Sequence[Tuple[int, int]] = DEFAULT_RESOLUTIONS
+    ) -> None:
+        """
+        Initialize index.
+
+        Args:
+            store: Detection store to follow
+            resolutions: (bucket seconds, retention seconds) pairs
+        """
+        self.store = store
+        self.resolutions = tuple(sorted(resolutions))
+        self._buckets: Dict[int, Dict[int, List[float]]] = {
+            size: {} for size, _ in self.resolutions
+        }
+        self.seq = 0
+
+    def catch_up(self, now: Optional[float] = None) -> int:
+        """
+        Fold in detections stored since the last call.
+
+        Args:
+            now: Current time for retention (epoch seconds)
+
+        Returns:
+            Number of detections added
+        """
+        version = self.store.version
+        if version < self.seq:
+            self._reset()
+        changes = self.store.changes_since(self.seq) if version > self.seq else []
+        return self.apply(version, changes, now)
+
+    def apply(
+        self,
+        version: int,
+        changes: Sequence[StoredDetection],
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Fold in changes read from the store elsewhere (e.g. off the event loop).
+
+        Args:
+            version: Store version read together with ``changes``
+            changes: ``store.changes_since(seq)`` for some ``seq``; changes
+                already folded in are skipped
+            now: Current time for retention (epoch seconds)
+
+        Returns:
+            Number of detections added
+        """
+        if version < self.seq:
+            self._reset()
+            return 0
+        fresh = [change for change in changes if change.seq > self.seq]
+        for change in fresh:
+            self.add(change.detection)
+        if fresh:
+            self.seq = fresh[-1].seq
+            self.prune(now)
+        return len(fresh)
+
+    def _reset(self) -> None:
+        """Forget every bucket after the history was reset underneath us."""
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self.seq = 0
+
+    def add(self, detection: DetectionRecord) -> None:
+        """Add one detection to every resolution."""
+        ts = to_epoch(detection.timestamp)
+        severity = _SEVERITY_INDEX.get(detection.severity.value)
+        shear = detection.max_wind_shear
+        for size, buckets in self._buckets.items():
+            start = int(ts // size) * size
+            bucket = buckets.get(start)
+            if bucket is None:
+                bucket = buckets[start] = [0, 0, 0, 0, 0, 0.0, shear, 0.0]
+            bucket[_COUNT] += 1
+            if severity is not None:
+                bucket[severity] += 1
+            bucket[_SHEAR_SUM] += shear
+            bucket[_SHEAR_MAX] = max(bucket[_SHEAR_MAX], shear)
+            bucket[_CONFIDENCE_SUM] += detection.confidence
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Drop buckets past their resolution's retention."""
+        if now is None:
+            now = time()
+        for size, retention in self.resolutions:
+            buckets = self._buckets[size]
+            cutoff = now - retention
+            stale = [start for start in buckets if start + size <= cutoff]
+            for start in stale:
+                del buckets[start]
+
+    def resolution_for(self, since: float, until: float, max_points: int) -> int:
+        """
+        Finest resolution that covers ``[since, until)`` in at most ``max_points`` buckets.
+
+        Resolutions whose retention does not reach back to ``since`` are
+        skipped; the coarsest resolution is the fallback.
+        """
+        for size, retention in self.resolutions:
+            if _bucket_count(since, until, size) <= max_points and until - retention <= since:
+                return size
+        return self.resolutions[-1][0]
+
+    def series(
+        self,
+        since: float,
+        until: float,
+        resolution: int,
+        max_points: Optional[int] = None
+    ) -> dict:
+        """
+        Contiguous buckets covering ``[since, until)``, empty ones included.
+
+        Args:
+            since: Window start (epoch seconds)
+            until: Window end (epoch seconds)
+            resolution: Bucket size; must be one of the configured resolutions
+            max_points: When given, the resolution must also cover the window
+                in at most this many buckets and be retained back to ``since``
+
+        Returns:
+            Columnar series: ``resolution``, bucket ``starts`` (epoch seconds),
+            ``count``, per-severity counts under ``severity``,
+            ``max_wind_shear``, ``mean_wind_shear`` and ``mean_confidence``
+            (None for empty buckets)
+
+        Raises:
+            ValueError: For an unknown resolution, or one that breaks ``max_points``
+                or its retention
+        """
+        retention = dict(self.resolutions).get(resolution)
+        if retention is None:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        if max_points is not None:
+            if _bucket_count(since, until, resolution) > max_points:
+                raise ValueError(
+                    f"Resolution {resolution} s needs more than {max_points} buckets for this range"
+                )
+            if until - retention > since:
+                raise ValueError(
+                    f"Resolution {resolution} s is only kept for {retention // 3600} h"
+                )
+        buckets = self._buckets[resolution]
+        first = int(floor(since / resolution)) * resolution
+        starts = list(range(first, int(until), resolution))
+        empty = [0, 0, 0, 0, 0, 0.0, None, 0.0]
+        rows = [buckets.get(start, empty) for start in starts]
+        return {
+            "resolution": resolution,
+            "starts": starts,
+            "count": [row[_COUNT] for row in rows],
+            "severity": {
+                severity: [row[index] for row in rows]
+                for severity, index in _SEVERITY_INDEX.items()
+            },
+            "max_wind_shear": [row[_SHEAR_MAX] for row in rows],
+            "mean_wind_shear": [_mean(row, _SHEAR_SUM) for row in rows],
+            "mean_confidence": [_mean(row, _CONFIDENCE_SUM) for row in rows],
+        }
+
+
+def _bucket_count(since: float, until: float, size: int) -> int:
+    """Number of ``size`` buckets ``series`` returns for ``[since, until)``."""
+    first = int(floor(since / size)) * size
+    return max(0, -(-(int(until) - first) // size))
+
+
+def _mean(row: List[float], total: int) -> Optional[float]:
+    """Bucket mean of the sum at index ``total``, or None for an empty bucket."""
+    return row[total] / row[_COUNT] if row[_COUNT] else None
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``threshold - 2``
+    equal buckets in between, the point forming the largest triangle with
+    the previously kept point and the next bucket's mean. Peaks and troughs
+    survive, unlike with bucket averaging.
+
+    Args:
+        x: Sorted x values (e.g. epoch seconds)
+        y: Values
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the kept points, ascending
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+        # Twice the triangle area for every candidate in the bucket at once
+        areas = np.abs(
+            (x[previous] - mean_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (mean_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[i + 1] = previous
+    return kept
@@ -45,9 +45,130 @@ class Settings(BaseSettings):
     sentry_dsn: str = Field(default="")
     prometheus_port: int = Field(default=9090)
     
+    # Metrics
+    loop_lag_interval: float = Field(
+        default=0.5, gt=0, description="Seconds between event-loop lag samples"
+    )
+    metrics_dir: str = Field(
+        default="",
+        description="Directory where workers share metrics snapshots (set for several workers)"
+    )
+    metrics_publish_interval: float = Field(
+        default=5.0, gt=0, description="Seconds between a worker's metrics snapshots"
+    )
+    websocket_queue_size: int = Field(
+        default=1000, ge=1, description="Pending messages kept per WebSocket client"
+    )
+    websocket_replay_limit: int = Field(
+        default=500, ge=0, description="Missed detections replayed to a resuming WebSocket client"
+    )
+    
+    # End-to-end latency budget (sensor timestamp to alert delivered)
+    latency_budget_seconds: float = Field(default=2.0, gt=0)
+    latency_window_seconds: float = Field(
+        default=300.0, gt=0, description="Rolling window used for budget checks"
+    )
+    latency_alarm_enabled: bool = Field(default=False)
+    latency_alarm_interval: float = Field(default=10.0, gt=0)
+    latency_max_sites: int = Field(
+        default=64,
+        ge=1,
+        description="Sites with their own latency summaries; the rest share 'other'",
+    )
+    
     # Performance
+    response_cache_size: int = Field(
+        default=256, ge=1, description="Cached /detections and /stats responses"
+    )
+    dashboard_sync_ttl: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds a /dashboard/sync payload is shared between dashboards",
+    )
+    dashboard_sync_max_delta: int = Field(
+        default=1000,
+        ge=1,
+        description="Detections behind at which /dashboard/sync sends a full snapshot",
+    )
     workers: int = Field(default=1, ge=1, le=32)
-    max_connections: int = Field(default=100, ge=1)
+    max_connections: int = Field(default=100, ge=1, description="Maximum WebSocket clients")
+    
+    # Admission control
+    sensor_rate_limit: float = Field(
+        default=10.0, gt=0, description="Sustained readings per second per sensor"
+    )
+    sensor_burst: int = Field(default=20, ge=1, description="Burst allowance per sensor")
+    ingest_concurrency: int = Field(
+        default=256, ge=1, description="Concurrent ingest requests per worker"
+    )
+    ingest_priority_reserve: int = Field(
+        default=32, ge=0, description="Extra concurrent slots for near-hazard readings"
+    )
+    shed_fraction: float = Field(
+        default=0.8,
+        gt=0,
+        le=1,
+        description="Fraction of ingest_concurrency at which routine readings are shed",
+    )
+    shed_loop_lag: float = Field(
+        default=0.25, gt=0, description="Event-loop lag (s) at which routine readings are shed"
+    )
+    
+    # Startup warm-up (runs before /ready reports ready)
+    warmup_enabled: bool = Field(default=True)
+    warmup_iterations: int = Field(default=3, ge=1, description="Synthetic passes per sensor type")
+    
+    # Shared detection state (required when running more than one worker)
+    state_backend: str = Field(
+        default="memory",
+        description="Detection history backend: 'memory' (per process) or 'sqlite' (shared)"
+    )
+    state_path: str = Field(
+        default="./microburst_state.db",
+        description="SQLite file holding detection state shared by all workers"
+    )
+    broadcast_poll_interval: float = Field(
+        default=0.25, gt=0, description="Seconds between checks for other workers' detections"
+    )
+    history_retention_hours: int = Field(
+        default=168, ge=1, description="Detections kept in the state backend; older ones are pruned"
+    )
+    stateful_detection: bool = Field(
+        default=True,
+        description=(
+            "Keep station histories, station networks and storm cell tracks between "
+            "readings; they are per process, so more than one worker needs this off"
+        )
+    )
+    
+    # Detection persistence (memory backend only; written to database_url)
+    persist_detections: bool = Field(default=True)
+    persist_batch_size: int = Field(
+        default=500, ge=1, description="Detections per write transaction"
+    )
+    persist_flush_interval: float = Field(
+        default=0.5, gt=0, description="Seconds between batched writes"
+    )
+    persist_max_pending: int = Field(default=100000, ge=1, description="Write queue bound")
+    persist_load_hours: int = Field(
+        default=168, ge=0, description="History loaded from the database at startup (hours)"
+    )
+    
+    # Raw sensor archive (every admitted reading, for reprocessing incidents)
+    raw_archive_enabled: bool = Field(default=False, description="Opt in to archiving readings")
+    raw_archive_path: str = Field(default="./raw_archive", description="Segment directory")
+    raw_archive_segment_mb: int = Field(
+        default=64, ge=1, description="Rotate segments at this size"
+    )
+    raw_archive_segment_seconds: int = Field(
+        default=3600, ge=1, description="Rotate segments at this age"
+    )
+    raw_archive_flush_interval: float = Field(
+        default=1.0, gt=0, description="Seconds between flushes of buffered records to disk"
+    )
+    raw_archive_retention_hours: float = Field(
+        default=168.0, ge=0, description="Sealed segments older than this are deleted (0 keeps all)"
+    )
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
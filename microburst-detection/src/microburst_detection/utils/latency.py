@@ -0,0 +1,213 @@
+# src/microburst_detection/utils/latency.py
+"""End-to-end detection latency tracking with streaming percentile summaries."""
+
+import math
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# Latency stages measured from the sensor's own timestamp
+STAGES: Tuple[str, ...] = ("ingest", "detection", "fusion", "delivery")
+
+
+class QuantileSketch:
+    """
+    Log-bucketed histogram giving percentiles within ~1% relative error.
+
+    Values are mapped to buckets growing by ``GROWTH``, so memory depends on
+    the dynamic range of the data rather than the number of samples and an
+    insert is a single ``log`` plus a dict increment.
+    """
+
+    GROWTH: float = 1.02
+    MIN_VALUE: float = 1e-4  # 0.1 ms; smaller (or negative, clock skew) values share bucket 0
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    _LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one sample in seconds."""
+        if value > self.MIN_VALUE:
+            index = int(math.log(value / self.MIN_VALUE) / self._LOG_GROWTH) + 1
+        else:
+            index = 0
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Return a new sketch holding the samples of both."""
+        merged = QuantileSketch()
+        merged.counts = dict(self.counts)
+        for index, count in other.counts.items():
+            merged.counts[index] = merged.counts.get(index, 0) + count
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.max = max(self.max, other.max)
+        return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value in seconds, or None when empty
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen > rank:
+                if index == 0:
+                    return min(self.MIN_VALUE, self.max)
+                # Geometric midpoint of the bucket, capped by the observed max
+                upper = self.MIN_VALUE * self.GROWTH ** index
+                return min(upper / math.sqrt(self.GROWTH), self.max)
+        return self.max
+
+
+class _StageSummary:
+    """Lifetime and rolling-window sketches for one (sensor, site, stage)."""
+
+    __slots__ = ("lifetime", "current", "previous")
+
+    def __init__(self) -> None:
+        self.lifetime = QuantileSketch()
+        self.current = QuantileSketch()
+        self.previous = QuantileSketch()
+
+
+class LatencyTracker:
+    """
+    Tracks latency from sensor timestamp to each pipeline stage.
+
+    Summaries are kept per sensor type and site, both for the process
+    lifetime and for a rolling window (the current and previous window
+    interval) used for budget alarms. Sites come from client readings, so
+    only the first ``max_sites`` distinct sites get their own summaries;
+    later ones are pooled under ``OTHER_SITE``.
+    """
+
+    OTHER_SITE: str = "other"
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_sites: int = 64
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            window_seconds: Length of one rolling window interval
+            clock: Monotonic clock used for window rotation
+            max_sites: Distinct sites tracked separately
+        """
+        self.window_seconds = window_seconds
+        self.max_sites = max_sites
+        self._clock = clock
+        self._window_start = clock()
+        self._summaries: Dict[Tuple[str, str, str], _StageSummary] = {}
+        self._sites: Set[str] = set()
+
+    def record(self, sensor_type: str, site: Optional[str], stage: str, latency: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            sensor_type: Sensor that produced the reading
+            site: Site identifier (``None`` is reported as ``unknown``)
+            stage: One of ``STAGES``
+            latency: Seconds since the sensor timestamp
+        """
+        self._rotate()
+        site = site or "unknown"
+        if site not in self._sites:
+            if len(self._sites) < self.max_sites:
+                self._sites.add(site)
+            else:
+                site = self.OTHER_SITE
+        key = (sensor_type, site, stage)
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = self._summaries[key] = _StageSummary()
+        summary.lifetime.add(latency)
+        summary.current.add(latency)
+
+    def summaries(self) -> List[dict]:
+        """Percentile summaries for every tracked (sensor, site, stage)."""
+        self._rotate()
+        rows = []
+        for (sensor_type, site, stage), summary in sorted(
+            self._summaries.items(),
+            key=lambda item: (item[0][0], item[0][1], STAGES.index(item[0][2])),
+        ):
+            lifetime = summary.lifetime
+            window = summary.current.merge(summary.previous)
+            rows.append({
+                "sensor_type": sensor_type,
+                "site": site,
+                "stage": stage,
+                "count": lifetime.count,
+                "mean": lifetime.total / lifetime.count if lifetime.count else None,
+                "p50": lifetime.quantile(0.50),
+                "p90": lifetime.quantile(0.90),
+                "p99": lifetime.quantile(0.99),
+                "max": lifetime.max,
+                "window_count": window.count,
+                "window_p99": window.quantile(0.99),
+            })
+        return rows
+
+    def breaches(self, budget_seconds: float) -> List[dict]:
+        """
+        Find sensor/site pairs whose rolling p99 exceeds the budget.
+
+        The last stage with samples is checked, so delivery latency is used
+        whenever WebSocket clients are connected and fusion otherwise.
+
+        Args:
+            budget_seconds: End-to-end latency budget
+
+        Returns:
+            Summary rows that are over budget
+        """
+        latest: Dict[Tuple[str, str], dict] = {}
+        for row in self.summaries():
+            if row["window_count"]:
+                latest[(row["sensor_type"], row["site"])] = row
+        return [
+            row for row in latest.values()
+            if row["window_p99"] is not None and row["window_p99"] > budget_seconds
+        ]
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._summaries.clear()
+        self._sites.clear()
+        self._window_start = self._clock()
+
+    def _rotate(self) -> None:
+        """Advance the rolling window if its interval has elapsed."""
+        elapsed = self._clock() - self._window_start
+        if elapsed < self.window_seconds:
+            return
+        stale = elapsed >= 2 * self.window_seconds
+        for summary in self._summaries.values():
+            summary.previous = QuantileSketch() if stale else summary.current
+            summary.current = QuantileSketch()
+        self._window_start = self._clock()
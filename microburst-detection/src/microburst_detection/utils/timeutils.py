@@ -0,0 +1,35 @@
+# src/microburst_detection/utils/timeutils.py
+"""Timestamp helpers shared by storage and API layers."""
+
+from datetime import datetime, timezone
+
+
+def to_epoch(value: datetime) -> float:
+    """
+    Convert a datetime to POSIX seconds.
+
+    Naive datetimes are interpreted as UTC, matching the ``datetime.utcnow()``
+    convention used throughout the detector.
+
+    Args:
+        value: Timestamp to convert
+
+    Returns:
+        Seconds since the Unix epoch
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def from_epoch(seconds: float) -> datetime:
+    """
+    Convert POSIX seconds to a naive UTC datetime.
+
+    Args:
+        seconds: Seconds since the Unix epoch
+
+    Returns:
+        Naive datetime in UTC
+    """
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
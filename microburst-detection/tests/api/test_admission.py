@@ -0,0 +1,99 @@
+"""Tests for ingest admission control."""
+
+from datetime import datetime
+from microburst_detection.api.admission import AdmissionController, Decision, TokenBucket
+from microburst_detection.core.models import AnemometerData
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def reading(wind_speed: float, sensor_id: str = "anem-1") -> AnemometerData:
+    """Anemometer reading with the given wind speed."""
+    return AnemometerData(
+        timestamp=datetime.utcnow(),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=10.0,
+        wind_speed=wind_speed,
+        wind_direction=245.0,
+        temperature=18.3,
+        pressure=1012.0,
+        sensor_id=sensor_id
+    )
+
+
+def test_token_bucket_refills():
+    """Test tokens are consumed and refilled at the configured rate."""
+    bucket = TokenBucket(rate=2.0, capacity=2, now=0.0)
+    assert bucket.try_acquire(0.0) and bucket.try_acquire(0.0)
+    assert not bucket.try_acquire(0.0)
+    assert bucket.retry_after() == 0.5
+    assert bucket.try_acquire(0.5)
+
+
+def test_routine_readings_rate_limited_per_sensor():
+    """Test each sensor has its own bucket."""
+    clock = FakeClock()
+    controller = AdmissionController(rate=1.0, burst=2, clock=clock)
+
+    decisions = [controller.admit("anemometer", reading(5.0)) for _ in range(3)]
+    assert decisions == [Decision.ADMIT, Decision.ADMIT, Decision.RATE_LIMITED]
+    assert controller.admit("anemometer", reading(5.0, "anem-2")) is Decision.ADMIT
+    assert controller.retry_after("anemometer", reading(5.0)) == 1
+
+    clock.now = 1.0
+    assert controller.admit("anemometer", reading(5.0)) is Decision.ADMIT
+
+
+def test_hazard_readings_only_skip_shedding():
+    """Test near-threshold readings survive overload but still pay their sensor's rate limit."""
+    lag = [0.0]
+    controller = AdmissionController(rate=1.0, burst=2, max_loop_lag=0.1, loop_lag=lambda: lag[0])
+
+    lag[0] = 0.5
+    assert controller.admit("anemometer", reading(5.0, "anem-3")) is Decision.SHED
+    assert controller.admit("anemometer", reading(25.0)) is Decision.ADMIT
+    assert controller.admit("anemometer", reading(25.0)) is Decision.ADMIT
+    assert controller.admit("anemometer", reading(25.0)) is Decision.RATE_LIMITED
+    counters = controller.snapshot()["counters"]["anemometer"]
+    assert counters["priority"] == 2 and counters["rate_limited"] == 1
+
+
+
+def test_hazard_readings_use_reserved_slots_past_the_limit():
+    """Test a near-hazard reading past max_in_flight is admitted, then refused as saturated."""
+    controller = AdmissionController(max_in_flight=1, priority_reserve=1)
+    with controller.slot(), controller.slot():
+        assert controller.in_flight > controller.max_in_flight
+        assert controller.admit("anemometer", reading(5.0, "anem-4")) is Decision.SHED
+        assert controller.admit("anemometer", reading(25.0)) is Decision.ADMIT
+        with controller.slot():
+            assert controller.admit("anemometer", reading(25.0)) is Decision.SATURATED
+    counters = controller.snapshot()["counters"]["anemometer"]
+    assert counters["saturated"] == 1 and counters["shed"] == 1 and counters["priority"] == 1
+
+
+def test_low_pressure_alone_is_routine():
+    """Test an ordinary low-pressure reading in light wind is not given priority."""
+    controller = AdmissionController()
+    calm = reading(5.0).model_copy(update={"pressure": 1004.0})
+    controller.admit("anemometer", calm)
+    assert controller.snapshot()["counters"]["anemometer"]["priority"] == 0
+
+
+def test_in_flight_slots_trigger_shedding():
+    """Test concurrency above the shed threshold sheds routine readings."""
+    controller = AdmissionController(max_in_flight=2, shed_fraction=0.5)
+    with controller.slot(), controller.slot():
+        assert controller.overloaded()
+        assert controller.admit("anemometer", reading(5.0)) is Decision.SHED
+    assert controller.in_flight == 0
+    assert not controller.overloaded()
@@ -0,0 +1,78 @@
+"""Tests for the version-aware response cache."""
+
+from datetime import datetime, timedelta
+from microburst_detection.api.cache import ResponseCache, SnapshotCache, etag_matches
+from microburst_detection.core.models import (
+    MicroburstDetection,
+    SeverityLevel,
+    DetectionMethod
+)
+from microburst_detection.storage.detection_store import MemoryDetectionStore
+from microburst_detection.utils.timeutils import to_epoch
+
+
+def make_detection(hours_ago: float) -> MicroburstDetection:
+    """Build a detection with a timestamp relative to now."""
+    return MicroburstDetection(
+        event_id=f"evt_{hours_ago}",
+        timestamp=datetime.utcnow() - timedelta(hours=hours_ago),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=10.0,
+        severity=SeverityLevel.SEVERE,
+        detection_method=DetectionMethod.ANEMOMETER,
+        max_wind_shear=8.0,
+        vertical_velocity=-15.0,
+        confidence=0.85,
+        radius=2000.0,
+        duration_seconds=300,
+        alert_level="WINDSHEAR_CRITICAL"
+    )
+
+
+def test_entry_survives_detections_outside_window():
+    """Test only detections inside the queried window invalidate an entry."""
+    store = MemoryDetectionStore()
+    cache = ResponseCache(store)
+    since = to_epoch(datetime.utcnow() - timedelta(hours=1))
+
+    cache.put("key", b"[]", store.version, oldest=None)
+    store.add(make_detection(hours_ago=5))
+    assert cache.get("key", since) is not None
+
+    store.add(make_detection(hours_ago=0.5))
+    assert cache.get("key", since) is None
+
+
+def test_entry_expires_when_window_slides_past_oldest():
+    """Test an entry is dropped once its oldest detection leaves the window."""
+    store = MemoryDetectionStore()
+    cache = ResponseCache(store)
+    oldest = to_epoch(datetime.utcnow() - timedelta(minutes=59))
+
+    cache.put("key", b"[...]", store.version, oldest=oldest)
+    assert cache.get("key", since=oldest - 1) is not None
+    assert cache.get("key", since=oldest + 1) is None
+
+
+def test_snapshot_entry_expires_on_any_change_or_ttl():
+    """Test snapshot entries last one store version and at most ttl seconds."""
+    store = MemoryDetectionStore()
+    cache = SnapshotCache(store, ttl=60.0)
+
+    cache.put("key", b"{}", store.version)
+    assert cache.get("key").body == b"{}"
+    store.add(make_detection(hours_ago=500))
+    assert cache.get("key") is None
+
+    cache.ttl = 0.0
+    cache.put("key", b"{}", store.version)
+    assert cache.get("key") is None
+
+
+def test_etag_matching():
+    """Test If-None-Match parsing."""
+    assert etag_matches('"abc", W/"def"', '"def"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abc"', '"abd"')
@@ -0,0 +1,352 @@
+"""Tests for the FastAPI server."""
+
+import json
+import threading
+import time
+
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from microburst_detection.api.server import app
+
+
+@pytest.fixture
+def client():
+    """Test client with the application lifespan running and warm-up finished."""
+    with TestClient(app) as client:
+        wait_until_ready(client)
+        yield client
+
+
+def wait_until_ready(client, timeout=30.0):
+    """Poll ``/ready`` until the background warm-up has finished."""
+    deadline = time.monotonic() + timeout
+    while client.get("/ready").status_code != 200:
+        assert time.monotonic() < deadline, "warm-up did not finish"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def anemometer_payload():
+    """Anemometer reading strong enough to trigger a detection."""
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "latitude": 52.453,
+        "longitude": -1.748,
+        "altitude": 10.0,
+        "wind_speed": 30.0,
+        "wind_direction": 245.0,
+        "temperature": 18.3,
+        "pressure": 1000.0
+    }
+
+
+def test_detection_is_returned_and_broadcast(client, anemometer_payload):
+    """Test a detection reaches both the HTTP caller and WebSocket clients."""
+    with client.websocket_connect("/ws/stream") as ws:
+        hello = ws.receive_json()
+        response = client.post("/detect/anemometer", json=anemometer_payload)
+        assert response.status_code == 200
+        message = ws.receive_json()
+
+    assert hello["type"] == "hello"
+    assert message["type"] == "detection"
+    assert message["seq"] > hello["seq"]
+    assert message["data"]["event_id"] == response.json()["event_id"]
+
+
+def test_every_stored_detection_is_broadcast(client, monkeypatch):
+    """Test station surges stored alongside the returned detection reach WebSocket clients."""
+    from microburst_detection.api import server
+    from microburst_detection.api.admission import AdmissionController
+    from microburst_detection.core.stations import StationBuffers
+
+    monkeypatch.setattr(server, "admission", AdmissionController(rate=1000.0, burst=1000))
+    server.detector.station_buffers["SURGE"] = StationBuffers(window=60.0, recent=10.0)
+    start = datetime.utcnow() - timedelta(minutes=5)
+
+    with client.websocket_connect("/ws/stream") as ws:
+        seq = ws.receive_json()["seq"]
+        returned = []
+        for t in range(60):
+            # Both stations surge together, so one reading stores two detections
+            for index, station in enumerate(("surge-a", "surge-b")):
+                response = client.post("/detect/anemometer", json={
+                    "timestamp": (start + timedelta(seconds=t)).isoformat(),
+                    "latitude": 52.45 + index * 0.01,
+                    "longitude": -1.75,
+                    "altitude": 10.0,
+                    "wind_speed": 16.0 if t >= 50 else 6.0,
+                    "wind_direction": 270.0,
+                    "temperature": 20.0,
+                    "pressure": 1000.0,
+                    "site": "SURGE",
+                    "sensor_id": station
+                })
+                if response.json() is not None:
+                    returned.append(response.json())
+        stored = server.detector.store.changes_since(seq)
+        messages = [ws.receive_json() for _ in stored]
+
+    assert len(returned) == 1 and len(stored) == 2
+    stations = {change.detection.additional_data["station"] for change in stored}
+    assert stations == {"surge-a", "surge-b"}
+    assert [m["seq"] for m in messages] == [change.seq for change in stored]
+    event_ids = [change.detection.event_id for change in stored]
+    assert [m["data"]["event_id"] for m in messages] == event_ids
+
+
+def test_websocket_resume_replays_missed_detections(client, anemometer_payload):
+    """Test a client reconnecting with since_seq receives what it missed, in order."""
+    with client.websocket_connect("/ws/stream") as ws:
+        last_seq = ws.receive_json()["seq"]
+    missed = [client.post("/detect/anemometer", json=anemometer_payload).json() for _ in range(3)]
+
+    with client.websocket_connect(f"/ws/stream?since_seq={last_seq}") as ws:
+        hello = ws.receive_json()
+        replayed = [ws.receive_json() for _ in range(3)]
+
+    assert hello["replayed"] == 3 and hello["missed"] == 0
+    assert [m["data"]["event_id"] for m in replayed] == [d["event_id"] for d in missed]
+    assert [m["seq"] for m in replayed] == list(range(last_seq + 1, last_seq + 4))
+
+
+@pytest.mark.asyncio
+async def test_held_client_gets_replay_before_held_broadcasts():
+    """Test broadcasts held during the history read follow the replay, without duplicates."""
+    import asyncio
+    from microburst_detection.api.server import ConnectionManager
+
+    class FakeSocket:
+        def __init__(self):
+            self.sent = []
+
+        async def accept(self):
+            pass
+
+        async def send_text(self, text):
+            self.sent.append(text)
+
+    manager = ConnectionManager()
+    ws = FakeSocket()
+    await manager.connect(ws, hold=True)
+    await manager.broadcast({"type": "detection", "seq": 5})
+    await manager.broadcast({"type": "detection", "seq": 6})
+    await asyncio.sleep(0)
+    assert ws.sent == []
+
+    manager.release(ws, [{"type": "hello", "seq": 4}, {"type": "detection", "seq": 5}], 5)
+    await asyncio.sleep(0.01)
+    assert [json.loads(text)["seq"] for text in ws.sent] == [4, 5, 6]
+    await manager.disconnect(ws)
+
+
+def test_invalid_reading_rejected(client, anemometer_payload):
+    """Test validation errors keep FastAPI's 422 format."""
+    anemometer_payload["wind_speed"] = -1.0
+    response = client.post("/detect/anemometer", json=anemometer_payload)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "wind_speed"]
+
+
+def test_metrics_endpoint(client, anemometer_payload):
+    """Test Prometheus exposition includes per-stage latency histograms."""
+    client.post("/detect/anemometer", json=anemometer_payload)
+    body = client.get("/metrics").text
+
+    assert "# TYPE microburst_stage_latency_seconds histogram" in body
+    for stage in ("validation", "detection", "fusion", "serialization", "broadcast"):
+        assert f'stage="{stage}",sensor_type="anemometer"' in body
+    assert 'microburst_ingest_requests_total{sensor_type="anemometer",outcome="accepted"}' in body
+    assert "microburst_detection_history_size " in body
+    assert 'stage="validation",sensor_type="anemometer",le="+Inf"' in body
+    assert "worker=" not in body
+
+
+def test_metrics_combine_workers(client, tmp_path, monkeypatch):
+    """Test a scrape reports the other workers' published counts too."""
+    from microburst_detection.api import metrics, server
+    from microburst_detection.utils.metrics import MultiProcessCollector
+
+    other = MultiProcessCollector(metrics.registry, tmp_path, worker="other")
+    other.write(metrics.registry.snapshot())
+    monkeypatch.setattr(
+        server, "collector", MultiProcessCollector(metrics.registry, tmp_path, worker="this")
+    )
+    detections = metrics.DETECTIONS.labels("lidar", "severe")
+    before = detections.value
+
+    detections.inc(3)
+    body = client.get("/metrics").text
+    total = 2 * before + 3
+    assert f'microburst_detections_total{{sensor_type="lidar",severity="severe"}} {total!r}' in body
+    assert 'microburst_websocket_queue_depth{aggregate="max",worker="other"}' in body
+
+
+def test_latency_report(client, anemometer_payload):
+    """Test per-stage latency is tracked per sensor type and site."""
+    anemometer_payload["site"] = "KDEN"
+    client.post("/detect/anemometer", json=anemometer_payload)
+    report = client.get("/latency").json()
+
+    stages = {
+        row["stage"] for row in report["summaries"]
+        if row["sensor_type"] == "anemometer" and row["site"] == "KDEN"
+    }
+    assert {"ingest", "detection", "fusion"} <= stages
+    assert report["budget_seconds"] == 2.0
+
+
+def test_detections_revalidate_with_etag(client, anemometer_payload):
+    """Test unchanged detection windows answer 304 Not Modified."""
+    client.post("/detect/anemometer", json=anemometer_payload)
+    first = client.get("/detections", params={"hours": 1})
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    cached = client.get("/detections", params={"hours": 1}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.post("/detect/anemometer", json=anemometer_payload)
+    changed = client.get("/detections", params={"hours": 1}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == len(first.json()) + 1
+
+
+def test_dashboard_sync_returns_deltas(client, anemometer_payload):
+    """Test a synced dashboard receives only new detections and changed stats."""
+    client.post("/detect/anemometer", json=anemometer_payload)
+    first = client.get("/dashboard/sync").json()
+    assert first["full"] is True
+    assert len(first["detections"]) == len(client.get("/detections").json())
+    assert first["stats"]["total_detections"] >= 1
+    assert first["health"]["status"] == "operational"
+
+    new = [client.post("/detect/anemometer", json=anemometer_payload).json() for _ in range(2)]
+    delta = client.get("/dashboard/sync", params={"cursor": first["cursor"]}).json()
+    assert delta["full"] is False
+    assert [d["event_id"] for d in delta["detections"]] == [d["event_id"] for d in new]
+    assert delta["stats"]["total_detections"] == first["stats"]["total_detections"] + 2
+
+    idle = client.get("/dashboard/sync", params={"cursor": delta["cursor"]}).json()
+    assert idle["full"] is False
+    assert idle["detections"] == []
+    assert idle["stats"] is None
+    assert client.get("/dashboard/sync", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_detections_stream_as_ndjson(client, anemometer_payload):
+    """Test NDJSON streaming and cursor pagination return the same rows."""
+    for _ in range(3):
+        client.post("/detect/anemometer", json=anemometer_payload)
+
+    streamed = client.get("/detections", params={"hours": 1, "format": "ndjson"})
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    lines = streamed.text.splitlines()
+
+    page = client.get("/detections", params={"hours": 1, "limit": 2})
+    assert len(page.json()) == 2
+    rest = client.get(
+        "/detections", params={"hours": 1, "limit": 1000, "cursor": page.headers["x-next-cursor"]}
+    )
+    assert len(page.json()) + len(rest.json()) == len(lines)
+
+
+def test_rate_limited_sensor_gets_429(client, anemometer_payload, monkeypatch):
+    """Test routine readings past the sensor burst are rejected with Retry-After."""
+    from microburst_detection.api import server
+    from microburst_detection.api.admission import AdmissionController
+
+    monkeypatch.setattr(server, "admission", AdmissionController(rate=0.01, burst=1))
+    anemometer_payload.update(wind_speed=5.0, pressure=1012.0, sensor_id="anem-42")
+
+    assert client.post("/detect/anemometer", json=anemometer_payload).status_code == 200
+    limited = client.post("/detect/anemometer", json=anemometer_payload)
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+    assert client.get("/admission").json()["counters"]["anemometer"]["rate_limited"] == 1
+
+
+def test_hazard_reading_past_the_limit(client, anemometer_payload, monkeypatch):
+    """Test a near-hazard reading uses the priority reserve and is never called routine."""
+    from microburst_detection.api import server
+    from microburst_detection.api.admission import AdmissionController
+
+    anemometer_payload.update(wind_speed=25.0, sensor_id="anem-43")
+    # The request itself is in flight, so a zero limit is already exceeded
+    monkeypatch.setattr(server, "admission", AdmissionController(max_in_flight=0))
+    assert client.post("/detect/anemometer", json=anemometer_payload).status_code == 200
+
+    monkeypatch.setattr(
+        server, "admission", AdmissionController(max_in_flight=0, priority_reserve=0)
+    )
+    refused = client.post("/detect/anemometer", json=anemometer_payload)
+    assert refused.status_code == 503
+    assert "near-hazard" in refused.json()["detail"] and "routine" not in refused.json()["detail"]
+    assert client.get("/admission").json()["counters"]["anemometer"]["saturated"] == 1
+
+
+def test_ready_after_warmup(client):
+    """Test readiness is reported once warm-up has run, without leaving detections."""
+    assert client.get("/ready").json() == {"status": "ready"}
+    body = client.get("/metrics").text
+    assert 'microburst_warmup_duration_seconds{path="total"}' in body
+    for path in ("stations", "cells", "volume", "batch"):
+        assert f'microburst_warmup_duration_seconds{{path="{path}"}}' in body
+    assert not [d for d in client.get("/detections").json() if d["site"] == "WARMUP"]
+
+
+def test_not_ready_while_warming_up(monkeypatch):
+    """Test the server serves requests during warm-up and /ready turns 200 only after it."""
+    from microburst_detection.api import server
+
+    release = threading.Event()
+
+    async def gated_warm_up(iterations):
+        release.wait(10)
+        return {"total": 0.0}
+
+    monkeypatch.setattr(server, "warm_up", gated_warm_up)
+    with TestClient(app) as client:
+        assert client.get("/ready").status_code == 503
+        assert client.get("/health").status_code == 200
+        release.set()
+        wait_until_ready(client)
+
+
+def test_series_buckets_and_trace(client, anemometer_payload):
+    """Test /series aggregates detections within the point budget and /series/trace downsamples."""
+    from microburst_detection.api import server
+
+    before = sum(client.get("/series", params={"hours": 1}).json()["count"])
+    for _ in range(2):
+        client.post("/detect/anemometer", json=anemometer_payload)
+    series = client.get("/series", params={"hours": 1, "points": 100}).json()
+    assert series["resolution"] == 60
+    assert len(series["starts"]) <= 100
+    assert sum(series["count"]) == before + 2
+
+    assert client.get("/series", params={"resolution": 7}).status_code == 400
+    assert client.get("/series", params={"hours": 1, "resolution": 300}).json()["resolution"] == 300
+    # An explicit resolution may not exceed the point budget or its retention
+    assert client.get("/series", params={"hours": 24, "resolution": 60}).status_code == 400
+    beyond = {"hours": server.retained_hours + 1}
+    assert client.get("/series", params=beyond).status_code == 400
+    assert client.get("/series/trace", params=beyond).status_code == 400
+    params = {"hours": 168, "points": 2000, "resolution": 300}
+    assert client.get("/series", params=params).status_code == 400
+
+    trace = client.get("/series/trace", params={"hours": 1, "points": 10}).json()
+    assert trace["field"] == "max_wind_shear"
+    assert len(trace["values"]) == min(trace["total"], 10)
+    assert trace["timestamps"] == sorted(trace["timestamps"])
+
+
+def test_several_workers_need_stateless_detection(monkeypatch):
+    """Test run_server refuses several workers while detection state is per process."""
+    from microburst_detection.api import server
+
+    monkeypatch.setattr(server.settings, "stateful_detection", True)
+    with pytest.raises(ValueError, match="STATEFUL_DETECTION=false"):
+        server.run_server(reload=False, workers=2)
@@ -0,0 +1,59 @@
+"""Tests for the benchmark runner."""
+
+import pytest
+
+from microburst_detection.benchmarks import runner
+
+
+def test_measure_reports_ordered_percentiles():
+    """Test calibration and the per-call statistics."""
+    stats = runner.measure(lambda: sum(range(50)), min_time=0.01)
+
+    assert stats["samples"] >= 5
+    assert stats["loops"] > 1
+    assert 0 < stats["min"] <= stats["p50"] <= stats["p90"] <= stats["p99"] <= stats["max"]
+
+
+def test_select_and_run_quick():
+    """Test case selection by substring and glob, and a quick run."""
+    names = [case.name for case in runner.select(["fusion"])]
+    assert names == ["fusion.sensor_fusion", "fusion.kalman_filter", "fusion.radar_mosaic"]
+    assert [case.name for case in runner.select(["algorithms.hook_echo*"])] == [
+        "algorithms.hook_echo", "algorithms.hook_echo_batch"
+    ]
+    assert {case.group for case in runner.select()} >= {
+        "algorithms", "fusion", "detector", "serialization", "http", "ws"
+    }
+
+    results = runner.run(runner.select(["detector.batch_radar"]), min_time=0.01, quick=True)
+
+    assert [runner.result_key(r) for r in results] == ["detector.batch_radar[100]"]
+    assert results[0]["ops_per_sec"] > 0
+
+
+def test_compare_against_baseline(tmp_path):
+    """Test regression classification and the JSON round trip."""
+    def result(name, p50):
+        return {"name": name, "size": 1, "p50": p50}
+
+    path = tmp_path / "baseline.json"
+    runner.save([result("a", 1.0), result("b", 1.0), result("c", 1.0)], path)
+    baseline = runner.load(path)["results"]
+    assert "python" in runner.load(path)["environment"]
+
+    rows = runner.compare(
+        [result("a", 1.25), result("b", 0.5), result("c", 1.05), result("d", 1.0)],
+        baseline, threshold=0.10
+    )
+
+    assert [row["status"] for row in rows] == ["regressed", "improved", "ok", "new"]
+    assert rows[0]["change"] == pytest.approx(0.25)
+
+
+def test_load_rejects_unknown_version(tmp_path):
+    """Test foreign JSON is not mistaken for a baseline."""
+    path = tmp_path / "other.json"
+    path.write_text('{"results": []}')
+
+    with pytest.raises(ValueError):
+        runner.load(path)
@@ -0,0 +1,29 @@
+"""Fixtures for CLI tests."""
+
+import socket
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def live_server():
+    """The API served by uvicorn on a free local port."""
+    import uvicorn
+
+    from microburst_detection.api.server import app
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert server.started
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(timeout=10)
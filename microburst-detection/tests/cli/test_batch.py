@@ -0,0 +1,56 @@
+"""Tests for batch analysis."""
+
+import gzip
+import json
+
+from microburst_detection.cli.batch import iter_input_files, run_batch, sensor_type_for
+from tests.fixtures.sample_data import sample_anemometer_data, sample_lidar_data
+
+WINDY = {**sample_anemometer_data().model_dump(mode="json"), "wind_speed": 30.0}
+CALM = {**WINDY, "wind_speed": 5.0}
+
+
+def test_run_batch_streams_detections(tmp_path):
+    """Test NDJSON, gzipped NDJSON and JSON inputs, bad lines and NDJSON output."""
+    stations = tmp_path / "stations"
+    stations.mkdir()
+    lines = [json.dumps(WINDY if i % 3 == 0 else CALM) for i in range(30)]
+    (stations / "day1.ndjson").write_text("\n".join(lines[:20] + ["not json", ""]) + "\n")
+    with gzip.open(stations / "day2.ndjson.gz", "wt") as f:
+        f.write("\n".join(lines[20:]) + "\n")
+    (stations / "single.json").write_text(json.dumps(WINDY))
+    output = tmp_path / "detections.ndjson"
+
+    summary = run_batch([str(stations)], output, workers=1, batch_size=7)
+
+    assert summary.files == 3
+    assert summary.readings["anemometer"] == 31
+    assert summary.invalid["anemometer"] == 1
+    assert summary.detections["anemometer"] == 11
+    written = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(written) == 11
+    assert all(d["detection_method"] == "anemometer" for d in written)
+
+
+def test_run_batch_process_pool(tmp_path):
+    """Test the process pool path produces the same counts."""
+    path = tmp_path / "readings.ndjson"
+    path.write_text("\n".join(json.dumps(WINDY) for _ in range(50)) + "\n")
+
+    summary = run_batch([str(path)], sensor_type="anemometer", workers=2, batch_size=10)
+
+    assert summary.readings["anemometer"] == 50
+    assert summary.detections["anemometer"] == 50
+
+
+def test_inputs_and_sensor_inference(tmp_path):
+    """Test glob expansion and sensor type inference from names and fields."""
+    for name in ("a.ndjson", "b.ndjson", "notes.txt"):
+        (tmp_path / name).write_text("")
+
+    found = iter_input_files([str(tmp_path / "*.ndjson")])
+    assert [p.name for p in found] == ["a.ndjson", "b.ndjson"]
+    assert sensor_type_for(tmp_path / "radar" / "x.ndjson", None) == "radar"
+    lidar = sample_lidar_data().model_dump(mode="json")
+    assert sensor_type_for(tmp_path / "x.ndjson", lidar) == "lidar"
+    assert sensor_type_for(tmp_path / "x.ndjson", {"latitude": 1}) is None
@@ -0,0 +1,55 @@
+"""Startup budget: import cost of the CLI and API entry points."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time in milliseconds, measured with ``python -X importtime``.
+# Generous enough for slow CI machines, tight enough to catch a heavy import
+# (SciPy alone costs ~300 ms) slipping back into module scope.
+BUDGETS_MS = {
+    "microburst_detection.cli.main": 400,
+    "microburst_detection.api.server": 1200,
+}
+BUDGET_SCALE = float(os.environ.get("IMPORT_BUDGET_SCALE", "1.0"))
+
+# Modules only specific commands or code paths need
+LAZY_MODULES = ("scipy", "aiohttp", "pandas", "pyarrow")
+
+
+def import_profile(module: str) -> tuple[float, set]:
+    """Import ``module`` in a fresh interpreter and return (ms, loaded modules)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            cumulative = int(total) / 1000
+    assert cumulative is not None, result.stderr[-2000:]
+    return cumulative, loaded
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS_MS))
+def test_import_time_within_budget(module):
+    """Test entry points import within budget and without lazy dependencies."""
+    # Best of three to ignore a cold filesystem cache
+    runs = [import_profile(module) for _ in range(3)]
+    elapsed = min(ms for ms, _ in runs)
+    loaded = runs[0][1]
+
+    eager = sorted(name for name in LAZY_MODULES if name in loaded)
+    assert not eager, f"{module} imports {eager} at module level"
+    budget = BUDGETS_MS[module] * BUDGET_SCALE
+    assert elapsed <= budget, f"{module} imports in {elapsed:.0f} ms (budget {budget:.0f} ms)"
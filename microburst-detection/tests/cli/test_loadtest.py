@@ -0,0 +1,42 @@
+"""Tests for the load generator."""
+
+import asyncio
+import random
+
+from microburst_detection.cli.loadtest import run_load_test, synthetic_reading
+from microburst_detection.core.detector import MicroburstDetector
+from microburst_detection.core.models import READING_MODELS, validate_readings
+
+
+def test_synthetic_readings_validate_and_trigger():
+    """Test hazard readings are detected and routine ones are not."""
+    rng = random.Random(0)
+    detector = MicroburstDetector()
+    for sensor_type, model in READING_MODELS.items():
+        hazard = validate_readings(model, [
+            synthetic_reading(sensor_type, rng, True, "s1") for _ in range(20)
+        ])
+        routine = validate_readings(model, [
+            synthetic_reading(sensor_type, rng, False, "s1") for _ in range(20)
+        ])
+        assert len(detector.detect_batch(sensor_type, hazard, store=False)) == 20
+        assert detector.detect_batch(sensor_type, routine, store=False) == []
+
+
+def test_load_test_against_local_server(live_server):
+    """Test requests, detections and subscriber deliveries are all accounted for."""
+    report = asyncio.run(run_load_test(
+        live_server, rate=40, duration=1.0, subscribers=2, concurrency=8,
+        hazard_ratio=0.5, seed=3
+    ))
+
+    requests = report["requests"]
+    delivery = report["delivery"]
+    assert requests["scheduled"] == 40
+    assert requests["completed"] == 40
+    assert requests["statuses"] == {"200": 40}
+    assert delivery["subscribers"] == 2
+    assert delivery["detections"] > 0
+    assert delivery["received"] == delivery["expected"] == 2 * delivery["detections"]
+    assert report["latency"]["p50"] <= report["latency"]["max"]
+    assert delivery["latency"]["p99"] is not None
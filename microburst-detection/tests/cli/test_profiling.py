@@ -0,0 +1,48 @@
+"""Tests for the pipeline profiler."""
+
+import json
+import random
+
+from microburst_detection.cli.loadtest import synthetic_reading
+from microburst_detection.cli.profiling import (
+    profile_workload,
+    recorded_workload,
+    synthetic_workload,
+)
+
+
+def test_profile_attributes_time_to_stages(tmp_path):
+    """Test every report is written and time is attributed to pipeline stages."""
+    summary = profile_workload(synthetic_workload(300, hazard_ratio=0.2), tmp_path, top=5)
+
+    reports = ("cpu.pstats", "functions.txt", "stacks.collapsed", "allocations.txt", "summary.json")
+    for name in reports:
+        assert (tmp_path / name).stat().st_size > 0
+    assert summary["counts"]["readings"] == 300
+    assert summary["counts"]["detections"] > 0
+    stages = {row["stage"]: row for row in summary["stages"]}
+    for stage in ("validate", "process_radar", "detect_hook_echo", "fuse_measurements", "_update"):
+        assert stages[stage]["calls"] > 0
+        assert 0 < stages[stage]["share"] <= 1
+    assert len(summary["functions"]) == 5
+    assert summary["allocations"]["peak_bytes"] > 0
+    assert json.loads((tmp_path / "summary.json").read_text())["counts"] == summary["counts"]
+
+    for line in (tmp_path / "stacks.collapsed").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("microburst_detection.cli.profiling:_pipeline")
+        assert int(count) > 0
+
+
+def test_recorded_workload_infers_type_and_limits(tmp_path):
+    """Test recorded files replay with their sensor type, up to the limit."""
+    rng = random.Random(0)
+    path = tmp_path / "radar" / "day.ndjson"
+    path.parent.mkdir()
+    path.write_text("".join(
+        json.dumps(synthetic_reading("radar", rng, False, "r1")) + "\n" for _ in range(10)
+    ))
+
+    workload = list(recorded_workload([str(tmp_path)], limit=4))
+    assert len(workload) == 4
+    assert {kind for kind, _ in workload} == {"radar"}
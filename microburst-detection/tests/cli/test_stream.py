@@ -0,0 +1,80 @@
+"""Tests for the stream consumer."""
+
+import asyncio
+import json
+import random
+
+from microburst_detection.cli.loadtest import synthetic_reading
+from microburst_detection.cli.main import _stream_async
+from microburst_detection.cli.stream import StreamConsumer, StreamState
+
+
+def _detection(seq: int, severity: str = "severe") -> str:
+    data = {"severity": severity, "site": "KDEN"}
+    return json.dumps({"type": "detection", "seq": seq, "data": data})
+
+
+def test_consumer_drops_duplicates_and_counts_gaps():
+    """Test replayed messages already seen are ignored and hello counters accumulate."""
+    seen = []
+    state = StreamState()
+    consumer = StreamConsumer(
+        "http://localhost:8000", state, on_detection=lambda m, t: seen.append(m["seq"])
+    )
+
+    consumer.handle(json.dumps({"type": "hello", "seq": 3, "replayed": 0, "missed": 0}))
+    for seq in (4, 5, 6):
+        consumer.handle(_detection(seq))
+    assert consumer.url().endswith("/ws/stream?since_seq=6")
+
+    # Reconnect: the server replays 5-8 (overlapping) and reports 2 it could not keep
+    consumer.handle(json.dumps({"type": "hello", "seq": 8, "replayed": 4, "missed": 2}))
+    for seq in (5, 6, 7, 8):
+        consumer.handle(_detection(seq, "low"))
+
+    assert seen == [4, 5, 6, 7, 8]
+    assert state.total == 5
+    assert state.duplicates == 2
+    assert state.by_severity == {"severe": 3, "low": 2}
+    assert (state.replayed, state.missed, state.resets) == (4, 2, 0)
+
+
+def test_consumer_follows_server_reset():
+    """Test a hello with a lower seq than ours restarts numbering."""
+    state = StreamState()
+    consumer = StreamConsumer("http://localhost:8000", state)
+    consumer.handle(json.dumps({"type": "hello", "seq": 100}))
+    consumer.handle(json.dumps({"type": "hello", "seq": 2}))
+    consumer.handle(_detection(3))
+
+    assert state.resets == 1
+    assert state.total == 1
+    assert state.last_seq == 3
+
+
+def test_headless_stream_replays_to_ndjson(live_server, tmp_path):
+    """Test --ndjson with --since-seq writes replayed detections in sequence order."""
+    import aiohttp
+
+    rng = random.Random(1)
+
+    async def post_hazards():
+        async with aiohttp.ClientSession() as session:
+            for i in range(3):
+                reading = synthetic_reading("anemometer", rng, True, f"stream-{i}")
+                url = f"{live_server}/detect/anemometer"
+                async with session.post(url, json=reading) as response:
+                    assert response.status == 200
+
+    asyncio.run(post_hazards())
+    output = tmp_path / "stream.ndjson"
+    state = StreamState()
+    asyncio.run(_stream_async(state, live_server, 1.0, 4.0, str(output), 0, False))
+
+    messages = [json.loads(line) for line in output.read_text().splitlines()]
+    seqs = [message["seq"] for message in messages]
+    assert len(messages) >= 3
+    assert seqs == sorted(set(seqs))
+    assert all(message["type"] == "detection" for message in messages)
+    assert state.total == len(messages)
+    assert state.connections == 1
@@ -0,0 +1,10 @@
+"""Shared test configuration."""
+
+import os
+import tempfile
+
+# Keep the API's persisted history and raw archive out of the working directory
+_STATE_DIR = tempfile.mkdtemp(prefix="microburst-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_STATE_DIR}/microburst.db")
+os.environ.setdefault("RAW_ARCHIVE_ENABLED", "true")
+os.environ.setdefault("RAW_ARCHIVE_PATH", f"{_STATE_DIR}/raw_archive")
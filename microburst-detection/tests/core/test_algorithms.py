@@ -2,7 +2,7 @@
 
 import pytest
 import numpy as np
-from microburst_detection.core.algorithms import WindShearDetector
+from microburst_detection.core.algorithms import ReflectivityAnalyzer, WindShearDetector
 
 
 def test_calculate_wind_shear():
@@ -25,3 +25,50 @@ def test_calculate_wind_shear_insufficient_points():
     with pytest.raises(ValueError, match="at least 3"):
         WindShearDetector.calculate_wind_shear(altitudes, vertical_velocities)
 
+
+
+def test_detect_hook_echo_batch_matches_single():
+    """Test the stacked hook echo screen agrees with the per-grid version."""
+    rng = np.random.default_rng(7)
+    grids = rng.uniform(30, 55, (20, 10, 10))
+
+    batch = ReflectivityAnalyzer.detect_hook_echo_batch(grids)
+
+    for i, grid in enumerate(grids):
+        single = ReflectivityAnalyzer.detect_hook_echo(grid, None, None)
+        assert batch["hook_detected"][i] == single["hook_detected"]
+        assert batch["hook_confidence"][i] == pytest.approx(single["hook_confidence"])
+        assert batch["max_reflectivity"][i] == single["max_reflectivity"]
+
+
+def test_screened_curvature_matches_full_pass():
+    """Test tile screening finds the same maximum Laplacian as the full grid pass."""
+    from scipy.ndimage import laplace
+
+    rng = np.random.default_rng(11)
+    yy, xx = np.mgrid[:150, :170]
+    storms = np.zeros((150, 170), dtype=bool)
+    for cy, cx, r in ((40, 60, 15), (100, 140, 6)):
+        storms |= (yy - cy) ** 2 + (xx - cx) ** 2 < r * r
+    masks = [
+        storms,
+        rng.uniform(size=(150, 170)) > 0.5,
+        np.zeros((150, 170), dtype=bool),
+        np.ones((150, 170), dtype=bool),
+        np.pad(np.ones((3, 3), dtype=bool), ((0, 67), (97, 0))),  # against the border
+        rng.uniform(size=(3, 5)) > 0.5,
+    ]
+    for mask in masks:
+        expected = np.abs(laplace(mask.astype(float))[1:-1, 1:-1]).max()
+        for tile in (1, 7, 32, 256):
+            assert ReflectivityAnalyzer.screened_max_curvature(mask, tile) == expected
+
+
+def test_detect_hook_echo_screens_large_grids():
+    """Test a large quiet grid is screened and still scores its storm edge."""
+    grid = np.full((600, 600), 15.0)
+    grid[300:310, 300:305] = 52.0
+    result = ReflectivityAnalyzer.detect_hook_echo(grid, None, None)
+    assert grid.size >= ReflectivityAnalyzer.SCREENING_MIN_CELLS
+    assert result["hook_confidence"] == 1.0 and result["hook_detected"]
+    assert result["max_reflectivity"] == 52.0
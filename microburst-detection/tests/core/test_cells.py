@@ -0,0 +1,122 @@
+"""Tests for storm cell extraction and tracking."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from microburst_detection.core.algorithms import ReflectivityAnalyzer
+from microburst_detection.core.cells import StormCellTracker
+from microburst_detection.core.detector import MicroburstDetector
+
+LAT = np.linspace(52.0, 52.99, 100)
+LON = np.linspace(-2.0, -0.02, 100)
+
+
+def storms(*boxes, background=20.0):
+    """A 100x100 grid with rectangular storms given as (row, col, height, width, dBZ)."""
+    grid = np.full((100, 100), background)
+    for row, col, height, width, dbz in boxes:
+        grid[row:row + height, col:col + width] = dbz
+    return grid
+
+
+def test_extract_cells_statistics():
+    """Test each connected storm gets its own area, centroid and reflectivity stats."""
+    grid = storms((10, 10, 4, 6, 50.0), (60, 70, 10, 10, 45.0))
+    grid[62, 72] = 65.0
+    cells = ReflectivityAnalyzer.extract_cells(grid, LAT, LON)
+
+    assert cells.dtype == ReflectivityAnalyzer.CELL_DTYPE
+    assert cells["label"].tolist() == [1, 2]
+    assert cells["area"].tolist() == [24, 100]
+    np.testing.assert_allclose(cells["row"], [11.5, 64.5])
+    np.testing.assert_allclose(cells["col"], [12.5, 74.5])
+    np.testing.assert_allclose(cells["latitude"], [52.115, 52.645])
+    np.testing.assert_allclose(cells["longitude"], [-1.75, -0.51])
+    assert cells["max_reflectivity"].tolist() == [50.0, 65.0]
+    assert cells["mean_reflectivity"][1] == pytest.approx(45.2)
+    # Rectangle corners: a cell with two clear neighbors
+    assert cells["curvature"].tolist() == [2.0, 2.0]
+
+    small = ReflectivityAnalyzer.extract_cells(grid, LAT, LON, min_area=50)
+    assert small["label"].tolist() == [2]
+    assert len(ReflectivityAnalyzer.extract_cells(storms(), LAT, LON)) == 0
+
+
+def test_cell_curvature_matches_grid_hook_score():
+    """Test the strongest cell curvature is the grid-wide hook echo curvature."""
+    rng = np.random.default_rng(5)
+    grid = rng.uniform(20.0, 55.0, (60, 80))
+    cells, labels = ReflectivityAnalyzer.extract_cells(grid, return_labels=True)
+
+    result = ReflectivityAnalyzer.detect_hook_echo(grid, None, None)
+    assert cells["hook_score"].max() == pytest.approx(result["hook_confidence"])
+    assert labels.max() == len(cells)
+    assert np.isnan(cells["latitude"]).all()
+    # A notch in a storm edge is counted for that storm
+    notched = storms((20, 20, 10, 10, 50.0), (60, 60, 10, 10, 50.0))
+    notched[20, 25] = 20.0
+    cells = ReflectivityAnalyzer.extract_cells(notched)
+    assert cells["curvature"].tolist() == [3.0, 2.0]
+
+
+def test_tracker_follows_moving_cells():
+    """Test cells keep their track across scans and new or expired storms are handled."""
+    tracker = StormCellTracker(expire_after=600.0)
+    first = tracker.update(ReflectivityAnalyzer.extract_cells(
+        storms((10, 10, 5, 5, 50.0), (60, 60, 5, 5, 50.0)), LAT, LON), 0.0)
+    assert first["track"].tolist() == [1, 2] and first["scans"].tolist() == [1, 1]
+
+    # Both move one cell east (~1.35 km) in 5 minutes; a third storm appears
+    second = tracker.update(ReflectivityAnalyzer.extract_cells(
+        storms((10, 11, 5, 5, 50.0), (40, 30, 5, 5, 50.0), (60, 61, 5, 5, 50.0)), LAT, LON), 300.0)
+    assert second["track"].tolist() == [1, 3, 2]
+    assert second["scans"].tolist() == [2, 1, 2]
+    assert second["speed"][0] == pytest.approx(1350.0 / 300.0, rel=0.05)
+    assert second["heading"][0] == pytest.approx(90.0, abs=1.0)
+    assert second["duration"][2] == 300.0
+
+    # Unmatched tracks live on until expire_after
+    single = ReflectivityAnalyzer.extract_cells(storms((10, 12, 5, 5, 50.0)), LAT, LON)
+    assert tracker.update(single, 800.0)["track"].tolist() == [1]
+    assert sorted(tracker.tracks) == [1, 2, 3]
+    assert tracker.update(single, 1000.0)["track"].tolist() == [1]
+    assert tracker.tracks == [1]
+
+
+def test_detector_reports_each_storm_once():
+    """Test a grid with two storms gives two detections, not repeated while they persist."""
+    detector = MicroburstDetector()
+    velocity = np.zeros((100, 100))
+    velocity[10:15, 10:12] = -12.0
+    velocity[10:15, 12:15] = 12.0
+
+    grid = storms((10, 10, 5, 5, 55.0), (60, 60, 8, 8, 48.0))
+    detections = asyncio.run(detector.process_reflectivity_grid(
+        grid, LAT, LON, 1_700_000_000.0, site="KDEN", velocity=velocity, cell_size=1350.0
+    ))
+    assert len(detections) == 2
+    calm, strong = detections
+    assert strong.max_wind_shear == 24.0 and calm.max_wind_shear == 0.0
+    assert strong.additional_data["max_reflectivity"] == 55.0
+    assert strong.latitude == pytest.approx(52.12) and strong.site == "KDEN"
+    assert strong.additional_data["track"] != calm.additional_data["track"]
+    assert len(detector.store) == 2
+
+    moved = storms((10, 11, 5, 5, 55.0), (60, 61, 8, 8, 48.0), (30, 80, 4, 4, 50.0))
+    detections = asyncio.run(detector.process_reflectivity_grid(
+        moved, LAT, LON, 1_700_000_300.0, site="KDEN"
+    ))
+    assert [d.additional_data["track"] for d in detections] == [3]
+
+
+def test_stateless_detector_reports_storm_every_scan():
+    """Test a detector without per-process tracks reports a persisting storm on each scan."""
+    detector = MicroburstDetector(stateful=False)
+    grid = storms((10, 10, 5, 5, 55.0))
+    for timestamp in (1_700_000_000.0, 1_700_000_300.0):
+        detections = asyncio.run(detector.process_reflectivity_grid(
+            grid, LAT, LON, timestamp, site="KDEN"
+        ))
+        assert len(detections) == 1
+    assert not detector.cell_trackers and len(detector.store) == 2
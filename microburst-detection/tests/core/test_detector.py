@@ -1,5 +1,7 @@
 """Tests for microburst detector."""
 
+import threading
+
 import pytest
 from datetime import datetime
 from microburst_detection.core.detector import MicroburstDetector
@@ -9,6 +11,7 @@ from microburst_detection.core.models import (
     AnemometerData,
     SeverityLevel
 )
+from microburst_detection.storage.detection_store import SQLiteDetectionStore
 
 
 @pytest.fixture
@@ -71,6 +74,45 @@ async def test_process_lidar_detection(detector, sample_lidar_data):
     assert result.severity in [SeverityLevel.MODERATE, SeverityLevel.SEVERE, SeverityLevel.EXTREME]
 
 
+@pytest.mark.asyncio
+async def test_shared_store_writes_off_event_loop(tmp_path, sample_anemometer_data):
+    """Test detections for a shared store are inserted outside the event loop thread."""
+    threads = []
+
+    class RecordingStore(SQLiteDetectionStore):
+        def add(self, detection):
+            threads.append(threading.get_ident())
+            return super().add(detection)
+
+    store = RecordingStore(tmp_path / "state.db")
+    detector = MicroburstDetector(store=store)
+    result = await detector.process_anemometer(sample_anemometer_data)
+
+    assert result is not None
+    assert threads and threading.get_ident() not in threads
+    assert detector.last_seq == store.version == 1
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_store_reads_off_event_loop(tmp_path):
+    """Test history reads from a shared store run outside the event loop thread."""
+    threads = []
+
+    class RecordingStore(SQLiteDetectionStore):
+        def query(self, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return super().query(*args, **kwargs)
+
+    store = RecordingStore(tmp_path / "state.db")
+    detector = MicroburstDetector(store=store)
+    await detector.get_recent_detections(hours=1)
+    assert await detector.read(store.query) == []
+
+    assert len(threads) == 2 and threading.get_ident() not in threads
+    store.close()
+
+
 @pytest.mark.asyncio
 async def test_process_lidar_no_detection(detector):
     """Test LIDAR processing with weak signal."""
@@ -132,3 +174,52 @@ async def test_get_statistics(detector, sample_lidar_data):
     assert 'severity_distribution' in stats
     assert 'avg_confidence' in stats
 
+
+
+@pytest.mark.asyncio
+async def test_detect_batch_matches_per_reading(detector):
+    """Test vectorized batches trigger on exactly the readings the per-reading paths do."""
+    now = datetime.utcnow()
+    lidar = [
+        LidarData(timestamp=now, latitude=52.453, longitude=-1.748, altitude=1200.0,
+                  vertical_velocity=velocity, backscatter=0.4)
+        for velocity in range(-6000, 1, 250)
+    ]
+    anemometer = [
+        AnemometerData(timestamp=now, latitude=52.453, longitude=-1.748, altitude=10.0,
+                       wind_speed=speed, wind_direction=245.0, temperature=18.3, pressure=pressure)
+        for speed in (15.0, 20.0, 21.0, 30.0) for pressure in (1000.0, 1010.0, 1020.0)
+    ]
+
+    for sensor_type, readings, process in (
+        ("lidar", lidar, detector.process_lidar),
+        ("anemometer", anemometer, detector.process_anemometer),
+    ):
+        expected = [await process(reading) for reading in readings]
+        expected = [d for d in expected if d is not None]
+        batch = detector.detect_batch(sensor_type, readings, store=False)
+
+        assert expected, sensor_type
+        assert len(batch) == len(expected)
+        for got, want in zip(batch, expected):
+            assert got.max_wind_shear == pytest.approx(want.max_wind_shear)
+            assert got.confidence == pytest.approx(want.confidence)
+            assert got.severity == want.severity
+            assert got.alert_level == want.alert_level
+
+
+def test_detect_batch_radar(detector, sample_radar_data):
+    """Test radar batches and storing of batch detections."""
+    strong = sample_radar_data.model_copy(update={"reflectivity": 60.0})
+    weak = sample_radar_data.model_copy(update={"reflectivity": 10.0})
+
+    unstored = detector.detect_batch("radar", [weak, strong, weak])
+    assert not detector.detection_history
+    detections = detector.detect_batch("radar", [weak, strong, weak], store=True)
+
+    assert len(detections) == len(unstored) <= 1
+    assert all(d.vertical_velocity == strong.radial_velocity for d in detections)
+    assert len(detector.detection_history) == len(detections)
+    assert detector.detect_batch("radar", []) == []
+    with pytest.raises(ValueError):
+        detector.detect_batch("sodar", [strong])
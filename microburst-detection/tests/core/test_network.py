@@ -0,0 +1,131 @@
+"""Tests for the anemometer station network."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+from microburst_detection.core.detector import MicroburstDetector
+from microburst_detection.core.models import AnemometerData
+from microburst_detection.core.network import StationNetwork
+
+ORIGIN = (52.453, -1.748)
+
+
+def station_grid(size: int = 12, spacing: float = 500.0) -> np.ndarray:
+    """Station (lat, lon) positions on a jittered square grid."""
+    rng = np.random.default_rng(0)
+    x, y = np.meshgrid(np.arange(size), np.arange(size))
+    xy = (np.column_stack((x.ravel(), y.ravel())) - (size - 1) / 2) * spacing
+    xy += rng.uniform(-100, 100, xy.shape)
+    lat = ORIGIN[0] + xy[:, 1] / 111195.0
+    lon = ORIGIN[1] + xy[:, 0] / (111195.0 * np.cos(np.radians(ORIGIN[0])))
+    return np.column_stack((lat, lon)), xy
+
+
+def outflow(xy: np.ndarray, strength: float, center=(0.0, 0.0)) -> tuple:
+    """Wind speed and direction for a 5 m/s westerly plus a radial outflow within 2 km of center."""
+    dx, dy = xy[:, 0] - center[0], xy[:, 1] - center[1]
+    r = np.hypot(dx, dy)
+    radial = np.where(r < 2000, strength * r / 2000, 0.0)
+    u = 5.0 + radial * dx / np.maximum(r, 1.0)
+    v = radial * dy / np.maximum(r, 1.0)
+    return np.hypot(u, v), np.degrees(np.arctan2(-u, -v)) % 360
+
+
+def feed(network: StationNetwork, positions: np.ndarray, winds: tuple, now: float):
+    for i, ((lat, lon), speed, direction) in enumerate(zip(positions, *winds)):
+        network.update(f"s{i}", lat, lon, speed, direction, now)
+    return network.evaluate(now)
+
+
+def test_network_alarms_once_at_outflow_center():
+    """Test a radial outflow raises one alarm at its center, only at onset."""
+    positions, xy = station_grid()
+    network = StationNetwork(smoothing=0)
+
+    assert feed(network, positions, outflow(xy, 0.0), 0.0) == []
+    alarms = feed(network, positions, outflow(xy, 15.0, center=(500.0, -500.0)), 1.0)
+    assert len(alarms) == 1
+    alarm = alarms[0]
+    assert abs(alarm.latitude - (ORIGIN[0] - 500.0 / 111195.0)) < 0.004
+    assert alarm.wind_shear >= network.shear_threshold
+    assert alarm.divergence > network.divergence_threshold
+    assert alarm.stations >= 3
+
+    # Persisting outflow does not alarm again; a new onset after it clears does
+    assert feed(network, positions, outflow(xy, 15.0, center=(500.0, -500.0)), 2.0) == []
+    assert feed(network, positions, outflow(xy, 0.0), 3.0) == []
+    assert len(feed(network, positions, outflow(xy, 15.0), 4.0)) == 1
+
+
+def test_network_triangulates_only_on_membership_change():
+    """Test the triangulation is reused across steps and rebuilt when stations join or leave."""
+    positions, xy = station_grid()
+    network = StationNetwork(smoothing=0, expire_after=30.0)
+    for step in range(5):
+        feed(network, positions, outflow(xy, 0.0), float(step))
+    assert network.rebuilds == 1
+
+    network.update("extra", ORIGIN[0] + 0.01, ORIGIN[1], 5.0, 270.0, 5.0)
+    network.evaluate(5.0)
+    assert network.rebuilds == 2 and len(network) == len(positions) + 1
+
+    # The extra station goes silent and expires
+    feed(network, positions, outflow(xy, 0.0), 40.0)
+    assert network.rebuilds == 3 and len(network) == len(positions)
+
+
+def test_network_skips_stale_stations():
+    """Test triangles with silent stations are not evaluated."""
+    positions, xy = station_grid(size=4)
+    network = StationNetwork(smoothing=0, stale_after=5.0)
+    feed(network, positions, outflow(xy, 0.0), 0.0)
+    speed, direction = outflow(xy, 20.0)
+    network.update("s5", *positions[5], speed[5], direction[5], 10.0)
+    assert network.evaluate(10.0) == []
+
+
+def test_network_smooths_out_gusts():
+    """Test a one-second gust pattern does not alarm but a sustained outflow does."""
+    positions, xy = station_grid()
+    network = StationNetwork(smoothing=5.0)
+    for step in range(6):
+        assert feed(network, positions, outflow(xy, 0.0), float(step)) == []
+    assert feed(network, positions, outflow(xy, 12.0), 6.0) == []
+    assert feed(network, positions, outflow(xy, 0.0), 7.0) == []
+    alarms = [
+        len(feed(network, positions, outflow(xy, 12.0), float(step))) for step in range(8, 20)
+    ]
+    assert sum(alarms) == 1
+
+
+def test_detector_reports_network_outflow():
+    """Test readings below the single-station threshold still detect a network outflow."""
+    positions, xy = station_grid()
+    detector = MicroburstDetector()
+    start = datetime.utcnow() - timedelta(minutes=5)
+
+    async def run():
+        results = []
+        for step, strength in enumerate([0.0] * 6 + [12.0] * 10):
+            speed, direction = outflow(xy, strength)
+            for i, (lat, lon) in enumerate(positions):
+                results.append(await detector.process_anemometer(AnemometerData(
+                    timestamp=start + timedelta(seconds=step),
+                    latitude=lat,
+                    longitude=lon,
+                    altitude=10.0,
+                    wind_speed=speed[i],
+                    wind_direction=direction[i],
+                    temperature=20.0,
+                    pressure=1013.0,
+                    site="BHX",
+                    sensor_id=f"bhx-{i}"
+                )))
+        return [result for result in results if result is not None]
+
+    detections = asyncio.run(run())
+    assert len(detections) == 1
+    assert detections[0].additional_data["network"] is True
+    assert detections[0].site == "BHX"
+    assert len(detector.store) == 1
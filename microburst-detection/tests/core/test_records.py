@@ -0,0 +1,95 @@
+"""Tests for internal record types and edge validation."""
+
+import pytest
+from datetime import datetime, timedelta
+from pydantic import ValidationError
+from microburst_detection.core.detector import MicroburstDetector
+from microburst_detection.core.models import (
+    AnemometerData,
+    DetectionMethod,
+    MicroburstDetection,
+    SeverityLevel,
+    validate_reading,
+    validate_readings
+)
+from microburst_detection.core.records import AnemometerReading, DetectionRecord
+
+
+def make_record() -> DetectionRecord:
+    """Detection record with every field populated."""
+    return DetectionRecord(
+        event_id="evt_1",
+        timestamp=datetime(2025, 11, 23, 21, 3, 15),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=10.0,
+        severity=SeverityLevel.SEVERE,
+        detection_method=DetectionMethod.ANEMOMETER,
+        max_wind_shear=8.0,
+        vertical_velocity=-15.0,
+        confidence=0.8,
+        radius=2000.0,
+        duration_seconds=300,
+        alert_level="WINDSHEAR_CRITICAL",
+        site="KDEN",
+        additional_data={"wind_speed": 30.0}
+    )
+
+
+def test_record_json_matches_pydantic_model():
+    """Test records serialize to the same payload as MicroburstDetection."""
+    record = make_record()
+    model = MicroburstDetection.model_validate(record.to_dict())
+
+    assert record.to_json() == model.model_dump_json()
+    assert DetectionRecord.from_json(record.to_json()) == record
+    assert DetectionRecord.coerce(model) == record
+
+
+@pytest.mark.asyncio
+async def test_detector_accepts_trusted_readings():
+    """Test the detector processes slot records without Pydantic models."""
+    reading = AnemometerReading(
+        timestamp=datetime.utcnow(),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=10.0,
+        wind_speed=30.0,
+        wind_direction=245.0,
+        temperature=18.3,
+        pressure=1000.0,
+        site="KDEN"
+    )
+    detector = MicroburstDetector()
+    detection = await detector.process_anemometer(reading)
+
+    assert isinstance(detection, DetectionRecord)
+    assert detection.site == "KDEN"
+    assert detector.fuse(reading).anemometer_available
+
+
+def test_batch_validation_reports_item_index():
+    """Test batch validation checks every item against one reference time."""
+    base = {
+        "latitude": 52.453,
+        "longitude": -1.748,
+        "altitude": 10.0,
+        "wind_speed": 25.0,
+        "wind_direction": 245.0,
+        "temperature": 18.3,
+        "pressure": 1010.0
+    }
+    items = [
+        {**base, "timestamp": "2025-11-23T21:03:00Z"},
+        {**base, "timestamp": (datetime.utcnow() - timedelta(minutes=1)).isoformat()},
+    ]
+    readings = validate_readings(AnemometerData, items)
+    assert [r.wind_speed for r in readings] == [25.0, 25.0]
+
+    items.append({**base, "timestamp": (datetime.utcnow() + timedelta(hours=1)).isoformat()})
+    with pytest.raises(ValidationError) as excinfo:
+        validate_readings(AnemometerData, items)
+    assert excinfo.value.errors()[0]["loc"] == (2, "timestamp")
+
+    with pytest.raises(ValidationError):
+        validate_reading(AnemometerData, {**base, "timestamp": "2999-01-01T00:00:00Z"})
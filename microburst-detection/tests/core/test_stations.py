@@ -0,0 +1,144 @@
+"""Tests for rolling anemometer station buffers."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from microburst_detection.core.detector import MicroburstDetector
+from microburst_detection.core.models import AnemometerData
+from microburst_detection.core.stations import StationBuffers
+
+START = 1_700_000_000.0
+
+
+def run_stations(
+    buffers: StationBuffers, seconds: int, sample, stations: int = 20, seed: int = 0
+) -> list:
+    """Feed ``sample(station, t)`` readings at irregular times; return (second, event) pairs."""
+    rng = np.random.default_rng(seed)
+    events = []
+    for t in range(seconds):
+        now = START + t
+        if buffers.due(now):
+            events += [(t, event) for event in buffers.evaluate(now)]
+        for station in range(stations):
+            if rng.random() < 0.3:
+                continue  # Irregular reporting: ~30% of seconds missing
+            speed, direction, pressure = sample(station, t, rng)
+            when = now + rng.random() * 0.9
+            buffers.update(f"s{station}", 52.0, -1.0, speed, direction, pressure, when)
+    return events
+
+
+def steady(station, t, rng):
+    speed = max(rng.normal(6.0, 1.0), 0.0)
+    return speed, rng.normal(270.0, 10.0) % 360, 1010.0 + rng.normal(0.0, 0.1)
+
+
+def test_surge_shift_and_jump_start_once():
+    """Test a gust front at one station raises each signal once, against its own baseline."""
+    def gust_front(station, t, rng):
+        speed, direction, pressure = steady(station, t, rng)
+        if station == 3 and t >= 420:
+            return speed + 12.0, (direction + 90.0) % 360, pressure + 2.0
+        return speed, direction, pressure
+
+    events = run_stations(StationBuffers(window=300.0, recent=20.0), 480, gust_front)
+
+    assert {event.station for _, event in events} == {"s3"}
+    assert all(t > 420 for t, _ in events)
+    signals = [name for _, event in events for name in ("surge", "direction_shift", "pressure_jump")
+               if getattr(event, name)]
+    assert sorted(set(signals)) == ["direction_shift", "pressure_jump", "surge"]
+    surge = next(event for _, event in events if event.surge)
+    assert surge.speed_change >= 7.5
+    assert surge.baseline_speed == pytest.approx(6.0, abs=0.5)
+
+
+def test_steady_noise_raises_nothing():
+    """Test gusty but steady winds at irregular times raise no events."""
+    assert run_stations(StationBuffers(window=300.0), 600, steady, seed=1) == []
+
+
+def test_irregular_samples_are_regularized():
+    """Test gaps are filled linearly up to the next sample and shared slots are averaged."""
+    buffers = StationBuffers(window=60.0, recent=5.0, max_gap=5.0)
+    buffers.update("a", 52.0, -1.0, 4.0, 270.0, 1000.0, START + 0.1)
+    buffers.update("a", 52.0, -1.0, 8.0, 270.0, 1004.0, START + 4.2)
+    buffers.update("a", 52.0, -1.0, 10.0, 270.0, 1006.0, START + 4.7)
+    buffers.update("a", 52.0, -1.0, 0.0, 270.0, 1000.0, START + 20.0)   # gap too long to fill
+
+    row = buffers._speed[0][(int(START) + np.arange(21)) % buffers.slots]
+    filled = buffers._filled[0][(int(START) + np.arange(21)) % buffers.slots]
+    np.testing.assert_allclose(row[:5], [4.0, 5.0, 6.0, 7.0, 9.0])
+    assert filled[:5].all() and not filled[5:20].any() and filled[20]
+    baseline = (1000 + 1001 + 1002 + 1003 + 1005 + 1000) / 6
+    assert buffers.baseline_pressure("a") == pytest.approx(baseline)
+
+
+def test_detector_reports_surge_and_uses_pressure_baseline():
+    """Test a station surge becomes a detection and single readings use the station's pressure."""
+    detector = MicroburstDetector()
+    start = datetime.utcnow() - timedelta(minutes=30)
+    rng = np.random.default_rng(2)
+
+    def reading(t: int, speed: float, pressure: float) -> AnemometerData:
+        return AnemometerData(
+            timestamp=start + timedelta(seconds=t),
+            latitude=52.45,
+            longitude=-1.75,
+            altitude=10.0,
+            wind_speed=speed,
+            wind_direction=270.0,
+            temperature=20.0,
+            pressure=pressure,
+            site="BHX",
+            sensor_id="bhx-1"
+        )
+
+    async def run():
+        results = []
+        for t in range(900):
+            speed = 16.0 if t >= 840 else max(rng.normal(6.0, 0.5), 0.0)
+            results.append(await detector.process_anemometer(reading(t, speed, 1000.0)))
+        return [result for result in results if result is not None]
+
+    detections = asyncio.run(run())
+    assert len(detections) == 1
+    assert detections[0].additional_data["surge"] is True
+    assert detections[0].additional_data["station"] == "bhx-1"
+    assert detections[0].max_wind_shear >= 7.5
+
+    # 1000 hPa is this station's normal, not a 13 hPa drop
+    strong = asyncio.run(detector.process_anemometer(reading(901, 21.0, 1000.0)))
+    assert strong.additional_data["pressure_drop"] == 0.0
+
+    # Batches use the same baselines but neither feed nor evaluate the station histories
+    buffers = detector.station_buffers["BHX"]
+    head, stored = buffers.head, len(detector.store)
+    readings = [reading(902, 21.0, 1000.0), reading(903, 3.0, 1000.0)]
+    batch = detector.detect_batch("anemometer", readings, store=True)
+    assert [d.additional_data["pressure_drop"] for d in batch] == [0.0]
+    assert buffers.head == head and len(detector.store) == stored + 1
+    fresh = MicroburstDetector().detect_batch(
+        "anemometer", [reading(902, 21.0, 1000.0)], store=False
+    )
+    assert fresh[0].additional_data["pressure_drop"] == 13.0
+
+
+def test_silent_stations_expire():
+    """Test a station silent for a whole window is dropped and its row reused cleanly."""
+    buffers = StationBuffers(window=60.0, recent=5.0)
+    for t in range(30):
+        buffers.update("a", 52.0, -1.0, 5.0, 270.0, 1000.0, START + t)
+        if t < 10:
+            buffers.update("b", 52.1, -1.0, 7.0, 270.0, 1005.0, START + t)
+    buffers.evaluate(START + 30)
+    assert len(buffers) == 2
+
+    buffers.evaluate(START + 70)
+    assert buffers._ids == ["a"] and buffers._index == {"a": 0}
+    assert buffers.baseline_pressure("a") == pytest.approx(1000.0)
+    buffers.update("c", 52.2, -1.0, 9.0, 270.0, 990.0, START + 71)
+    assert buffers._filled[1].sum() == 1 and buffers.baseline_pressure("b") is None
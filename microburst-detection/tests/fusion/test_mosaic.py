@@ -0,0 +1,99 @@
+"""Tests for multi-radar mosaics."""
+
+import numpy as np
+import pytest
+from microburst_detection.fusion.mosaic import MosaicGrid, RadarMosaic, SweepGeometry
+from microburst_detection.sensors.radar_volume import RadarVolume
+
+GRID = MosaicGrid(52.0, -1.0, width=200_000.0, height=200_000.0, cell=2000.0)
+GATES = 200
+AZIMUTHS = np.arange(0.0, 360.0, 1.0) + 0.5
+
+
+def geometry(latitude=52.0, longitude=-1.0, **overrides):
+    fields = dict(latitude=latitude, longitude=longitude, altitude=100.0, elevation=0.5,
+                  gates=GATES, gate_spacing=500.0, first_gate=250.0)
+    return SweepGeometry(**{**fields, **overrides})
+
+
+def constant(value):
+    return np.full((len(AZIMUTHS), GATES), value, dtype=np.float32)
+
+
+def test_gates_land_at_their_range_and_bearing():
+    """Test a composite of one radar reproduces range and bearing on the grid."""
+    mosaic = RadarMosaic(GRID)
+    ranges = (250.0 + 500.0 * np.arange(GATES)) / 1000.0
+    reflectivity = np.tile(ranges, (len(AZIMUTHS), 1))
+    velocity = np.tile(AZIMUTHS[:, None], (1, GATES))
+    mosaic.update("A", geometry(), AZIMUTHS, reflectivity, velocity)
+
+    composite, bearing = mosaic.composite()
+    assert composite.shape == GRID.shape == (100, 100)
+    # Cell centers 61 km east and 41 km north of the radar (1 km off the axes)
+    assert abs(composite[50, 80] - 61.0) < 1.0
+    assert abs(bearing[50, 80] - 89.0) < 1.0
+    assert abs(composite[70, 50] - 41.0) < 1.0
+    assert abs(bearing[70, 50] - 1.5) < 1.0
+    # Corners are beyond the last gate
+    assert np.isnan(composite[0, 0]) and np.isnan(bearing[-1, -1])
+
+
+def test_overlap_is_weighted_toward_the_nearest_radar():
+    """Test reflectivity blends by distance and velocity comes from the best radar with data."""
+    mosaic = RadarMosaic(GRID, range_scale=30_000.0)
+    west, east = geometry(longitude=-1.5), geometry(longitude=-0.5)
+    mosaic.update("W", west, AZIMUTHS, constant(10.0), constant(-5.0))
+    mosaic.update("E", east, AZIMUTHS, constant(50.0), constant(5.0))
+
+    reflectivity, velocity = mosaic.composite()
+    assert reflectivity[50, 20] < 12.0 and velocity[50, 20] == -5.0
+    assert reflectivity[50, 80] > 48.0 and velocity[50, 80] == 5.0
+    assert abs(reflectivity[50, 50] - 30.0) < 2.0
+
+    # Without the west radar's velocity the east radar fills in
+    mosaic.update("W", west, AZIMUTHS, constant(10.0), None)
+    reflectivity, velocity = mosaic.composite()
+    assert velocity[50, 20] == 5.0 and reflectivity[50, 20] < 12.0
+
+    mosaic.remove("E")
+    reflectivity, velocity = mosaic.composite()
+    assert np.nanmax(reflectivity) == pytest.approx(10.0) and np.isnan(velocity).all()
+
+
+def test_tables_are_cached_on_disk_and_reused_across_jitter(tmp_path):
+    """Test a restarted mosaic loads tables instead of rebuilding them."""
+    first = RadarMosaic(GRID, cache_dir=tmp_path)
+    first.update("A", geometry(), AZIMUTHS, constant(30.0))
+    # Elevation and azimuth jitter between scans reuse the table
+    jittered = AZIMUTHS + np.random.default_rng(0).normal(0.0, 0.1, len(AZIMUTHS))
+    first.update("A", geometry(elevation=0.48), jittered, constant(35.0))
+    assert first.tables_built == 1
+    assert len(list(tmp_path.glob("remap-*.npz"))) == 1
+
+    second = RadarMosaic(GRID, cache_dir=tmp_path)
+    second.update("A", geometry(), jittered, constant(35.0))
+    assert second.tables_built == 0 and second.tables_loaded == 1
+    np.testing.assert_array_equal(second.composite()[0], first.composite()[0])
+
+    second.update("A", geometry(gate_spacing=250.0), AZIMUTHS, constant(35.0))
+    assert second.tables_built == 1
+
+
+def test_sector_scan_and_volume_tilts(tmp_path):
+    """Test tilts feed the mosaic and unscanned sectors stay empty."""
+    volume = RadarVolume.create(
+        tmp_path / "vol", latitude=52.0, longitude=-1.0, altitude=100.0,
+        gates=GATES, gate_spacing=500.0, first_gate=250.0
+    )
+    sector = np.arange(0.0, 90.0, 1.0) + 0.5
+    volume.append_tilt(0.5, sector, {
+        "reflectivity": np.full((len(sector), GATES), 45.0),
+        "velocity": np.full((len(sector), GATES), -3.0),
+    })
+    mosaic = RadarMosaic(GRID)
+    mosaic.update_tilt("A", volume.tilt(0))
+
+    reflectivity, velocity = mosaic.composite()
+    assert reflectivity[70, 70] == 45.0 and velocity[70, 70] == -3.0   # north-east
+    assert np.isnan(reflectivity[30, 30]) and np.isnan(velocity[30, 30])  # south-west
@@ -0,0 +1,107 @@
+"""Tests for memory-mapped radar volumes."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from microburst_detection.core.detector import MicroburstDetector
+from microburst_detection.sensors.radar_volume import RadarVolume
+
+AZIMUTHS = np.arange(0.0, 360.0, 1.0)
+GATES = 400
+
+
+def sweep(outflow_at=None, seed=0):
+    """Reflectivity and velocity for one tilt, optionally with an outflow couplet."""
+    rng = np.random.default_rng(seed)
+    reflectivity = rng.uniform(0.0, 20.0, (len(AZIMUTHS), GATES))
+    velocity = rng.normal(0.0, 1.0, (len(AZIMUTHS), GATES))
+    if outflow_at is not None:
+        radial, gate = outflow_at
+        rows = slice(radial - 3, radial + 4)
+        velocity[rows, gate - 8:gate] = -9.0
+        velocity[rows, gate:gate + 8] = 9.0
+        reflectivity[rows, gate - 10:gate + 10] = 50.0
+    return {"reflectivity": reflectivity, "velocity": velocity}
+
+
+@pytest.fixture
+def volume(tmp_path):
+    return RadarVolume.create(
+        tmp_path / "vol", latitude=52.45, longitude=-1.75, altitude=100.0,
+        gates=GATES, gate_spacing=250.0, first_gate=125.0, site="BHX", timestamp=1_700_000_000.0
+    )
+
+
+def test_tilts_are_mapped_lazily_and_picked_up_by_readers(volume):
+    """Test readers see committed tilts only, and map only the moments they read."""
+    first = sweep(seed=1)
+    volume.append_tilt(0.5, AZIMUTHS, first, timestamp=1_700_000_005.0)
+
+    reader = RadarVolume(volume.path)
+    assert len(reader) == 1 and not reader.complete
+    tilt = reader.tilt(0)
+    assert tilt.shape == (360, GATES) and tilt._maps == {}
+    reflectivity = tilt.moment("reflectivity")
+    assert isinstance(reflectivity, np.memmap)
+    np.testing.assert_allclose(reflectivity, first["reflectivity"].astype(np.float32))
+    assert set(tilt._maps) == {"reflectivity"}
+
+    volume.append_tilt(1.5, AZIMUTHS, sweep(seed=2))
+    assert reader.refresh() == 2
+    assert reader.nbytes == 2 * 2 * 360 * GATES * 4
+    with pytest.raises(KeyError):
+        tilt.moment("differential_reflectivity")
+
+
+def test_streaming_tilt_is_published_on_commit(volume):
+    """Test radials written in chunks are invisible until commit and gaps stay NaN."""
+    data = sweep(seed=3)
+    writer = volume.begin_tilt(0.5, AZIMUTHS)
+    for start in range(0, 300, 100):
+        writer.write(start, **{name: values[start:start + 100] for name, values in data.items()})
+    reader = RadarVolume(volume.path)
+    assert len(reader) == 0
+
+    writer.commit()
+    assert reader.refresh() == 1
+    velocity = reader.tilt(0).moment("velocity")
+    np.testing.assert_allclose(velocity[:300], data["velocity"][:300].astype(np.float32))
+    assert np.isnan(velocity[300:]).all()
+
+
+def test_follow_yields_tilts_as_they_arrive(volume):
+    """Test a follower receives every tilt in order and stops when the volume completes."""
+    def scan():
+        for elevation in (0.5, 1.5, 2.5):
+            volume.append_tilt(elevation, AZIMUTHS, sweep())
+        volume.finish()
+
+    follower = RadarVolume(volume.path)
+    writer = threading.Thread(target=scan)
+    writer.start()
+    elevations = [tilt.elevation for tilt in follower.follow(poll=0.01, timeout=5.0)]
+    writer.join()
+    assert elevations == [0.5, 1.5, 2.5]
+    assert follower.complete
+
+
+def test_detection_runs_on_lowest_tilt_before_volume_completes(volume):
+    """Test an outflow couplet on the first tilt is detected and located."""
+    volume.append_tilt(0.5, AZIMUTHS, sweep(outflow_at=(90, 200)), timestamp=1_700_000_010.0)
+    detector = MicroburstDetector()
+
+    detection = asyncio.run(detector.process_radar_tilt(volume.tilt(0)))
+    assert detection is not None and not volume.complete
+    assert detection.max_wind_shear >= 15.0
+    assert detection.additional_data["azimuth"] == pytest.approx(90.0, abs=3.0)
+    assert detection.additional_data["range"] == pytest.approx(125.0 + 250.0 * 200, abs=1000.0)
+    # Due east of the radar, ~50 km out
+    assert detection.latitude == pytest.approx(52.45, abs=0.03)
+    assert detection.longitude > -1.75 + 0.6
+    assert detection.site == "BHX"
+    assert len(detector.store) == 1
+
+    quiet = volume.append_tilt(1.5, AZIMUTHS, sweep(seed=4))
+    assert asyncio.run(detector.process_radar_tilt(quiet)) is None
@@ -0,0 +1,145 @@
+"""Tests for the raw sensor archive."""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from microburst_detection.core.models import AnemometerData
+from pydantic import ValidationError
+from microburst_detection.storage.archive import DTYPES, RawArchiveReader, RawArchiveWriter
+from microburst_detection.utils.timeutils import to_epoch
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def reading(seconds: float) -> AnemometerData:
+    """Anemometer reading at a fixed base time plus ``seconds``."""
+    return AnemometerData(
+        timestamp=datetime(2025, 11, 23, 21, 0) + timedelta(seconds=seconds),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=10.0,
+        wind_speed=10.0 + seconds,
+        wind_direction=245.0,
+        temperature=18.3,
+        pressure=1012.0,
+        site="KDEN",
+        sensor_id="anem-7"
+    )
+
+
+def test_segments_rotate_and_scan_by_time(tmp_path):
+    """Test size rotation, sidecar indexes and zero-copy range scans."""
+    clock = FakeClock()
+    writer = RawArchiveWriter(
+        tmp_path, max_segment_bytes=DTYPES["anemometer"].itemsize * 4, clock=clock
+    )
+    for seconds in range(10):
+        clock.now += 1
+        writer.append("anemometer", reading(seconds))
+    writer.flush()
+
+    reader = RawArchiveReader(tmp_path)
+    segments = reader.segments("anemometer")
+    assert [s.count for s in segments] == [4, 4, 2]
+    assert [s.sealed for s in segments] == [True, True, False]
+
+    start = to_epoch(reading(3).timestamp)
+    chunks = list(reader.scan("anemometer", since=start, until=start + 4))
+    assert all(isinstance(chunk, np.memmap) for chunk in chunks)
+    assert np.concatenate(chunks)["wind_speed"].tolist() == [13.0, 14.0, 15.0, 16.0]
+
+    writer.close()
+    assert all(s.sealed for s in reader.segments("anemometer"))
+
+
+def test_replay_rebuilds_readings(tmp_path):
+    """Test archived records convert back to reading records, out-of-order included."""
+    writer = RawArchiveWriter(tmp_path)
+    for seconds in (5, 1, 3):
+        writer.append("anemometer", reading(seconds))
+    writer.close()
+
+    reader = RawArchiveReader(tmp_path)
+    assert reader.segments("anemometer")[0].ordered is False
+
+    replayed = list(reader.readings("anemometer", since=to_epoch(reading(2).timestamp)))
+    assert [r.wind_speed for r in replayed] == [15.0, 13.0]
+    assert replayed[0].timestamp == reading(5).timestamp
+    assert (replayed[0].site, replayed[0].sensor_id) == ("KDEN", "anem-7")
+    assert len(reader.read("lidar")) == 0
+
+
+def test_identifiers_fit_their_fields(tmp_path):
+    """Test identifiers are validated to their byte width and stored whole."""
+    with pytest.raises(ValidationError, match="at most 16 bytes"):
+        AnemometerData.model_validate({**reading(0).model_dump(), "site": "é" * 9})
+
+    site, sensor_id = "é" * 8, "s" * 32
+    writer = RawArchiveWriter(tmp_path)
+    longest = reading(0).model_copy(update={"site": site, "sensor_id": sensor_id})
+    writer.append("anemometer", longest)
+    with pytest.raises(ValueError, match="too long"):
+        writer.append("anemometer", reading(1).model_copy(update={"sensor_id": "s" * 33}))
+    writer.close()
+
+    replayed = next(RawArchiveReader(tmp_path).readings("anemometer"))
+    assert (replayed.site, replayed.sensor_id) == (site, sensor_id)
+
+
+def test_prune_removes_expired_sealed_segments(tmp_path):
+    """Test retention deletes old sealed segments and leaves the open one alone."""
+    clock = FakeClock()
+    writer = RawArchiveWriter(tmp_path, clock=clock)
+    writer.append("anemometer", reading(0))
+    writer.rotate()
+    writer.append("anemometer", reading(1))
+    writer.flush()
+
+    clock.now = to_epoch(reading(0).timestamp) + 7200
+    assert writer.prune(3600) == 1
+    segments = RawArchiveReader(tmp_path).segments("anemometer")
+    assert [s.sealed for s in segments] == [False]
+    assert len(list(tmp_path.glob("anemometer/*"))) == 1
+    writer.close()
+
+
+def test_flush_from_another_thread_during_rotation(tmp_path):
+    """Test a flushing thread survives segments being sealed under it."""
+    import sys
+    import threading
+
+    writer = RawArchiveWriter(tmp_path, max_segment_bytes=DTYPES["anemometer"].itemsize * 2)
+    done = threading.Event()
+    errors = []
+
+    def flush():
+        while not done.is_set():
+            try:
+                writer.flush()
+            except Exception as e:  # noqa: BLE001 - surfaced by the assertion below
+                errors.append(e)
+
+    flusher = threading.Thread(target=flush)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        flusher.start()
+        for seconds in range(2000):
+            writer.append("anemometer", reading(seconds))
+    finally:
+        done.set()
+        flusher.join()
+        sys.setswitchinterval(interval)
+    writer.close()
+
+    assert errors == []
+    segments = RawArchiveReader(tmp_path).segments("anemometer")
+    assert sum(s.count for s in segments) == 2000
@@ -0,0 +1,145 @@
+"""Tests for detection history backends."""
+
+import pytest
+from datetime import datetime, timedelta
+from microburst_detection.core.models import (
+    MicroburstDetection,
+    SeverityLevel,
+    DetectionMethod
+)
+from microburst_detection.storage.detection_store import (
+    MemoryDetectionStore,
+    SQLiteDetectionStore,
+    create_store
+)
+from microburst_detection.utils.timeutils import to_epoch
+
+
+def make_detection(
+    event_id: str, minutes_ago: float, severity: SeverityLevel
+) -> MicroburstDetection:
+    """Build a detection with a timestamp relative to now."""
+    return MicroburstDetection(
+        event_id=event_id,
+        timestamp=datetime.utcnow() - timedelta(minutes=minutes_ago),
+        latitude=52.453,
+        longitude=-1.748,
+        altitude=1200.0,
+        severity=severity,
+        detection_method=DetectionMethod.LIDAR,
+        max_wind_shear=6.0,
+        vertical_velocity=-9.0,
+        confidence=0.8,
+        radius=1000.0,
+        duration_seconds=180,
+        alert_level="WINDSHEAR_ALERT"
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    """Detection store for each backend."""
+    store = create_store(request.param, tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def test_query_returns_time_ordered_window(store):
+    """Test range queries are ordered by detection timestamp."""
+    store.add(make_detection("evt_b", 10, SeverityLevel.LOW))
+    store.add(make_detection("evt_a", 90, SeverityLevel.SEVERE))
+    store.add(make_detection("evt_c", 5, SeverityLevel.SEVERE))
+
+    cutoff = to_epoch(datetime.utcnow() - timedelta(minutes=60))
+    recent = store.query(since=cutoff)
+
+    assert [d.event_id for d in recent] == ["evt_b", "evt_c"]
+    assert [d.event_id for d in store.query(severity="SEVERE")] == ["evt_a", "evt_c"]
+
+
+def test_statistics_and_versioning(store):
+    """Test statistics aggregation and change tracking."""
+    assert store.version == 0
+
+    store.add(make_detection("evt_1", 1, SeverityLevel.LOW))
+    store.add(make_detection("evt_2", 2, SeverityLevel.EXTREME))
+
+    stats = store.statistics(since=0.0, days=7)
+    assert stats['total_detections'] == 2
+    assert stats['severity_distribution']['extreme'] == 1
+    assert stats['avg_confidence'] == pytest.approx(0.8)
+
+    assert store.version == 2
+    changes = store.changes_since(1)
+    assert [c.detection.event_id for c in changes] == ["evt_2"]
+    assert changes[0].seq == 2
+
+
+def test_prune_drops_old_detections_and_keeps_sequence(store):
+    """Test pruning deletes detections past the cutoff without reusing sequence numbers."""
+    store.add(make_detection("evt_old", 120, SeverityLevel.LOW))
+    store.add(make_detection("evt_new", 5, SeverityLevel.SEVERE))
+    store.add(make_detection("evt_late", 150, SeverityLevel.LOW))
+
+    cutoff = to_epoch(datetime.utcnow() - timedelta(minutes=60))
+    assert store.prune(cutoff) == 2
+    assert [d.event_id for d in store.query()] == ["evt_new"]
+    assert len(store) == 1 and store.version == 3
+    assert [c.detection.event_id for c in store.changes_since(1)][0] == "evt_new"
+
+    store.add(make_detection("evt_next", 1, SeverityLevel.LOW))
+    assert store.version == 4
+    assert [c.seq for c in store.changes_since(3)] == [4]
+    assert store.prune(to_epoch(datetime.utcnow())) == 2
+    assert len(store) == 0 and store.version == 4
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path):
+    """Test two store instances on one file see the same history."""
+    first = SQLiteDetectionStore(tmp_path / "state.db")
+    second = SQLiteDetectionStore(tmp_path / "state.db")
+
+    first.add(make_detection("evt_shared", 1, SeverityLevel.MODERATE))
+
+    assert second.shared
+    assert len(second) == 1
+    assert second.query()[0].event_id == "evt_shared"
+    first.close()
+    second.close()
+
+
+def test_sqlite_reads_do_not_wait_for_writes(tmp_path):
+    """Test reads use their own connection while another thread holds the write lock."""
+    store = SQLiteDetectionStore(tmp_path / "state.db")
+    store.add(make_detection("evt_1", 5, SeverityLevel.SEVERE))
+
+    with store._lock:
+        assert store.version == 1
+        assert [d.event_id for d in store.query()] == ["evt_1"]
+        assert len(store.changes_since(0)) == 1
+    store.close()
+
+
+def test_unknown_backend_rejected():
+    """Test invalid backend names fail loudly."""
+    with pytest.raises(ValueError, match="Unknown state backend"):
+        create_store("redis")
+    assert isinstance(create_store("memory"), MemoryDetectionStore)
+
+
+def test_keyset_pages_cover_window_without_gaps(store):
+    """Test cursor pagination visits every row once, in time order."""
+    for minutes in (30, 10, 20, 10, 40):
+        store.add(make_detection(f"evt_{minutes}", minutes, SeverityLevel.LOW))
+
+    seen = []
+    after = None
+    while True:
+        rows = store.page(after=after, limit=2)
+        seen.extend(row.detection.event_id for row in rows)
+        if len(rows) < 2:
+            break
+        after = rows[-1].cursor
+
+    assert seen == ["evt_40", "evt_30", "evt_20", "evt_10", "evt_10"]
+    assert [row.detection.event_id for row in store.iter_range(page_size=2)] == seen
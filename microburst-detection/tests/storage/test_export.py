@@ -0,0 +1,74 @@
+"""Tests for Parquet export."""
+
+import pytest
+from datetime import datetime, timedelta
+from microburst_detection.core.models import SeverityLevel
+from microburst_detection.storage.archive import RawArchiveReader, RawArchiveWriter
+from microburst_detection.storage.detection_store import MemoryDetectionStore
+from microburst_detection.storage.export import export_detections, export_readings
+from .test_archive import reading
+from .test_detection_store import make_detection
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_detections_partitioned_by_day_and_site(tmp_path):
+    """Test chunked export writes one partition per day and site."""
+    store = MemoryDetectionStore()
+    rows = [(60 * 48, "KDEN"), (30, "KDEN"), (20, None), (10, "KDEN")]
+    for index, (minutes, site) in enumerate(rows):
+        detection = make_detection(f"evt_{index}", minutes, SeverityLevel.SEVERE)
+        detection.site = site
+        store.add(detection)
+
+    summary = export_detections(store, tmp_path, chunk_size=2)
+
+    assert summary["rows"] == 4
+    partitions = {(p.parent.parent.name, p.parent.name) for p in summary["files"]}
+    today = datetime.utcnow().date()
+    # Detections from a few minutes ago may fall on yesterday just after midnight
+    assert len(partitions) >= 3
+    assert any(site == "site=unknown" for _, site in partitions)
+    assert ("date=" + str(today - timedelta(days=2)), "site=KDEN") in partitions
+
+    table = pq.read_table(tmp_path)
+    assert sorted(table.column("event_id").to_pylist()) == ["evt_0", "evt_1", "evt_2", "evt_3"]
+    assert str(table.schema.field("timestamp").type) == "timestamp[us, tz=UTC]"
+    assert set(table.column("site").to_pylist()) == {"KDEN", "unknown"}
+
+
+def test_raw_readings_export(tmp_path):
+    """Test archived readings export with decoded site and sensor columns."""
+    writer = RawArchiveWriter(tmp_path / "archive")
+    for seconds in (0, 1, 86400):
+        writer.append("anemometer", reading(seconds))
+    writer.close()
+
+    reader = RawArchiveReader(tmp_path / "archive")
+    summary = export_readings(reader, "anemometer", tmp_path / "out")
+
+    assert summary["rows"] == 3
+    assert len(summary["files"]) == 2
+    table = pq.read_table(summary["files"][0])
+    assert table.column("sensor_id").to_pylist() == ["anem-7", "anem-7"]
+    assert table.column("wind_speed").to_pylist() == [10.0, 11.0]
+
+
+def test_site_partitions_are_escaped(tmp_path):
+    """Test sites with path characters stay inside the dataset and read back unchanged."""
+    store = MemoryDetectionStore()
+    sites = ["../../escape", "A/B", "a b%"]
+    for index, site in enumerate(sites):
+        detection = make_detection(f"evt_{index}", 10, SeverityLevel.SEVERE)
+        detection.site = site
+        store.add(detection)
+
+    summary = export_detections(store, tmp_path / "out")
+
+    root = (tmp_path / "out").resolve()
+    assert all(root in path.resolve().parents for path in summary["files"])
+    assert {path.parent.name for path in summary["files"]} == {
+        "site=..%2F..%2Fescape", "site=A%2FB", "site=a%20b%25"
+    }
+    table = pq.read_table(tmp_path / "out")
+    assert sorted(table.column("site").to_pylist()) == sorted(sites)
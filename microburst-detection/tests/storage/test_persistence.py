@@ -0,0 +1,48 @@
+"""Tests for background detection persistence."""
+
+import asyncio
+import time
+import pytest
+from microburst_detection.core.models import SeverityLevel
+from microburst_detection.storage.detection_store import MemoryDetectionStore
+from microburst_detection.storage.persistence import DetectionWriter, sqlite_path_from_url
+from .test_detection_store import make_detection
+
+
+def test_sqlite_url_parsing():
+    """Test relative and absolute sqlite URLs resolve to file paths."""
+    assert str(sqlite_path_from_url("sqlite:///./microburst.db")) == "microburst.db"
+    assert str(sqlite_path_from_url("sqlite:////var/lib/microburst.db")) == "/var/lib/microburst.db"
+    with pytest.raises(ValueError, match="Unsupported"):
+        sqlite_path_from_url("postgresql://localhost/microburst")
+
+
+@pytest.mark.asyncio
+async def test_detections_survive_restart(tmp_path):
+    """Test write-behind persistence reloads history into a fresh store."""
+    writer = DetectionWriter(tmp_path / "history.db", batch_size=2, flush_interval=0.01)
+    store = MemoryDetectionStore(on_add=writer.submit)
+    task = asyncio.create_task(writer.run())
+
+    for index in range(5):
+        store.add(make_detection(f"evt_{index}", 10 - index, SeverityLevel.MODERATE))
+    store.add(make_detection("evt_old", 60 * 24 * 30, SeverityLevel.LOW))
+    assert writer.pending == 6  # add() returned before anything hit disk
+
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert writer.written == 6
+    writer.close()
+
+    restarted = DetectionWriter(tmp_path / "history.db")
+    fresh = MemoryDetectionStore(on_add=restarted.submit)
+    recent = store.query()[-1].timestamp
+    loaded = restarted.load_recent(fresh, since=time.time() - 24 * 3600)
+    restarted.close()
+
+    assert loaded == 5
+    assert [d.event_id for d in fresh.query()] == [f"evt_{index}" for index in range(5)]
+    assert fresh.query()[-1].timestamp == recent
+    assert restarted.pending == 0
@@ -0,0 +1,70 @@
+"""Tests for time-bucketed detection series."""
+
+import numpy as np
+import pytest
+from microburst_detection.core.models import SeverityLevel
+from microburst_detection.storage.detection_store import MemoryDetectionStore
+from microburst_detection.storage.series import SeriesIndex, lttb
+from microburst_detection.utils.timeutils import to_epoch
+
+from .test_detection_store import make_detection
+
+
+def test_series_follows_store_incrementally():
+    """Test buckets aggregate new detections only and empty buckets are filled in."""
+    store = MemoryDetectionStore()
+    index = SeriesIndex(store, resolutions=((60, 86400), (3600, 7 * 86400)))
+    store.add(make_detection("evt_a", 30, SeverityLevel.SEVERE))
+    store.add(make_detection("evt_b", 30, SeverityLevel.LOW))
+    assert index.catch_up() == 2
+    assert index.catch_up() == 0
+    store.add(make_detection("evt_c", 5, SeverityLevel.SEVERE))
+    assert index.catch_up() == 1
+
+    now = to_epoch(make_detection("now", 0, SeverityLevel.LOW).timestamp)
+    series = index.series(now - 3600, now, 60)
+    assert len(series["starts"]) in (60, 61)
+    assert sum(series["count"]) == 3
+    assert sum(series["severity"]["severe"]) == 2
+    assert sum(series["severity"]["low"]) == 1
+    busy = series["count"].index(2)
+    assert series["mean_confidence"][busy] == 0.8
+    assert series["max_wind_shear"][busy] == 6.0
+    idle = series["count"].index(0)
+    assert series["mean_wind_shear"][idle] is None
+
+    hourly = index.series(now - 86400, now, 3600)
+    assert sum(hourly["count"]) == 3
+
+
+def test_resolution_choice_respects_points_and_retention():
+    """Test the finest resolution within the point budget and retention is picked."""
+    index = SeriesIndex(MemoryDetectionStore())
+    now = 1_700_000_000.0
+    assert index.resolution_for(now - 3600, now, 300) == 60
+    assert index.resolution_for(now - 86400, now, 300) == 300
+    assert index.resolution_for(now - 30 * 86400, now, 2000) == 3600
+    assert index.resolution_for(now - 365 * 86400, now, 300) == 86400
+
+    # Explicit resolutions are checked against the same limits
+    # A window from a minute boundary, 59 min 20 s long, spans 60 one-minute buckets
+    since = now // 60 * 60 - 3540
+    assert index.resolution_for(since, now, 60) == 60
+    assert len(index.series(since, now, 60, max_points=60)["starts"]) == 60
+    assert index.resolution_for(since - 1, now, 60) == 300
+    with pytest.raises(ValueError, match="more than 300 buckets"):
+        index.series(now - 86400, now, 60, max_points=300)
+    with pytest.raises(ValueError, match="only kept for 48 h"):
+        index.series(now - 3 * 86400, now, 60, max_points=5000)
+
+
+def test_lttb_keeps_spikes():
+    """Test downsampling keeps the endpoints and an isolated peak."""
+    x = np.arange(10000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[5000] = 50.0
+    kept = lttb(x, y, 300)
+    assert len(kept) == 300
+    assert kept[0] == 0 and kept[-1] == 9999
+    assert 5000 in kept
+    assert np.all(np.diff(kept) > 0)
@@ -0,0 +1,2 @@
+"""Package initialization."""
+__version__ = "1.0.0"
@@ -0,0 +1,47 @@
+"""Tests for end-to-end latency tracking."""
+
+import pytest
+from microburst_detection.utils.latency import LatencyTracker, QuantileSketch
+
+
+def test_quantile_sketch_relative_error():
+    """Test percentiles stay within the sketch's relative error."""
+    sketch = QuantileSketch()
+    for ms in range(1, 1001):
+        sketch.add(ms / 1000)
+
+    assert sketch.count == 1000
+    assert sketch.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+    assert sketch.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+    assert sketch.quantile(1.0) <= sketch.max == 1.0
+
+
+def test_tracker_reports_breaches_on_last_stage():
+    """Test budget checks use the furthest stage reached."""
+    now = [0.0]
+    tracker = LatencyTracker(window_seconds=60, clock=lambda: now[0])
+
+    for _ in range(10):
+        tracker.record("lidar", "KDEN", "ingest", 0.1)
+        tracker.record("lidar", "KDEN", "delivery", 3.0)
+        tracker.record("radar", None, "fusion", 0.5)
+
+    breaches = tracker.breaches(budget_seconds=2.0)
+    assert [(b["sensor_type"], b["site"], b["stage"]) for b in breaches] == [
+        ("lidar", "KDEN", "delivery")
+    ]
+
+    # Two full windows later the rolling summary is empty again
+    now[0] = 130.0
+    assert tracker.breaches(budget_seconds=2.0) == []
+    assert tracker.summaries()[0]["count"] == 10
+
+
+def test_tracker_pools_sites_beyond_cap():
+    """Test sites past max_sites share one summary instead of growing without bound."""
+    tracker = LatencyTracker(max_sites=2)
+    for site in ("KDEN", "KORD", "X1", "X2", "KDEN"):
+        tracker.record("lidar", site, "ingest", 0.1)
+
+    counts = {row["site"]: row["count"] for row in tracker.summaries()}
+    assert counts == {"KDEN": 2, "KORD": 1, "other": 2}
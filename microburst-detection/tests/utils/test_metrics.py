@@ -0,0 +1,60 @@
+"""Tests for the metrics registry and multiprocess collection."""
+
+import json
+
+from microburst_detection.utils.metrics import MetricsRegistry, MultiProcessCollector
+
+
+def worker_registry():
+    """A registry like each worker process builds."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("outcome",))
+    clients = registry.gauge("clients", "Connected clients")
+    size = registry.gauge("store_size", "Shared store size", multiprocess_mode="max")
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    return registry, requests, clients, size, latency
+
+
+def test_collector_combines_workers(tmp_path):
+    """Test counters and histograms sum over workers and gauges follow their mode."""
+    first, requests, clients, size, latency = worker_registry()
+    requests.labels("accepted").inc(2)
+    clients.set(3)
+    size.set(10)
+    latency.observe(0.05)
+    MultiProcessCollector(first, tmp_path, worker="1").write(first.snapshot())
+
+    second, requests, clients, size, latency = worker_registry()
+    requests.labels("accepted").inc(5)
+    requests.labels("shed").inc()
+    clients.set(4)
+    size.set(12)
+    latency.observe(0.5)
+    body = MultiProcessCollector(second, tmp_path, worker="2").render(second.snapshot())
+
+    assert 'requests_total{outcome="accepted"} 7.0' in body
+    assert 'requests_total{outcome="shed"} 1.0' in body
+    assert "clients 7.0" in body
+    assert "store_size 12.0" in body
+    assert 'latency_seconds_bucket{le="0.1"} 1' in body
+    assert 'latency_seconds_bucket{le="1.0"} 2' in body
+    assert "latency_seconds_count 2" in body
+
+
+def test_exited_workers_keep_counts_but_not_gauges(tmp_path):
+    """Test a stale snapshot still counts towards counters while its gauges drop out."""
+    first, requests, clients, _, _ = worker_registry()
+    requests.labels("accepted").inc(2)
+    clients.set(3)
+    MultiProcessCollector(first, tmp_path, worker="1").write(first.snapshot())
+    path = tmp_path / "1.json"
+    published = json.loads(path.read_text())
+    published["written"] -= 3600
+    path.write_text(json.dumps(published))
+
+    second, requests, clients, _, _ = worker_registry()
+    clients.set(4)
+    body = MultiProcessCollector(second, tmp_path, worker="2").render(second.snapshot())
+
+    assert 'requests_total{outcome="accepted"} 2.0' in body
+    assert "clients 4.0" in body
@@ -60,8 +60,14 @@ const API_CONFIG = {
     detectAnemometer: '/detect/anemometer',
     detections: '/detections',
     stats: '/stats',
+    sync: '/dashboard/sync',
+    series: '/series',
     wsStream: '/ws/stream'
-  }
+  },
+  syncIntervalMs: 10000,
+  detectionHours: 24,
+  statsDays: 7,
+  timelinePoints: 288
 };
 
 // WebSocket connection
@@ -73,6 +79,9 @@ const state = {
   currentSensorTab: 'lidar',
   selectedContinent: 'all',  // Continental filter
   detections: [],
+  syncCursor: null,         // /dashboard/sync position
+  syncedIds: new Set(),     // event_ids of detections that came from the API
+  stats: null,
   sensorData: {
     lidar: {
       altitudes: [500, 1000, 1500, 2000, 2500],
@@ -150,10 +159,9 @@ function initApp() {
   initializeContinentFilter();  // NEW: Continental filter
   
   // Connect to API
-  checkAPIHealth();
   connectWebSocket();
-  loadDetections();
-  loadStatistics();
+  syncDashboard();
+  setInterval(syncDashboard, API_CONFIG.syncIntervalMs);
   
   // Start real-time updates
   startRealTimeUpdates();
@@ -249,6 +257,7 @@ function switchView(viewName) {
     updateMap();
   } else if (viewName === 'history') {
     updateHistoryView();
+    loadTimeline();
   }
 }
 
@@ -1114,24 +1123,31 @@ function connectWebSocket() {
   }
 }
 
-function handleNewDetection(detectionData) {
-  // Map API response to internal format
-  const continent = getContinentByCoords(detectionData.latitude, detectionData.longitude);
-  
-  const newDetection = {
-    event_id: detectionData.event_id,
-    timestamp: detectionData.timestamp,
-    latitude: detectionData.latitude,
-    longitude: detectionData.longitude,
-    altitude: detectionData.altitude,
-    continent: continent,
-    severity: detectionData.severity?.toUpperCase() || 'LOW',
-    confidence: detectionData.confidence || 0.5,
-    max_wind_shear: detectionData.max_wind_shear || 0,
-    vertical_velocity: detectionData.vertical_velocity || 0,
-    detection_method: detectionData.detection_method?.toUpperCase() || 'UNKNOWN',
-    duration: detectionData.duration_seconds || 180
+// Convert an API detection to the dashboard's internal format
+function toDashboardDetection(det) {
+  return {
+    event_id: det.event_id,
+    timestamp: det.timestamp,
+    latitude: det.latitude,
+    longitude: det.longitude,
+    altitude: det.altitude,
+    continent: getContinentByCoords(det.latitude, det.longitude),
+    severity: det.severity?.toUpperCase() || 'LOW',
+    confidence: det.confidence || 0.5,
+    max_wind_shear: det.max_wind_shear || 0,
+    vertical_velocity: det.vertical_velocity || 0,
+    detection_method: det.detection_method?.toUpperCase() || 'UNKNOWN',
+    duration: det.duration_seconds || 180
   };
+}
+
+function handleNewDetection(detectionData) {
+  // Already delivered by a sync
+  if (state.syncedIds.has(detectionData.event_id)) {
+    return;
+  }
+  state.syncedIds.add(detectionData.event_id);
+  const newDetection = toDashboardDetection(detectionData);
   
   state.detections.unshift(newDetection);
   
@@ -1150,59 +1166,148 @@ function handleNewDetection(detectionData) {
   console.log('New detection received:', newDetection.event_id);
 }
 
-async function loadDetections() {
+// Dashboard delta sync: each poll returns only detections stored since
+// state.syncCursor, statistics only when they changed, and health.
+async function syncDashboard() {
   try {
     const apiEndpoint = document.getElementById('apiEndpoint')?.value || API_CONFIG.baseURL;
-    const response = await fetch(`${apiEndpoint}${API_CONFIG.endpoints.detections}?hours=24`);
+    const params = new URLSearchParams({
+      hours: API_CONFIG.detectionHours,
+      days: API_CONFIG.statsDays
+    });
+    if (state.syncCursor) {
+      params.set('cursor', state.syncCursor);
+    }
+    const response = await fetch(`${apiEndpoint}${API_CONFIG.endpoints.sync}?${params}`);
     
-    if (response.ok) {
-      const detections = await response.json();
-      // Convert API detections to internal format
-      detections.forEach(det => {
-        const continent = getContinentByCoords(det.latitude, det.longitude);
-        state.detections.push({
-          event_id: det.event_id,
-          timestamp: det.timestamp,
-          latitude: det.latitude,
-          longitude: det.longitude,
-          altitude: det.altitude,
-          continent: continent,
-          severity: det.severity?.toUpperCase() || 'LOW',
-          confidence: det.confidence || 0.5,
-          max_wind_shear: det.max_wind_shear || 0,
-          vertical_velocity: det.vertical_velocity || 0,
-          detection_method: det.detection_method?.toUpperCase() || 'UNKNOWN',
-          duration: det.duration_seconds || 180
-        });
-      });
-      
-      // Sort by timestamp
-      state.detections.sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
-      
-      updateMap();
-      if (state.currentView === 'history') {
-        updateHistoryView();
-      }
+    if (response.status === 400) {
+      // Unusable cursor: start over with a full snapshot next time
+      state.syncCursor = null;
+      return;
     }
+    if (!response.ok) {
+      state.apiConnected = false;
+      updateConnectionStatus(false);
+      return;
+    }
+    applySync(await response.json());
   } catch (error) {
-    console.error('Error loading detections:', error);
+    console.error('Dashboard sync failed:', error);
+    state.apiConnected = false;
+    updateConnectionStatus(false);
     // Continue with simulated data
   }
 }
 
-async function loadStatistics() {
+function applySync(payload) {
+  let changed = payload.full;
+  
+  if (payload.full) {
+    // Snapshot replaces every detection that came from the API
+    state.detections = state.detections.filter(d => !state.syncedIds.has(d.event_id));
+    state.syncedIds.clear();
+  }
+  
+  payload.detections.forEach(det => {
+    if (!state.syncedIds.has(det.event_id)) {
+      state.syncedIds.add(det.event_id);
+      state.detections.push(toDashboardDetection(det));
+      changed = true;
+    }
+  });
+  
+  // Drop API detections that have left the window
+  const windowStart = new Date(payload.window_start);
+  const count = state.detections.length;
+  state.detections = state.detections.filter(d => {
+    if (state.syncedIds.has(d.event_id) && new Date(d.timestamp) < windowStart) {
+      state.syncedIds.delete(d.event_id);
+      return false;
+    }
+    return true;
+  });
+  changed = changed || state.detections.length !== count;
+  
+  if (payload.stats) {
+    state.stats = payload.stats;
+    console.log('Statistics updated:', payload.stats);
+  }
+  
+  state.apiConnected = payload.health.status === 'operational';
+  updateConnectionStatus(state.apiConnected);
+  state.syncCursor = payload.cursor;
+  
+  if (changed) {
+    state.detections.sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp));
+    updateMap();
+    updateActiveAlerts();
+    if (state.currentView === 'history') {
+      updateHistoryView();
+      loadTimeline();
+    }
+  }
+}
+
+// Detection timeline (server-side buckets, so the payload stays small for any range)
+async function loadTimeline() {
   try {
     const apiEndpoint = document.getElementById('apiEndpoint')?.value || API_CONFIG.baseURL;
-    const response = await fetch(`${apiEndpoint}${API_CONFIG.endpoints.stats}?days=7`);
-    
+    const params = new URLSearchParams({
+      hours: API_CONFIG.detectionHours,
+      points: API_CONFIG.timelinePoints
+    });
+    const response = await fetch(`${apiEndpoint}${API_CONFIG.endpoints.series}?${params}`);
     if (response.ok) {
-      const stats = await response.json();
-      console.log('Statistics loaded:', stats);
-      // Update statistics display if needed
+      renderTimelineChart(await response.json());
     }
   } catch (error) {
-    console.error('Error loading statistics:', error);
+    console.error('Timeline load failed:', error);
+  }
+}
+
+function renderTimelineChart(series) {
+  const ctx = document.getElementById('timelineChart');
+  if (!ctx) return;
+  
+  const labels = series.starts.map(start => new Date(start * 1000).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }));
+  const datasets = Object.keys(SEVERITY_COLORS).map(severity => ({
+    type: 'bar',
+    label: severity,
+    data: series.severity[severity.toLowerCase()],
+    backgroundColor: SEVERITY_COLORS[severity],
+    stack: 'severity',
+    yAxisID: 'y'
+  }));
+  datasets.push({
+    type: 'line',
+    label: 'Max Wind Shear',
+    data: series.max_wind_shear,
+    borderColor: CHART_COLORS[0],
+    pointRadius: 0,
+    spanGaps: false,
+    yAxisID: 'shear'
+  });
+  
+  if (state.charts.timeline) {
+    state.charts.timeline.data.labels = labels;
+    state.charts.timeline.data.datasets = datasets;
+    state.charts.timeline.update('none');
+    return;
   }
+  
+  state.charts.timeline = new Chart(ctx, {
+    data: { labels, datasets },
+    options: {
+      responsive: true,
+      maintainAspectRatio: false,
+      animation: false,
+      scales: {
+        x: { stacked: true, ticks: { maxTicksLimit: 12 } },
+        y: { stacked: true, title: { display: true, text: 'Detections' } },
+        shear: { position: 'right', grid: { drawOnChartArea: false }, title: { display: true, text: 'Shear (m/s)' } }
+      }
+    }
+  });
 }
 
 // Test API connection
@@ -1213,7 +1318,8 @@ function testAPIConnection() {
     if (connected) {
       showToast('Conexión exitosa', 'success');
       connectWebSocket();
-      loadDetections();
+      state.syncCursor = null;
+      syncDashboard();
     } else {
       showToast('Error de conexión. Verifica que el servidor esté ejecutándose.', 'error');
     }